@@ -638,9 +638,10 @@ class Agent:
         """Choose direction intelligently based on exploration history.
 
         Prioritizes:
-        1. Directions leading to unexplored coordinates
-        2. Directions not recently taken
-        3. East/West to expand exploration (avoid north/south ping-pong)
+        1. The game's walkable route toward an EXPLORE quest target
+        2. Directions leading to unexplored coordinates
+        3. Directions not recently taken
+        4. East/West to expand exploration (avoid north/south ping-pong)
 
         Args:
             state: Current game state
@@ -651,6 +652,10 @@ class Agent:
         if not state.exits:
             return "north"  # Fallback
 
+        route = state.get_explore_route()
+        if route in state.exits:
+            return route
+
         direction_map = {
             "north": (0, 1),
             "south": (0, -1),
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare save formats on an existing game save.
+
+Loads a full game state save (any format) and reports the encoded size and
+the fastest save/load time of each format in persistence.SAVE_FORMATS.
+
+Usage:
+    python -m scripts.benchmark_saves SAVE_FILE [options]
+
+Examples:
+    python -m scripts.benchmark_saves saves/Hero_20250101_120000.json
+    python -m scripts.benchmark_saves saves/autosave_Hero.json --repeat 20
+    python -m scripts.benchmark_saves saves/Hero_20250101_120000.sav --output=bench.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cli_rpg.persistence import benchmark_save_formats, detect_save_type, load_game_state
+
+
+def main() -> int:
+    """Run the benchmark and report results.
+
+    Returns:
+        Exit code (0 for success, 1 for errors)
+    """
+    parser = argparse.ArgumentParser(description="Compare save formats on a game save")
+    parser.add_argument("save_file", help="Full game state save to benchmark")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Runs per format; the fastest is reported (default: 5)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Also write the results to this JSON file"
+    )
+    args = parser.parse_args()
+
+    try:
+        if detect_save_type(args.save_file) != "game_state":
+            print(f"Error: {args.save_file} is a character-only save", file=sys.stderr)
+            return 1
+        game_state = load_game_state(args.save_file)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    results = benchmark_save_formats(game_state, repeat=max(1, args.repeat))
+
+    print(f"{'format':<10}{'bytes':>12}{'save ms':>10}{'load ms':>10}")
+    for result in results:
+        print(
+            f"{result['format']:<10}{result['bytes']:>12,}"
+            f"{result['save_ms']:>10.2f}{result['load_ms']:>10.2f}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
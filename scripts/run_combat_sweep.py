@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Run a headless Monte Carlo combat balance sweep.
+
+Simulates class x level x enemy template fights across a process pool and
+reports win rate, turns-to-kill and damage distributions per cell.
+
+Usage:
+    python -m scripts.run_combat_sweep [options]
+
+Examples:
+    python -m scripts.run_combat_sweep --levels 1 5 10 --fights 5000
+    python -m scripts.run_combat_sweep --classes mage cleric --templates boss:dungeon
+    python -m scripts.run_combat_sweep --output=sweep.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cli_rpg.combat import ENEMY_TEMPLATES
+from cli_rpg.combat_sim import BOSS_TEMPLATES, format_sweep_report, sweep
+from cli_rpg.models.character import CharacterClass
+
+
+def main() -> int:
+    """Run the sweep and report results.
+
+    Returns:
+        Exit code (0 for success, 1 for errors)
+    """
+    parser = argparse.ArgumentParser(
+        description="Run a headless combat balance sweep",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Templates: {", ".join(ENEMY_TEMPLATES)}
+Boss templates: {", ".join(f"boss:{name}" for name in BOSS_TEMPLATES)}
+        """
+    )
+    parser.add_argument(
+        "--classes",
+        nargs="+",
+        default=None,
+        help="Classes to simulate (default: all)"
+    )
+    parser.add_argument(
+        "--levels",
+        nargs="+",
+        type=int,
+        default=[1],
+        help="Character levels to simulate (default: 1)"
+    )
+    parser.add_argument(
+        "--templates",
+        nargs="+",
+        default=None,
+        help="Enemy templates to simulate (default: all non-boss templates)"
+    )
+    parser.add_argument(
+        "--fights",
+        type=int,
+        default=1000,
+        help="Fights per cell (default: 1000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Base RNG seed (default: 0)"
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=100,
+        help="Turn limit per fight (default: 100)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output JSON report to file"
+    )
+    args = parser.parse_args()
+
+    classes = None
+    if args.classes:
+        try:
+            classes = [CharacterClass[name.upper()] for name in args.classes]
+        except KeyError as e:
+            print(f"Unknown class: {e.args[0]}", file=sys.stderr)
+            return 1
+    if args.templates:
+        valid = set(ENEMY_TEMPLATES) | {f"boss:{name}" for name in BOSS_TEMPLATES}
+        unknown = [name for name in args.templates if name not in valid]
+        if unknown:
+            print(f"Unknown template(s): {', '.join(unknown)}", file=sys.stderr)
+            return 1
+
+    start = time.perf_counter()
+    results = sweep(
+        classes=classes,
+        levels=args.levels,
+        templates=args.templates,
+        fights=args.fights,
+        workers=args.workers,
+        seed=args.seed,
+        max_turns=args.max_turns,
+    )
+    elapsed = time.perf_counter() - start
+    total = sum(cell.fights for cell in results)
+
+    print(format_sweep_report(results))
+    rate = total / elapsed * 60 if elapsed > 0 else 0.0
+    print(f"\n{total} fights in {elapsed:.1f}s ({rate:,.0f} fights/min)")
+
+    if args.output:
+        report = {
+            "seed": args.seed,
+            "fights": total,
+            "elapsed_seconds": round(elapsed, 2),
+            "cells": [cell.to_dict() for cell in results],
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
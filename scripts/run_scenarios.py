@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Run YAML validation scenarios in parallel.
+
+Games are forked from a fork server that imports cli_rpg once, and each step
+waits for the game's reply instead of sleeping, so the full scenario suite
+finishes in seconds. Prints per-scenario wall time.
+
+Usage:
+    python -m scripts.run_scenarios [paths...] [options]
+
+Examples:
+    python -m scripts.run_scenarios
+    python -m scripts.run_scenarios scripts/scenarios/combat --workers 4
+    python -m scripts.run_scenarios scripts/scenarios/movement/basic_navigation.yaml -v
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scripts.validation.scenarios import format_scenario_report, run_scenarios_parallel
+
+SCENARIOS_DIR = Path(__file__).parent / "scenarios"
+
+
+def main() -> int:
+    """Run the scenarios and report results.
+
+    Returns:
+        Exit code (0 if every scenario passed, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(
+        description="Run YAML validation scenarios in parallel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[SCENARIOS_DIR],
+        help="Scenario files or directories (default: scripts/scenarios)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print debug information"
+    )
+    args = parser.parse_args()
+
+    scenario_paths = []
+    for path in args.paths:
+        if path.is_dir():
+            scenario_paths.extend(sorted(path.rglob("*.yaml")))
+        elif path.exists():
+            scenario_paths.append(path)
+        else:
+            print(f"Scenario path not found: {path}", file=sys.stderr)
+            return 1
+    if not scenario_paths:
+        print("No scenarios found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = run_scenarios_parallel(scenario_paths, workers=args.workers, verbose=args.verbose)
+    elapsed = time.perf_counter() - start
+
+    print(format_scenario_report(results, elapsed))
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
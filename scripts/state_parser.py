@@ -56,6 +56,7 @@ class AgentState:
         exits: Available exit directions
         npcs: NPCs present at location
         commands: Valid commands at current state
+        routes: Quest target -> first step of its walkable path (from the game)
         inventory: List of item names in inventory
         dread: Current dread level (0-100)
         quests: List of active quest names
@@ -81,6 +82,7 @@ class AgentState:
     exits: list[str] = field(default_factory=list)
     npcs: list[str] = field(default_factory=list)
     commands: list[str] = field(default_factory=list)
+    routes: dict[str, str] = field(default_factory=dict)
     inventory: list[str] = field(default_factory=list)
     dread: int = 0
     # Environmental awareness fields
@@ -144,6 +146,13 @@ class AgentState:
                 return quest.target
         return None
 
+    def get_explore_route(self) -> Optional[str]:
+        """Get the game's next step toward the active EXPLORE quest target."""
+        target = self.get_explore_quest_target()
+        if target is None:
+            return None
+        return self.routes.get(target)
+
     def get_talk_quest_target(self) -> Optional[str]:
         """Get the target NPC from an active TALK quest."""
         for quest in self.quest_details:
@@ -281,6 +290,7 @@ def update_state(state: AgentState, message: dict[str, Any]) -> None:
 
         state.npcs = message.get("npcs", [])
         state.commands = message.get("commands", [])
+        state.routes = message.get("routes", {})
         # Actions are emitted when NOT in combat
         # (combat emits "combat" type messages instead)
         state.in_combat = False
@@ -26,11 +26,15 @@ from .regression import (
     ScenarioBaseline,
 )
 from .scenarios import (
+    ForkedGameSession,
+    ForkedScenarioRunner,
     Scenario,
     ScenarioResult,
     ScenarioRunner,
     ScenarioStep,
     StepResult,
+    format_scenario_report,
+    run_scenarios_parallel,
 )
 
 __all__ = [
@@ -46,6 +50,8 @@ __all__ = [
     "FeatureCoverage",
     "FeatureEvent",
     "FEATURE_DEFINITIONS",
+    "ForkedGameSession",
+    "ForkedScenarioRunner",
     "QualityResult",
     "RegressionBaseline",
     "RegressionDetector",
@@ -56,4 +62,6 @@ __all__ = [
     "ScenarioRunner",
     "ScenarioStep",
     "StepResult",
+    "format_scenario_report",
+    "run_scenarios_parallel",
 ]
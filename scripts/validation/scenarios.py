@@ -2,9 +2,20 @@
 
 Executes scripted test sequences using the existing assertion framework.
 Provides structured scenarios with steps, assertions, and wait conditions.
+
+ForkedScenarioRunner and run_scenarios_parallel run scenarios against games
+forked from a process that has already imported cli_rpg, in parallel.
 """
 
+import multiprocessing
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -12,7 +23,7 @@ from typing import Any, Dict, List, Optional
 import yaml
 
 from scripts.ai_agent import GameSession
-from scripts.state_parser import AgentState
+from scripts.state_parser import AgentState, parse_line
 from scripts.validation.assertions import Assertion, AssertionChecker, AssertionResult, AssertionType
 
 
@@ -248,17 +259,7 @@ class ScenarioRunner:
         # Determine seed (use scenario seed or generate one)
         seed = scenario.seed if scenario.seed is not None else int(time.time())
 
-        # Create GameSession with scenario configuration
-        max_commands = scenario.config.get("max_commands", 1000)
-        timeout = scenario.config.get("timeout", 300)
-
-        session = GameSession(
-            seed=seed,
-            max_commands=max_commands,
-            timeout=timeout,
-            verbose=self.verbose,
-            enable_checkpoints=False,  # Disable for testing
-        )
+        session = self._create_session(scenario, seed)
 
         step_results: List[StepResult] = []
         assertions_passed = 0
@@ -280,15 +281,12 @@ class ScenarioRunner:
                 creation_inputs=creation_inputs,
             )
 
-            # Wait for initial game startup (longer for character creation)
-            startup_wait = 1.0 if not skip_char_creation else 0.5
-            time.sleep(startup_wait)
-            session._read_output(wait_time=0.5, min_lines=1)
+            self._wait_for_startup(session, skip_char_creation)
 
             # Run setup commands
             for setup_cmd in scenario.setup:
                 session._send_command(setup_cmd)
-                session._read_output(wait_time=0.2)
+                self._read_setup_output(session)
 
             # Run scenario steps
             for step_index, step in enumerate(scenario.steps):
@@ -318,6 +316,44 @@ class ScenarioRunner:
             duration=duration,
         )
 
+    def _create_session(self, scenario: Scenario, seed: int) -> GameSession:
+        """Create the game session for a scenario.
+
+        Args:
+            scenario: Scenario being run (config supplies limits)
+            seed: Game seed
+
+        Returns:
+            Unstarted GameSession
+        """
+        return GameSession(
+            seed=seed,
+            max_commands=scenario.config.get("max_commands", 1000),
+            timeout=scenario.config.get("timeout", 300),
+            verbose=self.verbose,
+            enable_checkpoints=False,  # Disable for testing
+        )
+
+    def _wait_for_startup(self, session: GameSession, skip_char_creation: bool) -> None:
+        """Wait for the game to start and consume its opening output.
+
+        Args:
+            session: Started GameSession
+            skip_char_creation: False if character creation inputs were sent
+        """
+        # Longer for character creation
+        startup_wait = 1.0 if not skip_char_creation else 0.5
+        time.sleep(startup_wait)
+        session._read_output(wait_time=0.5, min_lines=1)
+
+    def _read_setup_output(self, session: GameSession) -> List[str]:
+        """Read the output of a setup command."""
+        return session._read_output(wait_time=0.2)
+
+    def _read_step_output(self, session: GameSession) -> List[str]:
+        """Read the output of a scenario step command."""
+        return session._read_output(wait_time=0.3, min_lines=1)
+
     def _execute_step(
         self,
         session: GameSession,
@@ -338,7 +374,7 @@ class ScenarioRunner:
         session._send_command(step.command)
 
         # Wait for output
-        output_lines = session._read_output(wait_time=0.3, min_lines=1)
+        output_lines = self._read_step_output(session)
         output = "\n".join(output_lines)
 
         # Process output to update state
@@ -446,3 +482,259 @@ class ScenarioRunner:
             prev_state=None,  # TODO: Track previous state if needed
             output=output,
         )
+
+
+# Message types that end the game's reply to a command in JSON mode
+# (the game emits state, then actions, or combat while fighting)
+_RESPONSE_END_TYPES = ("actions", "combat")
+
+# Modules imported once by the fork server and inherited by every game
+FORKSERVER_PRELOAD = ["cli_rpg.main", "scripts.validation.scenarios"]
+
+
+def _is_response_end(line: str) -> bool:
+    """Check whether a JSON output line ends the game's reply to a command."""
+    msg = parse_line(line)
+    if msg is None:
+        return False
+    if msg.get("type") in _RESPONSE_END_TYPES:
+        return True
+    return msg.get("type") == "narrative" and msg.get("text", "").startswith("GAME OVER")
+
+
+class _ForkedProcess:
+    """Minimal subprocess.Popen stand-in for a game forked in-process."""
+
+    def __init__(self, pid: int, stdin_fd: int):
+        self.pid = pid
+        self.stdin = os.fdopen(stdin_fd, "w", buffering=1)
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code, or None while the game is running."""
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid != 0:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Wait for the game to exit.
+
+        Raises:
+            subprocess.TimeoutExpired: If it is still running after timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.time() > deadline:
+                raise subprocess.TimeoutExpired(f"forked game {self.pid}", timeout)
+            time.sleep(0.01)
+        return self.returncode
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
+    def _signal(self, signum: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+
+@dataclass
+class ForkedGameSession(GameSession):
+    """GameSession that forks the current process instead of spawning Python.
+
+    The game runs cli_rpg.main.main() in a child forked from this process,
+    so when cli_rpg is already imported (e.g. in a fork-server worker) a
+    session starts without interpreter startup or import cost. Output and
+    state tracking work exactly as in GameSession.
+    """
+
+    def start(
+        self,
+        skip_character_creation: bool = True,
+        creation_inputs: Optional[list[str]] = None,
+    ) -> None:
+        """Fork the game and start the reader thread.
+
+        Args:
+            skip_character_creation: If True, use --skip-character-creation flag.
+            creation_inputs: Optional list of inputs for character creation,
+                             written up front (the game reads them in order).
+        """
+        import pty
+
+        from cli_rpg.main import main as game_main
+
+        args = ["--json", f"--seed={self.seed}"]
+        if skip_character_creation:
+            args.append("--skip-character-creation")
+        if self.demo_mode:
+            args.append("--demo")
+
+        master_fd, slave_fd = pty.openpty()
+        stdin_read, stdin_write = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                os.dup2(stdin_read, 0)
+                os.dup2(slave_fd, 1)
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, 2)
+                for fd in (master_fd, slave_fd, stdin_read, stdin_write, devnull):
+                    os.close(fd)
+                sys.stdin = os.fdopen(0, "r")
+                sys.stdout = os.fdopen(1, "w", buffering=1)
+                sys.stderr = os.fdopen(2, "w")
+                exit_code = game_main(args) or 0
+            finally:
+                sys.stdout.flush()
+                os._exit(exit_code)
+
+        os.close(slave_fd)
+        os.close(stdin_read)
+        self.process = _ForkedProcess(pid, stdin_write)
+        self._stdout_fd = master_fd
+
+        self._stop_reader = False
+        self._reader_thread = threading.Thread(target=self._reader_worker, daemon=True)
+        self._reader_thread.start()
+
+        if not skip_character_creation and creation_inputs:
+            for input_line in creation_inputs:
+                self.process.stdin.write(input_line + "\n")
+
+    def stop(self) -> None:
+        """Stop the game and reader thread, and release the pty."""
+        super().stop()
+        try:
+            os.close(self._stdout_fd)
+        except (AttributeError, OSError):
+            pass
+
+    def read_response(self, timeout: float = 10.0) -> list[str]:
+        """Read output until the game finishes replying to a command.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Output lines, ending with the reply's actions/combat line unless
+            the timeout expired first
+        """
+        deadline = time.time() + timeout
+        lines: list[str] = []
+        while time.time() < deadline:
+            try:
+                line = self._output_queue.get(timeout=0.05)
+            except queue.Empty:
+                if self.process is not None and self.process.poll() is not None:
+                    break
+                continue
+            lines.append(line)
+            if _is_response_end(line):
+                break
+        return lines
+
+
+class ForkedScenarioRunner(ScenarioRunner):
+    """ScenarioRunner using forked games and reply-driven reads.
+
+    Instead of fixed sleeps before each step, it reads until the game's
+    reply to the command is complete (JSON mode ends every reply with an
+    actions or combat message), so steps take as long as the game does.
+    """
+
+    def __init__(self, verbose: bool = False, response_timeout: float = 10.0):
+        """Initialize the runner.
+
+        Args:
+            verbose: If True, print debug information
+            response_timeout: Maximum wait for a reply, in seconds
+        """
+        super().__init__(verbose=verbose)
+        self.response_timeout = response_timeout
+
+    def _create_session(self, scenario: Scenario, seed: int) -> ForkedGameSession:
+        return ForkedGameSession(
+            seed=seed,
+            max_commands=scenario.config.get("max_commands", 1000),
+            timeout=scenario.config.get("timeout", 300),
+            verbose=self.verbose,
+            enable_checkpoints=False,
+        )
+
+    def _wait_for_startup(self, session: ForkedGameSession, skip_char_creation: bool) -> None:
+        lines = session.read_response(self.response_timeout)
+        session._process_messages(lines)
+
+    def _read_setup_output(self, session: ForkedGameSession) -> List[str]:
+        return session.read_response(self.response_timeout)
+
+    def _read_step_output(self, session: ForkedGameSession) -> List[str]:
+        return session.read_response(self.response_timeout)
+
+
+def _run_forked_scenario(path: str, verbose: bool) -> ScenarioResult:
+    """Run one scenario file in a pool worker (module level so it pickles)."""
+    return ForkedScenarioRunner(verbose=verbose).run(Path(path))
+
+
+def run_scenarios_parallel(
+    paths: List[Path],
+    workers: Optional[int] = None,
+    verbose: bool = False,
+) -> List[ScenarioResult]:
+    """Run scenario files in parallel from a pre-warmed fork server.
+
+    A fork server imports cli_rpg once; pool workers are forked from it and
+    each scenario's game is forked from a worker, so no game pays for
+    interpreter startup or imports. Workers are reused across scenarios and
+    every game starts from a fresh fork, so no state carries over.
+
+    Args:
+        paths: Scenario YAML files
+        workers: Worker processes (default: CPU count)
+        verbose: If True, print debug information
+
+    Returns:
+        ScenarioResult per path, in the same order
+    """
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [pool.submit(_run_forked_scenario, str(path), verbose) for path in paths]
+        return [future.result() for future in futures]
+
+
+def format_scenario_report(results: List[ScenarioResult], wall_time: float) -> str:
+    """Format per-scenario results and wall times.
+
+    Args:
+        results: Scenario results
+        wall_time: Elapsed time for the whole run in seconds
+
+    Returns:
+        Multi-line report
+    """
+    lines = []
+    for result in sorted(results, key=lambda r: -r.duration):
+        status = "PASS" if result.passed else "FAIL"
+        lines.append(
+            f"{status}  {result.duration:6.2f}s  {result.scenario_name} "
+            f"({result.assertions_passed}/{result.assertions_passed + result.assertions_failed} assertions)"
+        )
+    passed = sum(1 for r in results if r.passed)
+    total_time = sum(r.duration for r in results)
+    lines.append(
+        f"{passed}/{len(results)} scenarios passed in {wall_time:.2f}s "
+        f"({total_time:.2f}s of scenario time)"
+    )
+    return "\n".join(lines)
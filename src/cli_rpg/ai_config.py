@@ -4,6 +4,8 @@ import os
 from dataclasses import dataclass, field
 from typing import Optional
 
+from cli_rpg.prompt_budget import DEFAULT_PROMPT_TOKEN_BUDGETS
+
 
 class AIConfigError(Exception):
     """Exception raised for AI configuration errors."""
@@ -282,6 +284,21 @@ Requirements:
 Respond with ONLY the whisper text, no quotes or formatting."""
 
 
+# Default prompt template for companion banter generation
+DEFAULT_BANTER_GENERATION_PROMPT = """Generate a single line of companion banter for a {theme} RPG.
+
+Location Category: {location_category}
+Mood: {mood}
+
+Requirements:
+1. Write exactly ONE short remark a travelling companion says aloud (10-120 characters)
+2. Match the {theme} setting, the {location_category} surroundings and the {mood} mood
+3. Keep it in character for a loyal adventuring companion
+4. Do not name the speaker or the player
+
+Respond with ONLY the spoken line, no quotes or formatting."""
+
+
 # --- Layered Query Architecture Prompts (Step 5) ---
 
 # Default prompt template for world context generation (Layer 1)
@@ -486,7 +503,7 @@ class AIConfig:
 
     Attributes:
         api_key: API key for the LLM provider (required)
-        provider: AI provider - "openai", "anthropic", or "ollama" (default: "openai")
+        provider: AI provider - "openai", "anthropic", "ollama", or "mock" (default: "openai")
         model: Model identifier (default: "gpt-3.5-turbo" for openai, "claude-3-5-sonnet-latest" for anthropic, "llama3.2" for ollama)
         temperature: Generation randomness 0.0-2.0 (default: 0.7)
         max_tokens: Maximum response length (default: 2000)
@@ -498,6 +515,17 @@ class AIConfig:
         cache_file: Path to persistent cache file (default: ~/.cli_rpg/cache/ai_cache.json when caching enabled)
         ollama_base_url: Base URL for Ollama API (default: http://localhost:11434/v1)
         enable_streaming: Enable streaming for text generation (default: False)
+        mock_latency_ms: Mean request latency for the mock provider in ms (default: 0.0)
+        mock_latency_jitter_ms: Latency spread for the mock provider in ms (default: 0.0)
+        mock_latency_distribution: Mock latency distribution - "fixed", "uniform",
+            "normal", or "lognormal" (default: "fixed")
+        mock_token_delay_ms: Delay between streamed mock tokens in ms (default: 0.0)
+        mock_error_rate: Share of mock requests that fail, 0.0-1.0 (default: 0.0)
+        mock_truncation_rate: Share of mock responses cut off early, 0.0-1.0 (default: 0.0)
+        mock_seed: RNG seed for reproducible mock behaviour (default: None)
+        prompt_token_budgets: Estimated-token budget per generation type; prompts over
+            budget have context, name lists or conversation history trimmed
+            (default: DEFAULT_PROMPT_TOKEN_BUDGETS)
         location_generation_prompt: Prompt template for location generation
     """
 
@@ -514,6 +542,16 @@ class AIConfig:
     cache_file: Optional[str] = None
     ollama_base_url: Optional[str] = None
     enable_streaming: bool = False
+    mock_latency_ms: float = 0.0
+    mock_latency_jitter_ms: float = 0.0
+    mock_latency_distribution: str = "fixed"
+    mock_token_delay_ms: float = 0.0
+    mock_error_rate: float = 0.0
+    mock_truncation_rate: float = 0.0
+    mock_seed: Optional[int] = None
+    prompt_token_budgets: dict[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_PROMPT_TOKEN_BUDGETS)
+    )
     location_generation_prompt: str = field(default=DEFAULT_LOCATION_PROMPT)
     npc_dialogue_prompt: str = field(default=DEFAULT_NPC_DIALOGUE_PROMPT)
     enemy_generation_prompt: str = field(default=DEFAULT_ENEMY_GENERATION_PROMPT)
@@ -526,6 +564,7 @@ class AIConfig:
     npc_ascii_art_generation_prompt: str = field(default=DEFAULT_NPC_ASCII_ART_PROMPT)
     dream_generation_prompt: str = field(default=DEFAULT_DREAM_GENERATION_PROMPT)
     whisper_generation_prompt: str = field(default=DEFAULT_WHISPER_GENERATION_PROMPT)
+    banter_generation_prompt: str = field(default=DEFAULT_BANTER_GENERATION_PROMPT)
     world_context_prompt: str = field(default=DEFAULT_WORLD_CONTEXT_PROMPT)
     region_context_prompt: str = field(default=DEFAULT_REGION_CONTEXT_PROMPT)
     location_prompt_minimal: str = field(default=DEFAULT_LOCATION_PROMPT_MINIMAL)
@@ -558,6 +597,22 @@ class AIConfig:
         if self.retry_delay <= 0:
             raise AIConfigError("retry_delay must be positive")
 
+        # Validate mock provider settings
+        if self.mock_latency_ms < 0 or self.mock_latency_jitter_ms < 0 or self.mock_token_delay_ms < 0:
+            raise AIConfigError("mock latency settings must be non-negative")
+        if self.mock_latency_distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise AIConfigError(
+                "mock_latency_distribution must be 'fixed', 'uniform', 'normal', or 'lognormal'"
+            )
+        if not (0.0 <= self.mock_error_rate <= 1.0):
+            raise AIConfigError("mock_error_rate must be between 0.0 and 1.0")
+        if not (0.0 <= self.mock_truncation_rate <= 1.0):
+            raise AIConfigError("mock_truncation_rate must be between 0.0 and 1.0")
+
+        # Validate prompt budgets
+        if any(budget <= 0 for budget in self.prompt_token_budgets.values()):
+            raise AIConfigError("prompt_token_budgets values must be positive")
+
         # Set default cache_file when caching is enabled and no explicit path provided
         if self.enable_caching and self.cache_file is None:
             self.cache_file = os.path.expanduser("~/.cli_rpg/cache/ai_cache.json")
@@ -579,6 +634,13 @@ class AIConfig:
             AI_ENABLE_CACHING: Enable caching (true/false)
             AI_CACHE_TTL: Cache TTL in seconds
             AI_ENABLE_STREAMING: Enable LLM streaming for text generation (true/false)
+            AI_MOCK_LATENCY_MS: Mock provider mean latency in milliseconds
+            AI_MOCK_LATENCY_JITTER_MS: Mock provider latency spread in milliseconds
+            AI_MOCK_LATENCY_DISTRIBUTION: Mock latency distribution (fixed/uniform/normal/lognormal)
+            AI_MOCK_TOKEN_DELAY_MS: Mock provider delay between streamed tokens
+            AI_MOCK_ERROR_RATE: Share of mock requests that fail (0.0-1.0)
+            AI_MOCK_TRUNCATION_RATE: Share of mock responses that are truncated (0.0-1.0)
+            AI_MOCK_SEED: RNG seed for the mock provider
 
         Provider selection priority:
         1. If AI_PROVIDER is set, use that provider (must have corresponding API key)
@@ -614,8 +676,15 @@ class AIConfig:
                 provider = "ollama"
                 api_key = "ollama"  # Placeholder for OpenAI client
                 ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
+            elif explicit_provider == "mock":
+                # Local mock provider for offline load testing, no API key required
+                provider = "mock"
+                api_key = "mock"
             else:
-                raise AIConfigError(f"Invalid AI_PROVIDER: {explicit_provider}. Must be 'openai', 'anthropic', or 'ollama'")
+                raise AIConfigError(
+                    f"Invalid AI_PROVIDER: {explicit_provider}. "
+                    "Must be 'openai', 'anthropic', 'ollama', or 'mock'"
+                )
         elif anthropic_key:
             # Prefer Anthropic when both keys are available
             provider = "anthropic"
@@ -632,6 +701,8 @@ class AIConfig:
         elif provider == "ollama":
             # Check for OLLAMA_MODEL first, then AI_MODEL, then default
             default_model = os.getenv("OLLAMA_MODEL", "llama3.2")
+        elif provider == "mock":
+            default_model = "mock"
         else:
             default_model = "gpt-3.5-turbo"
 
@@ -650,6 +721,7 @@ class AIConfig:
         cache_ttl = int(os.getenv("AI_CACHE_TTL", "3600"))
         cache_file = os.getenv("AI_CACHE_FILE")  # None if not set, __post_init__ will set default
         enable_streaming = os.getenv("AI_ENABLE_STREAMING", "false").lower() == "true"
+        mock_seed_env = os.getenv("AI_MOCK_SEED")
 
         return cls(
             api_key=api_key,
@@ -664,7 +736,14 @@ class AIConfig:
             cache_ttl=cache_ttl,
             cache_file=cache_file,
             ollama_base_url=ollama_base_url,
-            enable_streaming=enable_streaming
+            enable_streaming=enable_streaming,
+            mock_latency_ms=float(os.getenv("AI_MOCK_LATENCY_MS", "0")),
+            mock_latency_jitter_ms=float(os.getenv("AI_MOCK_LATENCY_JITTER_MS", "0")),
+            mock_latency_distribution=os.getenv("AI_MOCK_LATENCY_DISTRIBUTION", "fixed").lower(),
+            mock_token_delay_ms=float(os.getenv("AI_MOCK_TOKEN_DELAY_MS", "0")),
+            mock_error_rate=float(os.getenv("AI_MOCK_ERROR_RATE", "0")),
+            mock_truncation_rate=float(os.getenv("AI_MOCK_TRUNCATION_RATE", "0")),
+            mock_seed=int(mock_seed_env) if mock_seed_env else None,
         )
     
     def to_dict(self) -> dict:
@@ -687,6 +766,14 @@ class AIConfig:
             "cache_file": self.cache_file,
             "ollama_base_url": self.ollama_base_url,
             "enable_streaming": self.enable_streaming,
+            "mock_latency_ms": self.mock_latency_ms,
+            "mock_latency_jitter_ms": self.mock_latency_jitter_ms,
+            "mock_latency_distribution": self.mock_latency_distribution,
+            "mock_token_delay_ms": self.mock_token_delay_ms,
+            "mock_error_rate": self.mock_error_rate,
+            "mock_truncation_rate": self.mock_truncation_rate,
+            "mock_seed": self.mock_seed,
+            "prompt_token_budgets": dict(self.prompt_token_budgets),
             "location_generation_prompt": self.location_generation_prompt,
             "npc_dialogue_prompt": self.npc_dialogue_prompt,
             "enemy_generation_prompt": self.enemy_generation_prompt,
@@ -699,6 +786,7 @@ class AIConfig:
             "npc_ascii_art_generation_prompt": self.npc_ascii_art_generation_prompt,
             "dream_generation_prompt": self.dream_generation_prompt,
             "whisper_generation_prompt": self.whisper_generation_prompt,
+            "banter_generation_prompt": self.banter_generation_prompt,
             "world_context_prompt": self.world_context_prompt,
             "region_context_prompt": self.region_context_prompt,
             "location_prompt_minimal": self.location_prompt_minimal,
@@ -733,6 +821,16 @@ class AIConfig:
             cache_file=data.get("cache_file"),
             ollama_base_url=data.get("ollama_base_url"),
             enable_streaming=data.get("enable_streaming", False),
+            mock_latency_ms=data.get("mock_latency_ms", 0.0),
+            mock_latency_jitter_ms=data.get("mock_latency_jitter_ms", 0.0),
+            mock_latency_distribution=data.get("mock_latency_distribution", "fixed"),
+            mock_token_delay_ms=data.get("mock_token_delay_ms", 0.0),
+            mock_error_rate=data.get("mock_error_rate", 0.0),
+            mock_truncation_rate=data.get("mock_truncation_rate", 0.0),
+            mock_seed=data.get("mock_seed"),
+            prompt_token_budgets=data.get(
+                "prompt_token_budgets", dict(DEFAULT_PROMPT_TOKEN_BUDGETS)
+            ),
             location_generation_prompt=data.get("location_generation_prompt", DEFAULT_LOCATION_PROMPT),
             npc_dialogue_prompt=data.get("npc_dialogue_prompt", DEFAULT_NPC_DIALOGUE_PROMPT),
             enemy_generation_prompt=data.get("enemy_generation_prompt", DEFAULT_ENEMY_GENERATION_PROMPT),
@@ -755,6 +853,9 @@ class AIConfig:
             whisper_generation_prompt=data.get(
                 "whisper_generation_prompt", DEFAULT_WHISPER_GENERATION_PROMPT
             ),
+            banter_generation_prompt=data.get(
+                "banter_generation_prompt", DEFAULT_BANTER_GENERATION_PROMPT
+            ),
             world_context_prompt=data.get(
                 "world_context_prompt", DEFAULT_WORLD_CONTEXT_PROMPT
             ),
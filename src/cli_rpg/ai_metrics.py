@@ -0,0 +1,328 @@
+"""In-process metrics for AI generation calls.
+
+This module provides AIMetrics, a thread-safe registry that AIService uses to
+record, per generation type (location, area, npc, quest, room, whisper, ...):
+- call counts, failures and coalesced (shared in-flight) calls
+- a latency histogram with fixed millisecond buckets
+- prompt/completion token counts from provider usage fields
+- API-level retries and parse/validation retries
+- cache hits and misses
+
+The registry is surfaced through the `ai-stats` command, an `ai_metrics`
+JSON-mode event and a session-end entry in the gameplay log, so the
+generation paths worth batching or caching can be identified.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last
+# bucket collects everything slower than the final bound.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Approximate characters per token, used when a provider reports no usage
+# (e.g. streamed responses)
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class GenerationStats:
+    """Accumulated metrics for a single generation type.
+
+    Attributes:
+        calls: Provider calls made (including failed ones)
+        failures: Provider calls that raised after exhausting retries
+        coalesced: Calls served by sharing an identical in-flight request
+        api_retries: API-level retry attempts (timeouts, rate limits, errors)
+        parse_retries: Regenerations after parse/validation failures
+        cache_hits: Lookups answered from the response cache
+        cache_misses: Lookups that required a provider call
+        prompt_tokens: Prompt tokens reported (or estimated) for calls
+        completion_tokens: Completion tokens reported (or estimated) for calls
+        total_latency_ms: Sum of call latencies in milliseconds
+        max_latency_ms: Slowest call latency in milliseconds
+        latency_histogram: Call counts per LATENCY_BUCKETS_MS bucket (+ overflow)
+    """
+
+    calls: int = 0
+    failures: int = 0
+    coalesced: int = 0
+    api_retries: int = 0
+    parse_retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    @property
+    def mean_latency_ms(self) -> float:
+        """Average call latency in milliseconds (0.0 with no calls)."""
+        return self.total_latency_ms / self.calls if self.calls else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> Optional[float]:
+        """Share of cache lookups that hit, or None if no lookups were made."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def add_latency(self, latency_ms: float) -> None:
+        """Record one call latency in the histogram.
+
+        Args:
+            latency_ms: Call duration in milliseconds
+        """
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.latency_histogram[index] += 1
+                return
+        self.latency_histogram[-1] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize stats to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary of counters, derived ratios and the latency histogram
+        """
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        hit_ratio = self.cache_hit_ratio
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "coalesced": self.coalesced,
+            "api_retries": self.api_retries,
+            "parse_retries": self.parse_retries,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": round(hit_ratio, 3) if hit_ratio is not None else None,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+            "mean_latency_ms": round(self.mean_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "latency_histogram": dict(zip(labels, self.latency_histogram)),
+        }
+
+
+@dataclass
+class _ActiveCall:
+    """Per-thread record for the provider call currently in progress."""
+
+    generation_type: str
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+
+
+class AIMetrics:
+    """Thread-safe registry of per-generation-type AI call metrics.
+
+    Provider calls are wrapped with track_call(); code running inside the
+    provider call (on the same thread) reports token usage and retries via
+    record_usage() and record_api_retry() without needing to know the
+    generation type.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._stats: dict[str, GenerationStats] = {}
+        self._local = threading.local()
+        self.started_at = time.time()
+
+    def _get(self, generation_type: str) -> GenerationStats:
+        """Return stats for a type, creating them if needed (lock must be held)."""
+        stats = self._stats.get(generation_type)
+        if stats is None:
+            stats = GenerationStats()
+            self._stats[generation_type] = stats
+        return stats
+
+    @contextmanager
+    def track_call(self, generation_type: str, prompt: str = "") -> Iterator[_ActiveCall]:
+        """Measure one provider call for a generation type.
+
+        Token usage reported via record_usage() during the call is attributed
+        to it; when no usage is reported, tokens are estimated from text length.
+
+        Args:
+            generation_type: Type of content being generated
+            prompt: Prompt text, used for token estimation
+
+        Yields:
+            The active call record
+        """
+        active = _ActiveCall(generation_type)
+        previous = getattr(self._local, "active", None)
+        self._local.active = active
+        self._local.last_type = generation_type
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield active
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._local.active = previous
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            prompt_tokens = active.prompt_tokens
+            if prompt_tokens is None:
+                prompt_tokens = len(prompt) // CHARS_PER_TOKEN
+            with self._lock:
+                stats = self._get(generation_type)
+                stats.calls += 1
+                if failed:
+                    stats.failures += 1
+                stats.add_latency(latency_ms)
+                stats.prompt_tokens += prompt_tokens
+                stats.completion_tokens += active.completion_tokens or 0
+
+    def record_usage(self, prompt_tokens: Any, completion_tokens: Any) -> None:
+        """Attribute provider-reported token usage to the active call.
+
+        Non-integer values (e.g. missing usage fields) are ignored.
+
+        Args:
+            prompt_tokens: Prompt/input tokens reported by the provider
+            completion_tokens: Completion/output tokens reported by the provider
+        """
+        active: Optional[_ActiveCall] = getattr(self._local, "active", None)
+        if active is None:
+            return
+        if isinstance(prompt_tokens, int) and not isinstance(prompt_tokens, bool):
+            active.prompt_tokens = prompt_tokens
+        if isinstance(completion_tokens, int) and not isinstance(completion_tokens, bool):
+            active.completion_tokens = completion_tokens
+
+    def record_completion_text(self, text: str) -> None:
+        """Estimate completion tokens for the active call if none were reported.
+
+        Args:
+            text: Response text of the active call
+        """
+        active: Optional[_ActiveCall] = getattr(self._local, "active", None)
+        if active is not None and active.completion_tokens is None:
+            active.completion_tokens = len(text) // CHARS_PER_TOKEN
+
+    def record_api_retry(self) -> None:
+        """Count an API-level retry for the active call's generation type."""
+        active: Optional[_ActiveCall] = getattr(self._local, "active", None)
+        generation_type = active.generation_type if active else "default"
+        with self._lock:
+            self._get(generation_type).api_retries += 1
+
+    def record_parse_retry(self) -> None:
+        """Count a parse/validation retry for this thread's last generation type."""
+        generation_type = getattr(self._local, "last_type", "default")
+        with self._lock:
+            self._get(generation_type).parse_retries += 1
+
+    def record_coalesced(self, generation_type: str) -> None:
+        """Count a call that shared an identical in-flight request.
+
+        Args:
+            generation_type: Type of content being generated
+        """
+        with self._lock:
+            self._get(generation_type).coalesced += 1
+
+    def record_cache(self, generation_type: str, hit: bool) -> None:
+        """Count a cache lookup.
+
+        Args:
+            generation_type: Type of content being generated
+            hit: True if the lookup was answered from cache
+        """
+        with self._lock:
+            stats = self._get(generation_type)
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def get(self, generation_type: str) -> GenerationStats:
+        """Return a copy of the stats for one generation type.
+
+        Args:
+            generation_type: Type of content generated
+
+        Returns:
+            GenerationStats copy (all zero if the type was never recorded)
+        """
+        with self._lock:
+            stats = self._stats.get(generation_type, GenerationStats())
+            return GenerationStats(**{
+                **stats.__dict__,
+                "latency_histogram": list(stats.latency_histogram),
+            })
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with per-type stats and session totals
+        """
+        with self._lock:
+            by_type = {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+        totals = {
+            key: sum(entry[key] for entry in by_type.values())
+            for key in (
+                "calls", "failures", "coalesced", "api_retries", "parse_retries",
+                "cache_hits", "cache_misses", "prompt_tokens", "completion_tokens",
+                "total_tokens",
+            )
+        }
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "totals": totals,
+            "by_type": by_type,
+        }
+
+    def format_report(self) -> str:
+        """Format metrics as a human-readable table.
+
+        Returns:
+            Multi-line report string
+        """
+        snapshot = self.snapshot()
+        by_type = snapshot["by_type"]
+        if not by_type:
+            return "No AI generation calls recorded this session."
+
+        lines = [
+            "=== AI Generation Stats ===",
+            f"{'Type':<14}{'Calls':>6}{'Fail':>6}{'Retry':>7}{'Cache':>8}"
+            f"{'Tokens':>9}{'Avg ms':>9}{'Max ms':>9}",
+        ]
+        for name, stats in by_type.items():
+            ratio = stats["cache_hit_ratio"]
+            cache = f"{ratio:.0%}" if ratio is not None else "-"
+            retries = stats["api_retries"] + stats["parse_retries"]
+            lines.append(
+                f"{name:<14}{stats['calls']:>6}{stats['failures']:>6}{retries:>7}{cache:>8}"
+                f"{stats['total_tokens']:>9}{stats['mean_latency_ms']:>9.0f}"
+                f"{stats['max_latency_ms']:>9.0f}"
+            )
+        totals = snapshot["totals"]
+        lines.append(
+            f"Total: {totals['calls']} calls, {totals['total_tokens']} tokens "
+            f"({totals['prompt_tokens']} prompt / {totals['completion_tokens']} completion), "
+            f"{totals['coalesced']} coalesced"
+        )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
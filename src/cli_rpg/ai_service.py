@@ -5,6 +5,7 @@ import hashlib
 import logging
 import random
 import sys
+import threading
 import time
 from enum import Enum, auto
 from typing import Any, Callable, Optional, TextIO, TYPE_CHECKING
@@ -27,6 +28,15 @@ except ImportError:  # pragma: no cover
     ANTHROPIC_AVAILABLE = False  # pragma: no cover
 
 from cli_rpg.ai_config import AIConfig
+from cli_rpg.ai_metrics import AIMetrics
+from cli_rpg.json_stream import StreamingFieldWriter
+from cli_rpg.mock_llm import MockLLMClient, MockLLMSettings
+from cli_rpg.prompt_budget import (
+    MAX_COMPRESSION_LEVEL,
+    CompressedContext,
+    PromptBudget,
+    estimate_tokens,
+)
 from cli_rpg.models.location import Location
 from cli_rpg.models.world_context import DEFAULT_THEME_ESSENCES, WorldContext
 from cli_rpg.models.region_context import RegionContext
@@ -127,6 +137,9 @@ OBTAINABLE_ITEMS: frozenset[str] = frozenset({
     "iron armor",  # crafted version (same name as loot)
 })
 
+# Shown on the terminal when a stream dies part way and the text is regenerated
+STREAM_INTERRUPTED_NOTICE = "[Connection interrupted - regenerating...]"
+
 
 class AIServiceError(Exception):
     """Base exception for AI service errors."""
@@ -143,6 +156,17 @@ class AITimeoutError(AIServiceError):
     pass
 
 
+class _InFlightCall:
+    """A provider call in progress that concurrent callers can wait on."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        # Thread making the call (its own nested calls for the prompt bypass coalescing)
+        self.owner = threading.get_ident()
+
+
 class AIService:
     """Service for generating game content using LLMs.
 
@@ -157,6 +181,9 @@ class AIService:
     # Type alias for content logger callback
     ContentLoggerCallback = Callable[[str, str, Any, str], None]
 
+    # Type alias for narrative stream handler: (text_delta, done) -> None
+    NarrativeStreamCallback = Callable[[str, bool], None]
+
     def __init__(
         self,
         config: AIConfig,
@@ -176,6 +203,16 @@ class AIService:
         self.provider = config.provider
         self._content_logger = content_logger
 
+        # Optional sink for streamed narrative text (e.g. JSON mode partial events).
+        # When None, streamed narrative is written to stdout if effects are enabled.
+        self.narrative_stream_handler: Optional["AIService.NarrativeStreamCallback"] = None
+
+        # Per-generation-type call, token, latency, retry and cache metrics
+        self.metrics = AIMetrics()
+
+        # Per-type prompt token budgets and per-region compressed context cache
+        self.prompt_budget = PromptBudget(config.prompt_token_budgets)
+
         # Initialize the appropriate client based on provider
         if self.provider == "anthropic":
             if not ANTHROPIC_AVAILABLE:
@@ -188,6 +225,17 @@ class AIService:
             # Ollama uses OpenAI-compatible API with custom base_url
             base_url = config.ollama_base_url or "http://localhost:11434/v1"
             self.client = OpenAI(api_key=config.api_key, base_url=base_url)
+        elif self.provider == "mock":
+            # Local mock provider implements the OpenAI client interface
+            self.client = MockLLMClient(MockLLMSettings(
+                latency_ms=config.mock_latency_ms,
+                latency_jitter_ms=config.mock_latency_jitter_ms,
+                latency_distribution=config.mock_latency_distribution,
+                token_delay_ms=config.mock_token_delay_ms,
+                error_rate=config.mock_error_rate,
+                truncation_rate=config.mock_truncation_rate,
+                seed=config.mock_seed,
+            ))
         else:
             # Default to OpenAI
             self.client = OpenAI(api_key=config.api_key)
@@ -195,6 +243,14 @@ class AIService:
         # Initialize cache if enabled
         # Cache can hold dict (for single location) or list (for area locations)
         self._cache: dict[str, tuple[Any, float]] = {}  # key -> (data, timestamp)
+        # World-build, flavor and interior threads share the cache: _cache_lock
+        # guards the dict, _cache_save_lock orders snapshots written to disk
+        self._cache_lock = threading.Lock()
+        self._cache_save_lock = threading.Lock()
+
+        # In-flight provider calls keyed by prompt hash (single-flight coalescing)
+        self._inflight: dict[str, _InFlightCall] = {}
+        self._inflight_lock = threading.Lock()
 
         # Load persisted cache from disk if caching is enabled
         if self.config.enable_caching:
@@ -241,6 +297,7 @@ class AIService:
         # Check cache if enabled
         if self.config.enable_caching:
             cached_result = self._get_cached(prompt)
+            self.metrics.record_cache("location", cached_result is not None)
             if cached_result is not None:
                 return cached_result
 
@@ -313,10 +370,15 @@ class AIService:
     def _call_llm(self, prompt: str, generation_type: str = "default") -> str:
         """Call LLM API with retry logic and progress indication.
 
+        Identical prompts issued concurrently (e.g. by the background generation
+        worker and the foreground move) are coalesced: the first caller makes the
+        API call and later callers wait for and share its response.
+
         Args:
             prompt: The prompt to send to the LLM
             generation_type: Type of content being generated for progress messages
-                            (location, npc, enemy, lore, area, default)
+                            and metrics (location, room, npc, enemy, lore, area,
+                            world_context, region_context, default)
 
         Returns:
             Response text from the LLM
@@ -325,14 +387,86 @@ class AIService:
             AIServiceError: If API call fails after retries
             AITimeoutError: If request times out
         """
-        with progress_indicator(generation_type):
-            if self.provider == "anthropic":
-                return self._call_anthropic(prompt)
-            elif self.provider == "ollama":
-                # Ollama uses OpenAI-compatible API
-                return self._call_openai(prompt, is_ollama=True)
-            else:
-                return self._call_openai(prompt)
+        return self._coalesced(
+            prompt, generation_type, lambda: self._call_provider_tracked(prompt, generation_type)
+        )
+
+    def _coalesced(self, prompt: str, generation_type: str, make_call: Callable[[], str]) -> str:
+        """Run make_call once for concurrent callers with the same prompt.
+
+        The first caller (the owner) runs make_call; callers arriving while it
+        is in flight wait and receive its final text or error. Calls from the
+        owner's own thread (e.g. a streaming call falling back to _call_llm)
+        run directly instead of waiting on themselves.
+
+        Args:
+            prompt: The prompt (its hash is the in-flight key)
+            generation_type: Type of content being generated (progress and metrics)
+            make_call: Performs the call and returns the response text
+
+        Returns:
+            Response text from the LLM
+        """
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            is_owner = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._inflight[key] = call
+
+        if not is_owner:
+            if call.owner == threading.get_ident():
+                return make_call()
+            # Another thread is already making this exact call - share its result
+            logger.debug(f"Coalescing duplicate {generation_type} request {key[:16]}")
+            self.metrics.record_coalesced(generation_type)
+            with progress_indicator(generation_type):
+                call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if call.result is not None else ""
+
+        try:
+            call.result = make_call()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.event.set()
+
+    def _call_provider_tracked(self, prompt: str, generation_type: str) -> str:
+        """Call the provider with a progress indicator, recording metrics."""
+        with progress_indicator(generation_type), \
+                self.metrics.track_call(generation_type, prompt):
+            result = self._call_provider(prompt)
+            self.metrics.record_completion_text(result)
+        return result
+
+    def _call_provider(self, prompt: str) -> str:
+        """Dispatch a non-streaming call to the configured provider.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            Response text from the LLM
+
+        Raises:
+            AIServiceError: If API call fails after retries
+            AITimeoutError: If request times out
+        """
+        if self.provider == "anthropic":
+            return self._call_anthropic(prompt)
+        elif self.provider == "ollama":
+            # Ollama uses OpenAI-compatible API
+            return self._call_openai(prompt, is_ollama=True)
+        else:
+            # OpenAI and the local mock provider share the OpenAI client interface
+            return self._call_openai(prompt)
 
     def _log_content(
         self,
@@ -374,6 +508,8 @@ class AIService:
         last_error: Optional[Exception] = None
 
         for attempt in range(self.config.max_retries + 1):
+            if attempt > 0:
+                self.metrics.record_api_retry()
             try:
                 response = self.client.chat.completions.create(
                     model=self.config.model,
@@ -384,6 +520,13 @@ class AIService:
                     max_tokens=self.config.max_tokens
                 )
 
+                usage = getattr(response, "usage", None)
+                if usage is not None:
+                    self.metrics.record_usage(
+                        getattr(usage, "prompt_tokens", None),
+                        getattr(usage, "completion_tokens", None),
+                    )
+
                 content = response.choices[0].message.content
                 return content if content is not None else ""
 
@@ -446,6 +589,8 @@ class AIService:
         last_error: Optional[Exception] = None
 
         for attempt in range(self.config.max_retries + 1):
+            if attempt > 0:
+                self.metrics.record_api_retry()
             try:
                 response = self.client.messages.create(
                     model=self.config.model,
@@ -455,6 +600,13 @@ class AIService:
                     max_tokens=self.config.max_tokens
                 )
 
+                usage = getattr(response, "usage", None)
+                if usage is not None:
+                    self.metrics.record_usage(
+                        getattr(usage, "input_tokens", None),
+                        getattr(usage, "output_tokens", None),
+                    )
+
                 # Extract text from first content block (must be TextBlock)
                 first_block = response.content[0]
                 if TextBlock is not None and isinstance(first_block, TextBlock):
@@ -616,16 +768,22 @@ class AIService:
     def _call_llm_streamable(
         self,
         prompt: str,
-        output: Optional[TextIO] = None
+        output: Optional[TextIO] = None,
+        generation_type: str = "default"
     ) -> str:
         """Call LLM with streaming if enabled, otherwise with progress indicator.
 
         Checks config.enable_streaming and effects_enabled() to determine
-        whether to use streaming. Falls back to non-streaming on errors.
+        whether to use streaming. Falls back to non-streaming on errors; if
+        tokens were already written, the partial line is ended with
+        STREAM_INTERRUPTED_NOTICE before the fallback call.
+        Streamed calls share _call_llm's in-flight coalescing: identical
+        concurrent requests wait for this call and receive its final text.
 
         Args:
             prompt: The prompt to send to the LLM
             output: Output stream for streaming tokens (defaults to sys.stdout)
+            generation_type: Type of content being generated (for progress and metrics)
 
         Returns:
             Response text from the LLM
@@ -634,17 +792,151 @@ class AIService:
             AIServiceError: If API call fails
             AITimeoutError: If request times out
         """
-        # Use streaming only if enabled in config AND effects are enabled
-        if self.config.enable_streaming and effects_enabled():
+        # Use streaming only if enabled in config AND effects are enabled, and
+        # never from background threads (their output would hit the prompt)
+        if (
+            self.config.enable_streaming
+            and effects_enabled()
+            and threading.current_thread() is threading.main_thread()
+        ):
+            if output is None:
+                output = sys.stdout
+            stream_output = output
+
+            def _write_token(text: str) -> None:
+                stream_output.write(text)
+                stream_output.flush()
+
+            def _stream() -> str:
+                writer = StreamingFieldWriter(on_delta=_write_token, fields=None)
+                try:
+                    return self._call_llm_streaming_tracked(
+                        prompt, writer, generation_type  # type: ignore[arg-type]
+                    )
+                except Exception as e:
+                    # Fall back to non-streaming on any streaming error
+                    logger.warning(f"Streaming failed, falling back to non-streaming: {e}")
+                    if writer.delivered:
+                        # End the partial line and mark it as superseded
+                        _write_token(f"\n{STREAM_INTERRUPTED_NOTICE}\n")
+                    return self._call_llm(prompt, generation_type=generation_type)
+
+            # Concurrent identical requests share this call (and get its final text)
+            return self._coalesced(prompt, generation_type, _stream)
+        else:
+            # Use regular non-streaming call with progress indicator
+            return self._call_llm(prompt, generation_type=generation_type)
+
+    def _call_llm_streaming_tracked(
+        self,
+        prompt: str,
+        output: Optional[TextIO],
+        generation_type: str
+    ) -> str:
+        """Call _call_llm_streaming, recording the call in the metrics registry.
+
+        Streamed responses carry no provider usage fields, so token counts are
+        estimated from the prompt and response length.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            output: Output stream for tokens
+            generation_type: Type of content being generated
+
+        Returns:
+            Complete response text after streaming finishes
+        """
+        with self.metrics.track_call(generation_type, prompt):
+            response_text = self._call_llm_streaming(prompt, output)
+            self.metrics.record_completion_text(response_text)
+        return response_text
+
+    def _get_narrative_stream_handler(self) -> Optional["AIService.NarrativeStreamCallback"]:
+        """Return the handler for streamed narrative text, if streaming applies.
+
+        Streaming only applies when enabled in config and the call is made from
+        the main thread (background pre-generation must never write to the
+        terminal). A configured narrative_stream_handler takes precedence;
+        otherwise text goes to stdout when effects are enabled.
+
+        Returns:
+            Handler callable or None if narrative should not be streamed
+        """
+        if not self.config.enable_streaming:
+            return None
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        if self.narrative_stream_handler is not None:
+            return self.narrative_stream_handler
+        if not effects_enabled():
+            return None
+
+        def _write_to_stdout(text: str, done: bool) -> None:
+            sys.stdout.write("\n" if done else text)
+            sys.stdout.flush()
+
+        return _write_to_stdout
+
+    def _call_llm_narrative_streamable(
+        self,
+        prompt: str,
+        generation_type: str = "default",
+        fields: Optional[tuple[str, ...]] = ("description",),
+    ) -> str:
+        """Call LLM, streaming narrative fields of the response as they arrive.
+
+        For structured (JSON) generations, an incremental parser extracts the
+        first value of the given fields (e.g. "description") and hands it to the
+        narrative stream handler while the rest of the object is still arriving.
+        The complete response text is returned for normal parsing. Pass
+        fields=None for plain-text responses to stream the text unchanged.
+
+        Falls back to _call_llm (with progress indicator) when streaming is
+        disabled or fails. If the stream fails after text was shown, the
+        handler is sent done=True first; JSON consumers should treat the
+        regular narrative message that follows as replacing the partials.
+        Identical concurrent requests are coalesced with the streamed call.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            generation_type: Type of content being generated
+            fields: JSON field names to stream, or None to stream raw text
+
+        Returns:
+            Complete response text from the LLM
+
+        Raises:
+            AIServiceError: If API call fails
+            AITimeoutError: If request times out
+        """
+        handler = self._get_narrative_stream_handler()
+        if handler is None:
+            return self._call_llm(prompt, generation_type=generation_type)
+
+        def _stream() -> str:
+            writer = StreamingFieldWriter(
+                on_delta=lambda text: handler(text, False),
+                on_complete=lambda: handler("", True),
+                fields=fields,
+            )
             try:
-                return self._call_llm_streaming(prompt, output)
+                response_text = self._call_llm_streaming_tracked(
+                    prompt, writer, generation_type  # type: ignore[arg-type]
+                )
             except Exception as e:
-                # Fall back to non-streaming on any streaming error
                 logger.warning(f"Streaming failed, falling back to non-streaming: {e}")
-                return self._call_llm(prompt)
-        else:
-            # Use regular non-streaming call with progress indicator
-            return self._call_llm(prompt)
+                if writer.delivered:
+                    # Finish the partial narrative so the fallback text starts cleanly
+                    writer.close()
+                    if self.narrative_stream_handler is None:
+                        sys.stdout.write(f"{STREAM_INTERRUPTED_NOTICE}\n")
+                        sys.stdout.flush()
+                return self._call_llm(prompt, generation_type=generation_type)
+            writer.close()
+            return response_text
+
+        # Concurrent identical requests share this call (and get its final text)
+        return self._coalesced(prompt, generation_type, _stream)
 
     def _generate_with_retry(
         self,
@@ -679,6 +971,7 @@ class AIService:
             except AIGenerationError as e:
                 last_error = e
                 if attempt < max_retries:
+                    self.metrics.record_parse_retry()
                     # Exponential backoff: 0.5s, 1s, 2s, ...
                     delay = 0.5 * (2 ** attempt)
                     logger.debug(
@@ -1024,16 +1317,18 @@ class AIService:
         """
         cache_key = hashlib.md5(prompt.encode()).hexdigest()
 
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            data, timestamp = entry
 
             # Check if cache entry is still valid
             if time.time() - timestamp < self.config.cache_ttl:
                 result: dict[str, Any] = data.copy()  # Return a copy to avoid mutations
                 return result
-            else:
-                # Cache expired, remove it
-                del self._cache[cache_key]
+            # Cache expired, remove it
+            del self._cache[cache_key]
 
         return None
     
@@ -1045,7 +1340,8 @@ class AIService:
             data: Location data to cache
         """
         cache_key = hashlib.md5(prompt.encode()).hexdigest()
-        self._cache[cache_key] = (data.copy(), time.time())
+        with self._cache_lock:
+            self._cache[cache_key] = (data.copy(), time.time())
         self._save_cache_to_file()
 
     def _load_cache_from_file(self) -> None:
@@ -1074,7 +1370,8 @@ class AIService:
                     timestamp = entry["timestamp"]
                     if current_time - timestamp < self.config.cache_ttl:
                         # Entry is still valid
-                        self._cache[key] = (entry["data"], timestamp)
+                        with self._cache_lock:
+                            self._cache[key] = (entry["data"], timestamp)
                     # Else: entry expired, don't load it
 
         except (json.JSONDecodeError, IOError, OSError) as e:
@@ -1084,7 +1381,9 @@ class AIService:
         """Persist cache to disk.
 
         Writes the in-memory cache to the cache file specified in config.
-        Creates parent directories if they don't exist.
+        Creates parent directories if they don't exist. Safe to call from
+        several threads: each save snapshots the cache under the lock and
+        replaces the file atomically, so readers never see a partial file.
         Handles file I/O errors gracefully by logging a warning.
         """
         cache_file = self.config.cache_file
@@ -1093,25 +1392,32 @@ class AIService:
 
         import os
 
-        try:
-            # Create parent directories if needed
-            cache_dir = os.path.dirname(cache_file)
-            if cache_dir:
-                os.makedirs(cache_dir, exist_ok=True)
-
-            # Convert cache to serializable format
-            serializable_cache = {}
-            for key, (data, timestamp) in self._cache.items():
-                serializable_cache[key] = {
-                    "data": data,
-                    "timestamp": timestamp
-                }
-
-            with open(cache_file, 'w') as f:
-                json.dump(serializable_cache, f)
-
-        except (IOError, OSError) as e:
-            logger.warning(f"Failed to save cache to {cache_file}: {e}")
+        temp_file = f"{cache_file}.tmp"
+        # Snapshot inside the save lock so a later save never loses to an earlier one
+        with self._cache_save_lock:
+            try:
+                # Create parent directories if needed
+                cache_dir = os.path.dirname(cache_file)
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+
+                # Convert cache to serializable format
+                with self._cache_lock:
+                    serializable_cache = {
+                        key: {"data": data, "timestamp": timestamp}
+                        for key, (data, timestamp) in self._cache.items()
+                    }
+
+                with open(temp_file, 'w') as f:
+                    json.dump(serializable_cache, f)
+                os.replace(temp_file, cache_file)
+
+            except (IOError, OSError) as e:
+                logger.warning(f"Failed to save cache to {cache_file}: {e}")
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
 
     def generate_area(
         self,
@@ -1165,12 +1471,15 @@ class AIService:
         # Check cache if enabled
         if self.config.enable_caching:
             cached_result = self._get_cached_list(prompt)
+            self.metrics.record_cache("area", cached_result is not None)
             if cached_result is not None:
                 return cached_result
 
         # Define the generation function that will be retried on parse failures
         def _do_generate() -> list[dict]:
-            response_text = self._call_llm(prompt, generation_type="area")
+            response_text = self._call_llm_narrative_streamable(
+                prompt, generation_type="area"
+            )
             return self._parse_area_response(response_text, size)
 
         # Call with retry wrapper for parse/validation failures
@@ -1279,6 +1588,20 @@ Respond with valid JSON array (no additional text):
 
 Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source location."""
 
+        # Enforce the area prompt budget by keeping fewer existing location names
+        trimmed = False
+        if context_locations and self.prompt_budget.over_budget("area", prompt):
+            budget = self.prompt_budget.budget_for("area") or 0
+            allowance = budget - (estimate_tokens(prompt) - estimate_tokens(location_list))
+            kept = self.prompt_budget.fit_items(context_locations[:10], allowance)
+            prompt = prompt.replace(
+                f"Existing Locations: {location_list}",
+                f"Existing Locations: {', '.join(kept)}",
+                1,
+            )
+            trimmed = True
+        self.prompt_budget.measure("area", prompt, trimmed=trimmed)
+
         return prompt
 
     def _parse_area_response(self, response_text: str, expected_size: int) -> list[dict]:
@@ -1414,16 +1737,18 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         """
         cache_key = hashlib.md5(prompt.encode()).hexdigest()
 
-        if cache_key in self._cache:
-            data, timestamp = self._cache[cache_key]
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            data, timestamp = entry
 
             if time.time() - timestamp < self.config.cache_ttl:
                 # Deep copy the list
                 import copy
                 result: list[dict[str, Any]] = copy.deepcopy(data)
                 return result
-            else:
-                del self._cache[cache_key]
+            del self._cache[cache_key]
 
         return None
 
@@ -1436,7 +1761,8 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         """
         import copy
         cache_key = hashlib.md5(prompt.encode()).hexdigest()
-        self._cache[cache_key] = (copy.deepcopy(data), time.time())
+        with self._cache_lock:
+            self._cache[cache_key] = (copy.deepcopy(data), time.time())
         self._save_cache_to_file()
 
     def generate_npc_dialogue(
@@ -1472,7 +1798,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="npc")
 
         # Clean and validate response
         dialogue = response_text.strip().strip('"').strip("'")
@@ -1679,7 +2005,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="art")
 
         # Clean and validate response
         art = self._parse_ascii_art_response(response_text)
@@ -1775,7 +2101,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="art")
 
         # Clean and validate response
         art = self._parse_location_ascii_art_response(response_text)
@@ -2035,7 +2361,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="lore")
 
         # Clean and validate response
         lore = response_text.strip().strip('"').strip("'")
@@ -2117,6 +2443,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         # Check cache if enabled
         if self.config.enable_caching:
             cached_result = self._get_cached(prompt)
+            self.metrics.record_cache("quest", cached_result is not None)
             if cached_result is not None:
                 # Ensure quest_giver is set correctly for cached results
                 cached_result["quest_giver"] = npc_name
@@ -2358,7 +2685,9 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
             player_input=player_input
         )
 
-        response_text = self._call_llm(prompt, generation_type="npc")
+        response_text = self._call_llm_narrative_streamable(
+            prompt, generation_type="npc", fields=None
+        )
 
         # Clean and validate response
         response = response_text.strip().strip('"').strip("'")
@@ -2396,28 +2725,41 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
             Formatted prompt string
         """
         # Format conversation history
-        if conversation_history:
-            history_lines = []
-            for entry in conversation_history:
-                role = entry.get("role", "unknown")
-                content = entry.get("content", "")
-                if role == "player":
-                    history_lines.append(f"Player: {content}")
-                else:
-                    history_lines.append(f"{npc_name}: {content}")
-            formatted_history = "\n".join(history_lines)
-        else:
-            formatted_history = "(No previous conversation)"
+        history_lines = []
+        for entry in conversation_history:
+            role = entry.get("role", "unknown")
+            content = entry.get("content", "")
+            if role == "player":
+                history_lines.append(f"Player: {content}")
+            else:
+                history_lines.append(f"{npc_name}: {content}")
+
+        def _format(history_text: str) -> str:
+            return self.config.npc_conversation_prompt.format(
+                npc_name=npc_name,
+                npc_description=npc_description,
+                npc_role=npc_role,
+                theme=theme,
+                location_name=location_name or "unknown location",
+                conversation_history=history_text,
+                player_input=player_input
+            )
 
-        return self.config.npc_conversation_prompt.format(
-            npc_name=npc_name,
-            npc_description=npc_description,
-            npc_role=npc_role,
-            theme=theme,
-            location_name=location_name or "unknown location",
-            conversation_history=formatted_history,
-            player_input=player_input
-        )
+        if not history_lines:
+            prompt = _format("(No previous conversation)")
+            self.prompt_budget.measure("npc", prompt)
+            return prompt
+
+        prompt = _format("\n".join(history_lines))
+        trimmed = False
+        if self.prompt_budget.over_budget("npc", prompt):
+            # Summarize older exchanges to fit the history into the remaining budget
+            budget = self.prompt_budget.budget_for("npc") or 0
+            allowance = budget - estimate_tokens(_format(""))
+            prompt = _format(self.prompt_budget.fit_history(history_lines, allowance))
+            trimmed = True
+        self.prompt_budget.measure("npc", prompt, trimmed=trimmed)
+        return prompt
 
     def generate_npc_ascii_art(
         self,
@@ -2451,7 +2793,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="art")
 
         # Clean and validate response
         art = self._parse_npc_ascii_art_response(response_text)
@@ -2551,7 +2893,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="dream")
 
         # Clean and validate response
         dream = response_text.strip().strip('"').strip("'")
@@ -2588,7 +2930,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         )
 
         # Use streamable LLM call for text generation (streaming when enabled)
-        response_text = self._call_llm_streamable(prompt)
+        response_text = self._call_llm_streamable(prompt, generation_type="whisper")
 
         # Clean and validate response
         whisper = response_text.strip().strip('"').strip("'")
@@ -2601,6 +2943,45 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
 
         return whisper
 
+    def generate_banter(
+        self,
+        theme: str,
+        location_category: Optional[str] = None,
+        dread: int = 0
+    ) -> str:
+        """Generate a line of companion banter with AI.
+
+        Args:
+            theme: World theme (e.g., "fantasy", "sci-fi")
+            location_category: Category of the current location (e.g., "forest", "town")
+            dread: Current dread level (0-100); 50+ makes the remark uneasy
+
+        Returns:
+            Generated banter text string (10-120 chars)
+
+        Raises:
+            AIGenerationError: If generation fails or response is too short
+            AIServiceError: If API call fails
+        """
+        prompt = self.config.banter_generation_prompt.format(
+            theme=theme,
+            location_category=location_category or "wilderness",
+            mood="uneasy and nervous" if dread >= 50 else "relaxed"
+        )
+
+        response_text = self._call_llm_streamable(prompt, generation_type="banter")
+
+        # Clean and validate response
+        banter = response_text.strip().strip('"').strip("'")
+
+        if len(banter) < 10:
+            raise AIGenerationError("Generated banter too short (min 10 chars)")
+
+        if len(banter) > 120:
+            banter = banter[:117] + "..."
+
+        return banter
+
     def _build_whisper_prompt(
         self,
         theme: str,
@@ -2682,7 +3063,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         from cli_rpg.models.world_context import WorldContext
 
         prompt = self._build_world_context_prompt(theme)
-        response_text = self._call_llm(prompt, generation_type="lore")
+        response_text = self._call_llm(prompt, generation_type="world_context")
         return self._parse_world_context_response(response_text, theme)
 
     def _build_world_context_prompt(self, theme: str) -> str:
@@ -2787,7 +3168,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         from cli_rpg.models.region_context import RegionContext
 
         prompt = self._build_region_context_prompt(theme, world_context, coordinates, terrain_hint)
-        response_text = self._call_llm(prompt, generation_type="area")
+        response_text = self._call_llm(prompt, generation_type="region_context")
         return self._parse_region_context_response(response_text, coordinates)
 
     def _build_region_context_prompt(
@@ -2919,6 +3300,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         terrain_type: Optional[str] = None,
         neighboring_locations: Optional[list[dict]] = None,
         required_category: Optional[str] = None,
+        stream_narrative: bool = True,
     ) -> dict:
         """Generate a new location using layered context (Layer 3).
 
@@ -2935,6 +3317,8 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
             neighboring_locations: Optional list of dicts with name and direction for spatial coherence
             required_category: If set, the location MUST have this category
                               (e.g., "dungeon", "cave" for forced enterable locations)
+            stream_narrative: If True and streaming is enabled, stream the description
+                             to the narrative handler while the response arrives
 
         Returns:
             Dictionary with keys: name, description, category, npcs (empty list)
@@ -2958,6 +3342,7 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         # Check cache if enabled
         if self.config.enable_caching:
             cached_result = self._get_cached(prompt)
+            self.metrics.record_cache("location", cached_result is not None)
             if cached_result is not None:
                 # Ensure npcs is empty for cached results
                 cached_result["npcs"] = []
@@ -2965,7 +3350,12 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
 
         # Define the generation function that will be retried on parse failures
         def _do_generate() -> dict:
-            response_text = self._call_llm(prompt, generation_type="location")
+            if stream_narrative:
+                response_text = self._call_llm_narrative_streamable(
+                    prompt, generation_type="location"
+                )
+            else:
+                response_text = self._call_llm(prompt, generation_type="location")
             result = self._parse_location_response(response_text)
             # Override npcs with empty list (Layer 3 doesn't generate NPCs)
             result["npcs"] = []
@@ -3007,23 +3397,37 @@ Note: Use "EXISTING_WORLD" as placeholder for the connection back to the source
         # Format terrain type (source_location and direction no longer used)
         terrain_text = terrain_type if terrain_type else "wilderness"
 
-        # Format neighboring locations as comma-separated "Name (direction)" or "none yet"
-        if neighboring_locations:
-            neighbors_text = ", ".join(
-                f"{loc['name']} ({loc['direction']})" for loc in neighboring_locations
+        # Format neighboring locations as "Name (direction)" entries
+        neighbors = [
+            f"{loc['name']} ({loc['direction']})" for loc in neighboring_locations or []
+        ]
+
+        def attempts():
+            # Full context fields first, then the region's compressed context
+            # at increasing levels (fewer neighbors, shorter fields)
+            yield CompressedContext(
+                theme=world_context.theme,
+                theme_essence=world_context.theme_essence,
+                region_name=region_context.name,
+                region_theme=region_context.theme,
+            ), neighbors
+            for level in range(MAX_COMPRESSION_LEVEL + 1):
+                kept = neighbors if level == 0 else neighbors[:max(1, len(neighbors) >> level)]
+                yield self.prompt_budget.compress_context(world_context, region_context, level), kept
+
+        # Use minimal template from config, compressing only while over budget
+        for attempt, (context, kept) in enumerate(attempts()):
+            prompt = self.config.location_prompt_minimal.format(
+                theme=context.theme,
+                theme_essence=context.theme_essence,
+                region_name=context.region_name,
+                region_theme=context.region_theme,
+                terrain_type=terrain_text,
+                neighboring_locations=", ".join(kept) if kept else "none yet"
             )
-        else:
-            neighbors_text = "none yet"
-
-        # Use minimal template from config
-        prompt = self.config.location_prompt_minimal.format(
-            theme=world_context.theme,
-            theme_essence=world_context.theme_essence,
-            region_name=region_context.name,
-            region_theme=region_context.theme,
-            terrain_type=terrain_text,
-            neighboring_locations=neighbors_text
-        )
+            if not self.prompt_budget.over_budget("location", prompt):
+                break
+        trimmed = attempt > 0
 
         # Add required category enforcement if set
         if required_category:
@@ -3035,6 +3439,7 @@ Generate a {required_category} with an evocative name and description.
 The category field in your JSON response MUST be "{required_category}"."""
             prompt = prompt + category_requirement
 
+        self.prompt_budget.measure("location", prompt, trimmed=trimmed)
         return prompt
 
     def generate_npcs_for_location(
@@ -3177,8 +3582,7 @@ The category field in your JSON response MUST be "{required_category}"."""
         )
 
         try:
-            # Call LLM with progress indicator for "location" type
-            response_text = self._call_llm(prompt, generation_type="location")
+            response_text = self._call_llm(prompt, generation_type="room")
 
             # Parse response
             return self._parse_room_content_response(response_text)
@@ -3314,6 +3718,7 @@ The category field in your JSON response MUST be "{required_category}"."""
                 region_context=region_context,
                 terrain_type=terrain_type,
                 required_category=entry_required_category,
+                stream_narrative=is_entry,
             )
 
             # Layer 4: Generate NPCs for this location
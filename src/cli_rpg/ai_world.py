@@ -2,7 +2,9 @@
 
 import logging
 import random
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Optional
 from cli_rpg.ai_service import AIService
 from cli_rpg.models.location import Location
 from cli_rpg.models.npc import NPC
@@ -14,6 +16,7 @@ from cli_rpg.models.quest import Quest, ObjectiveType
 from cli_rpg.world_grid import WorldGrid, SubGrid, DIRECTION_OFFSETS, get_subgrid_bounds
 from cli_rpg.world_tiles import ENTERABLE_CATEGORIES
 from cli_rpg.location_art import get_fallback_location_ascii_art
+from cli_rpg.exit_graph import get_exit_graph
 from cli_rpg.fallback_content import FallbackContentProvider
 from cli_rpg.procedural_interiors import RoomType
 
@@ -28,6 +31,9 @@ SAFE_ZONE_CATEGORIES = {"town", "village", "settlement"}
 # Categories that should have bosses in deepest room
 BOSS_CATEGORIES = frozenset({"dungeon", "cave", "ruins"})
 
+# Maximum concurrent AI requests while building the initial world
+WORLD_BUILD_WORKERS = 4
+
 
 def _find_furthest_room(
     placed_locations: dict,
@@ -1128,11 +1134,12 @@ def _generate_fallback_interior(location: Location) -> list[dict]:
             (RoomType.CHAMBER, (0, 1)),
         ]
 
-    # Generate content for each room using FallbackContentProvider
+    # Generate content for all rooms in one FallbackContentProvider call
+    contents = provider.get_room_contents(
+        (room_type, category) for room_type, _ in room_layout
+    )
     result = []
-    for idx, (room_type, rel_coords) in enumerate(room_layout):
-        content = provider.get_room_content(room_type, category)
-
+    for idx, ((_, rel_coords), content) in enumerate(zip(room_layout, contents)):
         # First room uses location name as prefix
         if idx == 0:
             name = f"{location.name} Entrance"
@@ -1149,67 +1156,80 @@ def _generate_fallback_interior(location: Location) -> list[dict]:
     return result
 
 
-def create_ai_world(
-    ai_service: AIService,
-    theme: str = "fantasy",
-    starting_location_name: str = "Town Square",
-    initial_size: int = 3
-) -> tuple[dict[str, Location], str]:
-    """Create an AI-generated world using grid-based placement.
+def _location_from_data(location_data: dict) -> Location:
+    """Create a Location from AI location data, without ASCII art or NPCs.
 
     Args:
-        ai_service: AIService instance for generating locations
-        theme: World theme (e.g., "fantasy", "sci-fi")
-        starting_location_name: Name for the starting location
-        initial_size: Target number of locations to generate
+        location_data: Location dictionary from AIService.generate_location
 
     Returns:
-        Tuple of (world, starting_location) where:
-        - world: Dictionary mapping location names to Location instances
-        - starting_location: Actual name of the starting location (may differ from parameter)
+        Location with hierarchy fields inferred from its category
 
     Raises:
-        AIServiceError: If generation fails
-        ValueError: If generated locations fail validation
+        KeyError: If name or description is missing
+        ValueError: If the location fails validation
     """
-    grid = WorldGrid()
+    category = location_data.get("category")
+    is_overworld, is_safe_zone = _infer_hierarchy_from_category(category)
+    # Note: No connections field - navigation is coordinate-based via WorldGrid
+    return Location(
+        name=location_data["name"],
+        description=location_data["description"],
+        category=category,
+        is_overworld=is_overworld,
+        is_safe_zone=is_safe_zone
+    )
 
-    # Track coordinates for each location we place
-    coord_queue = []  # List of (name, x, y, direction, suggested_target)
 
-    # Generate starting location
-    logger.info(f"Generating starting location: {starting_location_name}")
-    starting_data = ai_service.generate_location(
-        theme=theme,
-        context_locations=[],
-        source_location=None,
-        direction=None
-    )
+def _submit_ascii_art(
+    executor: ThreadPoolExecutor,
+    ai_service: AIService,
+    location: Location,
+    theme: str
+) -> Future:
+    """Start generating ASCII art for a location on the executor.
+
+    Args:
+        executor: Executor running the world build
+        ai_service: AIService instance
+        location: Location to generate art for
+        theme: World theme
 
-    # Generate ASCII art for starting location
-    starting_ascii_art = _generate_location_ascii_art(
+    Returns:
+        Future resolving to the ASCII art string (never raises; falls back
+        to template art on AI failure)
+    """
+    return executor.submit(
+        _generate_location_ascii_art,
         ai_service=ai_service,
-        location_name=starting_data["name"],
-        location_description=starting_data["description"],
-        location_category=starting_data.get("category"),
+        location_name=location.name,
+        location_description=location.description,
+        location_category=location.category,
         theme=theme
     )
 
-    # Infer hierarchy fields from category
-    starting_category = starting_data.get("category")
-    is_overworld, is_safe_zone = _infer_hierarchy_from_category(starting_category)
 
-    # Create starting location at origin (0, 0)
-    # Note: No connections field - navigation is coordinate-based via WorldGrid
-    starting_location = Location(
-        name=starting_data["name"],
-        description=starting_data["description"],
-        category=starting_category,
-        ascii_art=starting_ascii_art,
-        is_overworld=is_overworld,
-        is_safe_zone=is_safe_zone
+def _create_starting_location(ai_service: AIService, theme: str) -> Location:
+    """Generate the starting location with its default NPCs.
+
+    Args:
+        ai_service: AIService instance
+        theme: World theme
+
+    Returns:
+        Starting Location (ASCII art not yet set)
+
+    Raises:
+        AIServiceError: If generation fails
+        ValueError: If the generated location fails validation
+    """
+    starting_data = ai_service.generate_location(
+        theme=theme,
+        context_locations=[],
+        source_location=None,
+        direction=None
     )
-    grid.add_location(starting_location, 0, 0)
+    starting_location = _location_from_data(starting_data)
 
     # Add default merchant NPC to starting location for shop access
     potion = Item(
@@ -1256,93 +1276,163 @@ def create_ai_world(
     starting_location.npcs.append(quest_giver)
 
     # Add AI-generated NPCs to starting location (if any)
-    ai_npcs = _create_npcs_from_data(starting_data.get("npcs", []))
-    for npc in ai_npcs:
-        starting_location.npcs.append(npc)
+    starting_location.npcs.extend(_create_npcs_from_data(starting_data.get("npcs", [])))
+    return starting_location
+
 
+def _expand_frontier(
+    ai_service: AIService,
+    theme: str,
+    grid: WorldGrid,
+    starting_location: Location,
+    initial_size: int,
+    executor: ThreadPoolExecutor,
+    cancelled: Optional[threading.Event] = None
+) -> Iterator[Location]:
+    """Generate locations around the starting location in concurrent waves.
+
+    Each wave takes the next unoccupied frontier coordinates from the queue
+    (at most as many as are still needed) and generates them concurrently.
+    Results are placed in queue order, so placement does not depend on which
+    AI call finishes first. ASCII art for a wave's locations is generated
+    while the next wave's locations are in flight.
+
+    Args:
+        ai_service: AIService instance
+        theme: World theme
+        grid: Grid containing the starting location (new locations are added)
+        starting_location: Location at (0, 0)
+        initial_size: Target number of locations including the start
+        executor: Executor for AI calls
+        cancelled: Optional event that stops the build between waves
+
+    Yields:
+        Placed locations with ASCII art set, in placement order
+    """
     # Queue ALL cardinal directions for exploration (WFC will filter passability)
     # Connections are determined by terrain, not AI suggestions
-    for direction in DIRECTION_OFFSETS:
-        dx, dy = DIRECTION_OFFSETS[direction]
-        coord_queue.append((starting_location.name, 0 + dx, 0 + dy, direction, None))
+    coord_queue = []  # List of (source_name, x, y, direction)
+    for direction, (dx, dy) in DIRECTION_OFFSETS.items():
+        coord_queue.append((starting_location.name, dx, dy, direction))
 
-    # Generate connected locations up to initial_size
     generated_count = 1
     attempts = 0
     max_attempts = initial_size * 3  # Prevent infinite loops
+    pending_art: list[tuple[Location, Future]] = []
 
     while generated_count < initial_size and coord_queue and attempts < max_attempts:
-        attempts += 1
-
-        # Get next position to generate
-        source_name, target_x, target_y, direction, suggested_name = coord_queue.pop(0)
-
-        # Skip if position already occupied
-        if grid.get_by_coordinates(target_x, target_y) is not None:
-            continue
-
-        # Skip if name already exists
-        if suggested_name in grid:
-            continue
+        if cancelled is not None and cancelled.is_set():
+            break
 
-        # Note: direction is always in DIRECTION_OFFSETS because we filter
-        # at lines 125 and 178 when adding to the queue
+        # Take the next wave of unoccupied frontier coordinates
+        wave = []
+        claimed: set[tuple[int, int]] = set()
+        needed = initial_size - generated_count
+        while coord_queue and len(wave) < needed and attempts < max_attempts:
+            attempts += 1
+            source_name, target_x, target_y, direction = coord_queue.pop(0)
+            if (target_x, target_y) in claimed:
+                continue
+            # Skip if position already occupied
+            if grid.get_by_coordinates(target_x, target_y) is not None:
+                continue
+            claimed.add((target_x, target_y))
+            wave.append((source_name, target_x, target_y, direction))
 
-        try:
-            # Generate new location
+        context_locations = list(grid.keys())
+        futures = []
+        for source_name, target_x, target_y, direction in wave:
             logger.info(f"Generating location at ({target_x}, {target_y}) from {source_name}")
-            location_data = ai_service.generate_location(
+            futures.append(executor.submit(
+                ai_service.generate_location,
                 theme=theme,
-                context_locations=list(grid.keys()),
+                context_locations=list(context_locations),
                 source_location=source_name,
                 direction=direction
-            )
+            ))
+
+        # Finish the previous wave's art while this wave generates
+        for location, art in pending_art:
+            location.ascii_art = art.result()
+            yield location
+        pending_art = []
+
+        # Place results in queue order (deterministic regardless of timing)
+        for (source_name, target_x, target_y, direction), future in zip(wave, futures):
+            try:
+                location_data = future.result()
+                new_location = _location_from_data(location_data)
+                new_location.npcs.extend(
+                    _create_npcs_from_data(location_data.get("npcs", []))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to generate location: {e}")
+                continue
 
-            # Generate ASCII art for the new location
-            new_ascii_art = _generate_location_ascii_art(
-                ai_service=ai_service,
-                location_name=location_data["name"],
-                location_description=location_data["description"],
-                location_category=location_data.get("category"),
-                theme=theme
+            # Add to grid if name is unique (WorldGrid handles connections)
+            if new_location.name in grid:
+                logger.debug(f"Duplicate location name generated: {new_location.name}")
+                continue
+            grid.add_location(new_location, target_x, target_y)
+            generated_count += 1
+            pending_art.append(
+                (new_location, _submit_ascii_art(executor, ai_service, new_location, theme))
             )
 
-            # Infer hierarchy fields from category
-            new_category = location_data.get("category")
-            new_is_overworld, new_is_safe_zone = _infer_hierarchy_from_category(new_category)
-
-            # Create location (no connections - navigation is coordinate-based)
-            new_location = Location(
-                name=location_data["name"],
-                description=location_data["description"],
-                category=new_category,
-                ascii_art=new_ascii_art,
-                is_overworld=new_is_overworld,
-                is_safe_zone=new_is_safe_zone
-            )
+            # Queue all cardinal directions from new location (WFC handles terrain passability)
+            opposite = get_opposite_direction(direction)
+            for new_dir, (dx, dy) in DIRECTION_OFFSETS.items():
+                if new_dir != opposite:  # Skip back-connection direction
+                    coord_queue.append((new_location.name, target_x + dx, target_y + dy, new_dir))
 
-            # Add AI-generated NPCs to the new location
-            location_npcs = _create_npcs_from_data(location_data.get("npcs", []))
-            for npc in location_npcs:
-                new_location.npcs.append(npc)
+    for location, art in pending_art:
+        location.ascii_art = art.result()
+        yield location
 
-            # Add to grid if name is unique (WorldGrid handles connections)
-            if new_location.name not in grid:
-                grid.add_location(new_location, target_x, target_y)
-                generated_count += 1
-
-                # Queue all cardinal directions from new location (WFC handles terrain passability)
-                opposite = get_opposite_direction(direction)
-                for new_dir in DIRECTION_OFFSETS:
-                    if new_dir != opposite:  # Skip back-connection direction
-                        dx, dy = DIRECTION_OFFSETS[new_dir]
-                        coord_queue.append((new_location.name, target_x + dx, target_y + dy, new_dir, None))
-            else:
-                logger.debug(f"Duplicate location name generated: {new_location.name}")
 
-        except Exception as e:
-            logger.warning(f"Failed to generate location: {e}")
-            continue
+def create_ai_world(
+    ai_service: AIService,
+    theme: str = "fantasy",
+    starting_location_name: str = "Town Square",
+    initial_size: int = 3,
+    max_workers: int = WORLD_BUILD_WORKERS
+) -> tuple[dict[str, Location], str]:
+    """Create an AI-generated world using grid-based placement.
+
+    Frontier locations are generated concurrently (see _expand_frontier);
+    the layout depends only on the AI responses, not on their timing.
+
+    Args:
+        ai_service: AIService instance for generating locations
+        theme: World theme (e.g., "fantasy", "sci-fi")
+        starting_location_name: Name for the starting location
+        initial_size: Target number of locations to generate
+        max_workers: Maximum concurrent AI requests
+
+    Returns:
+        Tuple of (world, starting_location) where:
+        - world: Dictionary mapping location names to Location instances
+        - starting_location: Actual name of the starting location (may differ from parameter)
+
+    Raises:
+        AIServiceError: If generation fails
+        ValueError: If generated locations fail validation
+    """
+    grid = WorldGrid()
+
+    # Generate starting location
+    logger.info(f"Generating starting location: {starting_location_name}")
+    starting_location = _create_starting_location(ai_service, theme)
+    grid.add_location(starting_location, 0, 0)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Starting location art is generated alongside the first wave
+        starting_art = _submit_ascii_art(executor, ai_service, starting_location, theme)
+        for _ in _expand_frontier(
+            ai_service, theme, grid, starting_location, initial_size, executor
+        ):
+            pass
+        starting_location.ascii_art = starting_art.result()
 
     logger.info(f"Generated world with {len(grid)} locations")
 
@@ -1355,6 +1445,157 @@ def create_ai_world(
     return (grid.as_dict(), actual_starting_location)
 
 
+class WorldBuild:
+    """Initial world generation that continues in a background thread.
+
+    Returned by start_ai_world once the starting location is ready. The
+    remaining frontier locations are published as they are completed and
+    merged into the game world with drain() (see GameState.attach_world_build).
+
+    Attributes:
+        world: Dictionary holding the starting location
+        starting_location: Name of the starting location
+    """
+
+    def __init__(self, world: dict[str, Location], starting_location: str):
+        """Initialize a build with its starting location.
+
+        Args:
+            world: Dictionary holding the starting location
+            starting_location: Name of the starting location
+        """
+        self.world = world
+        self.starting_location = starting_location
+        self._ready: list[Location] = []
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(
+        self,
+        ai_service: AIService,
+        theme: str,
+        grid: WorldGrid,
+        initial_size: int,
+        max_workers: int
+    ) -> None:
+        """Start generating the rest of the world in a daemon thread.
+
+        Args:
+            ai_service: AIService instance
+            theme: World theme
+            grid: Grid containing the starting location
+            initial_size: Target number of locations including the start
+            max_workers: Maximum concurrent AI requests
+        """
+        starting_location = grid.get_by_coordinates(0, 0)
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(ai_service, theme, grid, starting_location, initial_size, max_workers),
+            daemon=True,
+            name="world-build"
+        )
+        self._thread.start()
+
+    def _run(
+        self,
+        ai_service: AIService,
+        theme: str,
+        grid: WorldGrid,
+        starting_location: Location,
+        initial_size: int,
+        max_workers: int
+    ) -> None:
+        """Background thread body: expand the frontier and publish locations."""
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for location in _expand_frontier(
+                    ai_service, theme, grid, starting_location,
+                    initial_size, executor, self._cancelled
+                ):
+                    with self._lock:
+                        self._ready.append(location)
+        except Exception as e:
+            logger.warning(f"Background world build failed: {e}")
+        finally:
+            self._finished.set()
+
+    @property
+    def done(self) -> bool:
+        """True once the background build has finished or stopped."""
+        return self._finished.is_set()
+
+    def drain(self) -> list[Location]:
+        """Return locations completed since the previous drain.
+
+        Returns:
+            Newly completed locations (coordinates and ASCII art set)
+        """
+        with self._lock:
+            ready, self._ready = self._ready, []
+        return ready
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background build to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if the build has finished
+        """
+        return self._finished.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stop the build after the current wave."""
+        self._cancelled.set()
+
+
+def start_ai_world(
+    ai_service: AIService,
+    theme: str = "fantasy",
+    starting_location_name: str = "Town Square",
+    initial_size: int = 3,
+    max_workers: int = WORLD_BUILD_WORKERS
+) -> WorldBuild:
+    """Generate the starting location and stream the rest of the world.
+
+    Same placement as create_ai_world, but returns as soon as the starting
+    location (with its ASCII art) is ready.
+
+    Args:
+        ai_service: AIService instance for generating locations
+        theme: World theme (e.g., "fantasy", "sci-fi")
+        starting_location_name: Name for the starting location
+        initial_size: Target number of locations to generate
+        max_workers: Maximum concurrent AI requests
+
+    Returns:
+        Running WorldBuild whose world holds the starting location
+
+    Raises:
+        AIServiceError: If starting location generation fails
+        ValueError: If the starting location fails validation
+    """
+    grid = WorldGrid()
+
+    logger.info(f"Generating starting location: {starting_location_name}")
+    starting_location = _create_starting_location(ai_service, theme)
+    starting_location.ascii_art = _generate_location_ascii_art(
+        ai_service=ai_service,
+        location_name=starting_location.name,
+        location_description=starting_location.description,
+        location_category=starting_location.category,
+        theme=theme
+    )
+    grid.add_location(starting_location, 0, 0)
+
+    build = WorldBuild({starting_location.name: starting_location}, starting_location.name)
+    build.start(ai_service, theme, grid, initial_size, max_workers)
+    return build
+
+
 def expand_world(
     world: dict[str, Location],
     ai_service: AIService,
@@ -1407,13 +1648,12 @@ def expand_world(
         if target_coords is not None:
             for dir_name, (dx, dy) in DIRECTION_OFFSETS.items():
                 neighbor_coords = (target_coords[0] + dx, target_coords[1] + dy)
-                for loc in world.values():
-                    if loc.coordinates == neighbor_coords:
-                        neighboring_locations.append({
-                            "name": loc.name,
-                            "direction": dir_name
-                        })
-                        break
+                loc = get_exit_graph(world).location_at(neighbor_coords)
+                if loc is not None:
+                    neighboring_locations.append({
+                        "name": loc.name,
+                        "direction": dir_name
+                    })
 
         # Use layered generation (Layer 3 for location, Layer 4 for NPCs)
         location_data = ai_service.generate_location_with_context(
@@ -1496,7 +1736,10 @@ def expand_world(
         secrets = _generate_secrets_for_location(new_category, distance=0)
         new_location.hidden_secrets.extend(secrets)
 
-    # Add to world
+    # Add to world (AI names are not deduplicated, so this may replace a
+    # location elsewhere)
+    if new_location.name in world:
+        get_exit_graph(world).invalidate()
     world[new_location.name] = new_location
 
     # Note: No connections needed - navigation is coordinate-based via WorldGrid
@@ -1661,11 +1904,7 @@ def expand_area(
 
         # Skip if coordinates already occupied (only check for entry locations at z=0)
         if rel_z == 0:
-            existing = None
-            for loc in world.values():
-                if loc.coordinates == (abs_x, abs_y):
-                    existing = loc
-                    break
+            existing = get_exit_graph(world).location_at((abs_x, abs_y))
 
             if existing is not None:
                 logger.debug(
@@ -1850,9 +2089,13 @@ def expand_area(
         entry_loc.is_exit_point = True  # Can exit from entry back to overworld
 
         # Only add entry to world
+        if entry_name in world:
+            get_exit_graph(world).invalidate()
         world[entry_name] = entry_loc
     else:
         # Single location or no entry - add all to world (legacy behavior)
+        if any(name in world for name in placed_locations):
+            get_exit_graph(world).invalidate()
         for name, data in placed_locations.items():
             world[name] = data["location"]
 
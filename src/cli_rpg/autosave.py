@@ -3,7 +3,9 @@ import json
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
+from cli_rpg.paged_world import is_paged_save, read_paged_save, write_paged_save
 from cli_rpg.persistence import _sanitize_filename
+from cli_rpg.string_store import unpack_save_data
 
 if TYPE_CHECKING:
     from cli_rpg.game_state import GameState
@@ -26,6 +28,9 @@ def get_autosave_path(character_name: str, save_dir: str = "saves") -> str:
 def autosave(game_state: "GameState", save_dir: str = "saves") -> str:
     """Automatically save game state to dedicated autosave slot.
 
+    Autosaves use the region-paged layout (see paged_world), so resuming
+    only materializes the regions around the player.
+
     Args:
         game_state: Current game state to save
         save_dir: Directory for save files
@@ -41,10 +46,8 @@ def autosave(game_state: "GameState", save_dir: str = "saves") -> str:
 
     filepath = get_autosave_path(game_state.current_character.name, save_dir)
 
-    game_data = game_state.to_dict()
-
     with open(filepath, 'w') as f:
-        json.dump(game_data, f, indent=2)
+        write_paged_save(game_state, f)
 
     return filepath
 
@@ -68,7 +71,8 @@ def load_autosave(character_name: str, save_dir: str = "saves") -> Optional["Gam
 
     try:
         with open(filepath, 'r') as f:
-            data = json.load(f)
+            # Older autosaves are a single JSON document
+            data = read_paged_save(f) if is_paged_save(filepath) else unpack_save_data(json.load(f))
         return GameState.from_dict(data)
     except (json.JSONDecodeError, KeyError, ValueError):
         return None
@@ -1,9 +1,16 @@
 """Background generation queue for pre-generating adjacent locations.
 
 This module provides a thread-based queue for pre-generating location data
-before the player arrives, eliminating blocking during movement.
+before the player arrives, eliminating blocking during movement. When the
+player outruns the queue, the foreground move attaches to the in-flight
+task instead of issuing a duplicate AI call (see pop_or_wait).
+
+Tasks carry a priority (see prefetch_planner): workers take the most likely
+tile first, and resubmitting a queued tile with a higher priority moves it
+ahead.
 """
 
+import itertools
 import logging
 import queue
 import threading
@@ -27,11 +34,23 @@ class GenerationTask:
         terrain: Terrain type at the coordinates
         world_context: Optional world context for layered generation
         region_context: Optional region context for layered generation
+        priority: Higher priorities are generated first
+        sequence: Submission order (breaks priority ties first-in first-out)
     """
     coords: tuple[int, int]
     terrain: str
     world_context: Optional["WorldContext"] = None
     region_context: Optional["RegionContext"] = None
+    priority: float = 0.0
+    sequence: int = 0
+
+    def __lt__(self, other: "GenerationTask") -> bool:
+        """Order tasks for the priority queue (highest priority first)."""
+        return (-self.priority, self.sequence) < (-other.priority, other.sequence)
+
+
+# Shutdown sentinel (sorts ahead of every real task)
+_SHUTDOWN = GenerationTask(coords=(0, 0), terrain="", priority=float("inf"))
 
 
 class BackgroundGenerationQueue:
@@ -44,10 +63,13 @@ class BackgroundGenerationQueue:
     Attributes:
         _ai_service: AI service for generating locations
         _theme: World theme for generation
-        _queue: Thread-safe queue for pending tasks
+        _queue: Thread-safe priority queue for pending tasks
         _cache: Dictionary mapping coords to generated location data
-        _pending: Set of coordinates currently being processed
+        _pending: Coordinates submitted but not yet finished, with their priority
+        _in_progress: Set of coordinates a worker is currently generating
+        _claimed: Coordinates taken over by the foreground (workers skip them)
         _lock: Thread lock for cache/pending access
+        _done: Condition notified whenever an in-progress task finishes
         _running: Whether the queue is active
         _workers: List of worker threads
         _num_workers: Number of worker threads to run
@@ -68,10 +90,14 @@ class BackgroundGenerationQueue:
         """
         self._ai_service = ai_service
         self._theme = theme
-        self._queue: queue.Queue[Optional[GenerationTask]] = queue.Queue()
+        self._queue: queue.PriorityQueue[GenerationTask] = queue.PriorityQueue()
+        self._sequence = itertools.count()
         self._cache: dict[tuple[int, int], dict] = {}
-        self._pending: set[tuple[int, int]] = set()
+        self._pending: dict[tuple[int, int], float] = {}
+        self._in_progress: set[tuple[int, int]] = set()
+        self._claimed: set[tuple[int, int]] = set()
         self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
         self._running = False
         self._workers: list[threading.Thread] = []
         self._num_workers = num_workers
@@ -109,7 +135,7 @@ class BackgroundGenerationQueue:
         # Wake up workers with sentinel values
         for _ in self._workers:
             try:
-                self._queue.put_nowait(None)
+                self._queue.put_nowait(_SHUTDOWN)
             except queue.Full:
                 pass
 
@@ -124,34 +150,58 @@ class BackgroundGenerationQueue:
         terrain: str,
         world_context: Optional["WorldContext"] = None,
         region_context: Optional["RegionContext"] = None,
+        priority: float = 0.0,
     ) -> bool:
         """Submit coordinates for background generation.
 
+        Resubmitting coordinates that are still queued with a higher priority
+        moves them ahead (the earlier entry is skipped when dequeued).
+
         Args:
             coords: Target coordinates for the location
             terrain: Terrain type at the coordinates
             world_context: Optional world context for layered generation
             region_context: Optional region context for layered generation
+            priority: Higher priorities are generated first (default 0)
 
         Returns:
-            True if submitted, False if already pending/cached or not running.
+            True if submitted or reprioritized, False if already
+            pending/cached or not running.
         """
         with self._lock:
             if not self._running:
                 return False
-            if coords in self._pending or coords in self._cache:
+            if coords in self._cache or coords in self._in_progress:
+                return False
+            if coords in self._pending and self._pending[coords] >= priority:
                 return False
-            self._pending.add(coords)
+            self._pending[coords] = priority
+            self._claimed.discard(coords)
+            sequence = next(self._sequence)
 
         task = GenerationTask(
             coords=coords,
             terrain=terrain,
             world_context=world_context,
             region_context=region_context,
+            priority=priority,
+            sequence=sequence,
         )
         self._queue.put(task)
         return True
 
+    def is_prefetched(self, coords: tuple[int, int]) -> bool:
+        """Check whether coordinates are generated or being generated.
+
+        Args:
+            coords: Coordinates to look up
+
+        Returns:
+            True if the location is cached or a worker is generating it
+        """
+        with self._lock:
+            return coords in self._cache or coords in self._in_progress
+
     def get_cached(self, coords: tuple[int, int]) -> Optional[dict]:
         """Get cached location data if available.
 
@@ -176,6 +226,40 @@ class BackgroundGenerationQueue:
         with self._lock:
             return self._cache.pop(coords, None)
 
+    def pop_or_wait(
+        self, coords: tuple[int, int], timeout: Optional[float] = None
+    ) -> Optional[dict]:
+        """Get cached data, attaching to an in-flight generation if there is one.
+
+        - If the location is already cached, it is popped and returned.
+        - If a worker is generating it right now, waits for that task to finish
+          and returns its result, so the caller does not fire a duplicate AI call.
+        - If it is queued but not started, the task is claimed (the worker will
+          skip it) and None is returned so the caller generates it directly.
+
+        Args:
+            coords: Coordinates to look up
+            timeout: Maximum seconds to wait for an in-progress task (None = no limit)
+
+        Returns:
+            Location data dict, or None if the caller should generate itself.
+        """
+        with self._done:
+            if coords in self._cache:
+                return self._cache.pop(coords)
+
+            if coords in self._in_progress:
+                logger.debug(f"Waiting for in-flight background generation at {coords}")
+                self._done.wait_for(lambda: coords not in self._in_progress, timeout=timeout)
+                return self._cache.pop(coords, None)
+
+            if coords in self._pending:
+                # Not started yet - take it over so it isn't generated twice
+                del self._pending[coords]
+                self._claimed.add(coords)
+
+            return None
+
     def _worker_loop(self) -> None:
         """Background worker loop.
 
@@ -184,7 +268,7 @@ class BackgroundGenerationQueue:
         while self._running:
             try:
                 task = self._queue.get(timeout=0.5)
-                if task is None:  # Shutdown sentinel
+                if task is _SHUTDOWN:
                     break
                 self._process_task(task)
             except queue.Empty:
@@ -200,6 +284,18 @@ class BackgroundGenerationQueue:
         Args:
             task: The generation task to process
         """
+        with self._lock:
+            if task.coords in self._claimed:
+                # Foreground move already took over this task
+                self._claimed.discard(task.coords)
+                return
+            if self._pending.get(task.coords) != task.priority:
+                # Superseded by a higher-priority resubmission, or already done
+                return
+            if task.coords in self._in_progress:
+                return
+            self._in_progress.add(task.coords)
+
         try:
             # Generate location data using AI service
             location_data = self._ai_service.generate_location(
@@ -211,13 +307,17 @@ class BackgroundGenerationQueue:
                 world_context=task.world_context,
             )
 
-            with self._lock:
+            with self._done:
                 self._cache[task.coords] = location_data
-                self._pending.discard(task.coords)
+                self._pending.pop(task.coords, None)
+                self._in_progress.discard(task.coords)
+                self._done.notify_all()
 
             logger.debug(f"Pre-generated location at {task.coords}")
 
         except Exception as e:
             logger.warning(f"Failed to pre-generate {task.coords}: {e}")
-            with self._lock:
-                self._pending.discard(task.coords)
+            with self._done:
+                self._pending.pop(task.coords, None)
+                self._in_progress.discard(task.coords)
+                self._done.notify_all()
@@ -438,6 +438,7 @@ def execute_camp(game_state: "GameState") -> Tuple[bool, str]:
         dream_chance=CAMP_DREAM_CHANCE,  # Override when tiredness is low
         last_dream_hour=game_state.last_dream_hour,
         current_hour=game_state.game_time.total_hours,
+        flavor_pool=getattr(game_state, 'flavor_pool', None),
     )
     if dream:
         # Update last_dream_hour for cooldown tracking
@@ -2,7 +2,7 @@
 
 import logging
 import random
-from typing import Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Optional, Tuple, Union, TYPE_CHECKING
 from cli_rpg.models.character import Character
 from cli_rpg.models.enemy import Enemy, ElementType, SpecialAttack
 from cli_rpg.models.item import Item, ItemType
@@ -10,6 +10,7 @@ from cli_rpg.models.status_effect import StatusEffect
 from cli_rpg.models.weather import Weather
 from cli_rpg.models.companion import Companion
 from cli_rpg import colors
+from cli_rpg.session_rng import COMBAT, LOOT, session_stream
 from cli_rpg.sound_effects import sound_victory
 
 if TYPE_CHECKING:
@@ -355,6 +356,7 @@ class CombatEncounter:
         companions: Optional[list[Companion]] = None,
         location_category: Optional[str] = None,
         game_state: Optional["GameState"] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         Initialize combat encounter.
@@ -367,6 +369,9 @@ class CombatEncounter:
             companions: Optional list of companions providing combat bonuses
             location_category: Optional location category for class bonuses (e.g., "forest")
             game_state: Optional GameState for faction reputation changes
+            rng: Optional random.Random for combat rolls (defaults to the game
+                 state's combat stream, or the global random module); inject a
+                 seeded instance for reproducible fights
 
         Note: Either enemies or enemy must be provided. If both are provided,
         enemies takes precedence. If enemy is provided, it's wrapped in a list.
@@ -377,6 +382,7 @@ class CombatEncounter:
         self.companions = companions or []
         self.location_category = location_category
         self.game_state = game_state
+        self.rng = rng
 
         # Handle backward compatibility
         if enemies is not None:
@@ -404,6 +410,14 @@ class CombatEncounter:
         # Stealth kill tracking for bonus XP
         self.stealth_kills = 0
 
+    @property
+    def _random(self) -> Any:
+        """Source of combat rolls: the injected RNG, the session's combat stream,
+        or the global random module."""
+        if self.rng is not None:
+            return self.rng
+        return session_stream(self.game_state, COMBAT)
+
     def _check_and_consume_stun(self) -> Optional[str]:
         """Check if player is stunned and consume the stun effect if so.
 
@@ -484,14 +498,14 @@ class CombatEncounter:
 
         # Check player burns
         for effect in list(self.player.status_effects):
-            if effect.name == "Burn" and random.random() < 0.4:
+            if effect.name == "Burn" and self._random.random() < 0.4:
                 self.player.status_effects.remove(effect)
                 messages.append("The rain douses your flames!")
 
         # Check enemy burns
         for enemy in self.get_living_enemies():
             for effect in list(enemy.status_effects):
-                if effect.name == "Burn" and random.random() < 0.4:
+                if effect.name == "Burn" and self._random.random() < 0.4:
                     enemy.status_effects.remove(effect)
                     messages.append(f"The rain extinguishes {enemy.name}'s flames!")
 
@@ -761,7 +775,7 @@ class CombatEncounter:
         # Check for critical hit (DEX-based + luck bonus + stance bonus)
         crit_chance = calculate_crit_chance(self.player.dexterity, self.player.luck)
         crit_chance += self.player.get_stance_crit_modifier()
-        is_crit = random.random() < crit_chance
+        is_crit = self._random.random() < crit_chance
         if is_crit:
             dmg = int(dmg * CRIT_MULTIPLIER)
 
@@ -1116,7 +1130,7 @@ class CombatEncounter:
         # Check for critical hit (INT-based for cast + luck bonus + stance bonus)
         crit_chance = calculate_crit_chance(self.player.intelligence, self.player.luck)
         crit_chance += self.player.get_stance_crit_modifier()
-        is_crit = random.random() < crit_chance
+        is_crit = self._random.random() < crit_chance
         if is_crit:
             dmg = int(dmg * CRIT_MULTIPLIER)
 
@@ -1205,7 +1219,7 @@ class CombatEncounter:
             message += f" {elem_msg}"
 
         # 25% chance to apply Burn effect
-        if random.random() < 0.25:
+        if self._random.random() < 0.25:
             burn = StatusEffect(
                 name="Burn",
                 effect_type="dot",
@@ -1290,7 +1304,7 @@ class CombatEncounter:
             message += f" {elem_msg}"
 
         # 30% chance to apply Freeze effect
-        if random.random() < 0.30:
+        if self._random.random() < 0.30:
             freeze = StatusEffect(
                 name="Freeze",
                 effect_type="freeze",
@@ -1537,7 +1551,7 @@ class CombatEncounter:
                 f"The undead creature takes {colors.damage(str(dmg))} holy damage!"
             )
             # Stun chance (30% base + divine power bonus) vs undead
-            if enemy.is_alive() and random.random() < stun_chance:
+            if enemy.is_alive() and self._random.random() < stun_chance:
                 stun = StatusEffect(
                     name="Stun",
                     effect_type="stun",
@@ -1579,7 +1593,7 @@ class CombatEncounter:
 
         # Base 50% chance + dexterity modifier
         flee_chance = 50 + (self.player.dexterity * 2)
-        roll = random.randint(1, 100)
+        roll = self._random.randint(1, 100)
 
         if roll <= flee_chance:
             return True, "You successfully flee from combat!"
@@ -1637,7 +1651,7 @@ class CombatEncounter:
         messages.append(msg)
 
         # Apply special attack status effect
-        if special.effect_type and random.random() < special.effect_chance:
+        if special.effect_type and self._random.random() < special.effect_chance:
             if special.effect_type == "stun":
                 effect = StatusEffect(
                     name="Stun",
@@ -1686,8 +1700,8 @@ class CombatEncounter:
             return None
 
         # 30% chance to telegraph a special attack
-        if random.random() < 0.3:
-            special = random.choice(enemy.special_attacks)
+        if self._random.random() < 0.3:
+            special = self._random.choice(enemy.special_attacks)
             enemy.telegraphed_attack = special.name
             return special.telegraph_message
 
@@ -1747,7 +1761,7 @@ class CombatEncounter:
             if self.player.is_stealthed():
                 # Stealth dodge: DEX * 5%, capped at 75%
                 stealth_dodge_chance = min(self.player.dexterity * 0.05, 0.75)
-                if random.random() < stealth_dodge_chance:
+                if self._random.random() < stealth_dodge_chance:
                     # Player dodged from stealth
                     msg = (
                         f"{colors.enemy(enemy.name)} attacks, but you "
@@ -1761,7 +1775,7 @@ class CombatEncounter:
             else:
                 # Normal dodge check (DEX-based)
                 dodge_chance = calculate_dodge_chance(self.player.dexterity)
-                if random.random() < dodge_chance:
+                if self._random.random() < dodge_chance:
                     # Player dodged the attack
                     msg = (
                         f"{colors.enemy(enemy.name)} attacks, but you "
@@ -1784,7 +1798,7 @@ class CombatEncounter:
             base_damage = max(1, attack_power - effective_defense)
 
             # Check for enemy critical hit (flat 5% chance)
-            is_crit = random.random() < ENEMY_CRIT_CHANCE
+            is_crit = self._random.random() < ENEMY_CRIT_CHANCE
             if is_crit:
                 base_damage = int(base_damage * CRIT_MULTIPLIER)
 
@@ -1807,7 +1821,7 @@ class CombatEncounter:
             elif self.parrying:
                 # Success chance: 40% base + DEX*2%, capped at 70%
                 parry_chance = min(40 + self.player.dexterity * 2, 70) / 100.0
-                if random.random() < parry_chance:
+                if self._random.random() < parry_chance:
                     # Successful parry - negate damage and counter-attack
                     dmg = 0
                     counter_damage = self.player.strength // 2
@@ -1878,7 +1892,7 @@ class CombatEncounter:
                 messages.append(f"The attack {colors.warning('breaks your stealth')}!")
 
             # Check if enemy can apply poison
-            if enemy.poison_chance > 0 and random.random() < enemy.poison_chance:
+            if enemy.poison_chance > 0 and self._random.random() < enemy.poison_chance:
                 # Apply poison effect
                 poison = StatusEffect(
                     name="Poison",
@@ -1892,7 +1906,7 @@ class CombatEncounter:
                 )
 
             # Check if enemy can apply burn
-            if enemy.burn_chance > 0 and random.random() < enemy.burn_chance:
+            if enemy.burn_chance > 0 and self._random.random() < enemy.burn_chance:
                 # Apply burn effect
                 burn = StatusEffect(
                     name="Burn",
@@ -1906,7 +1920,7 @@ class CombatEncounter:
                 )
 
             # Check if enemy can apply stun
-            if enemy.stun_chance > 0 and random.random() < enemy.stun_chance:
+            if enemy.stun_chance > 0 and self._random.random() < enemy.stun_chance:
                 # Apply stun effect
                 stun = StatusEffect(
                     name="Stun",
@@ -1920,7 +1934,7 @@ class CombatEncounter:
                 )
 
             # Check if enemy can apply freeze (to player - ice enemies freeze the player)
-            if enemy.freeze_chance > 0 and random.random() < enemy.freeze_chance:
+            if enemy.freeze_chance > 0 and self._random.random() < enemy.freeze_chance:
                 # Apply freeze effect to player
                 freeze = StatusEffect(
                     name="Freeze",
@@ -1934,7 +1948,7 @@ class CombatEncounter:
                 )
 
             # Check if enemy can apply bleed
-            if enemy.bleed_chance > 0 and random.random() < enemy.bleed_chance:
+            if enemy.bleed_chance > 0 and self._random.random() < enemy.bleed_chance:
                 # Apply bleed effect to player
                 bleed = StatusEffect(
                     name="Bleed",
@@ -2038,17 +2052,18 @@ class CombatEncounter:
             # Award gold based on sum of enemy levels, modified by luck (±5% per luck from 10)
             total_level = sum(e.level for e in self.enemies)
             luck_modifier = 1.0 + (self.player.luck - 10) * 0.05
-            gold_reward = int(random.randint(5, 15) * total_level * luck_modifier)
+            gold_reward = int(self._random.randint(5, 15) * total_level * luck_modifier)
             self.player.add_gold(gold_reward)
             messages.append(f"You earned {colors.gold(str(gold_reward) + ' gold')}!")
 
             # Generate and award loot from each enemy
+            loot_rng = session_stream(self.game_state, LOOT, default=self._random)
             for enemy in self.enemies:
                 # Use boss loot for boss enemies (guaranteed drop with enhanced stats)
                 if enemy.is_boss:
-                    loot = generate_boss_loot(enemy, self.player.level)
+                    loot = generate_boss_loot(enemy, self.player.level, rng=loot_rng)
                 else:
-                    loot = generate_loot(enemy, self.player.level, self.player.luck)
+                    loot = generate_loot(enemy, self.player.level, self.player.luck, rng=loot_rng)
                 if loot is not None:
                     if self.player.inventory.add_item(loot):
                         messages.append(f"You found: {colors.item(loot.name)}!")
@@ -2131,20 +2146,25 @@ class CombatEncounter:
         return "\n".join(lines)
 
 
-def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
+def generate_loot(
+    enemy: Enemy, level: int, luck: int = 10, rng: Optional[random.Random] = None
+) -> Optional[Item]:
     """Generate loot item dropped by defeated enemy.
 
     Args:
         enemy: The defeated enemy
         level: Player level for scaling loot stats
         luck: Player luck stat for drop rate and bonus modifiers (default 10)
+        rng: Optional random.Random for loot rolls (defaults to global random)
 
     Returns:
         Item if loot dropped, None otherwise (base 50% drop rate, ±2% per luck from 10)
     """
+    source = rng or random
+
     # Base 50% + 2% per luck above/below 10
     drop_chance = 0.50 + (luck - 10) * 0.02
-    if random.random() > drop_chance:
+    if source.random() > drop_chance:
         return None
 
     # Choose random item type
@@ -2155,7 +2175,7 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
         (ItemType.MISC, 0.10),
     ]
 
-    roll = random.random()
+    roll = source.random()
     cumulative: float = 0.0
     item_type = ItemType.MISC
     for itype, prob in item_types:
@@ -2172,10 +2192,10 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
         from cli_rpg.models.weapon_proficiency import infer_weapon_type
         prefixes = ["Rusty", "Iron", "Steel", "Sharp", "Worn", "Old"]
         names = ["Sword", "Dagger", "Axe", "Mace", "Spear"]
-        prefix = random.choice(prefixes)
-        name = random.choice(names)
+        prefix = source.choice(prefixes)
+        name = source.choice(names)
         full_name = f"{prefix} {name}"
-        damage_bonus = max(1, level + random.randint(1, 3) + luck_bonus)
+        damage_bonus = max(1, level + source.randint(1, 3) + luck_bonus)
         # Infer weapon type from generated name
         weapon_type = infer_weapon_type(full_name)
         return Item(
@@ -2189,9 +2209,9 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
     elif item_type == ItemType.ARMOR:
         prefixes = ["Worn", "Sturdy", "Leather", "Chain", "Old"]
         names = ["Armor", "Shield", "Helmet", "Gauntlets", "Boots"]
-        prefix = random.choice(prefixes)
-        name = random.choice(names)
-        defense_bonus = max(1, level + random.randint(0, 2) + luck_bonus)
+        prefix = source.choice(prefixes)
+        name = source.choice(names)
+        defense_bonus = max(1, level + source.randint(0, 2) + luck_bonus)
         return Item(
             name=f"{prefix} {name}",
             description=f"A {prefix.lower()} {name.lower()} from {enemy.name}",
@@ -2201,14 +2221,14 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
 
     elif item_type == ItemType.CONSUMABLE:
         # 15% chance for cure item, otherwise regular healing consumable
-        if random.random() < 0.15:
+        if source.random() < 0.15:
             # Cure items
             cure_items = [
                 ("Antidote", "A powerful cure for plagues and afflictions"),
                 ("Cure Vial", "A rare remedy that can cure deadly diseases"),
                 ("Purification Elixir", "Cleansing medicine from ancient recipes"),
             ]
-            name, desc = random.choice(cure_items)
+            name, desc = source.choice(cure_items)
             return Item(
                 name=name,
                 description=desc,
@@ -2216,13 +2236,13 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
                 is_cure=True,
             )
         else:
-            heal_amount = 15 + (level * 5) + random.randint(0, 10)
+            heal_amount = 15 + (level * 5) + source.randint(0, 10)
             potions = [
                 ("Health Potion", "Restores health when consumed"),
                 ("Healing Elixir", "A bubbling red liquid"),
                 ("Life Draught", "Smells of herbs and magic"),
             ]
-            name, desc = random.choice(potions)
+            name, desc = source.choice(potions)
             return Item(
                 name=name,
                 description=desc,
@@ -2237,7 +2257,7 @@ def generate_loot(enemy: Enemy, level: int, luck: int = 10) -> Optional[Item]:
             ("Monster Fang", "A trophy from battle"),
             ("Gem Stone", "A small polished gem"),
         ]
-        name, desc = random.choice(misc_items)
+        name, desc = source.choice(misc_items)
         return Item(
             name=name,
             description=desc,
@@ -2252,6 +2272,7 @@ def spawn_enemy(
     terrain_type: Optional[str] = None,
     distance: int = 0,
     is_night: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> Enemy:
     """
     Spawn an enemy appropriate for the location and player level.
@@ -2267,6 +2288,7 @@ def spawn_enemy(
         distance: Manhattan distance from origin for difficulty scaling (default 0)
         is_night: Whether it is currently night time. Undead enemies get +20% attack
                  and +10% health at night (Issue 27).
+        rng: Optional random.Random for enemy selection (defaults to global random)
 
     Returns:
         Enemy instance with stats scaled by distance
@@ -2316,7 +2338,7 @@ def spawn_enemy(
 
     # Select random enemy from template
     enemy_list = ENEMY_TEMPLATES.get(location_type, ENEMY_TEMPLATES["default"])
-    enemy_name = random.choice(enemy_list)
+    enemy_name = (rng or random).choice(enemy_list)
 
     # Calculate base stats from level
     base_health = 20 + (level * 10)
@@ -2465,6 +2487,7 @@ def spawn_boss(
     location_category: Optional[str] = None,
     boss_type: Optional[str] = None,
     empowered: bool = False,
+    rng: Optional[random.Random] = None,
 ) -> Enemy:
     """
     Spawn a boss enemy appropriate for the location and player level.
@@ -2480,6 +2503,7 @@ def spawn_boss(
         boss_type: Optional specific boss type to spawn (e.g., "stone_sentinel").
                    When provided, overrides category-based selection.
         empowered: If True, boss has 1.5x stats (from completed ritual).
+        rng: Optional random.Random for boss selection (defaults to global random)
 
     Returns:
         Enemy instance with is_boss=True
@@ -2690,7 +2714,7 @@ def spawn_boss(
 
     # Select random boss from template
     boss_list = boss_templates[category]
-    boss_name = random.choice(boss_list)
+    boss_name = (rng or random).choice(boss_list)
 
     # Scale stats: 2x base stats for bosses
     base_health = (40 + level * 25) * 2
@@ -2726,7 +2750,7 @@ def spawn_boss(
     )
 
 
-def generate_boss_loot(boss: Enemy, level: int) -> Item:
+def generate_boss_loot(boss: Enemy, level: int, rng: Optional[random.Random] = None) -> Item:
     """Generate guaranteed loot item dropped by defeated boss.
 
     Boss loot has:
@@ -2737,10 +2761,13 @@ def generate_boss_loot(boss: Enemy, level: int) -> Item:
     Args:
         boss: The defeated boss enemy
         level: Player level for scaling loot stats
+        rng: Optional random.Random for loot rolls (defaults to global random)
 
     Returns:
         Item (always returns an item, guaranteed drop)
     """
+    source = rng or random
+
     # Choose random item type (no misc for bosses)
     item_types = [
         (ItemType.WEAPON, 0.35),
@@ -2748,7 +2775,7 @@ def generate_boss_loot(boss: Enemy, level: int) -> Item:
         (ItemType.CONSUMABLE, 0.30),
     ]
 
-    roll = random.random()
+    roll = source.random()
     cumulative: float = 0.0
     item_type = ItemType.WEAPON
     for itype, prob in item_types:
@@ -2763,12 +2790,12 @@ def generate_boss_loot(boss: Enemy, level: int) -> Item:
     # Generate item based on type
     if item_type == ItemType.WEAPON:
         from cli_rpg.models.weapon_proficiency import infer_weapon_type
-        prefix = random.choice(legendary_prefixes)
+        prefix = source.choice(legendary_prefixes)
         names = ["Greatsword", "Warblade", "Doom Axe", "Soul Reaver", "Dragon Slayer"]
-        name = random.choice(names)
+        name = source.choice(names)
         full_name = f"{prefix} {name}"
         # Enhanced stats: level + random(5, 10)
-        damage_bonus = level + random.randint(5, 10)
+        damage_bonus = level + source.randint(5, 10)
         # Infer weapon type from generated name
         weapon_type = infer_weapon_type(full_name)
         return Item(
@@ -2780,11 +2807,11 @@ def generate_boss_loot(boss: Enemy, level: int) -> Item:
         )
 
     elif item_type == ItemType.ARMOR:
-        prefix = random.choice(legendary_prefixes)
+        prefix = source.choice(legendary_prefixes)
         names = ["Platemail", "Dragon Armor", "Titan Shield", "Crown of Power", "Warlord Gauntlets"]
-        name = random.choice(names)
+        name = source.choice(names)
         # Enhanced stats: level + random(4, 8)
-        defense_bonus = level + random.randint(4, 8)
+        defense_bonus = level + source.randint(4, 8)
         return Item(
             name=f"{prefix} {name}",
             description=f"Legendary armor dropped by {boss.name}",
@@ -2793,13 +2820,13 @@ def generate_boss_loot(boss: Enemy, level: int) -> Item:
         )
 
     else:  # CONSUMABLE
-        heal_amount = 50 + (level * 10) + random.randint(10, 30)
+        heal_amount = 50 + (level * 10) + source.randint(10, 30)
         potions = [
             ("Grand Elixir", "A powerful healing elixir of legendary quality"),
             ("Essence of Life", "Pure concentrated life energy"),
             ("Phoenix Tears", "Mystical tears that restore vitality"),
         ]
-        name, desc = random.choice(potions)
+        name, desc = source.choice(potions)
         return Item(
             name=name,
             description=desc,
@@ -2879,7 +2906,8 @@ def spawn_enemies(
     level: int,
     count: Optional[int] = None,
     location_category: Optional[str] = None,
-    distance: int = 0
+    distance: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> list[Enemy]:
     """
     Spawn multiple enemies appropriate for the location and player level.
@@ -2891,6 +2919,7 @@ def spawn_enemies(
                or 1-3 (level 4+)
         location_category: Optional category from Location.category field
         distance: Manhattan distance from origin for difficulty scaling (default 0)
+        rng: Optional random.Random for count and enemy selection (defaults to global random)
 
     Returns:
         List of Enemy instances with stats scaled by distance
@@ -2899,14 +2928,14 @@ def spawn_enemies(
         # Determine count based on level
         if level < 4:
             # Lower levels: 1-2 enemies
-            count = random.randint(1, 2)
+            count = (rng or random).randint(1, 2)
         else:
             # Higher levels: 1-3 enemies
-            count = random.randint(1, 3)
+            count = (rng or random).randint(1, 3)
 
     enemies = []
     for _ in range(count):
-        enemy = spawn_enemy(location_name, level, location_category, distance=distance)
+        enemy = spawn_enemy(location_name, level, location_category, distance=distance, rng=rng)
         enemies.append(enemy)
 
     return enemies
@@ -0,0 +1,386 @@
+"""Headless Monte Carlo combat simulator for balance sweeps.
+
+Runs CombatEncounter fights without display or sound, with an injected
+random.Random per fight, so that millions of fights can be simulated
+reproducibly. A sweep covers character class x level x enemy template
+(from spawn_enemy/spawn_boss) across a process pool and reports win rate,
+turns-to-kill and damage distributions per cell.
+
+Usage:
+    from cli_rpg.combat_sim import sweep, format_sweep_report
+    results = sweep(levels=[1, 5], fights=1000, workers=4, seed=42)
+    print(format_sweep_report(results))
+"""
+
+import hashlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
+
+from cli_rpg.combat import ENEMY_TEMPLATES, CombatEncounter, spawn_boss, spawn_enemy
+from cli_rpg.models.character import Character, CharacterClass
+
+# Boss categories understood by spawn_boss (prefixed "boss:" in template names)
+BOSS_TEMPLATES: tuple[str, ...] = ("dungeon", "ruins", "cave", "forest", "default")
+
+# Fights still running after this many turns count as losses (stalemates)
+DEFAULT_MAX_TURNS = 100
+
+# Base stats for simulated characters (class bonuses are applied on top)
+BASE_STAT = 10
+
+
+@dataclass
+class FightResult:
+    """Outcome of a single simulated fight.
+
+    Attributes:
+        won: True if every enemy was defeated
+        turns: Player actions taken
+        damage_dealt: Total enemy health removed
+        damage_taken: Total player health lost
+        stalemate: True if the fight hit the turn limit
+    """
+
+    won: bool
+    turns: int
+    damage_dealt: int
+    damage_taken: int
+    stalemate: bool = False
+
+
+@dataclass
+class CellStats:
+    """Aggregated results for one class/level/template cell.
+
+    Attributes:
+        character_class: Simulated class name
+        level: Simulated character level
+        template: Enemy template ("forest", ..., or "boss:<category>")
+        fights: Number of fights simulated
+        wins: Fights won
+        stalemates: Fights stopped at the turn limit
+        turns: Per-fight turn counts
+        damage_dealt: Per-fight damage dealt
+        damage_taken: Per-fight damage taken
+    """
+
+    character_class: str
+    level: int
+    template: str
+    fights: int = 0
+    wins: int = 0
+    stalemates: int = 0
+    turns: list[int] = field(default_factory=list)
+    damage_dealt: list[int] = field(default_factory=list)
+    damage_taken: list[int] = field(default_factory=list)
+
+    @property
+    def win_rate(self) -> float:
+        """Share of fights won (0.0 with no fights)."""
+        return self.wins / self.fights if self.fights else 0.0
+
+    def add(self, result: FightResult) -> None:
+        """Record one fight result.
+
+        Args:
+            result: Outcome of the fight
+        """
+        self.fights += 1
+        if result.won:
+            self.wins += 1
+        if result.stalemate:
+            self.stalemates += 1
+        self.turns.append(result.turns)
+        self.damage_dealt.append(result.damage_dealt)
+        self.damage_taken.append(result.damage_taken)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the cell summary to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with win rate and distribution summaries
+        """
+        return {
+            "class": self.character_class,
+            "level": self.level,
+            "template": self.template,
+            "fights": self.fights,
+            "wins": self.wins,
+            "stalemates": self.stalemates,
+            "win_rate": round(self.win_rate, 4),
+            "turns": summarize(self.turns),
+            "damage_dealt": summarize(self.damage_dealt),
+            "damage_taken": summarize(self.damage_taken),
+        }
+
+
+def summarize(values: list[int]) -> dict[str, float]:
+    """Summarize a distribution as mean, p50, p90 and max.
+
+    Args:
+        values: Sample values
+
+    Returns:
+        Dictionary of summary statistics (all zero for an empty sample)
+    """
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p50": float(ordered[int(last * 0.5)]),
+        "p90": float(ordered[int(last * 0.9)]),
+        "max": float(ordered[-1]),
+    }
+
+
+def _attack(combat: CombatEncounter) -> tuple[bool, str]:
+    """Basic attack policy used by every class."""
+    return combat.player_attack()
+
+
+def _mage_policy(combat: CombatEncounter) -> tuple[bool, str]:
+    """Mage: heal when low, otherwise cast while mana lasts."""
+    player = combat.player
+    if player.health < player.max_health * 0.3 and player.mana >= 25:
+        return combat.player_heal()
+    if player.mana >= 10:
+        return combat.player_cast()
+    return combat.player_attack()
+
+
+def _cleric_policy(combat: CombatEncounter) -> tuple[bool, str]:
+    """Cleric: smite while mana lasts."""
+    if combat.player.mana >= 15:
+        return combat.player_smite()
+    return combat.player_attack()
+
+
+def _warrior_policy(combat: CombatEncounter) -> tuple[bool, str]:
+    """Warrior: bash every third turn when stamina allows."""
+    if combat.turn_count % 3 == 0 and combat.player.stamina >= 15:
+        return combat.player_bash()
+    return combat.player_attack()
+
+
+# Action policy per class; classes without an entry use basic attacks
+CLASS_POLICIES: dict[CharacterClass, Callable[[CombatEncounter], tuple[bool, str]]] = {
+    CharacterClass.MAGE: _mage_policy,
+    CharacterClass.CLERIC: _cleric_policy,
+    CharacterClass.WARRIOR: _warrior_policy,
+}
+
+
+def _disable_output() -> None:
+    """Turn off colors and sound in this process (required for the fast path)."""
+    from cli_rpg.colors import set_colors_enabled
+    from cli_rpg.sound_effects import set_sound_enabled
+
+    set_colors_enabled(False)
+    set_sound_enabled(False)
+
+
+def build_character(character_class: CharacterClass, level: int) -> Character:
+    """Create a simulated character of the given class and level.
+
+    Args:
+        character_class: Class to simulate
+        level: Target level (>= 1)
+
+    Returns:
+        Character at full health and mana
+    """
+    character = Character(
+        f"Sim {character_class.value}", BASE_STAT, BASE_STAT, BASE_STAT,
+        character_class=character_class,
+    )
+    for _ in range(max(0, level - 1)):
+        character.level_up()
+    return character
+
+
+def spawn_for_template(template: str, level: int, rng: random.Random) -> Any:
+    """Spawn the enemy for a sweep template.
+
+    Args:
+        template: ENEMY_TEMPLATES key, or "boss:<category>" for spawn_boss
+        level: Player level for scaling
+        rng: Random source for enemy selection
+
+    Returns:
+        Spawned Enemy
+    """
+    if template.startswith("boss:"):
+        category = template.split(":", 1)[1]
+        return spawn_boss("Simulation", level, location_category=category, rng=rng)
+    return spawn_enemy("Simulation", level, location_category=template, rng=rng)
+
+
+def simulate_fight(
+    character_class: CharacterClass,
+    level: int,
+    template: str,
+    rng: random.Random,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> FightResult:
+    """Simulate one fight without display output.
+
+    Skips the combat intro and end_combat() rewards; only the turn loop
+    (player action then enemy_turn) is run.
+
+    Args:
+        character_class: Class to simulate
+        level: Character level
+        template: Enemy template (see spawn_for_template)
+        rng: Random source for enemy selection and all combat rolls
+        max_turns: Turn limit after which the fight counts as a stalemate
+
+    Returns:
+        FightResult for the fight
+    """
+    player = build_character(character_class, level)
+    enemy = spawn_for_template(template, level, rng)
+    combat = CombatEncounter(player, enemy=enemy, rng=rng)
+    combat.is_active = True
+    policy = CLASS_POLICIES.get(character_class, _attack)
+
+    start_health = player.health
+    enemy_health = sum(e.health for e in combat.enemies)
+    turns = 0
+    victory = False
+    while turns < max_turns:
+        turns += 1
+        victory, _ = policy(combat)
+        if victory:
+            break
+        combat.enemy_turn()
+        if not player.is_alive():
+            break
+
+    return FightResult(
+        won=victory,
+        turns=turns,
+        damage_dealt=enemy_health - sum(max(0, e.health) for e in combat.enemies),
+        damage_taken=max(0, start_health - player.health),
+        stalemate=not victory and player.is_alive(),
+    )
+
+
+def cell_seed(seed: int, character_class: CharacterClass, level: int, template: str) -> int:
+    """Derive a deterministic seed for one sweep cell.
+
+    Uses a stable hash so results do not depend on worker assignment or
+    PYTHONHASHSEED.
+
+    Args:
+        seed: Sweep base seed
+        character_class: Cell class
+        level: Cell level
+        template: Cell template
+
+    Returns:
+        64-bit integer seed
+    """
+    key = f"{seed}:{character_class.name}:{level}:{template}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
+
+
+def run_cell(
+    character_class: CharacterClass,
+    level: int,
+    template: str,
+    fights: int,
+    seed: int,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> CellStats:
+    """Simulate all fights for one sweep cell.
+
+    Args:
+        character_class: Class to simulate
+        level: Character level
+        template: Enemy template
+        fights: Number of fights
+        seed: Sweep base seed
+        max_turns: Turn limit per fight
+
+    Returns:
+        CellStats for the cell
+    """
+    _disable_output()
+    rng = random.Random(cell_seed(seed, character_class, level, template))
+    stats = CellStats(character_class.value, level, template)
+    for _ in range(fights):
+        stats.add(simulate_fight(character_class, level, template, rng, max_turns))
+    return stats
+
+
+def _run_cell_args(args: tuple) -> CellStats:
+    """Process-pool adapter for run_cell."""
+    return run_cell(*args)
+
+
+def sweep(
+    classes: Optional[Iterable[CharacterClass]] = None,
+    levels: Iterable[int] = (1,),
+    templates: Optional[Iterable[str]] = None,
+    fights: int = 1000,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> list[CellStats]:
+    """Run a class x level x template balance sweep.
+
+    Each cell is seeded independently, so results are identical for any
+    worker count.
+
+    Args:
+        classes: Classes to simulate (default: all)
+        levels: Character levels to simulate
+        templates: Enemy templates (default: all ENEMY_TEMPLATES keys)
+        fights: Fights per cell
+        workers: Worker processes (None = CPU count, 1 = run in-process)
+        seed: Base seed
+        max_turns: Turn limit per fight
+
+    Returns:
+        CellStats per cell, in sweep order
+    """
+    classes = list(classes) if classes is not None else list(CharacterClass)
+    templates = list(templates) if templates is not None else list(ENEMY_TEMPLATES)
+    cells = [
+        (character_class, level, template, fights, seed, max_turns)
+        for character_class in classes
+        for level in levels
+        for template in templates
+    ]
+    if workers == 1:
+        return [_run_cell_args(cell) for cell in cells]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_cell_args, cells))
+
+
+def format_sweep_report(results: list[CellStats]) -> str:
+    """Format sweep results as a human-readable table.
+
+    Args:
+        results: CellStats from sweep()
+
+    Returns:
+        Multi-line report string
+    """
+    lines = [
+        f"{'Class':<9}{'Lvl':>4} {'Template':<16}{'Fights':>8}{'Win%':>7}"
+        f"{'Turns':>7}{'p90':>5}{'Dealt':>8}{'Taken':>8}"
+    ]
+    for cell in results:
+        turns = summarize(cell.turns)
+        lines.append(
+            f"{cell.character_class:<9}{cell.level:>4} {cell.template:<16}{cell.fights:>8}"
+            f"{cell.win_rate:>7.1%}{turns['mean']:>7.1f}{turns['p90']:>5.0f}"
+            f"{summarize(cell.damage_dealt)['mean']:>8.1f}"
+            f"{summarize(cell.damage_taken)['mean']:>8.1f}"
+        )
+    return "\n".join(lines)
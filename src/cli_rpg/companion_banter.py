@@ -12,6 +12,7 @@ from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from cli_rpg.models.companion import Companion
+    from cli_rpg.flavor_pool import FlavorTextPool
 
 from cli_rpg.models.companion import BondLevel
 
@@ -135,6 +136,15 @@ BOND_BANTER_CHANCE = 0.25    # 25% chance to use bond-level banter
 class CompanionBanterService:
     """Service for generating companion banter during travel."""
 
+    def __init__(self, flavor_pool: Optional["FlavorTextPool"] = None):
+        """Initialize the banter service.
+
+        Args:
+            flavor_pool: Optional pool of prefetched AI banter lines, used
+                before the location category templates
+        """
+        self.flavor_pool = flavor_pool
+
     def get_banter(
         self,
         companions: list["Companion"],
@@ -142,6 +152,7 @@ class CompanionBanterService:
         weather: str = "clear",
         is_night: bool = False,
         dread: int = 0,
+        theme: str = "fantasy",
     ) -> Optional[tuple[str, str]]:
         """Get banter from a random companion.
 
@@ -151,6 +162,7 @@ class CompanionBanterService:
             weather: Current weather condition (clear, rain, storm, fog)
             is_night: Whether it's currently night time
             dread: Current dread level (0-100)
+            theme: World theme (selects the flavor pool)
 
         Returns:
             Tuple of (companion_name, banter_text) or None if no banter triggers
@@ -189,7 +201,15 @@ class CompanionBanterService:
         if is_night and random.random() < NIGHT_BANTER_CHANCE:
             return (companion.name, random.choice(NIGHT_BANTER))
 
-        # 5. Default: location category banter
+        # 5. Prefetched AI banter for this location, if any is pooled
+        if self.flavor_pool is not None:
+            from cli_rpg.flavor_pool import BANTER
+
+            pooled = self.flavor_pool.take(BANTER, location_category, theme, dread)
+            if pooled:
+                return (companion.name, pooled)
+
+        # 6. Default: location category banter
         category_banters = CATEGORY_BANTER.get(
             location_category or "default",
             CATEGORY_BANTER["default"]
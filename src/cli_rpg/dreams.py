@@ -15,6 +15,7 @@ from cli_rpg.text_effects import typewriter_print, pause_medium
 
 if TYPE_CHECKING:  # pragma: no cover
     from cli_rpg.ai_service import AIService  # pragma: no cover
+    from cli_rpg.flavor_pool import FlavorTextPool  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,7 @@ def maybe_trigger_dream(
     last_dream_hour: Optional[int] = None,
     current_hour: Optional[int] = None,
     tiredness: Optional[int] = None,
+    flavor_pool: Optional["FlavorTextPool"] = None,
 ) -> Optional[str]:
     """Potentially trigger a dream during rest.
 
@@ -103,6 +105,9 @@ def maybe_trigger_dream(
         current_hour: Current game hour (for cooldown check)
         tiredness: Current tiredness level (0-100). If provided, blocks dreams
                    when tiredness < 30 and modifies dream chance based on level.
+        flavor_pool: Optional pool of prefetched AI dreams. When provided, AI
+                     dreams are only served from the pool (never generated
+                     inline) and templates are used when it is empty.
 
     Returns:
         Formatted dream text if triggered, None otherwise
@@ -132,8 +137,15 @@ def maybe_trigger_dream(
     # Determine if this is a nightmare
     is_nightmare = dread >= NIGHTMARE_DREAD_THRESHOLD
 
-    # Try AI generation first if available
-    if ai_service is not None:
+    # Serve a prefetched AI dream when a pool is attached
+    if flavor_pool is not None:
+        from cli_rpg.flavor_pool import DREAM
+
+        pooled = flavor_pool.take(DREAM, None, theme, dread)
+        if pooled:
+            return format_dream(pooled)
+    # Otherwise try AI generation first if available
+    elif ai_service is not None:
         try:
             dream_text = ai_service.generate_dream(
                 theme=theme,
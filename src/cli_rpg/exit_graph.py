@@ -0,0 +1,169 @@
+"""Cached exit graph for overworld navigation.
+
+The overworld is a plain dict of name -> Location, so finding the location
+at a coordinate used to mean scanning every location. ExitGraph keeps a
+coordinate index for one world dict, so exit queries
+(Location.get_available_directions, the tab completer, map rendering) and
+coordinate lookups cost O(1) instead of O(world).
+
+The index is rebuilt lazily whenever the world dict changes size or its most
+recently inserted name changes (a location was added or removed, possibly
+both, or a PagedWorld region was paged in; only materialized locations are
+indexed, and a query pages in the region it falls in), or whenever any
+Location's coordinates were reassigned (Location.coordinate_moves), so a
+location moved in place is neither reported at its old coordinates nor
+missed at its new ones. Callers that replace a location under an existing
+name should call invalidate().
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+from cli_rpg.models.location import Location
+from cli_rpg.paged_world import PagedWorld
+
+# Overworld movement offsets (same as world_grid.DIRECTION_OFFSETS)
+EXIT_OFFSETS: dict[str, tuple[int, int]] = {
+    "north": (0, 1),
+    "south": (0, -1),
+    "east": (1, 0),
+    "west": (-1, 0),
+}
+
+# Number of world dicts whose graphs are kept (the game uses one; tests many)
+MAX_CACHED_GRAPHS = 8
+
+# Returned by ExitGraph._lookup when an indexed entry no longer matches the world
+_STALE = object()
+
+
+class ExitGraph:
+    """Coordinate index and exit queries for one overworld location dict.
+
+    Attributes:
+        world: The world dict being indexed (not copied)
+    """
+
+    def __init__(self, world: dict):
+        """Index a world dict.
+
+        Args:
+            world: Dictionary mapping location names to Locations
+        """
+        self.world = world
+        self._by_coords: dict[tuple, str] = {}
+        self._signature: Optional[tuple] = None
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next query."""
+        self._signature = None
+
+    def _sync(self) -> None:
+        """Rebuild the coordinate index if the world changed."""
+        # dict methods see only the materialized part of a PagedWorld. Dicts
+        # keep insertion order, so a removal followed by an addition leaves the
+        # size unchanged but puts a new name last
+        size = dict.__len__(self.world)
+        signature = (
+            size,
+            next(reversed(dict.keys(self.world))) if size else None,
+            Location.coordinate_moves,
+        )
+        if self._signature == signature:
+            return
+        by_coords: dict[tuple, str] = {}
+        for name, location in dict.items(self.world):
+            if isinstance(location.coordinates, tuple):
+                # First location wins, matching a linear scan of the world
+                by_coords.setdefault(location.coordinates, name)
+        self._by_coords = by_coords
+        self._signature = signature
+
+    def location_at(self, coords: tuple) -> Optional[Location]:
+        """Return the location at the given coordinates.
+
+        Args:
+            coords: Coordinate tuple
+
+        Returns:
+            Location at those coordinates, or None if there is none
+        """
+        if isinstance(self.world, PagedWorld):
+            self.world.load_region_at(coords)
+        self._sync()
+        location = self._lookup(coords)
+        if location is _STALE:
+            # Changed in place since the last rebuild
+            self.invalidate()
+            self._sync()
+            location = self._lookup(coords)
+        return None if location is _STALE else location
+
+    def _lookup(self, coords: tuple):
+        """Look up indexed coordinates.
+
+        Returns:
+            The Location, None if nothing is indexed there, or _STALE if the
+            indexed entry no longer matches the world
+        """
+        name = self._by_coords.get(coords)
+        if name is None:
+            return None
+        location = self.world.get(name)
+        if location is None or location.coordinates != coords:
+            return _STALE
+        return location
+
+    def has_location(self, coords: tuple) -> bool:
+        """Check whether a location exists at the given coordinates.
+
+        Args:
+            coords: Coordinate tuple
+
+        Returns:
+            True if a location is at those coordinates
+        """
+        return self.location_at(coords) is not None
+
+    def __contains__(self, coords: tuple) -> bool:
+        return self.has_location(coords)
+
+    def exits_from(self, coords: tuple) -> list[str]:
+        """Return the directions from a coordinate that lead to a location.
+
+        Args:
+            coords: Coordinate tuple (only x and y are used)
+
+        Returns:
+            Sorted list of direction names
+        """
+        x, y = coords[0], coords[1]
+        return sorted(
+            direction
+            for direction, (dx, dy) in EXIT_OFFSETS.items()
+            if self.has_location((x + dx, y + dy))
+        )
+
+
+_graphs: "OrderedDict[int, ExitGraph]" = OrderedDict()
+
+
+def get_exit_graph(world: dict) -> ExitGraph:
+    """Return the shared ExitGraph for a world dict, creating it on first use.
+
+    Args:
+        world: Dictionary mapping location names to Locations
+
+    Returns:
+        The world's ExitGraph
+    """
+    key = id(world)
+    graph = _graphs.get(key)
+    if graph is None or graph.world is not world:
+        graph = ExitGraph(world)
+        _graphs[key] = graph
+        while len(_graphs) > MAX_CACHED_GRAPHS:
+            _graphs.popitem(last=False)
+    else:
+        _graphs.move_to_end(key)
+    return graph
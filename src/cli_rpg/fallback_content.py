@@ -3,13 +3,20 @@
 Provides expanded template-based fallback content for rooms, NPCs, items, and quests.
 Uses seeded RNG for reproducibility. Templates are category-specific.
 
+The template dicts below are the editable source. At first use they are
+compiled once (see compile_fallback_tables) into tuple pools keyed by
+lowercase category, with every "fall back to default" lookup resolved ahead
+of time, so each selection is a single dict access plus one RNG draw.
+
 This module centralizes all fallback content generation that ContentLayer needs
 when AIService is unavailable or fails.
 """
 
 import random
+import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Iterable, Optional, TYPE_CHECKING
 
 from cli_rpg.procedural_interiors import RoomType
 
@@ -1322,6 +1329,173 @@ QUEST_TARGET_POOLS: dict[str, dict[str, list[str]]] = {
 }
 
 
+# =============================================================================
+# Compiled Selection Tables
+# =============================================================================
+
+# Last-resort pools used when a table has no "default" entry
+_UNKNOWN_ROOM_NAMES = ("Unknown Chamber",)
+_UNKNOWN_ROOM_DESCRIPTIONS = ("A mysterious chamber.",)
+_UNKNOWN_ITEMS = ({"name": "Unknown Item", "description": "A mysterious object."},)
+_UNKNOWN_TARGETS = ("Target",)
+
+# Item stats copied into generated item content, in output order
+_ITEM_STAT_KEYS = ("damage_bonus", "defense_bonus", "heal_amount")
+
+# A category pool table: lowercase category -> pool, always with a "default" key
+CategoryPools = dict[str, tuple]
+
+
+@dataclass(frozen=True)
+class CompiledFallbackTables:
+    """Fallback templates flattened into tuple pools with defaults pre-resolved.
+
+    Every category-keyed table maps interned lowercase keys to tuples and
+    always has a "default" entry, so selection never needs a chain of
+    fallback lookups. Pools keep the order of the source lists, so RNG
+    draws select exactly the same entries as the source templates.
+
+    Attributes:
+        room_names: RoomType -> room name pool
+        room_descriptions: RoomType -> category pools of descriptions
+        npcs: Role -> (names, descriptions, dialogues) pools
+        items: Item type -> category pools of (name, description, stats) entries
+        quests: Category -> pool of quest content dicts
+        treasures: Category -> (names, descriptions, loot table) pools
+        quest_targets: Quest template type -> category pools of target names
+    """
+
+    room_names: dict[RoomType, tuple[str, ...]]
+    room_descriptions: dict[RoomType, CategoryPools]
+    npcs: dict[str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]]
+    items: dict[str, CategoryPools]
+    quests: dict[str, tuple[dict, ...]]
+    treasures: dict[str, tuple[tuple[str, ...], tuple[str, ...], tuple[dict, ...]]]
+    quest_targets: dict[str, CategoryPools]
+
+
+def _strings(values: Iterable[str]) -> tuple[str, ...]:
+    """Intern a list of template strings into a tuple pool."""
+    return tuple(sys.intern(value) for value in values)
+
+
+def _category_pools(
+    by_category: dict[str, list], convert, fallback: tuple
+) -> CategoryPools:
+    """Compile a category -> list table into category -> tuple pools.
+
+    Empty category lists fall back to the default pool, and a missing or
+    empty default falls back to the given last-resort pool.
+
+    Args:
+        by_category: Source table keyed by category
+        convert: Function turning a source list into a tuple pool
+        fallback: Pool used when the table has no usable default
+
+    Returns:
+        Category pools with a "default" entry
+    """
+    default = convert(by_category.get("default") or []) or fallback
+    pools = {
+        sys.intern(category): convert(values) or default
+        for category, values in by_category.items()
+    }
+    pools["default"] = default
+    return pools
+
+
+def _item_entries(items: list[dict]) -> tuple:
+    """Compile item templates into (name, description, stats) entries."""
+    return tuple(
+        (
+            sys.intern(item.get("name", "Unknown Item")),
+            sys.intern(item.get("description", "A mysterious object.")),
+            tuple((key, item[key]) for key in _ITEM_STAT_KEYS if key in item),
+        )
+        for item in items
+    )
+
+
+@lru_cache(maxsize=1)
+def compile_fallback_tables() -> CompiledFallbackTables:
+    """Compile the fallback template dicts into selection tables (once).
+
+    Returns:
+        The compiled tables, shared by every FallbackContentProvider
+    """
+    npc_roles = set(NPC_NAMES) | set(NPC_DESCRIPTIONS) | set(NPC_DIALOGUES)
+    npcs = {
+        sys.intern(role): (
+            _strings(NPC_NAMES.get(role, NPC_NAMES["default"])),
+            _strings(NPC_DESCRIPTIONS.get(role, NPC_DESCRIPTIONS["default"])),
+            _strings(NPC_DIALOGUES.get(role, NPC_DIALOGUES["default"])),
+        )
+        for role in npc_roles
+    }
+
+    treasure_categories = (
+        set(TREASURE_CHEST_NAMES) | set(TREASURE_CHEST_DESCRIPTIONS) | set(TREASURE_LOOT_TABLES)
+    )
+    treasures = {
+        sys.intern(category): (
+            _strings(TREASURE_CHEST_NAMES.get(category, TREASURE_CHEST_NAMES["default"])),
+            _strings(
+                TREASURE_CHEST_DESCRIPTIONS.get(category, TREASURE_CHEST_DESCRIPTIONS["default"])
+            ),
+            tuple(TREASURE_LOOT_TABLES.get(category, TREASURE_LOOT_TABLES["default"])),
+        )
+        for category in treasure_categories
+    }
+
+    return CompiledFallbackTables(
+        room_names={
+            room_type: _strings(names) for room_type, names in ROOM_NAMES.items()
+        },
+        room_descriptions={
+            room_type: _category_pools(by_category, _strings, _UNKNOWN_ROOM_DESCRIPTIONS)
+            for room_type, by_category in ROOM_DESCRIPTIONS.items()
+        },
+        npcs=npcs,
+        items={
+            sys.intern(item_type): _category_pools(
+                by_category, _item_entries, _item_entries(list(_UNKNOWN_ITEMS))
+            )
+            for item_type, by_category in ITEM_TEMPLATES.items()
+        },
+        quests={
+            sys.intern(category): tuple(
+                {
+                    "name": quest["name"],
+                    "description": quest["description"],
+                    "objective_type": quest["objective_type"],
+                    "target": quest["target"],
+                }
+                for quest in quests
+            )
+            for category, quests in QUEST_TEMPLATES.items()
+        },
+        treasures=treasures,
+        quest_targets={
+            sys.intern(template_type): _category_pools(by_category, _strings, _UNKNOWN_TARGETS)
+            for template_type, by_category in QUEST_TARGET_POOLS.items()
+        },
+    )
+
+
+@lru_cache(maxsize=256)
+def _table_key(value: Optional[str], default: str) -> str:
+    """Normalize a category/role/type argument to its interned table key.
+
+    Args:
+        value: Caller-supplied value (any case, may be empty or None)
+        default: Key used for empty values
+
+    Returns:
+        Interned lowercase key
+    """
+    return sys.intern(value.lower()) if value else default
+
+
 # =============================================================================
 # FallbackContentProvider Class
 # =============================================================================
@@ -1341,10 +1515,12 @@ class FallbackContentProvider:
 
     seed: int
     _rng: "random.Random" = field(init=False, repr=False)
+    _tables: CompiledFallbackTables = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the random number generator with the provided seed."""
         self._rng = random.Random(self.seed)
+        self._tables = compile_fallback_tables()
 
     def get_room_content(self, room_type: RoomType, category: str) -> dict:
         """Generate room name and description.
@@ -1356,22 +1532,35 @@ class FallbackContentProvider:
         Returns:
             Dict with 'name' and 'description' keys.
         """
-        # Get name from room type templates
-        names = ROOM_NAMES.get(room_type, ["Unknown Chamber"])
-        name = self._rng.choice(names)
+        return self.get_room_contents([(room_type, category)])[0]
 
-        # Get description from room type + category templates
-        desc_by_category = ROOM_DESCRIPTIONS.get(room_type, {})
-        category_lower = category.lower() if category else "default"
+    def get_room_contents(
+        self, rooms: Iterable[tuple[RoomType, str]]
+    ) -> list[dict]:
+        """Generate names and descriptions for a batch of rooms in one call.
 
-        # Try category-specific, fall back to default
-        descriptions = desc_by_category.get(category_lower)
-        if not descriptions:
-            descriptions = desc_by_category.get("default", ["A mysterious chamber."])
+        Equivalent to calling get_room_content for each room in order (same
+        RNG draws), for filling a whole SubGrid or area from one provider.
 
-        description = self._rng.choice(descriptions)
+        Args:
+            rooms: (room_type, category) pairs
 
-        return {"name": name, "description": description}
+        Returns:
+            List of dicts with 'name' and 'description' keys, in input order.
+        """
+        choice = self._rng.choice
+        room_names = self._tables.room_names
+        room_descriptions = self._tables.room_descriptions
+        contents = []
+        for room_type, category in rooms:
+            name = choice(room_names.get(room_type, _UNKNOWN_ROOM_NAMES))
+            pools = room_descriptions.get(room_type)
+            if pools is None:
+                descriptions = _UNKNOWN_ROOM_DESCRIPTIONS
+            else:
+                descriptions = pools.get(_table_key(category, "default")) or pools["default"]
+            contents.append({"name": name, "description": choice(descriptions)})
+        return contents
 
     def get_npc_content(self, role: str, category: str) -> dict:
         """Generate NPC name, description, and dialogue.
@@ -1383,18 +1572,13 @@ class FallbackContentProvider:
         Returns:
             Dict with 'name', 'description', and 'dialogue' keys.
         """
-        role_lower = role.lower() if role else "default"
+        role_key = _table_key(role, "default")
+        names, descriptions, dialogues = (
+            self._tables.npcs.get(role_key) or self._tables.npcs["default"]
+        )
 
-        # Get name from role templates
-        names = NPC_NAMES.get(role_lower, NPC_NAMES["default"])
         name = self._rng.choice(names)
-
-        # Get description from role templates
-        descriptions = NPC_DESCRIPTIONS.get(role_lower, NPC_DESCRIPTIONS["default"])
         description = self._rng.choice(descriptions)
-
-        # Get dialogue from role templates
-        dialogues = NPC_DIALOGUES.get(role_lower, NPC_DIALOGUES["default"])
         dialogue = self._rng.choice(dialogues)
 
         return {"name": name, "description": description, "dialogue": dialogue}
@@ -1409,34 +1593,18 @@ class FallbackContentProvider:
         Returns:
             Dict with 'name', 'description', 'item_type', and relevant stats.
         """
-        item_type_lower = item_type.lower() if item_type else "misc"
-        category_lower = category.lower() if category else "default"
-
-        # Get templates for this item type
-        type_templates = ITEM_TEMPLATES.get(item_type_lower, ITEM_TEMPLATES["misc"])
-
-        # Get category-specific items or default
-        items = type_templates.get(category_lower, type_templates.get("default", []))
-        if not items:
-            items = type_templates.get("default", [{"name": "Unknown Item", "description": "A mysterious object."}])
+        item_type_key = _table_key(item_type, "misc")
+        category_key = _table_key(category, "default")
 
-        item = self._rng.choice(items)
+        # Unknown item types use the misc templates
+        pools = self._tables.items.get(item_type_key) or self._tables.items["misc"]
+        items = pools.get(category_key) or pools["default"]
 
-        # Build result with item_type
-        result = {
-            "name": item.get("name", "Unknown Item"),
-            "description": item.get("description", "A mysterious object."),
-            "item_type": item_type_lower,
-        }
-
-        # Add type-specific stats
-        if "damage_bonus" in item:
-            result["damage_bonus"] = item["damage_bonus"]
-        if "defense_bonus" in item:
-            result["defense_bonus"] = item["defense_bonus"]
-        if "heal_amount" in item:
-            result["heal_amount"] = item["heal_amount"]
+        name, description, stats = self._rng.choice(items)
 
+        # Build result with item_type, then type-specific stats
+        result = {"name": name, "description": description, "item_type": item_type_key}
+        result.update(stats)
         return result
 
     def get_quest_content(self, category: str) -> dict:
@@ -1448,18 +1616,11 @@ class FallbackContentProvider:
         Returns:
             Dict with 'name', 'description', 'objective_type', and 'target'.
         """
-        category_lower = category.lower() if category else "default"
+        category_key = _table_key(category, "default")
 
         # Get quests for this category or default
-        quests = QUEST_TEMPLATES.get(category_lower, QUEST_TEMPLATES["default"])
-        quest = self._rng.choice(quests)
-
-        return {
-            "name": quest["name"],
-            "description": quest["description"],
-            "objective_type": quest["objective_type"],
-            "target": quest["target"],
-        }
+        quests = self._tables.quests.get(category_key) or self._tables.quests["default"]
+        return dict(self._rng.choice(quests))
 
     def get_treasure_content(
         self, category: str, distance: int = 1, z_level: int = 0
@@ -1474,23 +1635,14 @@ class FallbackContentProvider:
         Returns:
             Dict with 'name', 'description', 'difficulty', and 'items' list.
         """
-        category_lower = category.lower() if category else "default"
+        category_key = _table_key(category, "default")
+        names, descriptions, loot_table = (
+            self._tables.treasures.get(category_key) or self._tables.treasures["default"]
+        )
 
-        # Get chest name
-        names = TREASURE_CHEST_NAMES.get(category_lower, TREASURE_CHEST_NAMES["default"])
         name = self._rng.choice(names)
-
-        # Get chest description
-        descriptions = TREASURE_CHEST_DESCRIPTIONS.get(
-            category_lower, TREASURE_CHEST_DESCRIPTIONS["default"]
-        )
         description = self._rng.choice(descriptions)
 
-        # Get loot table
-        loot_table = TREASURE_LOOT_TABLES.get(
-            category_lower, TREASURE_LOOT_TABLES["default"]
-        )
-
         # Select 1-2 items from loot table
         num_items = self._rng.randint(1, min(2, len(loot_table)))
         items = self._rng.sample(loot_table, num_items)
@@ -1520,14 +1672,13 @@ class FallbackContentProvider:
         Returns:
             A target name string appropriate for the quest type and category.
         """
-        type_pools = QUEST_TARGET_POOLS.get(template_type, QUEST_TARGET_POOLS.get("explore", {}))
-        category_lower = category.lower() if category else "default"
-
-        targets = type_pools.get(category_lower)
-        if not targets:
-            targets = type_pools.get("default", ["Target"])
+        quest_targets = self._tables.quest_targets
+        type_pools = quest_targets.get(template_type) or quest_targets.get("explore")
+        if type_pools is None:
+            return self._rng.choice(_UNKNOWN_TARGETS)
 
-        return self._rng.choice(targets)
+        category_key = _table_key(category, "default")
+        return self._rng.choice(type_pools.get(category_key) or type_pools["default"])
 
     def get_branch_content(
         self, template_type: str, branch_id: str, target: str, category: str
@@ -0,0 +1,344 @@
+"""Prefetched pools of AI flavor text (whispers, dreams, companion banter).
+
+Whispers, dreams and banter trigger on the move and rest paths, where a
+synchronous LLM round trip would add seconds to a command. FlavorTextPool
+keeps a small pool of pre-generated lines per (kind, category, theme, dread
+band), fills it from a background worker while the game waits for input,
+and serves lines instantly. When a pool is empty the caller uses its
+template text instead, so these features never block a command.
+
+Pools are persisted between sessions (see load/save), so a new session
+starts with the lines left over from the previous one.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cli_rpg.ai_service import AIService
+
+logger = logging.getLogger(__name__)
+
+# Flavor text kinds
+WHISPER = "whisper"
+DREAM = "dream"
+BANTER = "banter"
+FLAVOR_KINDS = (WHISPER, DREAM, BANTER)
+
+# Lines generated per pool on refill, and the level that triggers a refill
+DEFAULT_POOL_SIZE = 6
+DEFAULT_LOW_WATER = 2
+
+# Dread at or above this level uses the "high" band (nightmares, paranoid lines)
+HIGH_DREAD_THRESHOLD = 50
+
+# Persistence file name (stored next to the AI response cache file)
+FLAVOR_POOL_FILENAME = "flavor_pool.json"
+
+# Location name given to the AI for pooled dreams (not tied to one place)
+DREAM_LOCATION = "a place of rest on the road"
+
+PoolKey = tuple[str, str, str, str]  # (kind, category, theme, dread band)
+
+
+def dread_band(dread: int) -> str:
+    """Map a dread level to its pool band.
+
+    Args:
+        dread: Current dread level (0-100)
+
+    Returns:
+        "high" at HIGH_DREAD_THRESHOLD or above, otherwise "low"
+    """
+    return "high" if dread >= HIGH_DREAD_THRESHOLD else "low"
+
+
+def flavor_pool_path(ai_service: Optional["AIService"]) -> Optional[str]:
+    """Return where an AI service's flavor text pool is persisted.
+
+    Pools follow the AI response cache: they are stored next to the
+    configured cache file and not persisted when caching is disabled.
+
+    Args:
+        ai_service: AI service whose config holds the cache file
+
+    Returns:
+        Pool file path, or None if pools should not be persisted
+    """
+    config = getattr(ai_service, "config", None)
+    cache_file = getattr(config, "cache_file", None)
+    if not isinstance(cache_file, str) or not cache_file:
+        return None
+    return os.path.join(os.path.dirname(cache_file), FLAVOR_POOL_FILENAME)
+
+
+def pool_key(kind: str, category: Optional[str], theme: str, dread: int) -> PoolKey:
+    """Build the pool key for a request.
+
+    Args:
+        kind: WHISPER, DREAM or BANTER
+        category: Location category (None uses "default")
+        theme: World theme
+        dread: Current dread level (0-100)
+
+    Returns:
+        Pool key tuple
+    """
+    return (kind, category or "default", theme, dread_band(dread))
+
+
+class FlavorTextPool:
+    """Pools of pre-generated flavor text refilled by a background worker.
+
+    Attributes:
+        pool_size: Lines generated per pool on refill
+        low_water: Refill is requested when a pool drops below this size
+    """
+
+    def __init__(
+        self,
+        ai_service: Optional["AIService"],
+        pool_size: int = DEFAULT_POOL_SIZE,
+        low_water: int = DEFAULT_LOW_WATER,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            ai_service: AI service used for refills (None disables refills)
+            pool_size: Lines generated per pool on refill
+            low_water: Refill is requested when a pool drops below this size
+        """
+        self._ai_service = ai_service
+        self.pool_size = pool_size
+        self.low_water = low_water
+        self._pools: dict[PoolKey, list[str]] = {}
+        self._queued: set[PoolKey] = set()
+        self._queue: queue.Queue[Optional[PoolKey]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._running = False
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background refill worker.
+
+        If no AI service is configured, this is a no-op.
+        """
+        if self._ai_service is None:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = threading.Thread(
+                target=self._worker_loop, daemon=True, name="flavor-pool"
+            )
+            self._worker.start()
+
+    def shutdown(self) -> None:
+        """Stop the refill worker (lines already generated are kept)."""
+        with self._lock:
+            self._running = False
+        self._queue.put(None)
+        if self._worker is not None:
+            self._worker.join(timeout=1.0)
+            self._worker = None
+
+    def take(
+        self, kind: str, category: Optional[str], theme: str, dread: int = 0
+    ) -> Optional[str]:
+        """Take a pooled line, requesting a refill when the pool runs low.
+
+        Never blocks on generation.
+
+        Args:
+            kind: WHISPER, DREAM or BANTER
+            category: Location category
+            theme: World theme
+            dread: Current dread level (0-100)
+
+        Returns:
+            A pre-generated line, or None if the pool is empty
+        """
+        key = pool_key(kind, category, theme, dread)
+        with self._lock:
+            lines = self._pools.get(key)
+            text = lines.pop(0) if lines else None
+        self._request_refill(key)
+        return text
+
+    def prime(
+        self, kind: str, category: Optional[str], theme: str, dread: int = 0
+    ) -> None:
+        """Request a refill for a pool ahead of use if it is running low.
+
+        Args:
+            kind: WHISPER, DREAM or BANTER
+            category: Location category
+            theme: World theme
+            dread: Current dread level (0-100)
+        """
+        self._request_refill(pool_key(kind, category, theme, dread))
+
+    def available(
+        self, kind: str, category: Optional[str], theme: str, dread: int = 0
+    ) -> int:
+        """Return the number of pooled lines for a request.
+
+        Args:
+            kind: WHISPER, DREAM or BANTER
+            category: Location category
+            theme: World theme
+            dread: Current dread level (0-100)
+
+        Returns:
+            Lines currently in the pool
+        """
+        with self._lock:
+            return len(self._pools.get(pool_key(kind, category, theme, dread), []))
+
+    def _request_refill(self, key: PoolKey) -> None:
+        """Queue a pool for refill if it is below the low-water mark."""
+        with self._lock:
+            if not self._running or key in self._queued:
+                return
+            if len(self._pools.get(key, [])) >= self.low_water:
+                return
+            self._queued.add(key)
+        self._queue.put(key)
+
+    def _worker_loop(self) -> None:
+        """Refill queued pools until shutdown."""
+        while self._running:
+            try:
+                key = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if key is None:  # Shutdown sentinel
+                break
+            try:
+                self._refill(key)
+            finally:
+                with self._lock:
+                    self._queued.discard(key)
+
+    def _refill(self, key: PoolKey) -> None:
+        """Generate lines until a pool is full (stops at the first failure).
+
+        Args:
+            key: Pool to refill
+        """
+        while self._running:
+            with self._lock:
+                if len(self._pools.get(key, [])) >= self.pool_size:
+                    return
+            try:
+                text = self._generate(key)
+            except Exception as e:
+                logger.debug(f"Flavor text generation failed for {key}: {e}")
+                return
+            if not isinstance(text, str) or not text:
+                return
+            with self._lock:
+                self._pools.setdefault(key, []).append(text)
+
+    def _generate(self, key: PoolKey) -> str:
+        """Generate one line for a pool with the AI service.
+
+        Args:
+            key: Pool to generate for
+
+        Returns:
+            Generated text
+
+        Raises:
+            ValueError: If the pool kind is unknown
+            Any exception from the AI service
+        """
+        kind, category, theme, band = key
+        dread = HIGH_DREAD_THRESHOLD if band == "high" else 0
+        if kind == WHISPER:
+            return self._ai_service.generate_whisper(theme=theme, location_category=category)
+        if kind == DREAM:
+            return self._ai_service.generate_dream(
+                theme=theme,
+                dread=dread,
+                choices=None,
+                location_name=DREAM_LOCATION,
+                is_nightmare=band == "high",
+            )
+        if kind == BANTER:
+            return self._ai_service.generate_banter(
+                theme=theme, location_category=category, dread=dread
+            )
+        raise ValueError(f"Unknown flavor text kind: {kind}")
+
+    def to_dict(self) -> dict:
+        """Serialize pooled lines to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary with a list of non-empty pools
+        """
+        with self._lock:
+            pools = [
+                {"kind": kind, "category": category, "theme": theme, "band": band,
+                 "lines": list(lines)}
+                for (kind, category, theme, band), lines in self._pools.items()
+                if lines
+            ]
+        return {"pools": pools}
+
+    def load_dict(self, data: dict) -> None:
+        """Merge pooled lines from a dictionary created by to_dict.
+
+        Unknown kinds and malformed entries are ignored; pools are capped
+        at pool_size.
+
+        Args:
+            data: Dictionary from to_dict
+        """
+        with self._lock:
+            for entry in data.get("pools", []):
+                try:
+                    key = (entry["kind"], entry["category"], entry["theme"], entry["band"])
+                    lines = [line for line in entry["lines"] if isinstance(line, str) and line]
+                except (KeyError, TypeError):
+                    continue
+                if key[0] not in FLAVOR_KINDS:
+                    continue
+                pool = self._pools.setdefault(key, [])
+                pool.extend(lines[: max(0, self.pool_size - len(pool))])
+
+    def load(self, path: str) -> None:
+        """Load pooled lines saved by a previous session.
+
+        A missing or unreadable file leaves the pools unchanged.
+
+        Args:
+            path: Pool file path
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r") as f:
+                self.load_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load flavor text pool from {path}: {e}")
+
+    def save(self, path: str) -> None:
+        """Save pooled lines for the next session.
+
+        Args:
+            path: Pool file path
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f)
+        except OSError as e:
+            logger.warning(f"Failed to save flavor text pool to {path}: {e}")
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from cli_rpg.world_grid import SubGrid
     from cli_rpg.wfc_chunks import ChunkManager
     from cli_rpg.background_gen import BackgroundGenerationQueue
+    from cli_rpg.interior_builder import InteriorBuilder
+    from cli_rpg.ai_world import WorldBuild
+    from cli_rpg.flavor_pool import FlavorTextPool
     from cli_rpg.models.quest import Quest
 from cli_rpg.models.game_time import GameTime
 from cli_rpg.models.location import Location
@@ -44,8 +47,15 @@ from cli_rpg.models.world_event import WorldEvent
 from cli_rpg.world_events import (
     check_for_new_event,
     progress_events,
+    get_active_events,
     get_location_event_warning,
 )
+from cli_rpg.session_rng import AI_FALLBACK, ENCOUNTERS, WEATHER, SessionRNG
+from cli_rpg.prefetch_planner import PrefetchPlanner
+from cli_rpg.paged_world import PagedWorld, serialize_world
+from cli_rpg.map_pyramid import MapPyramid
+from cli_rpg.pathfinding import PathfindingService
+from cli_rpg.time_scheduler import QUEST_DEADLINES, TimeScheduler
 from cli_rpg.secrets import check_passive_detection
 from cli_rpg.location_noise import LocationNoiseManager
 
@@ -83,7 +93,7 @@ KNOWN_COMMANDS: set[str] = {
     "stance",  # Fighting stance command
     "inventory", "equip", "unequip", "use", "drop", "talk", "buy", "sell", "shop",
     "map", "worldmap", "help", "quests", "quest", "accept", "complete", "abandon", "lore", "rest",
-    "bestiary", "dump-state", "events", "companions", "recruit", "dismiss", "companion-quest",
+    "bestiary", "dump-state", "ai-stats", "events", "companions", "recruit", "dismiss", "companion-quest",
     "enter", "exit", "leave", "resolve", "pick", "open",
     "persuade", "intimidate", "bribe", "haggle",  # Social skills
     "search",  # Secret discovery
@@ -114,6 +124,12 @@ DREAD_NIGHT_BONUS = 5  # Extra dread when moving at night
 DREAD_TOWN_REDUCTION = 15  # Dread reduced when entering town
 DREAD_COMBAT_INCREASE = 10  # Dread increase when combat starts
 
+# Max seconds a move waits for an in-flight background generation of its target
+BACKGROUND_GEN_WAIT_TIMEOUT = 30.0
+
+# Seconds between checks while a move waits for the initial world build
+WORLD_BUILD_POLL_INTERVAL = 0.05
+
 
 def suggest_command(unknown_cmd: str, known_commands: set[str]) -> Optional[str]:
     """Suggest a similar command for typos using fuzzy matching.
@@ -247,6 +263,7 @@ class GameState:
         ai_service: Optional["AIService"] = None,
         theme: str = "fantasy",
         chunk_manager: Optional["ChunkManager"] = None,
+        seed: Optional[int] = None,
     ):
         """Initialize game state.
 
@@ -257,6 +274,9 @@ class GameState:
             ai_service: Optional AIService for dynamic world generation
             theme: World theme for AI generation (default: "fantasy")
             chunk_manager: Optional ChunkManager for WFC terrain generation
+            seed: Optional session seed for the named RNG streams (combat,
+                encounters, loot, weather, events, AI fallback); None uses
+                the global random module
 
         Raises:
             TypeError: If character is not a Character instance
@@ -297,6 +317,7 @@ class GameState:
         self.weather = Weather()  # Weather system tracking
         self.choices: list[dict] = []  # Echo choices: tracking significant player decisions
         self.world_events: list[WorldEvent] = []  # Living world events
+        self.scheduler = TimeScheduler()  # Game-time deadlines (quests, world events)
         self.companions: list[Companion] = []  # Party companions with bond mechanics
         self.haggle_bonus: float = 0.0  # Active haggle bonus (reset after one transaction)
         self.forage_cooldown: int = 0  # Forage command cooldown in hours
@@ -307,6 +328,7 @@ class GameState:
         self.in_sub_location: bool = False  # True when inside a SubGrid
         self.current_sub_grid: Optional["SubGrid"] = None  # Active sub-grid when inside one
         self.chunk_manager = chunk_manager  # Optional WFC chunk manager for terrain
+        self.rng = SessionRNG(seed)  # Named per-session random streams
         # Layered context caching (Step 6-7 of layered query architecture)
         self.world_context: Optional[WorldContext] = None  # Layer 1: World theme context
         self.region_contexts: dict[tuple[int, int], RegionContext] = {}  # Layer 2: Region contexts by coords
@@ -320,10 +342,23 @@ class GameState:
         self.quest_outcomes: list[QuestOutcome] = []
         # Visibility system: tiles the player has seen (within visibility radius)
         self.seen_tiles: set[tuple[int, int]] = set()
+        # Zoomable world map cache, refreshed as tiles are seen
+        self.map_pyramid = MapPyramid()
+        # Walkable paths over chunk terrain (see get_pathfinder)
+        self._pathfinder: Optional[PathfindingService] = None
         # World state tracking for persistent world changes
         self.world_state_manager = WorldStateManager()
         # Background generation queue for pre-generating adjacent locations
         self.background_gen_queue: Optional["BackgroundGenerationQueue"] = None
+        # Chooses which tiles/regions to pre-generate and tracks its hit rate
+        self.prefetch_planner = PrefetchPlanner()
+        # Initial world build still streaming in (see attach_world_build)
+        self.world_build: Optional["WorldBuild"] = None
+        # Builds interiors of nearby enterable POIs (see start_interior_builder)
+        self.interior_builder: Optional["InteriorBuilder"] = None
+        # Prefetched AI whispers/dreams/banter (see start_flavor_pool)
+        self.flavor_pool: Optional["FlavorTextPool"] = None
+        self._flavor_pool_file: Optional[str] = None
         # Economy system for dynamic supply/demand pricing
         self.economy_state = EconomyState()
         # Quest network for chain/dependency tracking
@@ -370,10 +405,24 @@ class GameState:
         Returns:
             Location at those coordinates, or None if not found
         """
-        for location in self.world.values():
-            if location.coordinates == coords:
-                return location
-        return None
+        from cli_rpg.exit_graph import get_exit_graph
+
+        return get_exit_graph(self.world).location_at(coords)
+
+    def _add_location(self, location: Location) -> None:
+        """Add a generated location to the world.
+
+        Generated names can collide with an existing location elsewhere; the
+        replaced entry's coordinates are dropped from the exit graph.
+
+        Args:
+            location: Location to add under its name
+        """
+        from cli_rpg.exit_graph import get_exit_graph
+
+        if location.name in self.world:
+            get_exit_graph(self.world).invalidate()
+        self.world[location.name] = location
 
     def calculate_visibility_radius(self, coords: tuple[int, int]) -> int:
         """Calculate visibility radius from terrain + PER bonus.
@@ -423,7 +472,67 @@ class GameState:
 
         radius = self.calculate_visibility_radius(coords)
         visible = get_tiles_in_radius(coords[0], coords[1], radius)
+        self.map_pyramid.mark_seen(visible - self.seen_tiles)
         self.seen_tiles.update(visible)
+        self._queue_visible_interiors(coords, visible)
+
+    def _queue_visible_interiors(
+        self, coords: tuple[int, int], visible: set[tuple[int, int]]
+    ) -> None:
+        """Attach finished interiors and queue builds for visible POIs.
+
+        Queued builds from other regions are cancelled. Only cached region
+        contexts are passed along, so this never waits on an AI call.
+
+        Args:
+            coords: Player position
+            visible: Tiles currently within visibility range
+        """
+        builder = self.interior_builder
+        if builder is None:
+            return
+
+        from cli_rpg.exit_graph import get_exit_graph
+        from cli_rpg.world_tiles import get_region_coords, is_enterable_category
+
+        self._attach_built_interiors()
+        region = get_region_coords(*coords)
+        builder.cancel_outside({region})
+
+        graph = get_exit_graph(self.world)
+        # Nearest POIs first, so a full queue holds the likeliest entries
+        for tile in sorted(visible, key=lambda t: abs(t[0] - coords[0]) + abs(t[1] - coords[1])):
+            location = graph.location_at(tile)
+            if (
+                location is None
+                or location.sub_grid is not None
+                or location.sub_locations
+                or not is_enterable_category(location.category)
+            ):
+                continue
+            builder.submit(
+                location,
+                region,
+                world_context=self.world_context,
+                region_context=self.region_contexts.get(get_region_coords(*tile)),
+            )
+
+    def _attach_built_interiors(self) -> None:
+        """Attach interiors the builder has finished to their locations."""
+        for name, sub_grid in self.interior_builder.pop_ready():
+            location = self.world.get(name)
+            if location is not None and location.sub_grid is None and not location.sub_locations:
+                self._attach_sub_grid(location, sub_grid)
+
+    @staticmethod
+    def _attach_sub_grid(location: Location, sub_grid: "SubGrid") -> None:
+        """Attach a generated interior and set its entry point."""
+        location.sub_grid = sub_grid
+        # Set entry_point from first is_exit_point location
+        for loc in sub_grid._by_name.values():
+            if loc.is_exit_point:
+                location.entry_point = loc.name
+                break
 
     def look(self) -> str:
         """Get a formatted description of the current location with progressive detail.
@@ -558,6 +667,25 @@ class GameState:
 
         return None
 
+    def _transition_weather(self) -> None:
+        """Advance the weather, drawing from the weather stream when seeded."""
+        rng = self.rng.stream(WEATHER)
+        if rng is None:
+            self.weather.transition()
+        else:
+            self.weather.transition(rng)
+
+    def _weather_flavor_text(self) -> str:
+        """Get weather flavor text, drawing from the weather stream when seeded.
+
+        Returns:
+            Flavor text for the current weather
+        """
+        rng = self.rng.stream(WEATHER)
+        if rng is None:
+            return self.weather.get_flavor_text()
+        return self.weather.get_flavor_text(rng)
+
     def is_in_combat(self) -> bool:
         """Check if combat is currently active.
 
@@ -603,7 +731,8 @@ class GameState:
             return None
 
         # 30% chance of encounter
-        if random.random() < 0.3:
+        rng = self.rng.stream(ENCOUNTERS)
+        if (rng or random).random() < 0.3:
             # Get current location's coordinates for distance calculation
             location = self.world.get(location_name)
             coords = location.coordinates if location else None
@@ -626,6 +755,7 @@ class GameState:
                     location_name=location_name,
                     level=self.current_character.level,
                     distance=distance,
+                    rng=rng,
                 )
             self.current_combat = CombatEncounter(
                 self.current_character,
@@ -677,6 +807,9 @@ class GameState:
         # Track previous location for look count reset
         previous_location = self.current_location
 
+        # Pick up initial-world locations finished in the background
+        self._merge_world_build()
+
         current = self.get_current_location()
 
         # Check if direction is valid (north, south, east, west)
@@ -713,6 +846,10 @@ class GameState:
                 self.is_sneaking = False
                 return (False, f"The {terrain} ahead is impassable.")
 
+        # Let the initial world build place this tile first, so the world does
+        # not depend on how far the build got before the player moved
+        self._await_world_build(target_coords)
+
         # Find location at target coordinates
         target_location = self._get_location_by_coordinates(target_coords)
 
@@ -794,10 +931,17 @@ class GameState:
 
                 ai_succeeded = False
 
-                # Check background generation cache first
+                # Check background generation cache first; if the worker is
+                # generating this tile right now, attach to it instead of
+                # issuing a duplicate AI call
                 cached_data = None
                 if self.background_gen_queue is not None:
-                    cached_data = self.background_gen_queue.pop_cached(target_coords)
+                    self.prefetch_planner.record_arrival(
+                        self.background_gen_queue.is_prefetched(target_coords)
+                    )
+                    cached_data = self.background_gen_queue.pop_or_wait(
+                        target_coords, timeout=BACKGROUND_GEN_WAIT_TIMEOUT
+                    )
 
                 if cached_data is not None:
                     # Use pre-generated location from cache
@@ -814,7 +958,7 @@ class GameState:
                             is_named=True,
                             is_overworld=True,
                         )
-                        self.world[new_location.name] = new_location
+                        self._add_location(new_location)
                         self.current_location = new_location.name
                         ai_succeeded = True
                     except Exception as e:
@@ -871,9 +1015,10 @@ class GameState:
                             chunk_manager=self.chunk_manager,
                             is_named=True,  # Mark as named POI
                             category_hint=category_hint,  # Pass clustering hint
+                            rng=self.rng.stream(AI_FALLBACK),
                         )
                         # Add to world
-                        self.world[new_location.name] = new_location
+                        self._add_location(new_location)
                         # Move to new location
                         self.current_location = new_location.name
                     except Exception as e:
@@ -910,7 +1055,8 @@ class GameState:
         # Update visibility based on current position
         self.update_visibility(target_coords)
 
-        # Pre-generate adjacent region contexts if near boundary
+        # Pre-generate the regions and tiles the player is likely to reach next
+        self.prefetch_planner.record_move(direction)
         self._pregenerate_adjacent_regions(target_coords)
 
         # Reset look count for previous location (fresh start on return)
@@ -920,7 +1066,7 @@ class GameState:
 
         # Add weather flavor text (if not clear weather)
         if self.weather.condition != "clear":
-            weather_flavor = self.weather.get_flavor_text()
+            weather_flavor = self._weather_flavor_text()
             message += f"\n{weather_flavor}"
 
         # Add expired quest messages (quests that failed due to time limit)
@@ -928,7 +1074,7 @@ class GameState:
             message += f"\n{colors.error(expired_msg)}"
 
         # Trigger weather transition after movement
-        self.weather.transition()
+        self._transition_weather()
 
         # Inform player if AI generation failed and template was used
         if ai_fallback_used:
@@ -969,6 +1115,9 @@ class GameState:
         for msg in explore_messages:
             message += f"\n{msg}"
 
+        # Warm the flavor text pools for the new surroundings
+        self._prime_flavor_text(location.category)
+
         # Check for ambient whisper (only when not in combat)
         if not self.is_in_combat():
             whisper = self.whisper_service.get_whisper(
@@ -990,7 +1139,8 @@ class GameState:
                 location_category=location.category,
                 weather=self.weather.condition,
                 is_night=self.game_time.is_night(),
-                dread=self.current_character.dread_meter.dread
+                dread=self.current_character.dread_meter.dread,
+                theme=self.theme
             )
             if banter:
                 companion_name, banter_text = banter
@@ -1007,7 +1157,7 @@ class GameState:
             message += f"\n{event_message}"
 
         # Check if entering a location with active events
-        event_warning = get_location_event_warning(self.current_location, self.world_events)
+        event_warning = get_location_event_warning(self.current_location, get_active_events(self))
         if event_warning:
             message += f"\n{event_warning}"
 
@@ -1206,6 +1356,7 @@ class GameState:
             message += f"\n{dread_message}"
 
         # Check for ambient whisper with depth parameter
+        self._prime_flavor_text(destination.category)
         whisper = self.whisper_service.get_whisper(
             location_category=destination.category,
             character=self.current_character,
@@ -1372,22 +1523,26 @@ class GameState:
             return (False, "There's nothing to enter here. This is open wilderness.")
         # Only generate SubGrid if no legacy sub_locations exist
         if not has_existing_content:
-            # Generate SubGrid on-demand for enterable locations
-            from cli_rpg.ai_world import generate_subgrid_for_location
-            current.sub_grid = generate_subgrid_for_location(
-                location=current,
-                ai_service=self.ai_service,
-                theme=self.theme,
-                world_context=self.world_context,
-                region_context=self.get_or_create_region_context(
-                    current.coordinates, current.terrain or "wilderness"
-                ) if current.coordinates else None,
-            )
-            # Set entry_point from first is_exit_point location
-            for loc in current.sub_grid._by_name.values():
-                if loc.is_exit_point:
-                    current.entry_point = loc.name
-                    break
+            # Use the interior built in the background, if there is one; a
+            # build that overruns the wait timeout is regenerated below
+            sub_grid = None
+            if self.interior_builder is not None:
+                sub_grid = self.interior_builder.pop_or_wait(
+                    current.name, timeout=BACKGROUND_GEN_WAIT_TIMEOUT
+                )
+            if sub_grid is None:
+                # Generate SubGrid on-demand for enterable locations
+                from cli_rpg.ai_world import generate_subgrid_for_location
+                sub_grid = generate_subgrid_for_location(
+                    location=current,
+                    ai_service=self.ai_service,
+                    theme=self.theme,
+                    world_context=self.world_context,
+                    region_context=self.get_or_create_region_context(
+                        current.coordinates, current.terrain or "wilderness"
+                    ) if current.coordinates else None,
+                )
+            self._attach_sub_grid(current, sub_grid)
 
         # If no target specified, use entry_point
         if target_name is None:
@@ -1635,11 +1790,30 @@ class GameState:
             return f"{dread_message}\n{light_message}"
         return dread_message or light_message
 
+    def _quest_target_coords(self) -> Optional[tuple[int, int]]:
+        """Return the coordinates of the first active quest's target location.
+
+        Returns:
+            Coordinates, or None if no active quest targets a known
+            overworld location
+        """
+        from cli_rpg.models.quest import QuestStatus
+
+        for quest in self.current_character.quests:
+            if quest.status != QuestStatus.ACTIVE:
+                continue
+            location = self.world.get(quest.target)
+            if location is not None and location.coordinates is not None:
+                return location.coordinates
+        return None
+
     def _pregenerate_adjacent_regions(self, coords: tuple[int, int]) -> None:
         """Pre-generate region contexts for regions near the given coordinates.
 
         Called after movement to pre-cache region contexts before the player
-        reaches the boundary, ensuring smooth gameplay.
+        reaches the boundary, ensuring smooth gameplay. Only the regions the
+        prefetch planner ranks most likely (by heading and quest target) are
+        generated.
 
         Args:
             coords: Current world coordinates to check for proximity
@@ -1652,7 +1826,9 @@ class GameState:
             terrain_hint = self.chunk_manager.get_tile_at(*coords)
 
         # Check for adjacent regions within proximity threshold
-        adjacent_regions = check_region_boundary_proximity(*coords)
+        adjacent_regions = self.prefetch_planner.plan_regions(
+            coords, check_region_boundary_proximity(*coords), self._quest_target_coords()
+        )
 
         for region_coords in adjacent_regions:
             # Skip if already cached
@@ -1673,10 +1849,11 @@ class GameState:
         self._queue_adjacent_locations(coords)
 
     def _queue_adjacent_locations(self, coords: tuple[int, int]) -> None:
-        """Queue adjacent locations for background generation.
+        """Queue likely next locations for background generation.
 
-        Submits unexplored adjacent coordinates to the background generation
-        queue for pre-generation before the player arrives.
+        Submits the unexplored tiles the prefetch planner ranks most likely
+        (recent heading, active quest target, unexplored regions) to the
+        background generation queue, with the planner's priorities.
 
         Args:
             coords: Current world coordinates
@@ -1684,15 +1861,21 @@ class GameState:
         if self.background_gen_queue is None:
             return
 
-        from cli_rpg.world_grid import DIRECTION_OFFSETS
-
-        for direction in DIRECTION_OFFSETS:
-            dx, dy = DIRECTION_OFFSETS[direction]
-            adj_coords = (coords[0] + dx, coords[1] + dy)
+        from cli_rpg.exit_graph import get_exit_graph
+        from cli_rpg.world_tiles import get_unexplored_region_directions
+
+        # The exit graph answers "is this tile generated?" without a world scan
+        targets = self.prefetch_planner.plan_tiles(
+            coords,
+            get_exit_graph(self.world),
+            quest_target=self._quest_target_coords(),
+            frontier_dirs=get_unexplored_region_directions(
+                *coords, self.get_explored_regions()
+            ),
+        )
 
-            # Skip if location already exists
-            if self._get_location_by_coordinates(adj_coords) is not None:
-                continue
+        for target in targets:
+            adj_coords = target.coords
 
             # Get terrain from chunk_manager if available
             terrain = "plains"
@@ -1713,6 +1896,7 @@ class GameState:
                 terrain=terrain,
                 world_context=world_ctx,
                 region_context=region_ctx,
+                priority=target.priority,
             )
 
     def start_background_generation(self) -> None:
@@ -1729,6 +1913,145 @@ class GameState:
             )
             self.background_gen_queue.start()
 
+    def start_flavor_pool(self) -> None:
+        """Start prefetching AI whispers, dreams and banter.
+
+        Loads lines saved by the previous session (next to the AI response
+        cache) and starts the background refill worker. Once started, these
+        features only use pooled AI text or templates, never an inline AI
+        call. No-op without an AI service.
+        """
+        if self.ai_service is None or self.flavor_pool is not None:
+            return
+        from cli_rpg.flavor_pool import FlavorTextPool, flavor_pool_path
+
+        self.flavor_pool = FlavorTextPool(self.ai_service)
+        self._flavor_pool_file = flavor_pool_path(self.ai_service)
+        if self._flavor_pool_file is not None:
+            self.flavor_pool.load(self._flavor_pool_file)
+        self.flavor_pool.start()
+        self.whisper_service.flavor_pool = self.flavor_pool
+        self.banter_service.flavor_pool = self.flavor_pool
+        self._prime_flavor_text(self.get_current_location().category)
+
+    def stop_flavor_pool(self) -> None:
+        """Stop the flavor text worker and save the remaining lines."""
+        if self.flavor_pool is None:
+            return
+        self.flavor_pool.shutdown()
+        if self._flavor_pool_file is not None:
+            self.flavor_pool.save(self._flavor_pool_file)
+        self.whisper_service.flavor_pool = None
+        self.banter_service.flavor_pool = None
+        self.flavor_pool = None
+
+    def _prime_flavor_text(self, category: Optional[str]) -> None:
+        """Request refills for the flavor pools used at a location.
+
+        Args:
+            category: Category of the location the player is at
+        """
+        if self.flavor_pool is None:
+            return
+        from cli_rpg.flavor_pool import BANTER, DREAM, WHISPER
+
+        dread = self.current_character.dread_meter.dread
+        self.flavor_pool.prime(WHISPER, category, self.theme, dread)
+        self.flavor_pool.prime(DREAM, None, self.theme, dread)
+        if self.companions:
+            self.flavor_pool.prime(BANTER, category, self.theme, dread)
+
+    def attach_world_build(self, build: "WorldBuild") -> None:
+        """Attach an initial world build that is still streaming in.
+
+        Locations completed by the build are merged into the world before
+        each overworld move. A move into a tile the build has not placed waits
+        for it (see _await_world_build).
+
+        Args:
+            build: WorldBuild returned by ai_world.start_ai_world
+        """
+        self.world_build = build
+        self._merge_world_build()
+
+    def _merge_world_build(self) -> None:
+        """Merge completed locations from the attached world build.
+
+        Locations whose name or coordinates are already taken (e.g. by a loaded
+        or hand-placed location) are dropped, as are locations on terrain the
+        chunk manager marks impassable (terrain is fixed once synced with the
+        starting world). Moves never generate tiles while the build is running,
+        so the merged world does not depend on timing.
+        """
+        if self.world_build is None:
+            return
+        from cli_rpg.world_tiles import is_passable
+
+        finished = self.world_build.done
+        for location in self.world_build.drain():
+            if (
+                location.name in self.world
+                or self._get_location_by_coordinates(location.coordinates) is not None
+            ):
+                logger.debug(f"Skipping streamed location '{location.name}' (already taken)")
+                continue
+            if self.chunk_manager is not None:
+                terrain = self.chunk_manager.get_tile_at(*location.coordinates)
+                if not is_passable(terrain):
+                    logger.debug(f"Skipping streamed location '{location.name}' (on {terrain})")
+                    continue
+                if location.terrain is None:
+                    location.terrain = terrain
+            self.world[location.name] = location
+        if finished:
+            self.world_build = None
+
+    def _await_world_build(self, coords: tuple[int, int]) -> None:
+        """Wait until the world build has placed a tile or finished.
+
+        Without this, a move could generate a tile the build was about to
+        place, and which of the two survives would depend on timing.
+
+        Args:
+            coords: Overworld coordinates the player is about to enter
+        """
+        while self.world_build is not None and self._get_location_by_coordinates(coords) is None:
+            self.world_build.wait(WORLD_BUILD_POLL_INTERVAL)
+            self._merge_world_build()
+
+    def stop_world_build(self) -> None:
+        """Cancel the initial world build, dropping locations not yet merged."""
+        if self.world_build is not None:
+            self.world_build.cancel()
+            self.world_build = None
+
+    def start_interior_builder(self) -> None:
+        """Start building interiors of nearby enterable POIs in the background.
+
+        Works with or without an AI service (fallback content). Seeded
+        sessions build interiors on enter instead, so a replay draws random
+        numbers in the same order.
+        """
+        if self.interior_builder is not None or self.rng.seed is not None:
+            return
+        from cli_rpg.interior_builder import InteriorBuilder
+
+        self.interior_builder = InteriorBuilder(ai_service=self.ai_service, theme=self.theme)
+        self.interior_builder.start()
+        location = self.get_current_location()
+        if location.is_overworld and location.coordinates is not None:
+            from cli_rpg.world_grid import get_tiles_in_radius
+
+            x, y = location.coordinates[0], location.coordinates[1]
+            radius = self.calculate_visibility_radius((x, y))
+            self._queue_visible_interiors((x, y), get_tiles_in_radius(x, y, radius))
+
+    def stop_interior_builder(self) -> None:
+        """Stop the interior builder, dropping interiors not yet attached."""
+        if self.interior_builder is not None:
+            self.interior_builder.shutdown()
+            self.interior_builder = None
+
     def stop_background_generation(self) -> None:
         """Stop background generation queue.
 
@@ -1795,14 +2118,32 @@ class GameState:
         """
         from cli_rpg.models.quest import QuestStatus
 
+        def _deadline(quest: "Quest") -> Optional[int]:
+            if quest.status in (QuestStatus.COMPLETED, QuestStatus.FAILED):
+                return None
+            if quest.time_limit_hours is None or quest.accepted_at is None:
+                return None
+            return quest.accepted_at + quest.time_limit_hours
+
         messages = []
         current_hour = self.game_time.total_hours
-        for quest in self.current_character.quests:
+        # Only quests whose deadline has passed are visited
+        self.scheduler.sync(QUEST_DEADLINES, self.current_character.quests, _deadline)
+        for entry in self.scheduler.pop_due(QUEST_DEADLINES, current_hour):
+            quest = entry.item
             if quest.status == QuestStatus.ACTIVE and quest.is_expired(current_hour):
                 quest.status = QuestStatus.FAILED
                 # Record the expired quest outcome
                 self.record_quest_outcome(quest, method="expired")
                 messages.append(f"Quest '{quest.name}' has expired and failed!")
+            elif quest.status == QuestStatus.AVAILABLE:
+                # Not yet accepted - check again once it may have become active
+                self.scheduler.schedule(QUEST_DEADLINES, current_hour + 1, quest, entry.order)
+            else:
+                due = _deadline(quest)
+                if due is not None and due > current_hour:
+                    # Deadline was extended after scheduling
+                    self.scheduler.schedule(QUEST_DEADLINES, due, quest, entry.order)
         return messages
 
     def record_quest_outcome(
@@ -2059,7 +2400,13 @@ class GameState:
         from cli_rpg.world_tiles import get_region_coords
 
         explored = set()
-        for location in self.world.values():
+        if isinstance(self.world, PagedWorld):
+            # Every unloaded page is a region with at least one location
+            explored.update(r for r in self.world.unloaded_regions if r is not None)
+            locations = self.world.loaded_values()
+        else:
+            locations = self.world.values()
+        for location in locations:
             if location.coordinates is not None:
                 explored.add(get_region_coords(*location.coordinates))
         return explored
@@ -2074,7 +2421,18 @@ class GameState:
             Alphabetically sorted list of destination names.
         """
         destinations = []
-        for loc in self.world.values():
+        if isinstance(self.world, PagedWorld):
+            locations = self.world.loaded_values()
+            # Unloaded regions are read from their pages, not paged in
+            for name, data in self.world.unloaded_location_data():
+                if (data.get("is_named", False) and
+                    data.get("coordinates") is not None and
+                    data.get("parent_location") is None and
+                    name != self.current_location):
+                    destinations.append(name)
+        else:
+            locations = self.world.values()
+        for loc in locations:
             # Must be named POI, have coordinates, be overworld (no parent)
             if (loc.is_named and
                 loc.coordinates is not None and
@@ -2083,10 +2441,99 @@ class GameState:
                 destinations.append(loc.name)
         return sorted(destinations)
 
+    def get_npc_names(self) -> set[str]:
+        """Get the names of the NPCs at every overworld location.
+
+        Returns:
+            Set of NPC names
+        """
+        if not isinstance(self.world, PagedWorld):
+            return {npc.name for loc in self.world.values() for npc in loc.npcs}
+        names = {npc.name for loc in self.world.loaded_values() for npc in loc.npcs}
+        # Unloaded regions are read from their pages, not paged in
+        for _, data in self.world.unloaded_location_data():
+            names.update(npc["name"] for npc in data.get("npcs", []))
+        return names
+
+    def get_pathfinder(self) -> Optional[PathfindingService]:
+        """Return the pathfinding service for the current chunk manager.
+
+        Returns:
+            PathfindingService, or None without WFC terrain
+        """
+        if self.chunk_manager is None:
+            return None
+        if self._pathfinder is None or self._pathfinder.chunk_manager is not self.chunk_manager:
+            self._pathfinder = PathfindingService(self.chunk_manager)
+        return self._pathfinder
+
+    def travel_distance(self, start: tuple[int, int], goal: tuple[int, int]) -> int:
+        """Return the walking distance between two overworld tiles.
+
+        Follows passable terrain when WFC terrain is available, falling back
+        to Manhattan distance without terrain or when no path is found.
+
+        Args:
+            start: Tile to walk from
+            goal: Tile to walk to
+
+        Returns:
+            Number of steps
+        """
+        pathfinder = self.get_pathfinder()
+        if pathfinder is not None:
+            steps = pathfinder.distance(start, goal)
+            if steps is not None:
+                return steps
+        return abs(goal[0] - start[0]) + abs(goal[1] - start[1])
+
+    def get_quest_route(self, quest: "Quest") -> Optional[tuple[str, int]]:
+        """Return which way to walk toward an explore quest's target location.
+
+        Args:
+            quest: Active quest (its current stage is used if it has stages)
+
+        Returns:
+            (direction, walking distance), or None if the objective is not
+            an overworld location, the player is inside a location, or no
+            path was found
+        """
+        from cli_rpg.models.quest import ObjectiveType
+
+        objective = quest.get_active_stage() or quest
+        if objective.objective_type != ObjectiveType.EXPLORE or self.in_sub_location:
+            return None
+        pathfinder = self.get_pathfinder()
+        target = self.world.get(objective.target)
+        current = self.world.get(self.current_location)
+        if pathfinder is None or target is None or current is None:
+            return None
+        if target.coordinates is None or current.coordinates is None:
+            return None
+        return pathfinder.route(current.coordinates, target.coordinates)
+
+    def get_quest_directions(self) -> dict[str, str]:
+        """Return the next step toward each active explore quest target.
+
+        Returns:
+            Target location name -> direction of its shortest walkable path
+        """
+        from cli_rpg.models.quest import QuestStatus
+
+        directions = {}
+        for quest in self.current_character.quests:
+            if quest.status != QuestStatus.ACTIVE:
+                continue
+            route = self.get_quest_route(quest)
+            if route is not None:
+                objective = quest.get_active_stage() or quest
+                directions[objective.target] = route[0]
+        return directions
+
     def fast_travel(self, destination: str) -> tuple[bool, str]:
         """Travel instantly to a previously-visited named location.
 
-        Consumes time proportional to Manhattan distance, increases tiredness,
+        Consumes time proportional to walking distance, increases tiredness,
         and has a chance for random encounters during the journey.
 
         Args:
@@ -2119,10 +2566,8 @@ class GameState:
         dest_location = self.world[matched]
         current = self.get_current_location()
 
-        # Calculate Manhattan distance and travel time
-        dx = abs(dest_location.coordinates[0] - current.coordinates[0])
-        dy = abs(dest_location.coordinates[1] - current.coordinates[1])
-        distance = dx + dy
+        # Calculate walking distance (around impassable terrain) and travel time
+        distance = self.travel_distance(current.coordinates, dest_location.coordinates)
         travel_hours = max(1, min(8, distance // 4))
 
         messages = [f"You begin your journey to {colors.location(matched)}..."]
@@ -2136,7 +2581,7 @@ class GameState:
             self.economy_state.update_time(self.game_time.hour)
 
             # Weather transition
-            self.weather.transition()
+            self._transition_weather()
 
             # Tiredness increase (3 per move)
             tiredness_msg = self.current_character.tiredness.increase(3)
@@ -2149,12 +2594,14 @@ class GameState:
                 messages.append(dread_msg)
 
             # Random encounter check (15% per hour)
-            if random.random() < 0.15 and not self.get_current_location().is_safe_zone:
+            rng = self.rng.stream(ENCOUNTERS)
+            if (rng or random).random() < 0.15 and not self.get_current_location().is_safe_zone:
                 # Hostile encounter interrupts travel
                 enemy = spawn_enemy(
                     location_name=self.current_location,
                     level=self.current_character.level,
                     location_category="wilderness",
+                    rng=rng,
                 )
                 self.current_combat = CombatEncounter(
                     self.current_character,
@@ -2183,19 +2630,19 @@ class GameState:
 
         return (True, "\n".join(messages))
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_world: bool = True) -> dict:
         """Serialize game state to dictionary.
 
+        Args:
+            include_world: Include the overworld locations under "world"
+                (paged saves write them separately, by region)
+
         Returns:
             Dictionary containing character, current_location, world data, theme, game_time, weather, choices, world_events, companions, and chunk_manager
         """
         data = {
             "character": self.current_character.to_dict(),
             "current_location": self.current_location,
-            "world": {
-                name: location.to_dict()
-                for name, location in self.world.items()
-            },
             "theme": self.theme,
             "game_time": self.game_time.to_dict(),
             "weather": self.weather.to_dict(),
@@ -2217,9 +2664,14 @@ class GameState:
             "quest_network": self.quest_network.to_dict(),
             "location_noise_seed": self.location_noise_manager.world_seed,
         }
+        if include_world:
+            data["world"] = serialize_world(self.world)
         # Include chunk_manager if present (WFC terrain)
         if self.chunk_manager is not None:
             data["chunk_manager"] = self.chunk_manager.to_dict()
+        # Include seeded RNG streams so a loaded game continues them
+        if self.rng.seed is not None:
+            data["rng"] = self.rng.to_dict()
         # Include world_context if present (Layer 1)
         if self.world_context is not None:
             data["world_context"] = self.world_context.to_dict()
@@ -2249,11 +2701,14 @@ class GameState:
         # Deserialize character
         character = Character.from_dict(data["character"])
 
-        # Deserialize world
-        world = {
-            name: Location.from_dict(location_data)
-            for name, location_data in data["world"].items()
-        }
+        # Deserialize world (paged saves arrive with only nearby regions loaded)
+        if isinstance(data["world"], PagedWorld):
+            world = data["world"]
+        else:
+            world = {
+                name: Location.from_dict(location_data)
+                for name, location_data in data["world"].items()
+            }
 
         # Get current location
         current_location = data["current_location"]
@@ -2268,7 +2723,9 @@ class GameState:
         parent_sub_grid = None
         if in_sub_location and current_location not in world:
             # Find parent location that contains this sub-grid location
-            for loc in world.values():
+            # (a paged world has already loaded the parent's region)
+            candidates = world.loaded_values() if isinstance(world, PagedWorld) else world.values()
+            for loc in candidates:
                 if loc.sub_grid is not None:
                     sub_grid_loc = loc.sub_grid.get_by_name(current_location)
                     if sub_grid_loc is not None:
@@ -2375,6 +2832,10 @@ class GameState:
                 world_seed=random.randint(0, 2**31)
             )
 
+        # Restore seeded RNG streams (unseeded for older saves)
+        if "rng" in data:
+            game_state.rng = SessionRNG.from_dict(data["rng"])
+
         # Restore world_context if present (Layer 1)
         if "world_context" in data:
             game_state.world_context = WorldContext.from_dict(data["world_context"])
@@ -8,6 +8,7 @@ from typing import Optional, TYPE_CHECKING
 
 from cli_rpg.models.enemy import Enemy
 from cli_rpg.combat import CombatEncounter
+from cli_rpg.session_rng import ENCOUNTERS, session_stream
 from cli_rpg import colors
 
 if TYPE_CHECKING:
@@ -112,18 +113,21 @@ HALLUCINATION_ASCII_ART = r"""
 """
 
 
-def spawn_hallucination(level: int, category: Optional[str] = None) -> Enemy:
+def spawn_hallucination(
+    level: int, category: Optional[str] = None, rng: Optional[random.Random] = None
+) -> Enemy:
     """Spawn a hallucination enemy.
 
     Args:
         level: Player level for stat scaling
         category: Location category for themed hallucinations (dungeon, forest, etc.)
+        rng: Optional random.Random for the template choice (defaults to global random)
 
     Returns:
         Enemy with is_hallucination=True
     """
     templates = get_hallucination_templates(category)
-    template = random.choice(templates)
+    template = (rng or random).choice(templates)
 
     return Enemy(
         name=template["name"],
@@ -163,7 +167,8 @@ def check_for_hallucination(game_state: "GameState") -> Optional[str]:
         return None
 
     # 30% chance to trigger
-    if random.random() > HALLUCINATION_CHANCE:
+    rng = session_stream(game_state, ENCOUNTERS)
+    if rng.random() > HALLUCINATION_CHANCE:
         return None
 
     # Get location for category-themed hallucinations
@@ -173,6 +178,7 @@ def check_for_hallucination(game_state: "GameState") -> Optional[str]:
     hallucination = spawn_hallucination(
         game_state.current_character.level,
         category=location.category if location else None,
+        rng=rng,
     )
 
     # Create combat encounter
@@ -0,0 +1,265 @@
+"""Background builder for the interiors of enterable locations.
+
+GameState.enter builds a SubGrid on demand the first time the player enters
+a dungeon, cave or town, which stalls the command on the procedural layout
+and its content (including AI calls when enabled). InteriorBuilder moves
+that work off the main thread: once an enterable POI comes within
+visibility range, GameState submits it here and a worker generates its
+SubGrid with generate_subgrid_for_location, the same call enter makes.
+
+Finished SubGrids are handed back to the main thread (pop_ready) and
+attached there, so a location never has a half-built interior. The queue is
+bounded, and tasks are tagged with the player's region so they can be
+cancelled when the player leaves it. If the player enters before the
+worker gets there, pop_or_wait attaches to the in-flight build or claims the
+queued task, as BackgroundGenerationQueue.pop_or_wait does for tiles.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Collection, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cli_rpg.ai_service import AIService
+    from cli_rpg.models.location import Location
+    from cli_rpg.models.region_context import RegionContext
+    from cli_rpg.models.world_context import WorldContext
+    from cli_rpg.world_grid import SubGrid
+
+logger = logging.getLogger(__name__)
+
+# Interiors waiting to be built at most (older submissions are kept)
+DEFAULT_MAX_QUEUED = 4
+
+
+@dataclass
+class InteriorTask:
+    """A background interior build.
+
+    Attributes:
+        location: Overworld location to build the interior for
+        region: Player's region when the task was submitted
+        world_context: Optional world context for layered generation
+        region_context: Optional region context for layered generation
+    """
+    location: "Location"
+    region: tuple[int, int]
+    world_context: Optional["WorldContext"] = None
+    region_context: Optional["RegionContext"] = None
+
+
+# Shutdown sentinel
+_SHUTDOWN = None
+
+
+class InteriorBuilder:
+    """Queue that builds SubGrids for enterable locations in a worker thread.
+
+    Attributes:
+        _ai_service: Optional AI service for interior content
+        _theme: World theme for generation
+        _max_queued: Maximum number of queued (not yet started) builds
+        _queue: FIFO of tasks (cancelled tasks are skipped when dequeued)
+        _pending: Location name -> queued task
+        _in_progress: Location names a worker is building right now
+        _built: Location name -> finished SubGrid not yet attached
+        _lock: Thread lock for pending/in-progress/built access
+        _done: Condition notified whenever a build finishes
+        _running: Whether the builder is active
+        _worker: Worker thread
+    """
+
+    def __init__(
+        self,
+        ai_service: Optional["AIService"],
+        theme: str,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        """Initialize the interior builder.
+
+        Args:
+            ai_service: AI service for interior content (None uses fallback content)
+            theme: World theme for generation
+            max_queued: Maximum number of builds waiting for the worker
+        """
+        self._ai_service = ai_service
+        self._theme = theme
+        self._max_queued = max_queued
+        self._queue: "queue.Queue[Optional[InteriorTask]]" = queue.Queue()
+        self._pending: dict[str, InteriorTask] = {}
+        self._in_progress: set[str] = set()
+        self._built: dict[str, "SubGrid"] = {}
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._running = False
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = threading.Thread(
+                target=self._worker_loop, daemon=True, name="interior-builder"
+            )
+            self._worker.start()
+
+    def shutdown(self) -> None:
+        """Stop the worker and drop queued builds."""
+        with self._lock:
+            self._running = False
+            self._pending.clear()
+        if self._worker is not None:
+            self._queue.put(_SHUTDOWN)
+            self._worker.join(timeout=1.0)
+            self._worker = None
+
+    def submit(
+        self,
+        location: "Location",
+        region: tuple[int, int],
+        world_context: Optional["WorldContext"] = None,
+        region_context: Optional["RegionContext"] = None,
+    ) -> bool:
+        """Queue a location's interior for building.
+
+        Args:
+            location: Enterable overworld location without an interior
+            region: Player's current region (for cancel_outside)
+            world_context: Optional world context for layered generation
+            region_context: Optional region context for layered generation
+
+        Returns:
+            True if queued, False if not running, already queued, building
+            or built, or the queue is full
+        """
+        name = location.name
+        with self._lock:
+            if not self._running:
+                return False
+            if name in self._pending or name in self._in_progress or name in self._built:
+                return False
+            if len(self._pending) >= self._max_queued:
+                return False
+            task = InteriorTask(
+                location=location,
+                region=region,
+                world_context=world_context,
+                region_context=region_context,
+            )
+            self._pending[name] = task
+        self._queue.put(task)
+        return True
+
+    def cancel_outside(self, regions: Collection[tuple[int, int]]) -> int:
+        """Cancel queued builds submitted from other regions.
+
+        Builds already in progress finish and are kept.
+
+        Args:
+            regions: Regions whose tasks are kept
+
+        Returns:
+            Number of tasks cancelled
+        """
+        with self._lock:
+            cancelled = [
+                name for name, task in self._pending.items() if task.region not in regions
+            ]
+            for name in cancelled:
+                del self._pending[name]
+        return len(cancelled)
+
+    def is_pending(self, name: str) -> bool:
+        """Check whether a location's interior is queued, building or built.
+
+        Args:
+            name: Overworld location name
+
+        Returns:
+            True if the builder has the location in hand
+        """
+        with self._lock:
+            return name in self._pending or name in self._in_progress or name in self._built
+
+    def pop_ready(self) -> list[tuple[str, "SubGrid"]]:
+        """Take every finished interior.
+
+        Returns:
+            (location name, SubGrid) pairs in completion order
+        """
+        with self._lock:
+            ready = list(self._built.items())
+            self._built.clear()
+        return ready
+
+    def pop_or_wait(self, name: str, timeout: Optional[float] = None) -> Optional["SubGrid"]:
+        """Get a location's interior, attaching to an in-flight build.
+
+        - If the interior is built, it is popped and returned.
+        - If the worker is building it, waits for that build and returns it.
+        - If it is queued but not started, the task is cancelled and None is
+          returned so the caller builds it directly.
+
+        Args:
+            name: Overworld location name
+            timeout: Maximum seconds to wait for an in-progress build (None = no limit)
+
+        Returns:
+            SubGrid, or None if the caller should build it itself
+        """
+        with self._done:
+            if name in self._in_progress:
+                logger.debug(f"Waiting for in-flight interior build of {name}")
+                self._done.wait_for(lambda: name not in self._in_progress, timeout=timeout)
+            self._pending.pop(name, None)
+            return self._built.pop(name, None)
+
+    def _worker_loop(self) -> None:
+        """Build queued interiors until shutdown."""
+        while True:
+            task = self._queue.get()
+            if task is _SHUTDOWN:
+                break
+            try:
+                self._process_task(task)
+            except Exception as e:
+                logger.warning(f"Background interior build error: {e}")
+
+    def _process_task(self, task: InteriorTask) -> None:
+        """Build one interior and store it for the main thread.
+
+        Args:
+            task: The build task to process
+        """
+        from cli_rpg.ai_world import generate_subgrid_for_location
+
+        name = task.location.name
+        with self._lock:
+            if self._pending.get(name) is not task:
+                # Cancelled, claimed by enter, or superseded
+                return
+            del self._pending[name]
+            self._in_progress.add(name)
+
+        sub_grid = None
+        try:
+            sub_grid = generate_subgrid_for_location(
+                location=task.location,
+                ai_service=self._ai_service,
+                theme=self._theme,
+                world_context=task.world_context,
+                region_context=task.region_context,
+            )
+            logger.debug(f"Pre-built interior of {name}")
+        except Exception as e:
+            logger.warning(f"Failed to pre-build interior of {name}: {e}")
+        finally:
+            with self._done:
+                if sub_grid is not None:
+                    self._built[name] = sub_grid
+                self._in_progress.discard(name)
+                self._done.notify_all()
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List, TYPE_CHECKING
 
 from cli_rpg import colors
+from cli_rpg.time_scheduler import INTERIOR_EVENTS, TimeScheduler
 
 if TYPE_CHECKING:
     from cli_rpg.game_state import GameState
@@ -24,6 +25,10 @@ CAVE_IN_DURATION_RANGE = (4, 12)
 # Location categories where cave-ins can occur
 CAVE_IN_CATEGORIES = {"dungeon", "cave", "ruins", "temple"}
 
+# Interior event types that expire after duration_hours (spreading hazards
+# additionally spread on every progress call)
+_TIMED_EVENT_TYPES = {"cave_in", "monster_migration"}
+
 # Directions that can be blocked (horizontal only, not up/down for now)
 BLOCKABLE_DIRECTIONS = {"north", "south", "east", "west"}
 
@@ -415,7 +420,10 @@ def progress_interior_events(
     messages = []
     current_hour = game_state.game_time.total_hours
 
-    for event in sub_grid.interior_events:
+    schedule = _get_event_schedule(sub_grid)
+    schedule.sync(INTERIOR_EVENTS, sub_grid.interior_events, _interior_deadline)
+    for entry in schedule.pop_due(INTERIOR_EVENTS, current_hour):
+        event = entry.item
         if not event.is_active:
             continue
 
@@ -430,6 +438,9 @@ def progress_interior_events(
                         f"The passage is open again."
                     )
                 )
+            else:
+                # Retry on the next progress call
+                schedule.schedule(INTERIOR_EVENTS, current_hour, event, entry.order)
 
         elif event.event_type == "monster_migration" and event.is_expired(current_hour):
             # Clear the migration
@@ -462,10 +473,53 @@ def progress_interior_events(
                 # Spread the hazard each hour
                 spread_messages = spread_hazard(sub_grid, event, current_hour)
                 messages.extend(spread_messages)
+                schedule.schedule(INTERIOR_EVENTS, current_hour, event, entry.order)
+
+        elif event.event_type in _TIMED_EVENT_TYPES:
+            # Not expired yet (start time changed) - wait for the new end
+            due = event.start_hour + event.duration_hours
+            schedule.schedule(INTERIOR_EVENTS, due, event, entry.order)
 
     return messages
 
 
+def _interior_deadline(event: InteriorEvent) -> Optional[int]:
+    """Return the hour at which progress_interior_events must visit an event.
+
+    Spreading hazards spread on every progress call, so they are due
+    immediately; cave-ins and migrations are due when they expire.
+
+    Args:
+        event: Interior event to schedule
+
+    Returns:
+        Due hour (GameTime.total_hours), or None for events that never expire here
+    """
+    if not event.is_active:
+        return None
+    if event.event_type == "spreading_hazard":
+        return 0
+    if event.event_type in _TIMED_EVENT_TYPES:
+        return event.start_hour + event.duration_hours
+    return None
+
+
+def _get_event_schedule(sub_grid: "SubGrid") -> TimeScheduler:
+    """Return the sub-grid's interior event schedule, attaching one if missing.
+
+    Args:
+        sub_grid: SubGrid (or SubGrid-like object) holding interior_events
+
+    Returns:
+        The TimeScheduler for the sub-grid's interior events
+    """
+    schedule = getattr(sub_grid, "event_schedule", None)
+    if not isinstance(schedule, TimeScheduler):
+        schedule = TimeScheduler()
+        sub_grid.event_schedule = schedule
+    return schedule
+
+
 def clear_cave_in(
     sub_grid: "SubGrid",
     coords: tuple,
@@ -928,7 +982,7 @@ def _handle_rival_arrival(
     # Check if it's a treasure room
     if target.treasures:
         for treasure in target.treasures:
-            treasure["opened"] = True
+            sub_grid.open_treasure(treasure)
         return colors.damage(
             f"You hear excited voices and the clinking of coins - "
             f"rival adventurers have claimed the treasure in {target.name}!"
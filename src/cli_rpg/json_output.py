@@ -6,13 +6,14 @@ per line with a 'type' field indicating the message category.
 
 Message types:
 - state: Current game state (location, health, gold, level)
-- narrative: Human-readable text (descriptions, action results)
+- narrative: Human-readable text (descriptions, action results); streamed
+  AI text arrives as partial narrative messages ("partial": true) first
 - actions: Available actions (exits, NPCs, valid commands)
 - error: Error with machine-readable code and human message
 - combat: Combat-specific state when in battle
 """
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 # Error codes for machine-readable errors
@@ -58,20 +59,46 @@ def emit_narrative(text: str) -> None:
     print(json.dumps({"type": "narrative", "text": text}))
 
 
-def emit_actions(exits: List[str], npcs: List[str], commands: List[str]) -> None:
+def emit_narrative_partial(text: str, done: bool = False) -> None:
+    """Emit a partial narrative message for AI text that is still streaming.
+
+    Partial messages carry incremental fragments of a narrative (e.g. a
+    location description) while the AI response is arriving. The final
+    fragment is marked with done=True. The complete narrative is still
+    emitted afterwards as a regular narrative message.
+
+    Args:
+        text: The newly received text fragment
+        done: True when the streamed narrative is complete
+    """
+    print(json.dumps({"type": "narrative", "text": text, "partial": True, "done": done}),
+          flush=True)
+
+
+def emit_actions(
+    exits: List[str],
+    npcs: List[str],
+    commands: List[str],
+    routes: Optional[Dict[str, str]] = None,
+) -> None:
     """Emit an actions message with available options.
 
     Args:
         exits: List of available exit directions
         npcs: List of NPC names present
         commands: List of valid commands
+        routes: Optional quest target -> first step of its walkable path
+            (included only when non-empty)
     """
-    print(json.dumps({
+    message = {
         "type": "actions",
         "exits": exits,
         "npcs": npcs,
         "commands": commands
-    }))
+    }
+    if routes:
+        message["routes"] = routes
+    print(json.dumps(message))
 
 
 def emit_error(code: str, message: str) -> None:
@@ -109,6 +136,15 @@ def emit_dump_state(game_state_dict: dict) -> None:
     print(json.dumps({"type": "dump_state", **game_state_dict}))
 
 
+def emit_ai_metrics(metrics: dict) -> None:
+    """Emit AI generation metrics for the ai-stats command and session end.
+
+    Args:
+        metrics: Metrics snapshot from AIMetrics.snapshot()
+    """
+    print(json.dumps({"type": "ai_metrics", **metrics}))
+
+
 def emit_session_info(seed: int, theme: str) -> None:
     """Emit session metadata including RNG seed.
 
@@ -0,0 +1,283 @@
+"""Incremental JSON parsing for streamed LLM responses.
+
+This module provides a small character-level scanner that watches a JSON
+document as it arrives token by token and surfaces the decoded contents of
+selected string fields (e.g. "description") before the document is complete.
+It does not build the final object - the full response is still parsed with
+json.loads once streaming finishes - it only lets narrative text be shown as
+soon as the provider starts sending it.
+"""
+
+from typing import Callable, Iterable, Optional
+
+# Callback invoked with (field_name, decoded_text_delta)
+FieldDeltaCallback = Callable[[str, str], None]
+
+# Callback invoked with (field_name) when a streamed field value is complete
+FieldCompleteCallback = Callable[[str], None]
+
+# Simple JSON escape sequences (the \uXXXX form is handled separately)
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class JSONFieldStreamer:
+    """Stream the decoded values of selected string fields from partial JSON.
+
+    Feed raw response chunks in arrival order with feed(). Whenever text is
+    decoded inside the value of one of the watched keys, on_delta is called
+    with the key and the newly decoded text. Fields are matched at any depth,
+    so an array of location objects streams each "description" in turn.
+
+    Text before the first '{' or '[' (such as a ```json code fence) is ignored.
+
+    Attributes:
+        fields: Set of key names whose string values are streamed
+        limit: Maximum number of field values to stream (None for unlimited)
+        streamed_count: Number of field values completed so far
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[str],
+        on_delta: FieldDeltaCallback,
+        on_complete: Optional[FieldCompleteCallback] = None,
+        limit: Optional[int] = None,
+    ):
+        """Initialize the streamer.
+
+        Args:
+            fields: Key names whose string values should be streamed
+            on_delta: Called with (field, text) for each decoded text fragment
+            on_complete: Optional callback called with (field) when a value ends
+            limit: Stop streaming after this many field values (None = no limit)
+        """
+        self.fields = set(fields)
+        self.limit = limit
+        self.streamed_count = 0
+        self._on_delta = on_delta
+        self._on_complete = on_complete
+
+        # Container stack: "{" for objects, "[" for arrays
+        self._stack: list[str] = []
+        # True when the next string in the current object is a key
+        self._expect_key = False
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._unicode_digits: Optional[str] = None
+        self._pending_high_surrogate: Optional[int] = None
+        self._buffer: list[str] = []
+        self._last_key: Optional[str] = None
+        # Field name currently being streamed (None when not inside a watched value)
+        self._active_field: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the streaming limit has been reached."""
+        return self.limit is not None and self.streamed_count >= self.limit
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of raw response text.
+
+        Args:
+            chunk: Raw text as received from the provider
+        """
+        if self.done:
+            return
+
+        delta: list[str] = []
+        for char in chunk:
+            if self._in_string:
+                decoded = self._consume_string_char(char)
+                if decoded is None:
+                    # End of string reached
+                    if self._active_field is not None:
+                        self._flush_delta(delta)
+                        self._finish_field()
+                        if self.done:
+                            return
+                    continue
+                if self._active_field is not None:
+                    delta.append(decoded)
+                elif self._string_is_key:
+                    self._buffer.append(decoded)
+                continue
+
+            self._consume_structural_char(char)
+
+        self._flush_delta(delta)
+
+    def _consume_structural_char(self, char: str) -> None:
+        """Handle a character outside of any string literal."""
+        if char == "{":
+            self._stack.append("{")
+            self._expect_key = True
+        elif char == "[":
+            self._stack.append("[")
+            self._expect_key = False
+        elif char in "}]":
+            if self._stack:
+                self._stack.pop()
+            self._expect_key = False
+        elif not self._stack:
+            # Preamble before the JSON document (code fences, prose)
+            return
+        elif char == ",":
+            self._expect_key = self._stack[-1] == "{"
+        elif char == ":":
+            self._expect_key = False
+        elif char == '"':
+            self._in_string = True
+            self._string_is_key = self._expect_key
+            self._buffer = []
+            if not self._string_is_key and self._last_key in self.fields and (
+                self._stack[-1] == "{"
+            ):
+                self._active_field = self._last_key
+
+    def _consume_string_char(self, char: str) -> Optional[str]:
+        """Decode one character inside a string literal.
+
+        Returns:
+            Decoded text (possibly empty) or None when the string terminates.
+        """
+        if self._unicode_digits is not None:
+            self._unicode_digits += char
+            if len(self._unicode_digits) < 4:
+                return ""
+            try:
+                code = int(self._unicode_digits, 16)
+            except ValueError:
+                code = 0xFFFD
+            self._unicode_digits = None
+            return self._decode_code_point(code)
+
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode_digits = ""
+                return ""
+            return _SIMPLE_ESCAPES.get(char, char)
+
+        if char == "\\":
+            self._escape = True
+            return ""
+
+        if char == '"':
+            self._in_string = False
+            if self._string_is_key:
+                self._last_key = "".join(self._buffer)
+                self._expect_key = False
+            return None
+
+        return char
+
+    def _decode_code_point(self, code: int) -> str:
+        """Combine UTF-16 surrogate pairs produced by \\uXXXX escapes."""
+        if 0xD800 <= code <= 0xDBFF:
+            self._pending_high_surrogate = code
+            return ""
+        if 0xDC00 <= code <= 0xDFFF and self._pending_high_surrogate is not None:
+            high = self._pending_high_surrogate
+            self._pending_high_surrogate = None
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+        self._pending_high_surrogate = None
+        return chr(code)
+
+    def _flush_delta(self, delta: list[str]) -> None:
+        """Send accumulated decoded text to the delta callback."""
+        if self._active_field is not None and delta:
+            self._on_delta(self._active_field, "".join(delta))
+        delta.clear()
+
+    def _finish_field(self) -> None:
+        """Mark the active field value as complete."""
+        field_name = self._active_field
+        self._active_field = None
+        self.streamed_count += 1
+        if self._on_complete is not None and field_name is not None:
+            self._on_complete(field_name)
+
+
+class StreamingFieldWriter:
+    """File-like adapter that feeds written text into a JSONFieldStreamer.
+
+    Lets the existing provider streaming calls (which write tokens to a TextIO)
+    drive incremental field extraction without changing their signatures.
+    Pass fields=None to forward all text unchanged (for plain-text responses).
+
+    Attributes:
+        delivered: True once any text has been handed to on_delta
+    """
+
+    def __init__(
+        self,
+        on_delta: Callable[[str], None],
+        on_complete: Optional[Callable[[], None]] = None,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = 1,
+    ):
+        """Initialize the writer.
+
+        Args:
+            on_delta: Called with each newly decoded narrative fragment
+            on_complete: Optional callback when the narrative is complete
+            fields: Field names to extract; None streams the raw text
+            limit: Maximum number of field values to stream
+        """
+        self._on_delta = on_delta
+        self._on_complete = on_complete
+        self._completed = False
+        self.delivered = False
+        self._streamer: Optional[JSONFieldStreamer] = None
+        if fields is not None:
+            self._streamer = JSONFieldStreamer(
+                fields,
+                on_delta=lambda _field, text: self._deliver(text),
+                on_complete=lambda _field: self._complete(),
+                limit=limit,
+            )
+
+    def write(self, text: str) -> int:
+        """Consume streamed response text.
+
+        Args:
+            text: Raw text fragment from the provider
+
+        Returns:
+            Number of characters consumed
+        """
+        if self._streamer is not None:
+            self._streamer.feed(text)
+        elif text and not self._completed:
+            self._deliver(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """No-op; deltas are delivered as soon as they are decoded."""
+
+    def close(self) -> None:
+        """Signal completion if the narrative has not already finished."""
+        self._complete()
+
+    def _deliver(self, text: str) -> None:
+        """Hand decoded text to the delta callback."""
+        self.delivered = True
+        self._on_delta(text)
+
+    def _complete(self) -> None:
+        """Invoke the completion callback once."""
+        if self._completed:
+            return
+        self._completed = True
+        if self._on_complete is not None:
+            self._on_complete()
@@ -9,12 +9,99 @@ Log entry types:
 - response: Game response text
 - state: Game state snapshot (location, health, gold, level)
 - ai_content: AI-generated content (location, npc, enemy, quest, dialogue, etc.)
+- ai_metrics: AI call/token/latency/cache metrics, written at session end
+- snapshot: Pointer to a full GameState snapshot file (for replay --from N)
 - session_end: Final entry when session ends
+
+Entries are queued and written by a background thread in batches, flushed
+when the buffer reaches flush_bytes or flush_interval seconds after the first
+buffered entry, and on close (also registered with atexit so a crashing
+session still gets its final flush). A failed write does not stop the writer:
+the first error is recorded, logged once, and raised by flush(). Large AI payloads are stored once per
+distinct payload in a content-addressed sidecar directory (<log>.ai/) and
+referenced from the log entry, so the main log stays small and fast to parse.
+With rotate_bytes set, the log is rotated into compressed segments
+(<log>.1.gz, <log>.2.gz, ...); log_segments() lists them in order.
 """
+import atexit
+import bz2
+import gzip
+import hashlib
 import json
+import logging
+import lzma
+import queue
+import re
+import shutil
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Commands between GameState snapshots (0 disables snapshots)
+DEFAULT_SNAPSHOT_INTERVAL = 100
+
+# Buffered bytes that trigger a write, and the longest an entry may wait
+DEFAULT_FLUSH_BYTES = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+
+# Longest flush() waits for the writer thread before giving up
+DEFAULT_FLUSH_TIMEOUT = 10.0  # seconds
+
+# Serialized AI payloads larger than this are moved to the sidecar directory
+AI_PAYLOAD_INLINE_LIMIT = 2048
+
+# Compression used for rotated segments: name -> (file suffix, opener)
+ROTATION_COMPRESSORS: dict[str, tuple[str, Callable[..., Any]]] = {
+    "gzip": (".gz", gzip.open),
+    "bz2": (".bz2", bz2.open),
+    "lzma": (".xz", lzma.open),
+}
+
+# Writer thread shutdown message (flush requests are threading.Event objects,
+# sidecar payloads are (path, serialized) tuples, entries are dicts)
+_CLOSE = object()
+
+
+def log_segments(log_path: str) -> list[Path]:
+    """List a log's files in write order: rotated segments, then the live log.
+
+    Args:
+        log_path: Path to the (live) log file
+
+    Returns:
+        Existing segment paths, oldest first
+    """
+    path = Path(log_path)
+    pattern = re.compile(re.escape(path.name) + r"\.(\d+)(\.\w+)?$")
+    rotated = []
+    if path.parent.is_dir():
+        for candidate in path.parent.iterdir():
+            match = pattern.match(candidate.name)
+            if match:
+                rotated.append((int(match.group(1)), candidate))
+    segments = [candidate for _, candidate in sorted(rotated)]
+    if path.exists():
+        segments.append(path)
+    return segments
+
+
+def open_log_segment(path: Path):
+    """Open a log segment for reading text, decompressing rotated segments.
+
+    Args:
+        path: Segment path from log_segments()
+
+    Returns:
+        Text file object
+    """
+    for suffix, opener in ROTATION_COMPRESSORS.values():
+        if path.name.endswith(suffix):
+            return opener(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
 
 
 class GameplayLogger:
@@ -25,32 +112,195 @@ class GameplayLogger:
 
     Args:
         log_path: Path to the log file to write
+        snapshot_interval: Commands between GameState snapshots (0 disables,
+            None uses DEFAULT_SNAPSHOT_INTERVAL)
+        flush_bytes: Buffered bytes that trigger a write
+        flush_interval: Seconds an entry may stay buffered before a write
+        rotate_bytes: Rotate the log into a compressed segment once it
+            reaches this size (None disables rotation)
+        rotate_compression: Compression for rotated segments (a key of
+            ROTATION_COMPRESSORS)
     """
 
-    def __init__(self, log_path: str):
-        """Initialize the logger with a file path.
+    def __init__(
+        self,
+        log_path: str,
+        snapshot_interval: Optional[int] = None,
+        flush_bytes: int = DEFAULT_FLUSH_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        rotate_bytes: Optional[int] = None,
+        rotate_compression: str = "gzip",
+    ):
+        """Initialize the logger with a file path and start the writer thread.
 
         Args:
             log_path: Path to the log file to create/write
+            snapshot_interval: Commands between GameState snapshots (0 disables,
+                None uses DEFAULT_SNAPSHOT_INTERVAL)
+            flush_bytes: Buffered bytes that trigger a write
+            flush_interval: Seconds an entry may stay buffered before a write
+            rotate_bytes: Rotate the log into a compressed segment once it
+                reaches this size (None disables rotation)
+            rotate_compression: Compression for rotated segments
+
+        Raises:
+            ValueError: If rotate_compression is unknown
         """
+        if rotate_compression not in ROTATION_COMPRESSORS:
+            raise ValueError(f"Unknown log compression: {rotate_compression}")
         self.log_path = Path(log_path)
         self.file = open(self.log_path, "w", encoding="utf-8")
+        self.snapshot_interval = (
+            DEFAULT_SNAPSHOT_INTERVAL if snapshot_interval is None else snapshot_interval
+        )
+        self.snapshot_dir = self.log_path.with_name(self.log_path.name + ".snapshots")
+        self.payload_dir = self.log_path.with_name(self.log_path.name + ".ai")
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.rotate_bytes = rotate_bytes
+        self.rotate_compression = rotate_compression
+        self._last_snapshot = 0
+        self._written_bytes = 0
+        self._segment_count = 0
+        self._known_payloads: set[str] = set()
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._error: Optional[OSError] = None
+        self._error_reported = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name="gameplay-logger"
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
     def _write_entry(self, entry_type: str, data: dict[str, Any]) -> None:
-        """Write a log entry to the file.
+        """Queue a log entry for the writer thread.
 
         Args:
             entry_type: The type of log entry (e.g., "command", "response")
             data: Additional data fields for the entry
         """
+        if self._closed:
+            return
+        self._report_error()
         entry = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "type": entry_type,
             **data
         }
-        self.file.write(json.dumps(entry) + "\n")
+        self._queue.put(entry)
+
+    def _writer_loop(self) -> None:
+        """Serialize queued entries and write them in batches until closed."""
+        buffer: list[str] = []
+        buffered = 0
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple):
+                path, serialized = item
+                try:
+                    path.write_text(serialized, encoding="utf-8")
+                except OSError as exc:
+                    self._record_error(exc)
+            elif isinstance(item, dict):
+                line = json.dumps(item, default=str) + "\n"
+                buffer.append(line)
+                buffered += len(line)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            force = item is _CLOSE or isinstance(item, threading.Event)
+            if buffer and (
+                force or buffered >= self.flush_bytes or time.monotonic() >= deadline
+            ):
+                try:
+                    self._write_lines(buffer)
+                except (OSError, ValueError) as exc:
+                    # ValueError: the file was left closed by an earlier failure
+                    self._record_error(exc)
+                buffer, buffered, deadline = [], 0, None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _CLOSE:
+                return
+
+    def _write_lines(self, lines: list[str]) -> None:
+        """Write a batch of serialized entries, rotating the log if it is full.
+
+        Args:
+            lines: Serialized JSON lines
+        """
+        for line in lines:
+            self.file.write(line)
+            self._written_bytes += len(line)
+            if self.rotate_bytes is not None and self._written_bytes >= self.rotate_bytes:
+                self._rotate()
         self.file.flush()
 
+    def _rotate(self) -> None:
+        """Compress the current log into the next numbered segment and reopen it."""
+        self.file.close()
+        self._segment_count += 1
+        suffix, opener = ROTATION_COMPRESSORS[self.rotate_compression]
+        segment = self.log_path.with_name(f"{self.log_path.name}.{self._segment_count}{suffix}")
+        try:
+            with open(self.log_path, "rb") as src, opener(segment, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        except OSError:
+            # Keep appending to the uncompressed log rather than losing entries
+            self._segment_count -= 1
+            self.file = open(self.log_path, "a", encoding="utf-8")
+            raise
+        self.file = open(self.log_path, "w", encoding="utf-8")
+        self._written_bytes = 0
+
+    def _record_error(self, exc: Exception) -> None:
+        """Remember the first write error so the session can surface it.
+
+        Args:
+            exc: Error raised while writing the log or a sidecar payload
+        """
+        if self._error is None:
+            if not isinstance(exc, OSError):
+                error = OSError(f"Gameplay log write failed: {exc}")
+                error.__cause__ = exc
+                exc = error
+            self._error = exc
+
+    def _report_error(self) -> None:
+        """Log a recorded write error once, from the caller's thread."""
+        if self._error is not None and not self._error_reported:
+            self._error_reported = True
+            logger.warning("Gameplay log %s is losing entries: %s", self.log_path, self._error)
+
+    def flush(self, timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT) -> None:
+        """Block until every queued entry has been written to disk.
+
+        Args:
+            timeout: Longest to wait for the writer thread (None waits forever)
+
+        Raises:
+            TimeoutError: If the writer thread died or did not finish in time
+            OSError: If a write failed since the logger was opened
+        """
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(0.05):
+            if not self._writer.is_alive():
+                raise TimeoutError(f"Gameplay log writer for {self.log_path} has stopped")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Gameplay log flush timed out after {timeout}s")
+        if self._error is not None:
+            self._error_reported = True
+            raise self._error
+
     def log_session_start(
         self,
         character_name: str,
@@ -142,12 +392,89 @@ class GameplayLogger:
         data: dict[str, Any] = {
             "generation_type": generation_type,
             "prompt_hash": prompt_hash,
-            "content": content,
         }
+        payload: dict[str, Any] = {"content": content}
         if raw_response is not None:
-            data["raw_response"] = raw_response
+            payload["raw_response"] = raw_response
+        # Serialized here: callers may keep mutating content after logging it
+        serialized = json.dumps(payload)
+        if len(serialized) > AI_PAYLOAD_INLINE_LIMIT:
+            data["payload"] = self._store_payload(serialized)
+        else:
+            data.update(json.loads(serialized))
         self._write_entry("ai_content", data)
 
+    def _store_payload(self, serialized: str) -> str:
+        """Store a large AI payload once in the content-addressed sidecar.
+
+        Args:
+            serialized: JSON-serialized payload
+
+        Returns:
+            Payload file path relative to the log's directory
+        """
+        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        name = f"{digest[:32]}.json"
+        if name not in self._known_payloads:
+            self._known_payloads.add(name)
+            self.payload_dir.mkdir(parents=True, exist_ok=True)
+            payload_path = self.payload_dir / name
+            if not payload_path.exists():
+                self._queue.put((payload_path, serialized))
+        return f"{self.payload_dir.name}/{name}"
+
+    def log_ai_metrics(self, metrics: dict[str, Any]) -> None:
+        """Log AI generation metrics for the session.
+
+        Args:
+            metrics: Metrics snapshot from AIMetrics.snapshot()
+        """
+        self._write_entry("ai_metrics", metrics)
+
+    def snapshot_due(self, command_index: int) -> bool:
+        """Check whether a snapshot should be taken after a command.
+
+        Args:
+            command_index: Number of commands executed so far
+
+        Returns:
+            True if snapshot_interval commands have run since the last snapshot
+        """
+        return (
+            self.snapshot_interval > 0
+            and command_index - self._last_snapshot >= self.snapshot_interval
+        )
+
+    def log_snapshot(self, command_index: int, snapshot: dict[str, Any]) -> None:
+        """Write a GameState snapshot file and log a pointer to it.
+
+        The file is stored in a directory next to the log and referenced by
+        a path relative to the log's directory.
+
+        Args:
+            command_index: Number of commands executed before the snapshot
+            snapshot: Snapshot from session_replay.make_snapshot()
+        """
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_path = self.snapshot_dir / f"cmd_{command_index:06d}.json"
+        with open(snapshot_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        self._last_snapshot = command_index
+        self._write_entry("snapshot", {
+            "command_index": command_index,
+            "file": f"{self.snapshot_dir.name}/{snapshot_path.name}",
+        })
+
     def close(self) -> None:
-        """Close the log file."""
+        """Write all queued entries and close the log file.
+
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_CLOSE)
+        self._writer.join()
         self.file.close()
+        self._report_error()
@@ -1,22 +1,41 @@
 """Main entry point for CLI RPG."""
+import logging
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from cli_rpg.character_creation import create_character, get_theme_selection, create_character_non_interactive
 from cli_rpg.models.character import Character, FightingStance
 from cli_rpg.models.item import Item, ItemType
-from cli_rpg.persistence import save_character, load_character, list_saves, save_game_state, load_game_state, detect_save_type
+from cli_rpg.persistence import save_character, load_character, list_saves, save_game_state, load_game_state, detect_save_type, SAVE_FORMATS
 from cli_rpg.game_state import GameState, parse_command, suggest_command, KNOWN_COMMANDS
-from cli_rpg.world import create_world
+from cli_rpg.world import create_world, start_world
 from cli_rpg.config import load_ai_config, is_ai_strict_mode
+from cli_rpg.ai_metrics import AIMetrics
 from cli_rpg.ai_service import AIService
 from cli_rpg.autosave import autosave
-from cli_rpg.map_renderer import render_map, render_worldmap
+from cli_rpg.map_renderer import render_map, render_worldmap, render_zoomed_worldmap
+from cli_rpg.map_pyramid import ZOOM_LEVELS
 from cli_rpg.input_handler import init_readline, get_input, set_completer_context
 from cli_rpg.dreams import maybe_trigger_dream, display_dream
 from cli_rpg.companion_reactions import process_companion_reactions
 from cli_rpg.text_effects import set_effects_enabled
 from cli_rpg.sound_effects import set_sound_enabled, sound_death, sound_quest_complete
 
+if TYPE_CHECKING:
+    from cli_rpg.logging_service import GameplayLogger
+
+
+def get_ai_metrics(ai_service) -> Optional[AIMetrics]:
+    """Return an AI service's metrics registry.
+
+    Args:
+        ai_service: AIService instance, or None when AI is disabled
+
+    Returns:
+        The service's AIMetrics, or None without AI (or for test doubles
+        that have no registry)
+    """
+    return getattr(ai_service, "metrics", None)
+
 
 def get_command_reference() -> str:
     """Return the full command reference string.
@@ -49,7 +68,7 @@ def get_command_reference() -> str:
         "  buy <item>         - Buy an item from the shop",
         "  sell <item>        - Sell an item to the shop",
         "  map (m)            - Display a map of explored areas",
-        "  worldmap (wm)      - Display the overworld map",
+        "  worldmap (wm) [z]  - Display the overworld map (zoom z = 1, 4 or 16)",
         "  travel <location>  - Fast travel to a discovered named location",
         "  lore               - Discover lore about your current location",
         "  rest (r)           - Rest to recover health (25% of max HP)",
@@ -79,7 +98,8 @@ def get_command_reference() -> str:
         "",
         "  help (h)           - Display this command reference",
         "  dump-state         - Export full game state as JSON",
-        "  save               - Save your game (not available during combat)",
+        "  ai-stats           - Show AI generation call, token and cache stats",
+        "  save [format]      - Save your game: json (default), pickle or marshal (not available during combat)",
         "  quit               - Return to main menu",
         "",
         "Combat Commands:",
@@ -1416,11 +1436,7 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
                     # Build set of valid location names for EXPLORE quest validation
                     valid_locations = {loc.lower() for loc in game_state.world.keys()}
                     # Build set of valid NPC names for TALK quest validation
-                    valid_npcs = {
-                        npc_in_loc.name.lower()
-                        for location in game_state.world.values()
-                        for npc_in_loc in location.npcs
-                    }
+                    valid_npcs = {name.lower() for name in game_state.get_npc_names()}
                     # Get world and region context for cohesive quest generation
                     world_ctx = game_state.get_or_create_world_context()
                     current_loc = game_state.world.get(game_state.current_location)
@@ -2019,7 +2035,22 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
             current_loc = game_state.get_current_location()
             if current_loc.parent_location:
                 worldmap_location = current_loc.parent_location
-        worldmap_output = render_worldmap(game_state.world, worldmap_location, game_state.seen_tiles)
+        if args:
+            # Zoomed view: "worldmap 4" or "worldmap 1:4"
+            zoom_arg = args[0].split(":")[-1]
+            if not zoom_arg.isdigit() or int(zoom_arg) not in ZOOM_LEVELS:
+                levels = ", ".join(str(level) for level in ZOOM_LEVELS)
+                return (True, f"\nUnknown zoom level '{args[0]}'. Use one of: {levels}")
+            worldmap_output = render_zoomed_worldmap(
+                game_state.world,
+                worldmap_location,
+                int(zoom_arg),
+                game_state.map_pyramid,
+                game_state.seen_tiles,
+                game_state.chunk_manager,
+            )
+        else:
+            worldmap_output = render_worldmap(game_state.world, worldmap_location, game_state.seen_tiles)
         return (True, f"\n{worldmap_output}")
 
     elif command == "travel":
@@ -2126,6 +2157,13 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
             f"Objective: {quest.objective_type.value.capitalize()} {quest.target}",
             f"Progress: {quest.current_count}/{quest.target_count}",
         ])
+        # Point the way to an explore target along walkable terrain
+        from cli_rpg.models.quest import QuestStatus
+        if quest.status == QuestStatus.ACTIVE:
+            route = game_state.get_quest_route(quest)
+            if route is not None:
+                direction, steps = route
+                lines.append(f"Heading: {direction} ({steps} step{'s' if steps != 1 else ''} away)")
         # Add time remaining for time-limited quests
         if quest.time_limit_hours:
             remaining = quest.get_time_remaining(game_state.game_time.total_hours)
@@ -2504,7 +2542,10 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
             return (True, f"\n{target_chest['name']} has already been opened. It's empty now.")
 
         # Open the chest and transfer items
-        target_chest["opened"] = True
+        if game_state.current_sub_grid is not None:
+            game_state.current_sub_grid.open_treasure(target_chest)
+        else:
+            target_chest["opened"] = True
 
         items_added = []
         for item_data in target_chest.get("items", []):
@@ -2547,9 +2588,24 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
         state_dict = game_state.to_dict()
         return (True, f"\n{json.dumps(state_dict, indent=2)}")
 
+    elif command == "ai-stats":
+        metrics = get_ai_metrics(game_state.ai_service)
+        if metrics is None:
+            return (True, "\nAI generation is not enabled for this session.")
+        report = metrics.format_report()
+        prefetch_report = game_state.prefetch_planner.format_report()
+        if prefetch_report:
+            report = f"{report}\n{prefetch_report}"
+        return (True, "\n" + report)
+
     elif command == "save":
+        if args and args[0].lower() not in SAVE_FORMATS:
+            return (True, f"\nUnknown save format '{args[0]}'. Choose from: {', '.join(SAVE_FORMATS)}")
         try:
-            filepath = save_game_state(game_state)
+            if args:
+                filepath = save_game_state(game_state, save_format=args[0].lower())
+            else:
+                filepath = save_game_state(game_state)
             return (True, f"\n✓ Game saved successfully!\n  Save location: {filepath}")
         except IOError as e:
             return (True, f"\n✗ Failed to save game: {e}")
@@ -2675,6 +2731,7 @@ def handle_exploration_command(game_state: GameState, command: str, args: list[s
                 tiredness=pre_rest_tiredness,
                 last_dream_hour=game_state.last_dream_hour,
                 current_hour=game_state.game_time.total_hours,
+                flavor_pool=getattr(game_state, 'flavor_pool', None),
             )
             if dream:
                 # Update last_dream_hour for cooldown tracking
@@ -2830,6 +2887,10 @@ def run_game_loop(game_state: GameState) -> None:
     """
     # Set up completer context for tab completion
     set_completer_context(game_state)
+    # Prefetch AI whispers/dreams/banter while waiting for input
+    game_state.start_flavor_pool()
+    # Build interiors of nearby dungeons/caves/towns before the player enters
+    game_state.start_interior_builder()
 
     try:
         # Main gameplay loop
@@ -2889,6 +2950,15 @@ def run_game_loop(game_state: GameState) -> None:
     finally:
         # Clear completer context when exiting the game loop
         set_completer_context(None)
+        game_state.stop_flavor_pool()
+        game_state.stop_interior_builder()
+        game_state.stop_world_build()
+        # Dump AI generation metrics for the session to the debug log
+        metrics = get_ai_metrics(game_state.ai_service)
+        if metrics is not None:
+            logging.getLogger(__name__).info(
+                "AI generation stats:\n%s", metrics.format_report()
+            )
 
 
 def start_game(
@@ -2908,9 +2978,10 @@ def start_game(
                 If False, falls back to default world on AI error.
         use_wfc: If True, enable WFC terrain generation for procedural world
     """
-    # Create game state with AI-powered or default world
+    # Create game state with AI-powered or default world; an AI world starts
+    # once its starting location is ready and streams in the rest
     try:
-        world, starting_location = create_world(
+        world, starting_location, world_build = start_world(
             ai_service=ai_service, theme=theme, strict=strict
         )
     except Exception as e:
@@ -2932,7 +3003,7 @@ def start_game(
                 )
             elif choice == "2":
                 # Use default world (non-strict mode)
-                world, starting_location = create_world(
+                world, starting_location, world_build = start_world(
                     ai_service=ai_service, theme=theme, strict=False
                 )
                 break
@@ -2944,7 +3015,7 @@ def start_game(
     
     # Validate world is not empty
     if not world:
-        raise ValueError("create_world() returned empty world")
+        raise ValueError("start_world() returned empty world")
     
     # Validate starting location exists in world
     if starting_location not in world:
@@ -2972,6 +3043,8 @@ def start_game(
         theme=theme,
         chunk_manager=chunk_manager,
     )
+    if world_build is not None:
+        game_state.attach_world_build(world_build)
 
     # Initialize default factions
     from cli_rpg.world import get_default_factions
@@ -3010,6 +3083,20 @@ def show_main_menu() -> str:
     return choice
 
 
+def _maybe_log_snapshot(logger: "GameplayLogger", game_state: GameState, commands_run: int) -> None:
+    """Log a GameState snapshot if one is due and the state can be restored.
+
+    Args:
+        logger: Active gameplay logger
+        game_state: Current game state
+        commands_run: Number of commands executed so far
+    """
+    from cli_rpg.session_replay import can_snapshot, make_snapshot
+
+    if logger.snapshot_due(commands_run) and can_snapshot(game_state):
+        logger.log_snapshot(commands_run, make_snapshot(game_state, commands_run))
+
+
 def run_json_mode(
     log_file: Optional[str] = None,
     delay_ms: int = 0,
@@ -3039,7 +3126,7 @@ def run_json_mode(
     from cli_rpg.models.character import Character, CharacterClass
     from cli_rpg.json_output import (
         emit_state, emit_narrative, emit_actions, emit_error, emit_combat,
-        classify_output, emit_session_info
+        classify_output, emit_session_info, emit_narrative_partial, emit_ai_metrics
     )
     from cli_rpg.logging_service import GameplayLogger
 
@@ -3061,6 +3148,8 @@ def run_json_mode(
             # Pass logger callback if logging is enabled
             content_logger = logger.log_ai_content if logger else None
             ai_service = AIService(ai_config, content_logger=content_logger)
+            # Stream AI narrative as partial narrative messages instead of raw stdout
+            ai_service.narrative_stream_handler = emit_narrative_partial
         except Exception:
             pass  # Silently fall back to non-AI mode
 
@@ -3113,6 +3202,7 @@ def run_json_mode(
             ai_service=ai_service,
             theme="fantasy",
             chunk_manager=chunk_manager,
+            seed=seed,
         )
 
         # Initialize default factions
@@ -3158,7 +3248,9 @@ def run_json_mode(
             exits = location.get_available_directions(world=game_state.world)
         npcs = [npc.name for npc in location.npcs] if location.npcs else []
         commands = get_available_commands()
-        emit_actions(exits=exits, npcs=npcs, commands=commands)
+        emit_actions(
+            exits=exits, npcs=npcs, commands=commands, routes=game_state.get_quest_directions()
+        )
 
     def emit_combat_state() -> None:
         """Emit combat state if in combat."""
@@ -3188,6 +3280,8 @@ def run_json_mode(
         )
 
     end_reason = "eof"
+    commands_run = 0
+    metrics = get_ai_metrics(ai_service)
 
     # Read commands from stdin until EOF
     for line in sys.stdin:
@@ -3217,6 +3311,8 @@ def run_json_mode(
             from cli_rpg.json_output import emit_dump_state
             state_dict = game_state.to_dict()
             emit_dump_state(state_dict)
+        elif command == "ai-stats" and metrics is not None:
+            emit_ai_metrics(metrics.snapshot())
         # Classify and emit output
         elif message:
             msg_type, error_code = classify_output(message)
@@ -3225,6 +3321,8 @@ def run_json_mode(
             else:
                 emit_narrative(message)
 
+        commands_run += 1
+
         # Log response and state
         if logger:
             logger.log_response(message)
@@ -3235,6 +3333,7 @@ def run_json_mode(
                 gold=game_state.current_character.gold,
                 level=game_state.current_character.level
             )
+            _maybe_log_snapshot(logger, game_state, commands_run)
 
         # Emit state after each command
         emit_current_state()
@@ -3259,8 +3358,14 @@ def run_json_mode(
         if delay_ms > 0:
             time.sleep(delay_ms / 1000.0)
 
+    # Dump AI metrics for the session
+    if metrics is not None:
+        emit_ai_metrics(metrics.snapshot())
+
     # Close logger
     if logger:
+        if metrics is not None:
+            logger.log_ai_metrics(metrics.snapshot())
         logger.log_session_end(end_reason)
         logger.close()
 
@@ -3271,7 +3376,8 @@ def run_replay_mode(
     log_file: str,
     validate: bool = False,
     continue_at: Optional[int] = None,
-    json_output: bool = False
+    json_output: bool = False,
+    start_from: Optional[int] = None
 ) -> int:
     """Replay a session from a log file.
 
@@ -3279,12 +3385,15 @@ def run_replay_mode(
     1. Deterministic replay using the original RNG seed
     2. Validation that game responses match (for debugging regressions)
     3. Option to continue interactively from any point in the log
+    4. Fast-forward to command N from the nearest logged snapshot
 
     Args:
         log_file: Path to the log file to replay
         validate: If True, validate state matches at each step
         continue_at: If set, switch to interactive after N commands
         json_output: If True, emit JSON output instead of text
+        start_from: If set, restore the nearest snapshot at or before this
+            command, replay silently up to it and print output from there
 
     Returns:
         Exit code (0 for success, 1 for validation failure)
@@ -3292,9 +3401,7 @@ def run_replay_mode(
     import random
     from cli_rpg.colors import set_colors_enabled
     from cli_rpg.models.character import Character, CharacterClass
-    from cli_rpg.session_replay import (
-        extract_seed, extract_commands, extract_states, validate_state
-    )
+    from cli_rpg.session_replay import build_log_index, restore_snapshot, validate_state
     from cli_rpg.json_output import emit_state, emit_narrative, emit_error
 
     # Disable ANSI colors, typewriter effects, and sounds for replay
@@ -3302,10 +3409,11 @@ def run_replay_mode(
     set_effects_enabled(False)
     set_sound_enabled(False)
 
-    # Extract seed and commands from log
-    seed = extract_seed(log_file)
-    commands = extract_commands(log_file, limit=continue_at)
-    states = extract_states(log_file) if validate else []
+    # Read seed, commands, states and snapshot pointers from the log
+    index = build_log_index(log_file)
+    seed = index.seed
+    commands = index.commands[:continue_at] if continue_at is not None else index.commands
+    snapshot = index.nearest_snapshot(start_from) if start_from is not None else None
 
     # Seed RNG for reproducibility
     if seed is not None:
@@ -3320,52 +3428,79 @@ def run_replay_mode(
         except Exception:
             pass  # Silently fall back to non-AI mode
 
-    # Create default character (replay uses same default as non-interactive)
-    character = Character(
-        name="Agent",
-        character_class=CharacterClass.WARRIOR,
-        strength=10,
-        dexterity=10,
-        intelligence=10,
-        charisma=10,
-        perception=10,
-        luck=10
-    )
+    first_command = 0
+    if snapshot is not None:
+        # Resume from the snapshot instead of replaying from the start
+        game_state, first_command = restore_snapshot(snapshot.path, ai_service=ai_service)
+    else:
+        # Create default character (replay uses same default as non-interactive)
+        character = Character(
+            name="Agent",
+            character_class=CharacterClass.WARRIOR,
+            strength=10,
+            dexterity=10,
+            intelligence=10,
+            charisma=10,
+            perception=10,
+            luck=10
+        )
 
-    # Create world and game state
-    world, starting_location = create_world(ai_service=ai_service, theme="fantasy", strict=False)
+        # Create world and game state
+        world, starting_location = create_world(ai_service=ai_service, theme="fantasy", strict=False)
 
-    # Generate WFC ChunkManager seed
-    import random as rnd
-    chunk_seed = seed if seed is not None else rnd.randint(0, 2**31 - 1)
+        # Generate WFC ChunkManager seed
+        import random as rnd
+        chunk_seed = seed if seed is not None else rnd.randint(0, 2**31 - 1)
 
-    # Initialize WFC ChunkManager for terrain generation
-    from cli_rpg.wfc_chunks import ChunkManager
-    from cli_rpg.world_tiles import DEFAULT_TILE_REGISTRY
-    chunk_manager = ChunkManager(
-        tile_registry=DEFAULT_TILE_REGISTRY,
-        world_seed=chunk_seed,
-    )
-    chunk_manager.sync_with_locations(world)
+        # Initialize WFC ChunkManager for terrain generation
+        from cli_rpg.wfc_chunks import ChunkManager
+        from cli_rpg.world_tiles import DEFAULT_TILE_REGISTRY
+        chunk_manager = ChunkManager(
+            tile_registry=DEFAULT_TILE_REGISTRY,
+            world_seed=chunk_seed,
+        )
+        chunk_manager.sync_with_locations(world)
 
-    game_state = GameState(
-        character,
-        world,
-        starting_location=starting_location,
-        ai_service=ai_service,
-        theme="fantasy",
-        chunk_manager=chunk_manager,
-    )
+        game_state = GameState(
+            character,
+            world,
+            starting_location=starting_location,
+            ai_service=ai_service,
+            theme="fantasy",
+            chunk_manager=chunk_manager,
+            seed=seed,
+        )
 
-    # Initialize default factions
-    from cli_rpg.world import get_default_factions
-    game_state.factions = get_default_factions()
+        # Initialize default factions
+        from cli_rpg.world import get_default_factions
+        game_state.factions = get_default_factions()
 
     # Replay commands
-    state_index = 0
     validation_failures = []
 
-    for i, command_input in enumerate(commands):
+    def check_state(commands_run: int) -> None:
+        """Compare the current state with the state logged after N commands."""
+        expected = index.states.get(commands_run)
+        if not validate or expected is None:
+            return
+        actual = {
+            "location": game_state.current_location,
+            "health": game_state.current_character.health,
+            "gold": game_state.current_character.gold,
+            "level": game_state.current_character.level
+        }
+        diffs = validate_state(expected, actual)
+        if diffs:
+            validation_failures.append((commands_run, diffs))
+            if json_output:
+                emit_error(code="STATE_MISMATCH", message="; ".join(diffs))
+            else:
+                print(f"⚠️  State mismatch at command {commands_run}: {'; '.join(diffs)}")
+
+    check_state(first_command)
+
+    for i in range(first_command, len(commands)):
+        command_input = commands[i]
         command, args = parse_command(command_input)
 
         if game_state.is_in_combat():
@@ -3375,8 +3510,10 @@ def run_replay_mode(
         else:
             continue_game, message = handle_exploration_command(game_state, command, args, non_interactive=True)
 
-        # Output (JSON or text)
-        if json_output:
+        # Output (JSON or text); commands before --from N run silently
+        if start_from is not None and i < start_from:
+            pass
+        elif json_output:
             emit_narrative(message.strip())
             emit_state(
                 location=game_state.current_location,
@@ -3390,22 +3527,7 @@ def run_replay_mode(
             print(message.strip())
 
         # Validate state if enabled
-        if validate and state_index < len(states):
-            expected = states[state_index]
-            actual = {
-                "location": game_state.current_location,
-                "health": game_state.current_character.health,
-                "gold": game_state.current_character.gold,
-                "level": game_state.current_character.level
-            }
-            diffs = validate_state(expected, actual)
-            if diffs:
-                validation_failures.append((i+1, diffs))
-                if json_output:
-                    emit_error(code="STATE_MISMATCH", message="; ".join(diffs))
-                else:
-                    print(f"⚠️  State mismatch at command {i+1}: {'; '.join(diffs)}")
-            state_index += 1
+        check_state(i + 1)
 
         if not continue_game:
             break
@@ -3543,6 +3665,7 @@ def run_non_interactive(
             ai_service=ai_service,
             theme="fantasy",
             chunk_manager=chunk_manager,
+            seed=seed,
         )
 
         # Initialize default factions
@@ -3572,6 +3695,8 @@ def run_non_interactive(
         )
 
     end_reason = "eof"
+    commands_run = 0
+    metrics = get_ai_metrics(ai_service)
 
     # Read commands from stdin until EOF
     for line in sys.stdin:
@@ -3595,6 +3720,8 @@ def run_non_interactive(
 
         print(message)
 
+        commands_run += 1
+
         # Log response and state
         if logger:
             logger.log_response(message.strip())
@@ -3605,6 +3732,7 @@ def run_non_interactive(
                 gold=game_state.current_character.gold,
                 level=game_state.current_character.level
             )
+            _maybe_log_snapshot(logger, game_state, commands_run)
 
         # Show combat status if in combat
         if game_state.is_in_combat() and game_state.current_combat is not None:
@@ -3626,6 +3754,8 @@ def run_non_interactive(
 
     # Close logger
     if logger:
+        if metrics is not None:
+            logger.log_ai_metrics(metrics.snapshot())
         logger.log_session_end(end_reason)
         logger.close()
 
@@ -3760,6 +3890,13 @@ def parse_args(args: Optional[list] = None):
         metavar="N",
         help="Continue interactively after replaying N commands (use with --replay)"
     )
+    parser.add_argument(
+        "--from",
+        dest="replay_from",
+        type=int,
+        metavar="N",
+        help="Fast-forward to command N from the nearest logged snapshot (use with --replay)"
+    )
     return parser.parse_args(args)
 
 
@@ -3792,7 +3929,8 @@ def main(args: Optional[list] = None) -> int:
             log_file=parsed_args.replay,
             validate=parsed_args.validate,
             continue_at=parsed_args.continue_at,
-            json_output=parsed_args.json
+            json_output=parsed_args.json,
+            start_from=parsed_args.replay_from
         )
 
     if parsed_args.json:
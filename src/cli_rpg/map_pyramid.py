@@ -0,0 +1,264 @@
+"""Multi-resolution terrain/POI pyramid for the zoomable world map.
+
+The zoomed world map draws one cell per 1x1, 4x4 or 16x16 block of tiles.
+MapPyramid answers "what does this block look like" for any zoom level:
+
+- terrain: the most common terrain among the block's known tiles (seen
+  tiles and tiles holding a location), from ChunkManager when available
+  and otherwise from the locations themselves
+- POI: the alphabetically first named overworld location in the block
+
+Coarse blocks are cached and dropped only when something inside them
+changes: a tile in the block is newly seen (GameState.update_visibility),
+a location is added there, or a ChunkManager chunk it overlaps has a tile
+rewritten. Building a view therefore costs time proportional to the
+number of cells on screen, not to the size of the explored world.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from cli_rpg.paged_world import PagedWorld
+from cli_rpg.world_tiles import REGION_SIZE
+
+if TYPE_CHECKING:
+    from cli_rpg.models.location import Location
+    from cli_rpg.wfc_chunks import ChunkManager
+
+# Tiles per cell edge at each zoom level
+ZOOM_LEVELS = (1, 4, 16)
+
+
+@dataclass(frozen=True)
+class MapCell:
+    """Summary of one map cell.
+
+    Attributes:
+        terrain: Dominant terrain of the cell's known tiles (None if unknown)
+        poi: Name of the cell's named location, if any
+    """
+
+    terrain: Optional[str] = None
+    poi: Optional[str] = None
+
+
+_EMPTY_CELL = MapCell()
+
+
+def _block_of(x: int, y: int, zoom: int) -> tuple[int, int]:
+    """Return the cell containing a tile at a zoom level."""
+    return (x // zoom, y // zoom)
+
+
+class MapPyramid:
+    """Cached per-zoom cell summaries for one game's overworld.
+
+    Attributes:
+        levels: Cached cells per zoom level (zoom 1 is not cached)
+    """
+
+    def __init__(self):
+        """Create an empty pyramid."""
+        self.levels: dict[int, dict[tuple[int, int], MapCell]] = {
+            zoom: {} for zoom in ZOOM_LEVELS if zoom > 1
+        }
+        self._tiles: dict[tuple[int, int], str] = {}  # tile -> location name
+        self._indexed: set[str] = set()
+        self._world_id: Optional[int] = None
+        self._seen_count = 0
+        self._chunk_revisions: dict[tuple[int, int], int] = {}
+
+    def clear(self) -> None:
+        """Drop every cached cell and the location index."""
+        for cells in self.levels.values():
+            cells.clear()
+        self._tiles.clear()
+        self._indexed.clear()
+        self._chunk_revisions.clear()
+
+    def _invalidate_tile(self, x: int, y: int) -> None:
+        """Drop the cached cells containing a tile."""
+        for zoom, cells in self.levels.items():
+            cells.pop(_block_of(x, y, zoom), None)
+
+    def mark_seen(self, tiles: Iterable[tuple[int, int]]) -> None:
+        """Record newly seen tiles.
+
+        Args:
+            tiles: Tiles that were not in seen_tiles before
+        """
+        for x, y in tiles:
+            self._invalidate_tile(x, y)
+            self._seen_count += 1
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int) -> None:
+        """Drop the cached cells overlapping a terrain chunk.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+            chunk_size: Tiles per chunk edge
+        """
+        min_x, min_y = chunk_x * chunk_size, chunk_y * chunk_size
+        for zoom, cells in self.levels.items():
+            for bx in range(min_x // zoom, (min_x + chunk_size - 1) // zoom + 1):
+                for by in range(min_y // zoom, (min_y + chunk_size - 1) // zoom + 1):
+                    cells.pop((bx, by), None)
+
+    def _sync_locations(self, world: dict) -> None:
+        """Index overworld locations added since the last sync.
+
+        New entries are appended to the world dict, so they are found by
+        walking it backwards until a known name. Removals rebuild the index.
+        Only materialized locations of a PagedWorld are indexed.
+        """
+        if id(world) != self._world_id or dict.__len__(world) < len(self._indexed):
+            self.clear()
+            self._world_id = id(world)
+        added = []
+        for name, location in reversed(dict.items(world)):
+            if name in self._indexed:
+                break
+            added.append((name, location))
+        if len(self._indexed) + len(added) != dict.__len__(world):
+            # Entries were removed and others added: rebuild from scratch
+            self.clear()
+            self._world_id = id(world)
+            added = list(dict.items(world))
+        for name, location in reversed(added):
+            self._indexed.add(name)
+            coords = location.coordinates
+            if not location.is_overworld or not isinstance(coords, tuple):
+                continue
+            tile = (coords[0], coords[1])
+            if tile not in self._tiles:
+                self._tiles[tile] = name
+                self._invalidate_tile(*tile)
+
+    def _sync_chunks(self, chunk_manager: "ChunkManager", tiles: tuple[int, int, int, int]) -> None:
+        """Invalidate cells over chunks rewritten since the last render."""
+        min_x, max_x, min_y, max_y = tiles
+        size = chunk_manager.chunk_size
+        for cx in range(min_x // size, max_x // size + 1):
+            for cy in range(min_y // size, max_y // size + 1):
+                revision = chunk_manager.chunk_revision(cx, cy)
+                if self._chunk_revisions.get((cx, cy), 0) != revision:
+                    self._chunk_revisions[(cx, cy)] = revision
+                    self.invalidate_chunk(cx, cy, size)
+
+    def location_at(self, world: dict, tile: tuple[int, int]) -> Optional["Location"]:
+        """Return the indexed overworld location at a tile."""
+        name = self._tiles.get(tile)
+        return world.get(name) if name is not None else None
+
+    def _tile_cell(
+        self,
+        world: dict,
+        x: int,
+        y: int,
+        seen_tiles: set[tuple[int, int]],
+        chunk_manager: Optional["ChunkManager"],
+    ) -> MapCell:
+        """Summarize a single tile."""
+        location = self.location_at(world, (x, y))
+        if location is None and (x, y) not in seen_tiles:
+            return _EMPTY_CELL
+        if chunk_manager is not None:
+            terrain = chunk_manager.get_tile_at(x, y)
+        else:
+            terrain = (location.terrain or "plains") if location is not None else None
+        poi = location.name if location is not None and location.is_named else None
+        return MapCell(terrain, poi)
+
+    def _block_cell(
+        self,
+        world: dict,
+        zoom: int,
+        block: tuple[int, int],
+        seen_tiles: set[tuple[int, int]],
+        chunk_manager: Optional["ChunkManager"],
+    ) -> MapCell:
+        """Summarize a zoom x zoom block (cached)."""
+        cells = self.levels[zoom]
+        cell = cells.get(block)
+        if cell is not None:
+            return cell
+        terrain: Counter = Counter()
+        pois = []
+        for x in range(block[0] * zoom, (block[0] + 1) * zoom):
+            for y in range(block[1] * zoom, (block[1] + 1) * zoom):
+                tile = self._tile_cell(world, x, y, seen_tiles, chunk_manager)
+                if tile.terrain is not None:
+                    terrain[tile.terrain] += 1
+                if tile.poi is not None:
+                    pois.append(tile.poi)
+        # Most common terrain; ties go to the alphabetically first name
+        dominant = min(terrain, key=lambda t: (-terrain[t], t)) if terrain else None
+        cell = MapCell(dominant, min(pois) if pois else None)
+        cells[block] = cell
+        return cell
+
+    def view(
+        self,
+        world: dict,
+        center: tuple[int, int],
+        zoom: int,
+        width: int,
+        height: int,
+        seen_tiles: set[tuple[int, int]],
+        chunk_manager: Optional["ChunkManager"] = None,
+    ) -> list[list[MapCell]]:
+        """Return the cells of a view centered on a tile.
+
+        Args:
+            world: Dictionary mapping location names to Locations
+            center: Tile to center the view on
+            zoom: Tiles per cell edge (one of ZOOM_LEVELS)
+            width: Cells per row
+            height: Rows
+            seen_tiles: Tiles the player has seen
+            chunk_manager: Optional WFC terrain source
+
+        Returns:
+            Rows of cells, top (highest y) first
+
+        Raises:
+            ValueError: If zoom is not one of ZOOM_LEVELS
+        """
+        if zoom not in ZOOM_LEVELS:
+            raise ValueError(f"Unsupported zoom level: {zoom}")
+
+        cx, cy = _block_of(center[0], center[1], zoom)
+        min_bx, min_by = cx - width // 2, cy - height // 2
+        tiles = (
+            min_bx * zoom,
+            (min_bx + width) * zoom - 1,
+            min_by * zoom,
+            (min_by + height) * zoom - 1,
+        )
+
+        if isinstance(world, PagedWorld):
+            # Materialize the regions under the view so their locations are indexed
+            for rx in range(tiles[0] // REGION_SIZE, tiles[1] // REGION_SIZE + 1):
+                for ry in range(tiles[2] // REGION_SIZE, tiles[3] // REGION_SIZE + 1):
+                    world.load_region((rx, ry))
+        if len(seen_tiles) != self._seen_count:
+            # seen_tiles changed without mark_seen (e.g. replaced on load)
+            for cells in self.levels.values():
+                cells.clear()
+            self._seen_count = len(seen_tiles)
+        self._sync_locations(world)
+        if chunk_manager is not None:
+            self._sync_chunks(chunk_manager, tiles)
+
+        rows = []
+        for by in range(min_by + height - 1, min_by - 1, -1):
+            row = []
+            for bx in range(min_bx, min_bx + width):
+                if zoom == 1:
+                    row.append(self._tile_cell(world, bx, by, seen_tiles, chunk_manager))
+                else:
+                    row.append(self._block_cell(world, zoom, (bx, by), seen_tiles, chunk_manager))
+            rows.append(row)
+        return rows
@@ -7,10 +7,12 @@ from wcwidth import wcswidth
 
 from cli_rpg.models.location import Location
 from cli_rpg import colors
+from cli_rpg.paged_world import PagedWorld
 from cli_rpg.world_tiles import get_terrain_symbol
 
 if TYPE_CHECKING:
     from cli_rpg.world_grid import SubGrid
+    from cli_rpg.map_pyramid import MapPyramid
     from cli_rpg.wfc_chunks import ChunkManager
 
 # Category to marker mapping for location icons
@@ -72,6 +74,18 @@ def pad_marker(marker: str, target_width: int) -> str:
     return (" " * max(0, padding)) + marker
 
 
+def _items_near(world: dict[str, Location], coords: tuple[int, int], radius: int):
+    """Return world items that may lie within radius of coords.
+
+    A paged world pages in only the regions the radius reaches and returns its
+    materialized locations; a plain world returns all of its items.
+    """
+    if isinstance(world, PagedWorld):
+        world.load_near(coords, radius)
+        return list(dict.items(world))
+    return world.items()
+
+
 def render_map(
     world: dict[str, Location],
     current_location: str,
@@ -111,7 +125,7 @@ def render_map(
 
     # Extract locations with coordinates that are within the viewport
     locations_with_coords = []
-    for name, location in world.items():
+    for name, location in _items_near(world, (player_x, player_y), 4):
         if location.coordinates is not None:
             x, y = location.coordinates
             if min_x <= x <= max_x and min_y <= y <= max_y:
@@ -489,9 +503,12 @@ def render_worldmap(
             parent_context_message = f"(You are inside {parent_name})\n\n"
             map_center_location = parent_name
 
-    # Filter world to only overworld locations
+    # Filter world to only overworld locations (a paged world only needs the
+    # regions around the map center)
+    center_coords = world[map_center_location].coordinates
+    items = world.items() if center_coords is None else _items_near(world, center_coords, 4)
     overworld_locations = {
-        name: loc for name, loc in world.items() if loc.is_overworld
+        name: loc for name, loc in items if loc.is_overworld
     }
 
     # Check if any overworld locations exist
@@ -513,3 +530,99 @@ def render_worldmap(
             map_output = "\n".join(lines)
 
     return map_output
+
+
+# Size of the zoomed world map in cells
+ZOOMED_MAP_WIDTH = 41
+ZOOMED_MAP_HEIGHT = 17
+
+# Letters for named locations on the zoomed world map
+ZOOMED_MAP_SYMBOLS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def render_zoomed_worldmap(
+    world: dict[str, Location],
+    current_location: str,
+    zoom: int,
+    pyramid: "MapPyramid",
+    seen_tiles: Optional[set[tuple[int, int]]] = None,
+    chunk_manager: Optional["ChunkManager"] = None,
+    width: int = ZOOMED_MAP_WIDTH,
+    height: int = ZOOMED_MAP_HEIGHT,
+) -> str:
+    """Render the overworld at 1:1, 1:4 or 1:16 scale.
+
+    Each character is one block of zoom x zoom tiles, drawn with the block's
+    dominant terrain or a letter for its named location. Cells come from the
+    MapPyramid cache, so the cost depends on the screen size rather than on
+    how much of the world has been explored.
+
+    Args:
+        world: Dictionary mapping location names to Location objects
+        current_location: Name of the player's current location
+        zoom: Tiles per map character (one of map_pyramid.ZOOM_LEVELS)
+        pyramid: Cell cache for this game
+        seen_tiles: Tiles the player has seen
+        chunk_manager: Optional ChunkManager for WFC terrain
+        width: Map width in characters
+        height: Map height in characters
+
+    Returns:
+        ASCII string representation of the zoomed map with legend
+    """
+    current_loc = world.get(current_location)
+    if current_loc is None:
+        return "No overworld map available - current location not found."
+
+    context_line = None
+    if not current_loc.is_overworld and current_loc.parent_location:
+        parent_loc = world.get(current_loc.parent_location)
+        if parent_loc and parent_loc.is_overworld:
+            context_line = f"(You are inside {current_loc.parent_location})"
+            current_loc = parent_loc
+    if current_loc.coordinates is None:
+        return "No overworld map available - current location has no coordinates."
+
+    center = (current_loc.coordinates[0], current_loc.coordinates[1])
+    rows = pyramid.view(world, center, zoom, width, height, seen_tiles or set(), chunk_manager)
+
+    symbols: dict[str, str] = {}
+    map_rows = []
+    for row_index, row in enumerate(rows):
+        row_parts = []
+        for col_index, cell in enumerate(row):
+            if row_index == height // 2 and col_index == width // 2:
+                row_parts.append(colors.bold_colorize("@", colors.CYAN))
+            elif cell.poi is not None:
+                if cell.poi not in symbols and len(symbols) < len(ZOOMED_MAP_SYMBOLS):
+                    symbols[cell.poi] = ZOOMED_MAP_SYMBOLS[len(symbols)]
+                row_parts.append(symbols.get(cell.poi, "?"))
+            elif cell.terrain is not None:
+                row_parts.append(get_terrain_symbol(cell.terrain))
+            else:
+                row_parts.append(" ")
+        map_rows.append("".join(row_parts))
+
+    span_x = (width // 2) * zoom
+    span_y = (height // 2) * zoom
+    lines = [f"=== WORLD MAP (1:{zoom}) ==="]
+    if context_line:
+        lines.append(context_line)
+    lines.append("┌" + "─" * width + "┐")
+    lines.extend("│" + row + "│" for row in map_rows)
+    lines.append("└" + "─" * width + "┘")
+    lines.append(
+        f"x {center[0] - span_x}..{center[0] + span_x}, "
+        f"y {center[1] - span_y}..{center[1] + span_y}"
+    )
+    lines.append("")
+    lines.append("Legend:")
+    lines.append(f"  {colors.bold_colorize('@', colors.CYAN)} = You ({current_loc.name})")
+    for name, symbol in symbols.items():
+        lines.append(f"  {symbol} = {name}")
+    lines.append(f"  {WATER_MARKER} = Water (impassable)")
+    lines.append("")
+    lines.append("Terrain: T=forest .=plains n=hills :=desert %=swamp ,=beach ^=foothills M=mountain")
+    lines.append("Zoom: worldmap 1 | worldmap 4 | worldmap 16")
+
+    return "\n".join(lines)
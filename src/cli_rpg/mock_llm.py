@@ -0,0 +1,430 @@
+"""Local mock LLM provider for offline load testing.
+
+This module provides MockLLMClient, a drop-in stand-in for the OpenAI client
+that AIService uses when AIConfig.provider is "mock". It serves schema-valid
+responses for every AIService generate_* method from built-in templates, so the
+AI-enabled hot paths (API retry/backoff, _generate_with_retry, background
+generation, streaming and truncated-JSON repair) can be exercised without a
+network connection.
+
+Realistic provider behaviour is simulated through MockLLMSettings:
+- latency: fixed, uniform, normal or lognormal distribution per request
+- streaming: responses are split into small token chunks with per-token delay
+- errors: a configurable share of requests raise MockLLMError (retried by AIService)
+- truncation: a configurable share of responses are cut off mid-document
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional
+
+# Valid latency distribution names for MockLLMSettings.latency_distribution
+LATENCY_DISTRIBUTIONS: frozenset[str] = frozenset({"fixed", "uniform", "normal", "lognormal"})
+
+# Approximate characters per token used for usage accounting and stream chunking
+CHARS_PER_TOKEN = 4
+
+# Name fragments for generated places and characters
+_PLACE_ADJECTIVES = [
+    "Misty", "Silent", "Amber", "Hollow", "Crimson", "Whispering", "Frozen",
+    "Sunken", "Gilded", "Ashen", "Verdant", "Shattered",
+]
+_PLACE_NOUNS = [
+    "Hollow", "Crossing", "Vale", "Ridge", "Fen", "Grove", "Watch", "Reach",
+    "Barrow", "Spire", "Glade", "Steading",
+]
+_PERSON_FIRST = ["Alda", "Bren", "Corin", "Dessa", "Edric", "Fenna", "Garr", "Hilde", "Ivo", "Jora"]
+_PERSON_LAST = ["Ashdown", "Blackwood", "Crane", "Dunmore", "Elderby", "Frost", "Graves", "Holt"]
+_ENEMY_NAMES = ["Gloom Stalker", "Bone Crawler", "Ash Wraith", "Mire Fiend", "Stone Gnasher"]
+_LOCATION_CATEGORIES = ["wilderness", "forest", "ruins", "cave", "village", "temple", "dungeon"]
+_AREA_CATEGORIES = ["wilderness", "forest", "ruins", "village", "cave"]
+_KILL_TARGETS = ["Wolf", "Goblin", "Skeleton", "Bandit", "Giant Spider"]
+_ROLES = ["villager", "merchant", "quest_giver", "guard", "traveler"]
+
+# Relative coordinates for generated areas (entry first, all within the 7x7 bounds)
+_AREA_OFFSETS = [(0, 0), (0, 1), (1, 1), (-1, 1), (0, 2), (1, 2), (-1, 2)]
+
+_ASCII_ART = "\n".join([
+    "    /\\    ",
+    "   /  \\   ",
+    "  / /\\ \\  ",
+    " /_/  \\_\\ ",
+    "  |    |  ",
+    "  |____|  ",
+])
+
+
+class MockLLMError(Exception):
+    """Simulated transient provider failure raised by the mock client."""
+    pass
+
+
+@dataclass
+class MockLLMSettings:
+    """Behaviour settings for the mock LLM provider.
+
+    Attributes:
+        latency_ms: Mean request latency before the first token (milliseconds)
+        latency_jitter_ms: Spread of the latency distribution (milliseconds)
+        latency_distribution: "fixed", "uniform", "normal" or "lognormal"
+        token_delay_ms: Delay between streamed token chunks (milliseconds)
+        error_rate: Probability (0.0-1.0) that a request raises MockLLMError
+        truncation_rate: Probability (0.0-1.0) that a response is cut off early
+        seed: Optional RNG seed for reproducible latency, failures and content
+    """
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    token_delay_ms: float = 0.0
+    error_rate: float = 0.0
+    truncation_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class MockResponseFactory:
+    """Builds template responses matching AIService prompt formats.
+
+    The request kind is detected from the opening phrase of the prompt, which
+    follows the default templates in ai_config. Unknown prompts receive a short
+    plain-text reply.
+    """
+
+    # (kind, pattern) pairs checked in order against the prompt
+    _KIND_PATTERNS: list[tuple[str, re.Pattern]] = [
+        ("area", re.compile(r"Generate a connected area of (\d+) locations")),
+        ("world_context", re.compile(r"Generate world-level thematic context")),
+        ("region_context", re.compile(r"Generate region-level context")),
+        ("npcs", re.compile(r"Generate NPCs for a")),
+        ("location", re.compile(r"Generate a (?:new )?location for a")),
+        ("enemy", re.compile(r"Generate an enemy for a")),
+        ("item", re.compile(r"Generate an item for a")),
+        ("quest", re.compile(r"Generate a quest for a")),
+        ("ascii_art", re.compile(r"Generate ASCII art for")),
+        ("dialogue", re.compile(r"Generate a single conversational greeting")),
+        ("lore", re.compile(r"Generate an? \w+ snippet for")),
+        ("whisper", re.compile(r"Generate a single atmospheric whisper")),
+        ("dream", re.compile(r"Generate a short, atmospheric dream")),
+        ("banter", re.compile(r"Generate a single line of companion banter")),
+        ("conversation", re.compile(r"You are roleplaying as")),
+        ("room", re.compile(r"Generate a room for a")),
+    ]
+
+    def __init__(self, rng: random.Random):
+        """Initialize the factory.
+
+        Args:
+            rng: Random instance used for template selection
+        """
+        self._rng = rng
+        self._name_counter = 0
+
+    def detect_kind(self, prompt: str) -> str:
+        """Detect which generation method a prompt belongs to.
+
+        Args:
+            prompt: The prompt text
+
+        Returns:
+            Kind name (e.g. "location", "quest") or "text" if unrecognized
+        """
+        for kind, pattern in self._KIND_PATTERNS:
+            if pattern.search(prompt):
+                return kind
+        return "text"
+
+    def respond(self, prompt: str) -> str:
+        """Build a schema-valid response for the prompt.
+
+        Args:
+            prompt: The prompt text
+
+        Returns:
+            Response text in the format the prompt requests
+        """
+        kind = self.detect_kind(prompt)
+        builder = getattr(self, f"_build_{kind}")
+        return builder(prompt)
+
+    def _place_name(self) -> str:
+        """Return a unique place name."""
+        self._name_counter += 1
+        base = f"{self._rng.choice(_PLACE_ADJECTIVES)} {self._rng.choice(_PLACE_NOUNS)}"
+        return f"{base} {self._name_counter}"
+
+    def _person_name(self) -> str:
+        """Return a person name."""
+        return f"{self._rng.choice(_PERSON_FIRST)} {self._rng.choice(_PERSON_LAST)}"
+
+    @staticmethod
+    def _player_level(prompt: str) -> int:
+        """Extract the player level from a prompt (defaults to 1)."""
+        match = re.search(r"Player Level: (\d+)", prompt)
+        return int(match.group(1)) if match else 1
+
+    def _npc(self, role: str) -> dict:
+        """Build a single NPC entry."""
+        npc: dict[str, Any] = {
+            "name": self._person_name(),
+            "description": "A weathered local with watchful eyes.",
+            "dialogue": "Well met, stranger. Mind the roads after dark.",
+            "role": role,
+        }
+        if role == "merchant":
+            npc["shop_inventory"] = [
+                {"name": "Iron Sword", "price": 100, "item_type": "weapon", "damage_bonus": 5},
+                {"name": "Leather Vest", "price": 60, "item_type": "armor", "defense_bonus": 3},
+                {"name": "Healing Salve", "price": 40, "item_type": "consumable",
+                 "heal_amount": 20},
+            ]
+        return npc
+
+    def _build_location(self, prompt: str) -> str:
+        match = re.search(r'MUST have category "(\w+)"', prompt)
+        category = match.group(1) if match else self._rng.choice(_LOCATION_CATEGORIES)
+        return json.dumps({
+            "name": self._place_name(),
+            "description": "Mist drifts between old stones while distant bells toll "
+                           "somewhere beyond the ridge.",
+            "category": category,
+            "npcs": [],
+        })
+
+    def _build_area(self, prompt: str) -> str:
+        match = self._KIND_PATTERNS[0][1].search(prompt)
+        size = max(1, min(len(_AREA_OFFSETS), int(match.group(1)) if match else 5))
+        forced = re.search(r'MUST have category "(\w+)"', prompt)
+        locations = []
+        for index, (dx, dy) in enumerate(_AREA_OFFSETS[:size]):
+            if index == 0 and forced:
+                category = forced.group(1)
+            else:
+                category = self._rng.choice(_AREA_CATEGORIES)
+            locations.append({
+                "name": self._place_name(),
+                "description": "Wind combs the tall grass and carries the smell of rain.",
+                "relative_coords": [dx, dy],
+                "category": category,
+                "npcs": [],
+            })
+        return json.dumps(locations)
+
+    def _build_world_context(self, prompt: str) -> str:
+        return json.dumps({
+            "theme_essence": "A fading realm where old oaths still bind the living.",
+            "naming_style": "Weathered Anglo-Saxon names with hard consonants",
+            "tone": "melancholy and watchful",
+        })
+
+    def _build_region_context(self, prompt: str) -> str:
+        return json.dumps({
+            "name": f"The {self._rng.choice(_PLACE_ADJECTIVES)} Marches",
+            "theme": "Borderlands of crumbling watchtowers and wary villages.",
+            "danger_level": self._rng.choice(["low", "medium", "high"]),
+            "landmarks": ["Broken Beacon", "Old King's Road"],
+        })
+
+    def _build_npcs(self, prompt: str) -> str:
+        roles = ["villager", "merchant", self._rng.choice(_ROLES)]
+        return json.dumps({"npcs": [self._npc(role) for role in roles]})
+
+    def _build_enemy(self, prompt: str) -> str:
+        level = self._player_level(prompt)
+        return json.dumps({
+            "name": self._rng.choice(_ENEMY_NAMES),
+            "description": "A hunched shape wrapped in tattered shadow.",
+            "attack_flavor": "lunges with jagged claws",
+            "health": 20 + level * 10,
+            "attack_power": 3 + level * 2,
+            "defense": 1 + level,
+            "xp_reward": 20 + level * 10,
+        })
+
+    def _build_item(self, prompt: str) -> str:
+        level = self._player_level(prompt)
+        return json.dumps({
+            "name": "Tarnished Blade",
+            "description": "An old blade that still holds an edge.",
+            "item_type": "weapon",
+            "damage_bonus": 2 + level,
+            "defense_bonus": 0,
+            "heal_amount": 0,
+            "suggested_price": 20 + level * 15,
+        })
+
+    def _build_quest(self, prompt: str) -> str:
+        level = self._player_level(prompt)
+        target = self._rng.choice(_KILL_TARGETS)
+        return json.dumps({
+            "name": f"Cull the {target}s",
+            "description": f"Drive off the {target.lower()}s troubling the roads.",
+            "objective_type": "kill",
+            "target": target,
+            "target_count": 3,
+            "gold_reward": 30 + level * 15,
+            "xp_reward": 25 + level * 12,
+            "difficulty": "normal",
+            "recommended_level": level,
+        })
+
+    def _build_ascii_art(self, prompt: str) -> str:
+        return _ASCII_ART
+
+    def _build_dialogue(self, prompt: str) -> str:
+        return "Welcome, traveler. These are uneasy days, so keep your wits about you."
+
+    def _build_lore(self, prompt: str) -> str:
+        return (
+            "Long ago the river kings sealed a pact beneath the hills, and every "
+            "spring the water still runs red where the first oath was broken."
+        )
+
+    def _build_whisper(self, prompt: str) -> str:
+        return "Something beneath the floor counts your footsteps."
+
+    def _build_dream(self, prompt: str) -> str:
+        return "You dream of a door that opens onto the same door, again and again."
+
+    def _build_banter(self, prompt: str) -> str:
+        return "Keep your eyes open. I don't like how quiet it is here."
+
+    def _build_conversation(self, prompt: str) -> str:
+        return "Aye, I have heard of it. Few who go looking come back the same."
+
+    def _build_room(self, prompt: str) -> str:
+        return json.dumps({
+            "name": f"{self._rng.choice(_PLACE_ADJECTIVES)} Chamber",
+            "description": "Dust hangs in the still air and faded murals watch from "
+                           "the walls of this forgotten chamber.",
+        })
+
+    def _build_text(self, prompt: str) -> str:
+        return "The mock oracle considers your words in silence."
+
+
+class _MockCompletions:
+    """Implements client.chat.completions.create for the mock client."""
+
+    def __init__(self, client: "MockLLMClient"):
+        self._client = client
+
+    def create(self, messages: list[dict], stream: bool = False, **kwargs: Any) -> Any:
+        """Create a (mock) chat completion.
+
+        Args:
+            messages: Chat messages; the last message's content is the prompt
+            stream: If True, return an iterator of chunk objects
+            **kwargs: Accepted for OpenAI compatibility (model, temperature, ...)
+
+        Returns:
+            Completion object, or chunk iterator when streaming
+
+        Raises:
+            MockLLMError: When a simulated failure is injected
+        """
+        prompt = messages[-1]["content"] if messages else ""
+        return self._client.complete(prompt, stream=stream)
+
+
+class MockLLMClient:
+    """OpenAI-compatible client that serves template responses locally.
+
+    Only the subset of the client interface used by AIService is implemented:
+    client.chat.completions.create(...) with and without stream=True. Responses
+    carry a usage object (prompt_tokens, completion_tokens, total_tokens).
+
+    Attributes:
+        settings: MockLLMSettings controlling latency and failure injection
+        request_count: Total number of requests received
+    """
+
+    def __init__(self, settings: Optional[MockLLMSettings] = None):
+        """Initialize the mock client.
+
+        Args:
+            settings: Behaviour settings (defaults to instant, error-free responses)
+        """
+        self.settings = settings or MockLLMSettings()
+        self._rng = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        self._factory = MockResponseFactory(self._rng)
+        self.request_count = 0
+        self.chat = SimpleNamespace(completions=_MockCompletions(self))
+
+    def complete(self, prompt: str, stream: bool = False) -> Any:
+        """Serve a response for a prompt, applying latency and failure injection.
+
+        Args:
+            prompt: The prompt text
+            stream: If True, return an iterator of streamed chunks
+
+        Returns:
+            Completion object or chunk iterator
+
+        Raises:
+            MockLLMError: When a simulated failure is injected
+        """
+        # Draw all random decisions under the lock so seeded runs are reproducible
+        with self._lock:
+            self.request_count += 1
+            latency = self._sample_latency()
+            fail = self._rng.random() < self.settings.error_rate
+            text = self._factory.respond(prompt)
+            if self._rng.random() < self.settings.truncation_rate and len(text) > 1:
+                text = text[: max(1, int(len(text) * self._rng.uniform(0.5, 0.95)))]
+
+        time.sleep(latency)
+        if fail:
+            raise MockLLMError("Simulated provider error (mock error_rate)")
+
+        if stream:
+            return self._stream_chunks(text)
+
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+            usage=self._usage(prompt, text),
+        )
+
+    def _sample_latency(self) -> float:
+        """Draw a request latency in seconds from the configured distribution."""
+        mean = self.settings.latency_ms / 1000.0
+        jitter = self.settings.latency_jitter_ms / 1000.0
+        distribution = self.settings.latency_distribution
+        if mean <= 0:
+            return 0.0
+        if distribution == "uniform":
+            value = self._rng.uniform(mean - jitter, mean + jitter)
+        elif distribution == "normal":
+            value = self._rng.gauss(mean, jitter)
+        elif distribution == "lognormal":
+            # Median at the mean latency; sigma from the relative jitter (long right tail)
+            sigma = jitter / mean if jitter > 0 else 0.5
+            value = mean * self._rng.lognormvariate(0.0, sigma)
+        else:
+            value = mean
+        return max(0.0, value)
+
+    def _stream_chunks(self, text: str) -> Iterator[Any]:
+        """Yield the response as OpenAI-style streaming chunks."""
+        delay = self.settings.token_delay_ms / 1000.0
+        for start in range(0, len(text), CHARS_PER_TOKEN):
+            if delay > 0 and start > 0:
+                time.sleep(delay)
+            token = text[start:start + CHARS_PER_TOKEN]
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+
+    @staticmethod
+    def _usage(prompt: str, text: str) -> Any:
+        """Estimate token usage for a request/response pair."""
+        prompt_tokens = max(1, len(prompt) // CHARS_PER_TOKEN)
+        completion_tokens = max(1, len(text) // CHARS_PER_TOKEN)
+        return SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
@@ -80,7 +80,7 @@ if TYPE_CHECKING:
     from cli_rpg.models.animal_companion import AnimalCompanion
     from cli_rpg.models.item import Item
     from cli_rpg.models.inventory import Inventory
-    from cli_rpg.models.quest import Quest
+    from cli_rpg.models.quest import ObjectiveType, Quest
     from cli_rpg.models.enemy import Enemy
     from cli_rpg.models.status_effect import StatusEffect
     from cli_rpg.models.faction import Faction
@@ -143,6 +143,15 @@ class Character:
     crafting_proficiency: CraftingProficiency = field(default_factory=CraftingProficiency)
     unlocked_recipes: Set[str] = field(default_factory=set)
     animal_companion: Optional["AnimalCompanion"] = None
+    # Quest objective index: (ObjectiveType, lowercase target) -> quests with a
+    # matching main objective, stage or branch (rebuilt when quests is replaced)
+    _quest_index: Optional[Dict[tuple, List["Quest"]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (quests list, indexed length, last indexed quest) at the last index update
+    _quest_index_state: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate attributes and calculate derived stats."""
@@ -630,6 +639,87 @@ class Character:
         """
         return any(q.name.lower() == quest_name.lower() for q in self.quests)
 
+    @staticmethod
+    def _objective_keys(quest: "Quest") -> Set[tuple]:
+        """Return the (objective type, lowercase target) keys a quest listens for.
+
+        Covers the main objective, every stage and every alternative branch, so
+        stage advancement never requires re-indexing.
+
+        Args:
+            quest: Quest to index
+
+        Returns:
+            Set of (ObjectiveType, lowercase target) tuples
+        """
+        keys = {(quest.objective_type, quest.target.lower())}
+        for stage in quest.stages:
+            keys.add((stage.objective_type, stage.target.lower()))
+        for branch in quest.alternative_branches:
+            keys.add((branch.objective_type, branch.target.lower()))
+        return keys
+
+    def _index_quest(self, quest: "Quest") -> None:
+        """Add a quest to the objective index (no-op for finished quests)."""
+        from cli_rpg.models.quest import QuestStatus
+
+        if quest.status in (QuestStatus.COMPLETED, QuestStatus.FAILED):
+            return
+        for key in self._objective_keys(quest):
+            self._quest_index.setdefault(key, []).append(quest)
+
+    def _sync_quest_index(self) -> Dict[tuple, List["Quest"]]:
+        """Bring the objective index up to date with self.quests.
+
+        Quests appended since the last update (accepted quests) are indexed
+        incrementally; any other change to the list triggers a full rebuild.
+
+        Returns:
+            The objective index
+        """
+        quests = self.quests
+        state = self._quest_index_state
+        if (
+            self._quest_index is not None
+            and state is not None
+            and state[0] is quests
+            and state[1] <= len(quests)
+            and (state[1] == 0 or quests[state[1] - 1] is state[2])
+        ):
+            for quest in quests[state[1]:]:
+                self._index_quest(quest)
+        else:
+            self._quest_index = {}
+            for quest in quests:
+                self._index_quest(quest)
+        self._quest_index_state = (quests, len(quests), quests[-1] if quests else None)
+        return self._quest_index
+
+    def _quests_for(self, objective_type: "ObjectiveType", target: str) -> List["Quest"]:
+        """Return the quests with an objective matching an event, in quest order.
+
+        Completed and failed quests are pruned from the index as they are found.
+
+        Args:
+            objective_type: Objective type of the event
+            target: Event target (enemy, item, location or NPC name)
+
+        Returns:
+            Candidate quests (callers still check status and objective state)
+        """
+        from cli_rpg.models.quest import QuestStatus
+
+        candidates = self._sync_quest_index().get((objective_type, target.lower()))
+        if not candidates:
+            return []
+        live = [
+            q for q in candidates
+            if q.status not in (QuestStatus.COMPLETED, QuestStatus.FAILED)
+        ]
+        if len(live) != len(candidates):
+            candidates[:] = live
+        return live
+
     def _check_branch_progress(
         self, quest: "Quest", objective_type: "ObjectiveType", target: str
     ) -> Optional[str]:
@@ -701,7 +791,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.KILL, enemy_name):
             if quest.status != QuestStatus.ACTIVE:
                 continue
 
@@ -798,7 +888,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.COLLECT, item_name):
             if quest.status != QuestStatus.ACTIVE:
                 continue
 
@@ -864,7 +954,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.DROP, enemy_name):
             if (
                 quest.status == QuestStatus.ACTIVE
                 and quest.objective_type == ObjectiveType.DROP
@@ -903,7 +993,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.EXPLORE, location_name):
             if quest.status != QuestStatus.ACTIVE:
                 continue
 
@@ -968,7 +1058,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.TALK, npc_name):
             if quest.status != QuestStatus.ACTIVE:
                 continue
 
@@ -1065,7 +1155,7 @@ class Character:
         from cli_rpg.models.quest import QuestStatus, ObjectiveType
 
         messages = []
-        for quest in self.quests:
+        for quest in self._quests_for(ObjectiveType.USE, item_name):
             if quest.status != QuestStatus.ACTIVE:
                 continue
 
@@ -1150,8 +1240,16 @@ class Character:
                 f"only active quests can be abandoned (current status: {status_name})."
             )
 
-        # Remove quest from list
+        # Remove quest from list and from the objective index
+        self._sync_quest_index()
         self.quests.remove(matching_quest)
+        for key in self._objective_keys(matching_quest):
+            indexed = self._quest_index.get(key)
+            if indexed:
+                indexed[:] = [q for q in indexed if q is not matching_quest]
+        self._quest_index_state = (
+            self.quests, len(self.quests), self.quests[-1] if self.quests else None
+        )
         return (True, f"Quest abandoned: {matching_quest.name}")
 
     def apply_status_effect(self, effect: "StatusEffect") -> None:
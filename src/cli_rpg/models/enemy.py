@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, TYPE_CHECKING
 
+from cli_rpg.string_store import intern_text
+
 if TYPE_CHECKING:
     from cli_rpg.models.status_effect import StatusEffect
 
@@ -297,9 +299,9 @@ class Enemy:
             defense=data["defense"],
             xp_reward=data["xp_reward"],
             level=data.get("level", 1),
-            description=data.get("description", ""),
+            description=intern_text(data.get("description", "")),
             attack_flavor=data.get("attack_flavor", ""),
-            ascii_art=data.get("ascii_art", ""),
+            ascii_art=intern_text(data.get("ascii_art", "")),
             is_boss=data.get("is_boss", False),
             poison_chance=data.get("poison_chance", 0.0),
             poison_damage=data.get("poison_damage", 0),
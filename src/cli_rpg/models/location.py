@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, ClassVar, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from cli_rpg import colors
+from cli_rpg.string_store import intern_text
 
 if TYPE_CHECKING:
     from cli_rpg.models.npc import NPC
@@ -31,6 +32,9 @@ class Location:
     MIN_DESCRIPTION_LENGTH: ClassVar[int] = 1
     MAX_DESCRIPTION_LENGTH: ClassVar[int] = 500
     VALID_DIRECTIONS: ClassVar[set[str]] = {"north", "south", "east", "west"}
+    # Number of in-place coordinate changes on any location, so coordinate
+    # indexes (see exit_graph.ExitGraph) can tell when they are stale
+    coordinate_moves: ClassVar[int] = 0
 
     name: str
     description: str
@@ -107,7 +111,8 @@ class Location:
             Falls back to coordinate-based lookup if allowed_exits is empty.
 
         For overworld navigation:
-            Checks neighboring coordinates for locations.
+            Checks neighboring coordinates for locations via the world's
+            cached ExitGraph.
 
         Args:
             world: Optional world dict mapping names to Locations (for overworld)
@@ -147,20 +152,9 @@ class Location:
                 if sub_grid.is_within_bounds(*target) and sub_grid.get_by_coordinates(*target):
                     directions.append(direction)
         elif world is not None:
-            # 2D navigation for overworld
-            offsets_2d = {
-                "north": (0, 1),
-                "south": (0, -1),
-                "east": (1, 0),
-                "west": (-1, 0),
-            }
-            for direction, (dx, dy) in offsets_2d.items():
-                target = (x + dx, y + dy)
-                # Check world dict for overworld navigation
-                for loc in world.values():
-                    if loc.coordinates == target:
-                        directions.append(direction)
-                        break
+            # 2D navigation for overworld (coordinate-indexed, O(1) per direction)
+            from cli_rpg.exit_graph import get_exit_graph
+            return get_exit_graph(world).exits_from((x, y))
 
         return sorted(directions)
 
@@ -457,7 +451,7 @@ class Location:
         # Parse category if present (for backward compatibility)
         category = data.get("category")
         # Parse ascii_art if present (for backward compatibility)
-        ascii_art = data.get("ascii_art", "")
+        ascii_art = intern_text(data.get("ascii_art", ""))
         # Parse details if present (for backward compatibility)
         details = data.get("details")
         # Parse secrets if present (for backward compatibility)
@@ -507,7 +501,7 @@ class Location:
         # Note: Legacy 'connections' field is ignored if present (backward compatibility)
         return cls(
             name=data["name"],
-            description=data["description"],
+            description=intern_text(data["description"]),
             npcs=npcs,
             coordinates=coordinates,
             category=category,
@@ -573,3 +567,26 @@ class Location:
             result += f"\nEnter: {', '.join(self.sub_locations)}"
 
         return result
+
+
+class _CoordinatesField:
+    """Data descriptor for Location.coordinates that counts in-place changes.
+
+    Installed after the dataclass is built, so __init__ still takes the
+    field's default; only reassignments of an existing location's
+    coordinates bump Location.coordinate_moves.
+    """
+
+    def __get__(self, obj: Optional[Location], objtype: Any = None) -> Any:
+        if obj is None:
+            return None
+        return obj._coordinates  # type: ignore[attr-defined]
+
+    def __set__(self, obj: Location, value: Any) -> None:
+        if hasattr(obj, "_coordinates"):
+            Location.coordinate_moves += 1
+        obj._coordinates = value  # type: ignore[attr-defined]
+
+
+Location.coordinates = _CoordinatesField()  # type: ignore[assignment]
+
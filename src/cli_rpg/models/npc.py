@@ -5,6 +5,7 @@ from typing import List, Optional, TYPE_CHECKING
 
 from cli_rpg.models.npc_relationship import NPCRelationship, RelationshipType
 from cli_rpg.models.npc_arc import NPCArc, NPCArcStage
+from cli_rpg.string_store import intern_text
 
 if TYPE_CHECKING:
     from cli_rpg.models.shop import Shop
@@ -360,7 +361,7 @@ class NPC:
         arc = NPCArc.from_dict(arc_data) if arc_data else None
         return cls(
             name=data["name"],
-            description=data["description"],
+            description=intern_text(data["description"]),
             dialogue=data["dialogue"],
             is_merchant=data.get("is_merchant", False),
             shop=shop,
@@ -368,7 +369,7 @@ class NPC:
             offered_quests=offered_quests,
             greetings=data.get("greetings", []),
             conversation_history=data.get("conversation_history", []),
-            ascii_art=data.get("ascii_art", ""),
+            ascii_art=intern_text(data.get("ascii_art", "")),
             available_at_night=data.get("available_at_night", True),
             is_recruitable=data.get("is_recruitable", False),
             willpower=data.get("willpower", 5),  # Default 5 for backward compat
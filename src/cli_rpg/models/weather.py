@@ -115,14 +115,17 @@ class Weather:
         """
         return self.TRAVEL_MODIFIERS.get(self.condition, 0)
 
-    def get_flavor_text(self) -> str:
+    def get_flavor_text(self, rng: Optional[random.Random] = None) -> str:
         """Get a random flavor text for the current weather.
 
+        Args:
+            rng: Optional random.Random for the choice (defaults to global random)
+
         Returns:
             A descriptive string for the current weather
         """
         texts = WEATHER_FLAVOR.get(self.condition, ["The weather is unremarkable."])
-        return random.choice(texts)
+        return (rng or random).choice(texts)
 
     def get_effective_condition(self, location_category: Optional[str] = None) -> str:
         """Get the effective weather condition, accounting for location.
@@ -161,16 +164,20 @@ class Weather:
             return "full"
         return VISIBILITY_LEVELS.get(self.condition, "full")
 
-    def transition(self) -> Optional[str]:
+    def transition(self, rng: Optional[random.Random] = None) -> Optional[str]:
         """Potentially change weather state (10% chance per hour).
 
+        Args:
+            rng: Optional random.Random for the rolls (defaults to global random)
+
         Returns:
             New weather condition if changed, None otherwise
         """
+        source = rng or random
         # 10% chance of weather change per hour
-        if random.random() < 0.1:
+        if source.random() < 0.1:
             # Pick a new weather state (can be the same)
-            new_condition = random.choice(self.WEATHER_STATES)
+            new_condition = source.choice(self.WEATHER_STATES)
             if new_condition != self.condition:
                 self.condition = new_condition
                 return new_condition
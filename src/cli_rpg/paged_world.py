@@ -0,0 +1,379 @@
+"""Region-paged world storage for fast save loading.
+
+A paged save is a JSON Lines file. The first line is a header holding
+everything except the overworld (character, time, quests, ...) plus an index
+of the region pages; each following line is one page, the locations of one
+region (see get_region_coords) keyed by name. Locations without coordinates
+share a single unplaced page.
+
+Loading parses only the header. Page lines are kept as text and the current
+region and its neighbours are materialized into Locations; PagedWorld pages
+the rest in on demand, when a location in it is looked up by name or by
+coordinates (ExitGraph). Resuming a long game therefore costs about the same
+as resuming a new one. Iterating values() or items() pages everything in, so
+radius queries use load_near() and loaded_values(), and world-wide listings
+read unloaded pages through unloaded_location_data().
+
+Long art and descriptions are stored once in the header's string table (see
+string_store); each page lists the blob IDs it references so unloaded pages
+can be written back with only the strings they need.
+"""
+
+import json
+from collections.abc import KeysView
+from typing import IO, Iterator, Optional, TYPE_CHECKING
+
+from cli_rpg.models.location import Location
+from cli_rpg.string_store import STRINGS_KEY, StringStore
+from cli_rpg.world_tiles import get_region_coords
+
+if TYPE_CHECKING:
+    from cli_rpg.game_state import GameState
+
+# Value of the header's "save_format" key
+PAGED_SAVE_FORMAT = "paged-v1"
+
+# Regions around the current one materialized on load
+RESIDENT_RADIUS = 1
+
+Region = Optional[tuple[int, int]]  # None is the unplaced page
+
+
+def _region_of(coordinates) -> Region:
+    """Return the page region for a location's coordinates (list or tuple)."""
+    if coordinates is None:
+        return None
+    return get_region_coords(coordinates[0], coordinates[1])
+
+
+class PagedWorld(dict):
+    """World dict whose regions are materialized on first access.
+
+    Materialized locations live in the dict itself; unloaded regions are kept
+    as page text. Name lookups (world[name], in, get) and assignments page in
+    the region that holds the name, so callers see an ordinary world dict.
+
+    Attributes:
+        strings: String table that unloaded pages reference
+    """
+
+    def __init__(self, locations: Optional[dict] = None):
+        """Create a paged world.
+
+        Args:
+            locations: Already materialized locations
+        """
+        super().__init__(locations or {})
+        self.strings = StringStore()
+        self._pages: dict[Region, tuple[list[str], str]] = {}
+        self._page_blobs: dict[Region, list[str]] = {}
+        self._unloaded: dict[str, Region] = {}
+
+    def add_page(
+        self, region: Region, names: list[str], text: str, blobs: Optional[list[str]] = None
+    ) -> None:
+        """Register an unloaded page.
+
+        Args:
+            region: Region coordinates of the page (None for unplaced)
+            names: Location names stored in the page
+            text: JSON text of the page ({name: location data})
+            blobs: IDs of the strings the page references
+        """
+        self._pages[region] = (names, text)
+        self._page_blobs[region] = blobs or []
+        for name in names:
+            self._unloaded[name] = region
+
+    @property
+    def unloaded_regions(self) -> list[Region]:
+        """Regions whose pages have not been materialized."""
+        return list(self._pages)
+
+    def load_region(self, region: Region) -> int:
+        """Materialize a region's page if it is still unloaded.
+
+        Args:
+            region: Region coordinates (None for the unplaced page)
+
+        Returns:
+            Number of locations materialized
+        """
+        entry = self._pages.pop(region, None)
+        if entry is None:
+            return 0
+        self._page_blobs.pop(region, None)
+        page = self.strings.unpack(json.loads(entry[1]))
+        for name, location_data in page.items():
+            self._unloaded.pop(name, None)
+            if not dict.__contains__(self, name):
+                dict.__setitem__(self, name, Location.from_dict(location_data))
+        return len(page)
+
+    def load_region_at(self, coordinates: tuple) -> int:
+        """Materialize the region containing a world coordinate.
+
+        Args:
+            coordinates: World coordinates (only x and y are used)
+
+        Returns:
+            Number of locations materialized
+        """
+        if not self._pages:
+            return 0
+        return self.load_region(_region_of(coordinates))
+
+    def load_around(self, region: Region, radius: int = RESIDENT_RADIUS) -> None:
+        """Materialize a region, its neighbours and the unplaced page.
+
+        Args:
+            region: Center region (None loads only the unplaced page)
+            radius: Neighbouring regions loaded in each direction
+        """
+        self.load_region(None)
+        if region is None:
+            return
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                self.load_region((region[0] + dx, region[1] + dy))
+
+    def load_all(self) -> None:
+        """Materialize every remaining page."""
+        for region in list(self._pages):
+            self.load_region(region)
+
+    def loaded_values(self) -> list[Location]:
+        """Return the materialized locations without paging anything in."""
+        return list(dict.values(self))
+
+    def load_near(self, coordinates: tuple, radius: int) -> None:
+        """Materialize every region within a distance of a world coordinate.
+
+        Afterwards all locations within radius tiles of the coordinates (in
+        each direction) are materialized.
+
+        Args:
+            coordinates: World coordinates (only x and y are used)
+            radius: Distance from the coordinates in each direction
+        """
+        if not self._pages:
+            return
+        x, y = coordinates[0], coordinates[1]
+        min_rx, min_ry = get_region_coords(x - radius, y - radius)
+        max_rx, max_ry = get_region_coords(x + radius, y + radius)
+        for rx in range(min_rx, max_rx + 1):
+            for ry in range(min_ry, max_ry + 1):
+                self.load_region((rx, ry))
+
+    def unloaded_location_data(self) -> Iterator[tuple[str, dict]]:
+        """Yield the locations of unloaded pages without materializing them.
+
+        The data is decoded page JSON; long strings (see string_store) are
+        left as references, so only short fields should be read from it.
+
+        Yields:
+            (name, Location.to_dict() data) pairs
+        """
+        for _, text in list(self._pages.values()):
+            yield from json.loads(text).items()
+
+    def _load_name(self, name: str) -> bool:
+        """Page in the region holding an unloaded name."""
+        if name not in self._unloaded:
+            return False
+        self.load_region(self._unloaded[name])
+        return True
+
+    def __missing__(self, name: str) -> Location:
+        if self._load_name(name):
+            return dict.__getitem__(self, name)
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, name) or name in self._unloaded
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __setitem__(self, name: str, location: Location) -> None:
+        # Keep a region either fully paged or fully materialized
+        self._load_name(name)
+        if self._pages and isinstance(location, Location):
+            self.load_region(_region_of(location.coordinates))
+        dict.__setitem__(self, name, location)
+
+    def __delitem__(self, name: str) -> None:
+        self._load_name(name)
+        dict.__delitem__(self, name)
+
+    def pop(self, name: str, *default):
+        self._load_name(name)
+        return dict.pop(self, name, *default)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._unloaded)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from dict.__iter__(self)
+        yield from list(self._unloaded)
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+    def unloaded_pages(self) -> dict[Region, tuple[list[str], str]]:
+        """Return the unloaded pages as region -> (names, page text)."""
+        return dict(self._pages)
+
+    def page_blobs(self, region: Region) -> list[str]:
+        """Return the string IDs an unloaded page references."""
+        return self._page_blobs.get(region, [])
+
+
+def serialize_world(world: dict) -> dict[str, dict]:
+    """Serialize a world dict to {name: location data}.
+
+    Unloaded pages of a PagedWorld are decoded but not materialized.
+
+    Args:
+        world: Plain or paged world dict
+
+    Returns:
+        Dictionary mapping location names to Location.to_dict() data
+    """
+    if not isinstance(world, PagedWorld):
+        return {name: location.to_dict() for name, location in world.items()}
+    data: dict[str, dict] = {}
+    for _, text in world.unloaded_pages().values():
+        data.update(world.strings.unpack(json.loads(text)))
+    for name, location in dict.items(world):
+        data[name] = location.to_dict()
+    return data
+
+
+def _current_region(game_state: "GameState") -> Region:
+    """Region of the overworld location the player is at (or inside)."""
+    name = game_state.current_location
+    sub_grid = game_state.current_sub_grid
+    if game_state.in_sub_location and sub_grid is not None:
+        name = sub_grid.parent_name
+    location = game_state.world.get(name)
+    if location is None:
+        return None
+    return _region_of(location.coordinates)
+
+
+def write_paged_save(game_state: "GameState", f: IO[str]) -> None:
+    """Write a game state as a region-paged save.
+
+    Unloaded pages of a PagedWorld world are written back verbatim.
+
+    Args:
+        game_state: Game state to save
+        f: Text file open for writing
+    """
+    world = game_state.world
+    unloaded: dict[Region, tuple[list[str], str]] = {}
+    if isinstance(world, PagedWorld):
+        unloaded = world.unloaded_pages()
+        locations = dict.items(world)
+    else:
+        locations = world.items()
+
+    pages: dict[Region, dict[str, dict]] = {}
+    for name, location in locations:
+        region = _region_of(location.coordinates)
+        if region in unloaded:
+            # Moved in place into an unloaded region: merge with its page
+            page = world.strings.unpack(json.loads(unloaded.pop(region)[1]))
+            pages.setdefault(region, {}).update(page)
+        pages.setdefault(region, {})[name] = location.to_dict()
+
+    strings = StringStore()
+    lines: list[tuple[Region, list[str], str, list[str]]] = []
+    for region, page in pages.items():
+        page_strings = StringStore()
+        text = json.dumps(page_strings.pack(page))
+        strings.blobs.update(page_strings.blobs)
+        lines.append((region, list(page), text, list(page_strings.blobs)))
+    for region, (names, text) in unloaded.items():
+        blobs = world.page_blobs(region)
+        strings.blobs.update(world.strings.subset(blobs))
+        lines.append((region, names, text, blobs))
+
+    header = strings.pack(game_state.to_dict(include_world=False))
+    header["save_format"] = PAGED_SAVE_FORMAT
+    region = _current_region(game_state)
+    header["current_region"] = list(region) if region is not None else None
+    header["pages"] = [
+        {"region": list(r) if r is not None else None, "names": names, "blobs": blobs}
+        for r, names, _, blobs in lines
+    ]
+    header[STRINGS_KEY] = strings.blobs
+    f.write(json.dumps(header))
+    f.write("\n")
+    for _, _, text, _ in lines:
+        f.write(text)
+        f.write("\n")
+
+
+def read_paged_save(f: IO[str]) -> dict:
+    """Read a region-paged save.
+
+    Only the header is parsed; the current region, its neighbours and the
+    unplaced page are materialized, and the rest stay as page text.
+
+    Args:
+        f: Text file open for reading, positioned at the header line
+
+    Returns:
+        Save data in the GameState.from_dict layout, with "world" a PagedWorld
+
+    Raises:
+        ValueError: If the file is not a paged save or is truncated
+    """
+    header = json.loads(f.readline())
+    if header.get("save_format") != PAGED_SAVE_FORMAT:
+        raise ValueError("Not a paged save file")
+    world = PagedWorld()
+    world.strings = StringStore(header.pop(STRINGS_KEY, {}))
+    world.strings.unpack(header)
+    for entry in header.pop("pages"):
+        text = f.readline()
+        if not text:
+            raise ValueError("Paged save file is truncated")
+        region = tuple(entry["region"]) if entry["region"] is not None else None
+        world.add_page(region, entry["names"], text.rstrip("\n"), entry.get("blobs"))
+    current = header.pop("current_region")
+    world.load_around(tuple(current) if current is not None else None)
+    header.pop("save_format")
+    header["world"] = world
+    return header
+
+
+def is_paged_save(filepath: str) -> bool:
+    """Check whether a file is a region-paged save, reading only its first line.
+
+    Args:
+        filepath: Path to the save file
+
+    Returns:
+        True if the first line is a paged save header
+    """
+    with open(filepath, "r") as f:
+        first_line = f.readline()
+    try:
+        header = json.loads(first_line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(header, dict) and header.get("save_format") == PAGED_SAVE_FORMAT
@@ -0,0 +1,349 @@
+"""Walkable paths over generated WFC terrain.
+
+Movement is blocked by impassable terrain (see world_tiles.is_passable), so
+straight Manhattan distance under-estimates travel and a one-step look at
+get_valid_moves cannot see around a lake. PathfindingService answers path
+queries over the terrain a ChunkManager has already generated:
+
+- find_path: A* between two tiles (bounded by max_expansions)
+- distance_field: a Dijkstra map around a target tile, i.e. the walking
+  distance from every tile within field_radius of it. Fields are cached per
+  target (least recently used dropped), so repeated queries toward the same
+  target (quest hints every turn, agents walking to a goal) are a lookup.
+- distance / route / next_step: use the target's field when the start is
+  inside it, else A*
+
+Chunks that have not been generated are never generated here (generation
+order shapes terrain); their tiles count as walkable, the usual free-space
+assumption for unexplored ground. Each field records the state of the
+chunks it covers (generated or not, and ChunkManager.chunk_revision) and is
+rebuilt when any of them changes, so edits invalidate fields per chunk.
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from cli_rpg.world_tiles import DIRECTION_OFFSETS, is_passable
+
+if TYPE_CHECKING:
+    from cli_rpg.wfc_chunks import ChunkManager
+
+# Half-width of the square a distance field covers around its target
+DEFAULT_FIELD_RADIUS = 32
+
+# Distance fields kept in the cache
+DEFAULT_MAX_FIELDS = 16
+
+# A* gives up after expanding this many tiles
+DEFAULT_MAX_EXPANSIONS = 20000
+
+# Distance of tiles a field did not reach
+UNREACHED = 0xFFFF
+
+# Chunk state recorded for chunks that have not been generated
+_UNGENERATED = -1
+
+Tile = tuple[int, int]
+
+
+@dataclass
+class DistanceField:
+    """Walking distances to a target from the square around it.
+
+    Attributes:
+        target: Tile the distances lead to
+        radius: Half-width of the covered square
+        distances: Row-major (x, then y) distances, UNREACHED if not reachable
+        chunk_states: Covered chunk -> revision (or -1 if ungenerated) at build
+    """
+
+    target: Tile
+    radius: int
+    distances: array
+    chunk_states: dict[tuple[int, int], int] = field(default_factory=dict)
+
+    def _index(self, tile: Tile) -> Optional[int]:
+        """Return the array index of a tile, or None outside the square."""
+        dx = tile[0] - self.target[0] + self.radius
+        dy = tile[1] - self.target[1] + self.radius
+        side = 2 * self.radius + 1
+        if 0 <= dx < side and 0 <= dy < side:
+            return dx * side + dy
+        return None
+
+    def contains(self, tile: Tile) -> bool:
+        """Check whether a tile lies inside the covered square."""
+        return self._index(tile) is not None
+
+    def distance_from(self, tile: Tile) -> Optional[int]:
+        """Return the walking distance from a tile to the target.
+
+        Returns:
+            Steps to the target, or None if outside the square or unreached
+        """
+        index = self._index(tile)
+        if index is None or self.distances[index] == UNREACHED:
+            return None
+        return self.distances[index]
+
+    def next_step(self, tile: Tile) -> Optional[str]:
+        """Return the direction that moves one step closer to the target.
+
+        Returns:
+            Direction name, or None at the target or if no step gets closer
+        """
+        current = self.distance_from(tile)
+        if not current:
+            return None
+        for direction, (dx, dy) in DIRECTION_OFFSETS.items():
+            if self.distance_from((tile[0] + dx, tile[1] + dy)) == current - 1:
+                return direction
+        return None
+
+
+class PathfindingService:
+    """A* paths and cached distance fields over ChunkManager terrain.
+
+    Attributes:
+        chunk_manager: Terrain source (read with peek_tile, never generated)
+        field_radius: Half-width of the square each distance field covers
+        max_fields: Number of distance fields kept
+        max_expansions: A* search limit
+        _fields: Cached fields by target tile, least recently used first
+    """
+
+    def __init__(
+        self,
+        chunk_manager: "ChunkManager",
+        field_radius: int = DEFAULT_FIELD_RADIUS,
+        max_fields: int = DEFAULT_MAX_FIELDS,
+        max_expansions: int = DEFAULT_MAX_EXPANSIONS,
+    ):
+        """Create a pathfinding service.
+
+        Args:
+            chunk_manager: ChunkManager whose generated terrain is searched
+            field_radius: Half-width of the square each distance field covers
+            max_fields: Number of distance fields kept in the cache
+            max_expansions: Tiles A* may expand before giving up
+        """
+        self.chunk_manager = chunk_manager
+        self.field_radius = field_radius
+        self.max_fields = max_fields
+        self.max_expansions = max_expansions
+        self._fields: "OrderedDict[Tile, DistanceField]" = OrderedDict()
+
+    def is_walkable(self, tile: Tile) -> bool:
+        """Check whether a tile can be walked on (unknown terrain can)."""
+        terrain = self.chunk_manager.peek_tile(tile[0], tile[1])
+        return terrain is None or is_passable(terrain)
+
+    def find_path(self, start: Tile, goal: Tile) -> Optional[list[Tile]]:
+        """Find a shortest walkable path with A*.
+
+        The start and goal tiles are always allowed, so a path can begin or
+        end on a location whose own tile is impassable terrain.
+
+        Args:
+            start: Tile to walk from
+            goal: Tile to walk to
+
+        Returns:
+            Tiles from start to goal inclusive, or None if no path was found
+            within max_expansions
+        """
+        start, goal = tuple(start), tuple(goal)
+        gx, gy = goal
+        came_from: dict[Tile, Optional[Tile]] = {start: None}
+        cost: dict[Tile, int] = {start: 0}
+        frontier = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start)]
+        expansions = 0
+
+        while frontier and expansions < self.max_expansions:
+            _, steps, tile = heapq.heappop(frontier)
+            if tile == goal:
+                path = []
+                while tile is not None:
+                    path.append(tile)
+                    tile = came_from[tile]
+                return path[::-1]
+            if steps > cost[tile]:
+                continue  # Stale heap entry
+            expansions += 1
+            for dx, dy in DIRECTION_OFFSETS.values():
+                neighbor = (tile[0] + dx, tile[1] + dy)
+                next_steps = steps + 1
+                if next_steps >= cost.get(neighbor, UNREACHED):
+                    continue
+                if neighbor != goal and not self.is_walkable(neighbor):
+                    continue
+                cost[neighbor] = next_steps
+                came_from[neighbor] = tile
+                estimate = next_steps + abs(neighbor[0] - gx) + abs(neighbor[1] - gy)
+                heapq.heappush(frontier, (estimate, next_steps, neighbor))
+        return None
+
+    def distance_field(self, target: Tile) -> DistanceField:
+        """Return the (cached) distance field for a target tile.
+
+        Args:
+            target: Tile the distances lead to
+
+        Returns:
+            Current DistanceField (rebuilt if any covered chunk changed)
+        """
+        target = tuple(target)
+        distance_field = self._fields.get(target)
+        if distance_field is not None and self._is_current(distance_field):
+            self._fields.move_to_end(target)
+            return distance_field
+
+        distance_field = self._build_field(target)
+        self._fields[target] = distance_field
+        self._fields.move_to_end(target)
+        while len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return distance_field
+
+    def distance(self, start: Tile, goal: Tile) -> Optional[int]:
+        """Return the walking distance between two tiles.
+
+        Args:
+            start: Tile to walk from
+            goal: Tile to walk to
+
+        Returns:
+            Steps along a shortest path, or None if no path was found
+        """
+        start, goal = tuple(start), tuple(goal)
+        if self._in_field_range(start, goal):
+            steps = self.distance_field(goal).distance_from(start)
+            if steps is not None:
+                return steps
+        path = self.find_path(start, goal)
+        return len(path) - 1 if path is not None else None
+
+    def route(self, start: Tile, goal: Tile) -> Optional[tuple[str, int]]:
+        """Return the first direction and length of a shortest path.
+
+        Args:
+            start: Tile to walk from
+            goal: Tile to walk to
+
+        Returns:
+            (direction, steps), or None at the goal or if no path was found
+        """
+        start, goal = tuple(start), tuple(goal)
+        if start == goal:
+            return None
+        if self._in_field_range(start, goal):
+            distance_field = self.distance_field(goal)
+            direction = distance_field.next_step(start)
+            if direction is not None:
+                return (direction, distance_field.distance_from(start))
+        path = self.find_path(start, goal)
+        if path is None or len(path) < 2:
+            return None
+        step = (path[1][0] - start[0], path[1][1] - start[1])
+        for direction, offset in DIRECTION_OFFSETS.items():
+            if offset == step:
+                return (direction, len(path) - 1)
+        return None
+
+    def next_step(self, start: Tile, goal: Tile) -> Optional[str]:
+        """Return the first direction of a shortest path.
+
+        Args:
+            start: Tile to walk from
+            goal: Tile to walk to
+
+        Returns:
+            Direction name, or None at the goal or if no path was found
+        """
+        found = self.route(start, goal)
+        return found[0] if found is not None else None
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int) -> int:
+        """Drop the cached fields that cover a chunk.
+
+        Fields also notice chunk edits on their own (see chunk_revision);
+        this is for callers that change terrain some other way.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            Number of fields dropped
+        """
+        stale = [
+            target
+            for target, distance_field in self._fields.items()
+            if (chunk_x, chunk_y) in distance_field.chunk_states
+        ]
+        for target in stale:
+            del self._fields[target]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached field."""
+        self._fields.clear()
+
+    def _in_field_range(self, start: Tile, goal: Tile) -> bool:
+        """Check whether start lies inside goal's distance field."""
+        radius = self.field_radius
+        return abs(start[0] - goal[0]) <= radius and abs(start[1] - goal[1]) <= radius
+
+    def _chunk_state(self, chunk: tuple[int, int]) -> int:
+        """Return a chunk's revision, or -1 if it has not been generated."""
+        if not self.chunk_manager.has_chunk(*chunk):
+            return _UNGENERATED
+        return self.chunk_manager.chunk_revision(*chunk)
+
+    def _covered_chunks(self, target: Tile) -> list[tuple[int, int]]:
+        """Return the chunks overlapping the square around a target."""
+        size = self.chunk_manager.chunk_size
+        radius = self.field_radius
+        return [
+            (cx, cy)
+            for cx in range((target[0] - radius) // size, (target[0] + radius) // size + 1)
+            for cy in range((target[1] - radius) // size, (target[1] + radius) // size + 1)
+        ]
+
+    def _is_current(self, distance_field: DistanceField) -> bool:
+        """Check that no chunk under a field changed since it was built."""
+        chunk_state = self._chunk_state
+        return all(
+            chunk_state(chunk) == state for chunk, state in distance_field.chunk_states.items()
+        )
+
+    def _build_field(self, target: Tile) -> DistanceField:
+        """Run a breadth-first Dijkstra pass out from the target."""
+        radius = self.field_radius
+        side = 2 * radius + 1
+        min_x, min_y = target[0] - radius, target[1] - radius
+        chunk_states = {chunk: self._chunk_state(chunk) for chunk in self._covered_chunks(target)}
+        distances = array("H", [UNREACHED]) * (side * side)
+
+        distances[radius * side + radius] = 0
+        queue = deque([target])
+        while queue:
+            x, y = queue.popleft()
+            next_distance = distances[(x - min_x) * side + (y - min_y)] + 1
+            for dx, dy in DIRECTION_OFFSETS.values():
+                nx, ny = x + dx, y + dy
+                ix, iy = nx - min_x, ny - min_y
+                if not (0 <= ix < side and 0 <= iy < side):
+                    continue
+                index = ix * side + iy
+                if distances[index] != UNREACHED or not self.is_walkable((nx, ny)):
+                    continue
+                distances[index] = next_distance
+                queue.append((nx, ny))
+
+        return DistanceField(
+            target=target, radius=radius, distances=distances, chunk_states=chunk_states
+        )
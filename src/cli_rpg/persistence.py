@@ -1,14 +1,121 @@
-"""Character and game state persistence system for CLI RPG."""
+"""Character and game state persistence system for CLI RPG.
+
+Saves are written in one of SAVE_FORMATS:
+
+- "json": indented JSON, easy to read and diff (the default, for debugging)
+- "pickle": pickle protocol 5, the most compact and fastest to load
+- "marshal": marshal format 4, similar speed with a slightly larger file
+
+Binary saves use the .sav extension and start with a fixed header (magic,
+schema version, codec and save kind), so detect_save_type reads only the
+header. Binary saves hold plain data only: the pickle codec fails on any
+object that is not a built-in container, string or number and refuses to
+look up any class or function when loading, and marshal cannot encode
+classes or instances at all. Saves with a schema version newer than
+SAVE_SCHEMA_VERSION are rejected. convert_save rewrites a save in another
+format, and benchmark_save_formats compares sizes and timings.
+"""
+import io
 import json
+import marshal
+import pickle
+import struct
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 from cli_rpg.models.character import Character
+from cli_rpg.paged_world import is_paged_save, read_paged_save
+from cli_rpg.string_store import pack_save_data, unpack_save_data
 
 if TYPE_CHECKING:
     from cli_rpg.game_state import GameState
 
 
+# Format used when none is given
+DEFAULT_SAVE_FORMAT = "json"
+
+# File extensions by kind of format
+JSON_SAVE_EXTENSION = ".json"
+BINARY_SAVE_EXTENSION = ".sav"
+
+# First bytes of every binary save
+BINARY_SAVE_MAGIC = b"CLIRPGSV"
+
+# Layout version of binary saves; bump when the payload layout changes
+SAVE_SCHEMA_VERSION = 1
+
+# Header: magic, schema version, codec code, save kind code
+_BINARY_HEADER = struct.Struct(">8sHBB")
+
+# Save kinds stored in the binary header, by code
+_SAVE_KINDS = ("character", "game_state")
+
+# marshal format version (stable since Python 3.4)
+_MARSHAL_VERSION = 4
+
+
+class _PlainDataPickler(pickle.Pickler):
+    """Pickler that refuses anything but plain data."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reject objects that would be pickled by reference or reduction.
+
+        Built-in containers, strings, numbers, booleans and None never
+        reach this hook.
+        """
+        raise pickle.PicklingError(f"Cannot store {type(obj).__name__} in a save file")
+
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """Unpickler with an empty allowlist of classes and functions."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        """Refuse every global lookup (plain data never needs one)."""
+        raise pickle.UnpicklingError(f"Save file references {module}.{name}, which is not allowed")
+
+
+def _pickle_dumps(data: Any) -> bytes:
+    """Pickle plain data with protocol 5."""
+    buffer = io.BytesIO()
+    _PlainDataPickler(buffer, protocol=5).dump(data)
+    return buffer.getvalue()
+
+
+def _pickle_loads(payload: bytes) -> Any:
+    """Unpickle plain data."""
+    return _PlainDataUnpickler(io.BytesIO(payload)).load()
+
+
+@dataclass(frozen=True)
+class SaveCodec:
+    """A binary payload encoding.
+
+    Attributes:
+        name: Format name used by save functions
+        code: Byte identifying the codec in the binary header
+        dumps: Encodes plain save data to bytes
+        loads: Decodes bytes back to plain save data
+    """
+
+    name: str
+    code: int
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+BINARY_CODECS: dict[str, SaveCodec] = {
+    codec.name: codec
+    for codec in (
+        SaveCodec("pickle", 1, _pickle_dumps, _pickle_loads),
+        SaveCodec("marshal", 2, lambda data: marshal.dumps(data, _MARSHAL_VERSION), marshal.loads),
+    )
+}
+
+SAVE_FORMATS = ("json", *BINARY_CODECS)
+
+
 def _format_timestamp(ts: str) -> str:
     """Convert YYYYMMDD_HHMMSS to human-readable format.
 
@@ -51,57 +158,212 @@ def _sanitize_filename(name: str) -> str:
     return sanitized
 
 
-def _generate_filename(character_name: str) -> str:
+def _generate_filename(character_name: str, extension: str = JSON_SAVE_EXTENSION) -> str:
     """Generate unique filename with timestamp.
     
     Args:
         character_name: Name of the character
+        extension: File extension including the dot
         
     Returns:
-        Filename in format: {sanitized_name}_{timestamp}.json
+        Filename in format: {sanitized_name}_{timestamp}{extension}
     """
     sanitized_name = _sanitize_filename(character_name)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"{sanitized_name}_{timestamp}.json"
+    return f"{sanitized_name}_{timestamp}{extension}"
+
+
+def _save_extension(save_format: str) -> str:
+    """Return the file extension for a save format.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if save_format == "json":
+        return JSON_SAVE_EXTENSION
+    if save_format in BINARY_CODECS:
+        return BINARY_SAVE_EXTENSION
+    raise ValueError(f"Unknown save format '{save_format}' (choose from {', '.join(SAVE_FORMATS)})")
+
+
+def encode_save_data(data: dict, save_format: str, kind: str) -> bytes:
+    """Encode save data in a save format.
+
+    Args:
+        data: Plain save data (character or packed game state dict)
+        save_format: One of SAVE_FORMATS
+        kind: "character" or "game_state" (recorded in binary headers)
+
+    Returns:
+        File contents
+
+    Raises:
+        ValueError: If the format is unknown or data is not plain
+    """
+    _save_extension(save_format)
+    if save_format == "json":
+        return json.dumps(data, indent=2).encode("utf-8")
+    codec = BINARY_CODECS[save_format]
+    try:
+        payload = codec.dumps(data)
+    except (pickle.PicklingError, ValueError) as e:
+        raise ValueError(f"Save data is not plain data: {e}")
+    header = _BINARY_HEADER.pack(
+        BINARY_SAVE_MAGIC, SAVE_SCHEMA_VERSION, codec.code, _SAVE_KINDS.index(kind)
+    )
+    return header + payload
+
+
+def _read_binary_header(header: bytes) -> tuple[SaveCodec, str]:
+    """Validate a binary save header.
+
+    Returns:
+        (codec, save kind)
+
+    Raises:
+        ValueError: If the header is invalid, or from a newer schema version
+    """
+    if len(header) < _BINARY_HEADER.size:
+        raise ValueError("Binary save file is truncated")
+    magic, version, codec_code, kind_code = _BINARY_HEADER.unpack(header[:_BINARY_HEADER.size])
+    if magic != BINARY_SAVE_MAGIC:
+        raise ValueError("Not a binary save file")
+    if version > SAVE_SCHEMA_VERSION:
+        raise ValueError(
+            f"Save file schema version {version} is newer than supported ({SAVE_SCHEMA_VERSION})"
+        )
+    for codec in BINARY_CODECS.values():
+        if codec.code == codec_code:
+            break
+    else:
+        raise ValueError(f"Unknown save codec {codec_code}")
+    if kind_code >= len(_SAVE_KINDS):
+        raise ValueError(f"Unknown save kind {kind_code}")
+    return codec, _SAVE_KINDS[kind_code]
+
+
+def decode_save_data(raw: bytes) -> dict:
+    """Decode the contents of a JSON or binary save file.
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Save data with string references resolved
+
+    Raises:
+        ValueError: If the contents are invalid (json.JSONDecodeError for JSON)
+    """
+    if not raw.startswith(BINARY_SAVE_MAGIC):
+        return unpack_save_data(json.loads(raw))
+    codec, _ = _read_binary_header(raw)
+    try:
+        data = codec.loads(raw[_BINARY_HEADER.size:])
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        raise ValueError(f"Corrupted binary save file: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("Binary save file does not hold a save dictionary")
+    return unpack_save_data(data)
+
+
+def is_binary_save(filepath: str) -> bool:
+    """Check whether a file is a binary save, reading only its magic bytes.
+
+    Args:
+        filepath: Path to the save file
+
+    Returns:
+        True if the file starts with BINARY_SAVE_MAGIC
+    """
+    with open(filepath, "rb") as f:
+        return f.read(len(BINARY_SAVE_MAGIC)) == BINARY_SAVE_MAGIC
+
 
+def detect_save_format(filepath: str) -> str:
+    """Detect the format a save file was written in.
 
-def save_character(character: Character, save_dir: str = "saves") -> str:
-    """Save character to JSON file.
+    Args:
+        filepath: Path to save file
+
+    Returns:
+        A name from SAVE_FORMATS, or "paged" for region-paged autosaves
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If a binary header is invalid
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"Save file not found: {filepath}")
+    if is_binary_save(filepath):
+        with open(filepath, "rb") as f:
+            codec, _ = _read_binary_header(f.read(_BINARY_HEADER.size))
+        return codec.name
+    if is_paged_save(filepath):
+        return "paged"
+    return "json"
+
+
+def _read_save_file(filepath: str) -> dict:
+    """Read a save file in any format.
+
+    Paged saves parse only the header and nearby regions.
+
+    Raises:
+        ValueError: If the file is invalid (json.JSONDecodeError for JSON)
+    """
+    if is_binary_save(filepath):
+        with open(filepath, "rb") as f:
+            return decode_save_data(f.read())
+    with open(filepath, 'r') as f:
+        if is_paged_save(filepath):
+            return read_paged_save(f)
+        return unpack_save_data(json.load(f))
+
+
+def _write_save_file(save_dir: str, name: str, data: dict, save_format: str, kind: str) -> str:
+    """Write save data to a new timestamped file.
+
+    Returns:
+        Full path to the written file
+    """
+    extension = _save_extension(save_format)
+    contents = encode_save_data(data, save_format, kind)
+
+    save_path = Path(save_dir)
+    save_path.mkdir(parents=True, exist_ok=True)
+    filepath = save_path / _generate_filename(name, extension)
+    with open(filepath, 'wb') as f:
+        f.write(contents)
+    return str(filepath)
+
+
+def save_character(
+    character: Character, save_dir: str = "saves", save_format: str = DEFAULT_SAVE_FORMAT
+) -> str:
+    """Save character to a file.
     
     Args:
         character: Character instance to save
         save_dir: Directory to save character files (default: "saves")
+        save_format: One of SAVE_FORMATS (default: indented JSON)
         
     Returns:
         Full path to saved file
         
     Raises:
         IOError: If write operation fails
+        ValueError: If the save format is unknown
     """
     try:
-        # Create directory if it doesn't exist
-        save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate unique filename
-        filename = _generate_filename(character.name)
-        filepath = save_path / filename
-        
-        # Serialize character to dictionary
-        character_data = character.to_dict()
-        
-        # Write JSON to file
-        with open(filepath, 'w') as f:
-            json.dump(character_data, f, indent=2)
-        
-        return str(filepath)
-        
+        return _write_save_file(
+            save_dir, character.name, character.to_dict(), save_format, "character"
+        )
     except (OSError, PermissionError) as e:
         raise IOError(f"Failed to save character: {e}")
 
 
 def load_character(filepath: str) -> Character:
-    """Load character from JSON file.
+    """Load character from a save file in any format.
     
     Args:
         filepath: Path to character save file
@@ -119,9 +381,7 @@ def load_character(filepath: str) -> Character:
         raise FileNotFoundError(f"Save file not found: {filepath}")
     
     try:
-        # Load and parse JSON
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_save_file(filepath)
         
         # Validate required keys
         required_keys = ['name', 'strength', 'dexterity', 'intelligence']
@@ -158,12 +418,13 @@ def list_saves(save_dir: str = "saves") -> list[dict[str, Any]]:
     if not save_path.exists():
         return []
 
-    # Find all JSON files
-    json_files = list(save_path.glob("*.json"))
+    # Find all JSON and binary save files
+    save_files = list(save_path.glob(f"*{JSON_SAVE_EXTENSION}"))
+    save_files += save_path.glob(f"*{BINARY_SAVE_EXTENSION}")
 
     saves = []
-    for json_file in json_files:
-        filename = json_file.stem  # Filename without extension
+    for save_file in save_files:
+        filename = save_file.stem  # Filename without extension
 
         # Detect autosave by filename prefix
         is_autosave = filename.startswith("autosave_")
@@ -183,12 +444,12 @@ def list_saves(save_dir: str = "saves") -> list[dict[str, Any]]:
 
         # Fallback timestamp from file mtime if unknown
         if timestamp == "unknown":
-            mtime = json_file.stat().st_mtime
+            mtime = save_file.stat().st_mtime
             timestamp = datetime.fromtimestamp(mtime).strftime("%Y%m%d_%H%M%S")
 
         saves.append({
             'name': character_name,
-            'filepath': str(json_file),
+            'filepath': str(save_file),
             'timestamp': timestamp,
             'display_time': _format_timestamp(timestamp),
             'is_autosave': is_autosave,
@@ -219,6 +480,16 @@ def detect_save_type(filepath: str) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"Save file not found: {filepath}")
     
+    # Binary saves record their kind in the header
+    if is_binary_save(filepath):
+        with open(filepath, "rb") as f:
+            _, kind = _read_binary_header(f.read(_BINARY_HEADER.size))
+        return kind
+
+    # Region-paged saves (autosaves) are detected from their header line
+    if is_paged_save(filepath):
+        return "game_state"
+
     try:
         # Load and parse JSON
         with open(filepath, 'r') as f:
@@ -259,43 +530,35 @@ def delete_save(filepath: str) -> bool:
         return False
 
 
-def save_game_state(game_state: "GameState", save_dir: str = "saves") -> str:
-    """Save complete game state to JSON file.
+def save_game_state(
+    game_state: "GameState", save_dir: str = "saves", save_format: str = DEFAULT_SAVE_FORMAT
+) -> str:
+    """Save complete game state to a file.
     
     Args:
         game_state: GameState instance to save
         save_dir: Directory to save game files (default: "saves")
+        save_format: One of SAVE_FORMATS (default: indented JSON)
         
     Returns:
         Full path to saved file
         
     Raises:
         IOError: If write operation fails
+        ValueError: If the save format is unknown
     """
     try:
-        # Create directory if it doesn't exist
-        save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate unique filename
-        filename = _generate_filename(game_state.current_character.name)
-        filepath = save_path / filename
-        
-        # Serialize game state to dictionary
-        game_data = game_state.to_dict()
-        
-        # Write JSON to file
-        with open(filepath, 'w') as f:
-            json.dump(game_data, f, indent=2)
-        
-        return str(filepath)
-        
+        # Serialize game state to dictionary (long art/descriptions stored once)
+        game_data = pack_save_data(game_state.to_dict())
+        return _write_save_file(
+            save_dir, game_state.current_character.name, game_data, save_format, "game_state"
+        )
     except (OSError, PermissionError) as e:
         raise IOError(f"Failed to save game state: {e}")
 
 
 def load_game_state(filepath: str) -> "GameState":
-    """Load complete game state from JSON file.
+    """Load complete game state from a save file in any format.
     
     Args:
         filepath: Path to game state save file
@@ -316,9 +579,7 @@ def load_game_state(filepath: str) -> "GameState":
         raise FileNotFoundError(f"Save file not found: {filepath}")
     
     try:
-        # Load and parse JSON
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_save_file(filepath)
         
         # Validate required keys
         required_keys = ['character', 'current_location', 'world']
@@ -337,3 +598,75 @@ def load_game_state(filepath: str) -> "GameState":
     except ValueError as e:
         # Re-raise validation errors from GameState
         raise ValueError(f"Invalid game state data: {e}")
+
+
+def convert_save(filepath: str, save_format: str) -> str:
+    """Rewrite a save file in another format next to the original.
+
+    The save is loaded into a Character or GameState and written again, so
+    paged autosaves are fully materialized. The new file keeps the original
+    name with the new format's extension; the original is left in place
+    unless the extensions match.
+
+    Args:
+        filepath: Path to a save file in any format
+        save_format: One of SAVE_FORMATS
+
+    Returns:
+        Path to the converted file
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If the format is unknown or the save is invalid
+        IOError: If the write fails
+    """
+    extension = _save_extension(save_format)
+    if detect_save_type(filepath) == "game_state":
+        data = pack_save_data(load_game_state(filepath).to_dict())
+        kind = "game_state"
+    else:
+        data = load_character(filepath).to_dict()
+        kind = "character"
+
+    target = Path(filepath).with_suffix(extension)
+    contents = encode_save_data(data, save_format, kind)
+    try:
+        with open(target, 'wb') as f:
+            f.write(contents)
+    except (OSError, PermissionError) as e:
+        raise IOError(f"Failed to convert save: {e}")
+    return str(target)
+
+
+def benchmark_save_formats(game_state: "GameState", repeat: int = 5) -> list[dict[str, Any]]:
+    """Measure each save format on a game state, in memory.
+
+    Encoding includes string packing; decoding includes string unpacking
+    but not GameState.from_dict, which is the same for every format.
+
+    Args:
+        game_state: GameState to encode
+        repeat: Runs per format (the fastest is reported)
+
+    Returns:
+        One dict per format with keys: format, bytes, save_ms, load_ms
+    """
+    game_dict = game_state.to_dict()
+    results = []
+    for save_format in SAVE_FORMATS:
+        save_times = []
+        load_times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            contents = encode_save_data(pack_save_data(game_dict), save_format, "game_state")
+            save_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            decode_save_data(contents)
+            load_times.append(time.perf_counter() - start)
+        results.append({
+            'format': save_format,
+            'bytes': len(contents),
+            'save_ms': min(save_times) * 1000,
+            'load_ms': min(load_times) * 1000,
+        })
+    return results
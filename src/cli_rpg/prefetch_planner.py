@@ -0,0 +1,247 @@
+"""Frontier-aware prefetch planning for overworld expansion.
+
+After each move the game pre-generates locations and region contexts the
+player may reach next. Rather than queueing every neighbour, PrefetchPlanner
+scores the tiles within two steps and the nearby regions by:
+
+- heading: recent movement directions, most recent weighted highest
+- quest: progress toward the active quest's target location
+- frontier: directions toward unexplored regions (the same preference as
+  WorldGrid.get_prioritized_frontier_exits)
+
+and returns only the K most likely, with priorities for the background
+queue. It also tracks the prefetch hit rate: the share of generated moves
+whose target was already pre-generated (or in flight) when the player arrived.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Container, Iterable, Optional
+
+from cli_rpg.world_grid import DIRECTION_OFFSETS
+from cli_rpg.world_tiles import get_region_coords
+
+# Tiles and regions prefetched per move
+DEFAULT_PREFETCH_TILES = 4
+DEFAULT_PREFETCH_REGIONS = 2
+
+# Moves remembered for the heading, and how fast older moves fade
+HEADING_WINDOW = 6
+HEADING_DECAY = 0.5
+
+# Steps ahead considered for tile prefetch
+LOOKAHEAD_STEPS = 2
+
+# Score weights
+HEADING_WEIGHT = 2.0
+QUEST_WEIGHT = 1.5
+FRONTIER_WEIGHT = 0.5
+
+
+@dataclass
+class PrefetchTarget:
+    """A tile chosen for prefetch.
+
+    Attributes:
+        coords: Tile coordinates
+        priority: Score (higher is more likely to be visited next)
+    """
+
+    coords: tuple[int, int]
+    priority: float
+
+
+def _manhattan(a: tuple[int, int], b: tuple[int, int]) -> int:
+    """Manhattan distance between two coordinates."""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def _unit(dx: int, dy: int) -> tuple[float, float]:
+    """Normalize an offset by its Manhattan length (zero offset stays zero)."""
+    length = abs(dx) + abs(dy)
+    if length == 0:
+        return (0.0, 0.0)
+    return (dx / length, dy / length)
+
+
+class PrefetchPlanner:
+    """Chooses which tiles and regions to pre-generate after a move.
+
+    Attributes:
+        max_tiles: Tiles returned by plan_tiles
+        max_regions: Regions returned by plan_regions
+        hits: Generated moves whose target was pre-generated
+        misses: Generated moves whose target had to be generated inline
+    """
+
+    def __init__(
+        self,
+        max_tiles: int = DEFAULT_PREFETCH_TILES,
+        max_regions: int = DEFAULT_PREFETCH_REGIONS,
+        window: int = HEADING_WINDOW,
+    ):
+        """Initialize the planner.
+
+        Args:
+            max_tiles: Tiles returned by plan_tiles
+            max_regions: Regions returned by plan_regions
+            window: Recent moves used for the heading
+        """
+        self.max_tiles = max_tiles
+        self.max_regions = max_regions
+        self._recent: deque[str] = deque(maxlen=window)
+        self.hits = 0
+        self.misses = 0
+
+    def record_move(self, direction: str) -> None:
+        """Record an overworld move for the heading.
+
+        Args:
+            direction: Direction moved (north, south, east, west)
+        """
+        if direction in DIRECTION_OFFSETS:
+            self._recent.append(direction)
+
+    def record_arrival(self, prefetched: bool) -> None:
+        """Record whether a newly generated move target was prefetched.
+
+        Args:
+            prefetched: True if background generation had the target ready
+                or in flight
+        """
+        if prefetched:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Share of generated moves served by prefetch (None before any)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def heading(self) -> tuple[float, float]:
+        """Return the recency-weighted average direction of recent moves.
+
+        Returns:
+            (x, y) vector with length at most 1; (0, 0) with no history
+        """
+        weight = 1.0
+        total = 0.0
+        hx = hy = 0.0
+        for direction in reversed(self._recent):
+            dx, dy = DIRECTION_OFFSETS[direction]
+            hx += dx * weight
+            hy += dy * weight
+            total += weight
+            weight *= HEADING_DECAY
+        if total == 0:
+            return (0.0, 0.0)
+        return (hx / total, hy / total)
+
+    def _score(
+        self,
+        origin: tuple[int, int],
+        offset: tuple[int, int],
+        heading: tuple[float, float],
+        quest_target: Optional[tuple[int, int]],
+        frontier_dirs: Iterable[str],
+    ) -> float:
+        """Score an offset from the origin (tile or region steps)."""
+        ux, uy = _unit(*offset)
+        score = HEADING_WEIGHT * (ux * heading[0] + uy * heading[1])
+
+        if quest_target is not None:
+            steps = abs(offset[0]) + abs(offset[1])
+            target = (origin[0] + offset[0], origin[1] + offset[1])
+            progress = (_manhattan(origin, quest_target) - _manhattan(target, quest_target)) / steps
+            score += QUEST_WEIGHT * max(0.0, progress)
+
+        frontier = [
+            ux * DIRECTION_OFFSETS[d][0] + uy * DIRECTION_OFFSETS[d][1] for d in frontier_dirs
+        ]
+        if frontier:
+            score += FRONTIER_WEIGHT * max(0.0, max(frontier))
+        return score
+
+    def plan_tiles(
+        self,
+        coords: tuple[int, int],
+        generated: Container[tuple[int, int]],
+        quest_target: Optional[tuple[int, int]] = None,
+        frontier_dirs: Iterable[str] = (),
+    ) -> list[PrefetchTarget]:
+        """Pick the tiles most likely to be entered next.
+
+        Candidates are the ungenerated tiles within LOOKAHEAD_STEPS moves.
+        Nearer tiles score higher, so with no heading, quest or frontier
+        signal the four neighbours come first.
+
+        Args:
+            coords: Player's current coordinates
+            generated: Coordinates that already have a location (any
+                container, e.g. a set or an ExitGraph)
+            quest_target: Coordinates of the active quest's target, if known
+            frontier_dirs: Directions toward unexplored regions
+
+        Returns:
+            Up to max_tiles targets, highest priority first
+        """
+        heading = self.heading()
+        frontier_dirs = list(frontier_dirs)
+        targets = []
+        for dx in range(-LOOKAHEAD_STEPS, LOOKAHEAD_STEPS + 1):
+            for dy in range(-LOOKAHEAD_STEPS, LOOKAHEAD_STEPS + 1):
+                steps = abs(dx) + abs(dy)
+                if steps == 0 or steps > LOOKAHEAD_STEPS:
+                    continue
+                tile = (coords[0] + dx, coords[1] + dy)
+                if tile in generated:
+                    continue
+                score = self._score(coords, (dx, dy), heading, quest_target, frontier_dirs)
+                targets.append(PrefetchTarget(tile, round(score / steps + 1.0 / steps, 6)))
+
+        targets.sort(key=lambda t: (-t.priority, _manhattan(coords, t.coords), t.coords))
+        return targets[: self.max_tiles]
+
+    def plan_regions(
+        self,
+        coords: tuple[int, int],
+        candidates: Iterable[tuple[int, int]],
+        quest_target: Optional[tuple[int, int]] = None,
+    ) -> list[tuple[int, int]]:
+        """Pick the nearby regions most likely to be entered next.
+
+        Args:
+            coords: Player's current coordinates
+            candidates: Region coordinates near the player (e.g. from
+                check_region_boundary_proximity)
+            quest_target: Coordinates of the active quest's target, if known
+
+        Returns:
+            Up to max_regions region coordinates, most likely first
+        """
+        heading = self.heading()
+        current = get_region_coords(*coords)
+        quest_region = get_region_coords(*quest_target) if quest_target else None
+        scored = []
+        for region in candidates:
+            offset = (region[0] - current[0], region[1] - current[1])
+            if offset == (0, 0):
+                continue
+            score = self._score(current, offset, heading, quest_region, ())
+            scored.append((-score, region))
+        scored.sort()
+        return [region for _, region in scored[: self.max_regions]]
+
+    def format_report(self) -> Optional[str]:
+        """Format the prefetch hit rate for display.
+
+        Returns:
+            One-line summary, or None if no generated moves were recorded
+        """
+        rate = self.hit_rate
+        if rate is None:
+            return None
+        total = self.hits + self.misses
+        return f"Prefetch: {self.hits}/{total} new locations ready on arrival ({rate:.0%})"
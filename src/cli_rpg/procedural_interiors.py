@@ -7,14 +7,17 @@ Architecture:
 - RoomType: Classification of room purposes
 - RoomTemplate: Blueprint for a single room in a layout
 - BSPNode: Binary Space Partitioning tree node for dungeon generation
+- RoomTable: Compact array-backed layout (coords, type codes, connection bitmasks)
 - BSPGenerator: Generator using BSP algorithm for dungeons, temples, ruins
 - CATEGORY_GENERATORS: Maps location categories to generator types
 - generate_interior_layout: Factory function for generating layouts
+- generate_interior_layouts: Batch variant returning RoomTables
 """
 
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Protocol
+from typing import Iterable, Optional, Protocol
 import random
 
 
@@ -69,6 +72,10 @@ class GeneratorProtocol(Protocol):
         """
         ...
 
+    def generate_table(self) -> "RoomTable":
+        """Generate the same layout as a compact RoomTable."""
+        ...
+
 
 @dataclass
 class BSPNode:
@@ -176,6 +183,194 @@ OPPOSITE_DIRECTION: dict[str, str] = {
     "down": "up",
 }
 
+# Direction codes for RoomTable (index into this tuple)
+DIRECTIONS: tuple[str, ...] = tuple(DIRECTION_OFFSETS)
+_DIRECTION_CODES: dict[str, int] = {name: code for code, name in enumerate(DIRECTIONS)}
+
+# Room type codes for RoomTable (index into this tuple)
+ROOM_TYPES: tuple[RoomType, ...] = tuple(RoomType)
+_ROOM_TYPE_CODES: dict[RoomType, int] = {room_type: code for code, room_type in enumerate(ROOM_TYPES)}
+
+# Number of connections for each connection bitmask
+_LINK_COUNTS: tuple[int, ...] = tuple(bin(mask).count("1") for mask in range(1 << len(DIRECTIONS)))
+
+# link_order value for each bitmask when directions are added in DIRECTIONS order
+_MASK_ORDERS: tuple[int, ...] = tuple(
+    sum(
+        (code + 1) << (3 * _LINK_COUNTS[mask & ((1 << code) - 1)])
+        for code in range(len(DIRECTIONS))
+        if mask & (1 << code)
+    )
+    for mask in range(1 << len(DIRECTIONS))
+)
+
+# Decoded link_order values (filled on demand)
+_LINK_ORDERS: dict[int, tuple[str, ...]] = {}
+
+
+def _decode_link_order(order: int) -> tuple[str, ...]:
+    """Return the directions packed in a RoomTable.link_order value."""
+    directions = _LINK_ORDERS.get(order)
+    if directions is None:
+        decoded = []
+        remaining = order
+        while remaining:
+            decoded.append(DIRECTIONS[(remaining & 7) - 1])
+            remaining >>= 3
+        directions = _LINK_ORDERS[order] = tuple(decoded)
+    return directions
+
+
+@dataclass
+class RoomTable:
+    """Compact array-backed layout: one row per room.
+
+    Generators fill a RoomTable instead of building RoomTemplate objects;
+    to_templates converts it for code that expects RoomTemplate lists.
+
+    Attributes:
+        xs: Room x coordinates
+        ys: Room y coordinates
+        zs: Room z coordinates
+        kinds: Room type codes (index into ROOM_TYPES)
+        links: Connection bitmask (bit n set = DIRECTIONS[n] connected)
+        link_order: Connections in the order they were added, 3 bits each
+            (direction code + 1, first connection in the lowest bits)
+        entries: 1 for entry/exit rooms, else 0
+        hazards: Suggested hazards by room index (only rooms that have any)
+    """
+
+    xs: array = field(default_factory=lambda: array("i"))
+    ys: array = field(default_factory=lambda: array("i"))
+    zs: array = field(default_factory=lambda: array("i"))
+    kinds: array = field(default_factory=lambda: array("B"))
+    links: array = field(default_factory=lambda: array("B"))
+    link_order: array = field(default_factory=lambda: array("I"))
+    entries: array = field(default_factory=lambda: array("B"))
+    hazards: dict[int, list[str]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def add_room(
+        self, coords: tuple[int, int, int], room_type: RoomType, is_entry: bool = False
+    ) -> int:
+        """Append a room without connections.
+
+        Args:
+            coords: 3D position as (x, y, z)
+            room_type: Room classification
+            is_entry: True for entry/exit rooms
+
+        Returns:
+            Index of the new room
+        """
+        self.xs.append(coords[0])
+        self.ys.append(coords[1])
+        self.zs.append(coords[2])
+        self.kinds.append(_ROOM_TYPE_CODES[room_type])
+        self.links.append(0)
+        self.link_order.append(0)
+        self.entries.append(1 if is_entry else 0)
+        return len(self.xs) - 1
+
+    def add_rooms(self, coords: Iterable[tuple[int, int, int]], room_type: RoomType) -> range:
+        """Append rooms of one type without connections.
+
+        Args:
+            coords: 3D positions as (x, y, z)
+            room_type: Room classification for every new room
+
+        Returns:
+            Indices of the new rooms
+        """
+        start = len(self.xs)
+        for x, y, z in coords:
+            self.xs.append(x)
+            self.ys.append(y)
+            self.zs.append(z)
+        added = len(self.xs) - start
+        self.kinds.extend(array("B", [_ROOM_TYPE_CODES[room_type]]) * added)
+        self.links.extend(array("B", [0]) * added)
+        self.link_order.extend(array("I", [0]) * added)
+        self.entries.extend(array("B", [0]) * added)
+        return range(start, start + added)
+
+    def coords(self, index: int) -> tuple[int, int, int]:
+        """Return a room's (x, y, z) position."""
+        return (self.xs[index], self.ys[index], self.zs[index])
+
+    def room_type(self, index: int) -> RoomType:
+        """Return a room's type."""
+        return ROOM_TYPES[self.kinds[index]]
+
+    def set_room_type(self, index: int, room_type: RoomType, is_entry: Optional[bool] = None) -> None:
+        """Change a room's type (and optionally its entry flag)."""
+        self.kinds[index] = _ROOM_TYPE_CODES[room_type]
+        if is_entry is not None:
+            self.entries[index] = 1 if is_entry else 0
+
+    def connect(self, index: int, direction: str) -> None:
+        """Add a connection to a room unless it already has it."""
+        code = _DIRECTION_CODES[direction]
+        mask = self.links[index]
+        if mask & (1 << code):
+            return
+        self.link_order[index] |= (code + 1) << (3 * _LINK_COUNTS[mask])
+        self.links[index] = mask | (1 << code)
+
+    def set_link_masks(self, masks: list[int]) -> None:
+        """Replace every room's connections from bitmasks.
+
+        Connections are recorded in DIRECTIONS order (north, south, east,
+        west, up, down).
+
+        Args:
+            masks: One connection bitmask per room
+        """
+        self.links = array("B", masks)
+        self.link_order = array("I", [_MASK_ORDERS[mask] for mask in masks])
+
+    def connection_count(self, index: int) -> int:
+        """Return how many connections a room has."""
+        return _LINK_COUNTS[self.links[index]]
+
+    def connections(self, index: int) -> list[str]:
+        """Return a room's connections in the order they were added."""
+        return list(_decode_link_order(self.link_order[index]))
+
+    def to_templates(self) -> list[RoomTemplate]:
+        """Convert to RoomTemplate blueprints (in room order)."""
+        decode = _decode_link_order
+        templates = [
+            RoomTemplate((x, y, z), ROOM_TYPES[kind], list(decode(order)), entry == 1)
+            for x, y, z, kind, order, entry in zip(
+                self.xs, self.ys, self.zs, self.kinds, self.link_order, self.entries
+            )
+        ]
+        for index, hazards in self.hazards.items():
+            templates[index].suggested_hazards = list(hazards)
+        return templates
+
+    @classmethod
+    def from_templates(cls, templates: list[RoomTemplate]) -> "RoomTable":
+        """Build a table from RoomTemplate blueprints.
+
+        Args:
+            templates: Rooms to pack (connections keep their order)
+
+        Returns:
+            Equivalent RoomTable
+        """
+        table = cls()
+        for template in templates:
+            index = table.add_room(template.coords, template.room_type, template.is_entry)
+            for direction in template.connections:
+                table.connect(index, direction)
+            if template.suggested_hazards:
+                table.hazards[index] = list(template.suggested_hazards)
+        return table
+
 
 class CellularAutomataGenerator:
     """Cellular automata generator for cave/mine layouts.
@@ -240,6 +435,10 @@ class CellularAutomataGenerator:
 
         return all_rooms
 
+    def generate_table(self) -> RoomTable:
+        """Generate layout as a compact RoomTable."""
+        return RoomTable.from_templates(self.generate())
+
     def _generate_level(self, z: int) -> list[RoomTemplate]:
         """Generate rooms for a single z-level using cellular automata."""
         # Initialize grid with random noise
@@ -515,23 +714,27 @@ class BSPGenerator:
 
     def generate(self) -> list[RoomTemplate]:
         """Generate layout returning list of RoomTemplate blueprints."""
-        rooms: list[RoomTemplate] = []
+        return self.generate_table().to_templates()
+
+    def generate_table(self) -> RoomTable:
+        """Generate layout as a compact RoomTable."""
+        table = RoomTable()
+        levels: list[list[tuple[int, int, int]]] = []
 
         # Generate for each z-level
         for z in range(self.max_z, self.min_z - 1, -1):
-            level_rooms = self._generate_level(z)
-            rooms.extend(level_rooms)
+            levels.append(self._generate_level(table, z))
 
         # Ensure rooms are connected between levels
-        self._add_vertical_connections(rooms)
+        self._add_vertical_connections(table, [level for level in levels if level])
 
         # Assign special room types
-        self._assign_room_types(rooms)
+        self._assign_room_types(table)
 
-        return rooms
+        return table
 
-    def _generate_level(self, z: int) -> list[RoomTemplate]:
-        """Generate rooms for a single z-level."""
+    def _generate_level(self, table: RoomTable, z: int) -> list[tuple[int, int, int]]:
+        """Generate rooms for a single z-level, returning (index, x, y) per room."""
         width = self.max_x - self.min_x + 1
         height = self.max_y - self.min_y + 1
 
@@ -541,20 +744,15 @@ class BSPGenerator:
         # Build BSP tree
         self._split_recursively(root, 0)
 
-        # Collect leaf nodes and create rooms
-        leaves = self._collect_leaves(root)
-
-        # Create rooms in leaves
-        rooms: list[RoomTemplate] = []
-        for leaf in leaves:
-            room_coords = self._create_room_in_partition(leaf, z)
-            if room_coords:
-                rooms.append(room_coords)
+        # Create rooms in leaves (keyed by leaf node identity)
+        leaf_rooms: dict[int, tuple[int, int, int]] = {}
+        for leaf in self._collect_leaves(root):
+            index = self._create_room_in_partition(table, leaf, z)
+            if index is not None:
+                leaf_rooms[id(leaf)] = (index, table.xs[index], table.ys[index])
 
         # Connect sibling rooms
-        self._connect_siblings(root, rooms, z)
-
-        return rooms
+        return self._connect_siblings(table, root, leaf_rooms)
 
     def _split_recursively(self, node: BSPNode, depth: int) -> None:
         """Recursively split the BSP tree."""
@@ -579,9 +777,9 @@ class BSPGenerator:
         return leaves
 
     def _create_room_in_partition(
-        self, node: BSPNode, z: int
-    ) -> Optional[RoomTemplate]:
-        """Create a room within a leaf partition."""
+        self, table: RoomTable, node: BSPNode, z: int
+    ) -> Optional[int]:
+        """Create a room within a leaf partition, returning its index."""
         # For very small partitions (like 3x3), use the entire partition
         if node.width <= self.MIN_ROOM_SIZE + 1 or node.height <= self.MIN_ROOM_SIZE + 1:
             # Use the entire partition as a room
@@ -618,7 +816,7 @@ class BSPGenerator:
         # Store room info in node for connection generation
         node.room = (room_x, room_y, room_width, room_height)
 
-        # Pick a point in the room for the RoomTemplate coords
+        # Pick a point in the room for the room coords
         center_x = room_x + room_width // 2
         center_y = room_y + room_height // 2
 
@@ -626,76 +824,68 @@ class BSPGenerator:
         center_x = max(self.min_x, min(self.max_x, center_x))
         center_y = max(self.min_y, min(self.max_y, center_y))
 
-        return RoomTemplate(
-            coords=(center_x, center_y, z),
-            room_type=RoomType.CHAMBER,  # Will be reassigned later
-            connections=[],
-            is_entry=False,
-        )
+        # Type is reassigned later
+        return table.add_room((center_x, center_y, z), RoomType.CHAMBER)
 
     def _connect_siblings(
-        self, node: BSPNode, rooms: list[RoomTemplate], z: int
-    ) -> None:
-        """Connect rooms in sibling partitions."""
+        self, table: RoomTable, node: BSPNode, leaf_rooms: dict[int, tuple[int, int, int]]
+    ) -> list[tuple[int, int, int]]:
+        """Connect rooms in sibling partitions.
+
+        Returns:
+            (index, x, y) of the rooms in this subtree, in leaf order
+        """
         if node.is_leaf:
-            return
+            room = leaf_rooms.get(id(node))
+            return [] if room is None else [room]
 
         # Recursively connect children first
-        if node.left:
-            self._connect_siblings(node.left, rooms, z)
-        if node.right:
-            self._connect_siblings(node.right, rooms, z)
+        left_rooms = self._connect_siblings(table, node.left, leaf_rooms) if node.left else []
+        right_rooms = self._connect_siblings(table, node.right, leaf_rooms) if node.right else []
 
         # Connect rooms between left and right subtrees
-        if node.left and node.right:
-            left_rooms = self._get_rooms_in_subtree(node.left, rooms, z)
-            right_rooms = self._get_rooms_in_subtree(node.right, rooms, z)
-
-            if left_rooms and right_rooms:
-                # Find closest pair of rooms
-                best_pair = None
-                best_dist = float("inf")
-
-                for lr in left_rooms:
-                    for rr in right_rooms:
-                        dist = abs(lr.coords[0] - rr.coords[0]) + abs(
-                            lr.coords[1] - rr.coords[1]
-                        )
-                        if dist < best_dist:
-                            best_dist = dist
-                            best_pair = (lr, rr)
-
-                if best_pair:
-                    self._add_connection(best_pair[0], best_pair[1])
-
-    def _get_rooms_in_subtree(
-        self, node: BSPNode, rooms: list[RoomTemplate], z: int
-    ) -> list[RoomTemplate]:
-        """Get all rooms in a subtree."""
-        result = []
-        for room in rooms:
-            x, y, rz = room.coords
-            if rz == z and node.x <= x < node.x + node.width and node.y <= y < node.y + node.height:
-                result.append(room)
-        return result
+        if left_rooms and right_rooms:
+            best_pair = self._closest_pair(left_rooms, right_rooms)
+            if best_pair:
+                self._add_connection(table, best_pair[0], best_pair[1])
+
+        return left_rooms + right_rooms
+
+    @staticmethod
+    def _closest_pair(
+        first: list[tuple[int, int, int]], second: list[tuple[int, int, int]]
+    ) -> Optional[tuple[int, int]]:
+        """Find the first pair of rooms with the smallest x/y distance.
+
+        Args:
+            first: (index, x, y) of the rooms on one side
+            second: (index, x, y) of the rooms on the other side
+
+        Returns:
+            (first index, second index), or None if either side is empty
+        """
+        best_pair = None
+        best_dist = float("inf")
+
+        for a, ax, ay in first:
+            for b, bx, by in second:
+                dist = abs(ax - bx) + abs(ay - by)
+                if dist < best_dist:
+                    best_dist = dist
+                    best_pair = (a, b)
+            if best_dist == 0:
+                break  # No later pair can be strictly closer
 
-    def _add_connection(self, room1: RoomTemplate, room2: RoomTemplate) -> None:
+        return best_pair
+
+    def _add_connection(self, table: RoomTable, room1: int, room2: int) -> None:
         """Add bidirectional connections between two rooms."""
-        x1, y1, z1 = room1.coords
-        x2, y2, z2 = room2.coords
+        x1, y1, z1 = table.coords(room1)
+        x2, y2, z2 = table.coords(room2)
 
         if z1 != z2:
             # Vertical connection
-            if z1 < z2:
-                if "up" not in room1.connections:
-                    room1.connections.append("up")
-                if "down" not in room2.connections:
-                    room2.connections.append("down")
-            else:
-                if "down" not in room1.connections:
-                    room1.connections.append("down")
-                if "up" not in room2.connections:
-                    room2.connections.append("up")
+            direction = "up" if z1 < z2 else "down"
         else:
             # Horizontal connection - determine direction
             dx = x2 - x1
@@ -703,123 +893,87 @@ class BSPGenerator:
 
             if abs(dx) >= abs(dy):
                 # Primarily east-west
-                if dx > 0:
-                    if "east" not in room1.connections:
-                        room1.connections.append("east")
-                    if "west" not in room2.connections:
-                        room2.connections.append("west")
-                else:
-                    if "west" not in room1.connections:
-                        room1.connections.append("west")
-                    if "east" not in room2.connections:
-                        room2.connections.append("east")
+                direction = "east" if dx > 0 else "west"
             else:
                 # Primarily north-south
-                if dy > 0:
-                    if "north" not in room1.connections:
-                        room1.connections.append("north")
-                    if "south" not in room2.connections:
-                        room2.connections.append("south")
-                else:
-                    if "south" not in room1.connections:
-                        room1.connections.append("south")
-                    if "north" not in room2.connections:
-                        room2.connections.append("north")
-
-    def _add_vertical_connections(self, rooms: list[RoomTemplate]) -> None:
-        """Add up/down connections between adjacent z-levels."""
-        # Group rooms by z-level
-        by_level: dict[int, list[RoomTemplate]] = {}
-        for room in rooms:
-            z = room.coords[2]
-            if z not in by_level:
-                by_level[z] = []
-            by_level[z].append(room)
-
-        # For each pair of adjacent levels, add stair connections
-        z_levels = sorted(by_level.keys(), reverse=True)
-        for i in range(len(z_levels) - 1):
-            upper_z = z_levels[i]
-            lower_z = z_levels[i + 1]
-
-            upper_rooms = by_level[upper_z]
-            lower_rooms = by_level[lower_z]
+                direction = "north" if dy > 0 else "south"
 
-            if upper_rooms and lower_rooms:
-                # Find closest pair between levels
-                best_pair = None
-                best_dist = float("inf")
+        table.connect(room1, direction)
+        table.connect(room2, OPPOSITE_DIRECTION[direction])
 
-                for ur in upper_rooms:
-                    for lr in lower_rooms:
-                        dist = abs(ur.coords[0] - lr.coords[0]) + abs(
-                            ur.coords[1] - lr.coords[1]
-                        )
-                        if dist < best_dist:
-                            best_dist = dist
-                            best_pair = (ur, lr)
+    def _add_vertical_connections(
+        self, table: RoomTable, levels: list[list[tuple[int, int, int]]]
+    ) -> None:
+        """Add up/down connections between adjacent z-levels.
 
-                if best_pair:
-                    self._add_connection(best_pair[0], best_pair[1])
+        Args:
+            table: Layout being generated
+            levels: (index, x, y) of the rooms of each non-empty level, top level first
+        """
+        # For each pair of adjacent levels, add stair connections
+        for upper_rooms, lower_rooms in zip(levels, levels[1:]):
+            best_pair = self._closest_pair(upper_rooms, lower_rooms)
+            if best_pair:
+                self._add_connection(table, best_pair[0], best_pair[1])
 
-    def _assign_room_types(self, rooms: list[RoomTemplate]) -> None:
+    def _assign_room_types(self, table: RoomTable) -> None:
         """Assign special room types (entry, boss, treasure, puzzle)."""
-        if not rooms:
+        if not len(table):
             return
 
+        xs, ys, zs = table.xs, table.ys, table.zs
+        rooms = range(len(table))
+
         # Find entry room: at max_z level, closest to center
         center_x = (self.min_x + self.max_x) // 2
         center_y = (self.min_y + self.max_y) // 2
 
-        top_level_rooms = [r for r in rooms if r.coords[2] == self.max_z]
+        top_level_rooms = [i for i in rooms if zs[i] == self.max_z]
         if top_level_rooms:
             entry_room = min(
                 top_level_rooms,
-                key=lambda r: abs(r.coords[0] - center_x) + abs(r.coords[1] - center_y),
+                key=lambda i: abs(xs[i] - center_x) + abs(ys[i] - center_y),
             )
-            entry_room.room_type = RoomType.ENTRY
-            entry_room.is_entry = True
+            table.set_room_type(entry_room, RoomType.ENTRY, is_entry=True)
 
         # Find boss room: at min_z level, furthest from entry
-        bottom_level_rooms = [r for r in rooms if r.coords[2] == self.min_z]
+        bottom_level_rooms = [i for i in rooms if zs[i] == self.min_z]
         if bottom_level_rooms and self.min_z < self.max_z:
-            entry_coords = (
-                entry_room.coords if top_level_rooms else (center_x, center_y, self.max_z)
+            entry_x, entry_y = (
+                (xs[entry_room], ys[entry_room]) if top_level_rooms else (center_x, center_y)
             )
             boss_room = max(
                 bottom_level_rooms,
-                key=lambda r: abs(r.coords[0] - entry_coords[0])
-                + abs(r.coords[1] - entry_coords[1]),
+                key=lambda i: abs(xs[i] - entry_x) + abs(ys[i] - entry_y),
             )
-            boss_room.room_type = RoomType.BOSS_ROOM
+            table.set_room_type(boss_room, RoomType.BOSS_ROOM)
         elif bottom_level_rooms and self.min_z == self.max_z:
             # Single level: place boss furthest from entry
             if top_level_rooms:
-                entry_coords = entry_room.coords
-                candidates = [r for r in rooms if r != entry_room]
+                entry_x, entry_y = xs[entry_room], ys[entry_room]
+                candidates = [i for i in rooms if i != entry_room]
                 if candidates:
                     boss_room = max(
                         candidates,
-                        key=lambda r: abs(r.coords[0] - entry_coords[0])
-                        + abs(r.coords[1] - entry_coords[1]),
+                        key=lambda i: abs(xs[i] - entry_x) + abs(ys[i] - entry_y),
                     )
-                    boss_room.room_type = RoomType.BOSS_ROOM
+                    table.set_room_type(boss_room, RoomType.BOSS_ROOM)
 
         # Assign treasure and puzzle rooms to dead ends (1 connection)
-        for room in rooms:
-            if room.room_type in (RoomType.ENTRY, RoomType.BOSS_ROOM):
+        for i in rooms:
+            if table.room_type(i) in (RoomType.ENTRY, RoomType.BOSS_ROOM):
                 continue
-            if len(room.connections) == 1:
+            if table.connection_count(i) == 1:
                 roll = self.rng.random()
                 if roll < 0.3:
-                    room.room_type = RoomType.TREASURE
+                    table.set_room_type(i, RoomType.TREASURE)
                 elif roll < 0.5:
-                    room.room_type = RoomType.PUZZLE
+                    table.set_room_type(i, RoomType.PUZZLE)
 
         # Rooms with 3+ connections become corridors
-        for room in rooms:
-            if room.room_type == RoomType.CHAMBER and len(room.connections) >= 3:
-                room.room_type = RoomType.CORRIDOR
+        for i in rooms:
+            if table.room_type(i) == RoomType.CHAMBER and table.connection_count(i) >= 3:
+                table.set_room_type(i, RoomType.CORRIDOR)
 
 
 class GridSettlementGenerator:
@@ -849,56 +1003,41 @@ class GridSettlementGenerator:
 
     def generate(self) -> list[RoomTemplate]:
         """Generate layout returning list of RoomTemplate blueprints."""
-        rooms: list[RoomTemplate] = []
-        coord_to_room: dict[tuple[int, int, int], RoomTemplate] = {}
+        return self.generate_table().to_templates()
+
+    def generate_table(self) -> RoomTable:
+        """Generate layout as a compact RoomTable."""
+        table = RoomTable()
+        coord_to_room: dict[tuple[int, int, int], int] = {}
 
         # Generate street grid
         street_coords = self._generate_street_grid()
 
         # Create rooms for streets
-        for x, y in street_coords:
-            room = RoomTemplate(
-                coords=(x, y, 0),
-                room_type=RoomType.CORRIDOR,
-                connections=[],
-                is_entry=False,
-            )
-            rooms.append(room)
-            coord_to_room[(x, y, 0)] = room
+        street_rooms = [(x, y, 0) for x, y in street_coords]
+        coord_to_room.update(zip(street_rooms, table.add_rooms(street_rooms, RoomType.CORRIDOR)))
 
         # Add building locations along streets
         building_coords = self._generate_buildings(street_coords)
         for x, y in building_coords:
             if (x, y, 0) not in coord_to_room:
-                room = RoomTemplate(
-                    coords=(x, y, 0),
-                    room_type=RoomType.CHAMBER,
-                    connections=[],
-                    is_entry=False,
-                )
-                rooms.append(room)
-                coord_to_room[(x, y, 0)] = room
+                coord_to_room[(x, y, 0)] = table.add_room((x, y, 0), RoomType.CHAMBER)
 
         # Ensure we have at least an entry room
-        if not rooms:
+        if not len(table):
             center_x = (self.min_x + self.max_x) // 2
             center_y = (self.min_y + self.max_y) // 2
-            entry_room = RoomTemplate(
-                coords=(center_x, center_y, 0),
-                room_type=RoomType.ENTRY,
-                connections=[],
-                is_entry=True,
+            coord_to_room[(center_x, center_y, 0)] = table.add_room(
+                (center_x, center_y, 0), RoomType.ENTRY, is_entry=True
             )
-            rooms.append(entry_room)
-            coord_to_room[(center_x, center_y, 0)] = entry_room
 
         # Add connections based on adjacency
-        self._add_connections(rooms, coord_to_room)
+        self._add_connections(table, coord_to_room)
 
         # Assign entry room (center of settlement)
-        self._assign_entry(rooms)
+        self._assign_entry(table)
 
-        return rooms
+        return table
 
     def _generate_street_grid(self) -> set[tuple[int, int]]:
         """Generate street coordinates as a grid pattern."""
@@ -959,34 +1098,36 @@ class GridSettlementGenerator:
 
     def _add_connections(
         self,
-        rooms: list[RoomTemplate],
-        coord_to_room: dict[tuple[int, int, int], RoomTemplate],
+        table: RoomTable,
+        coord_to_room: dict[tuple[int, int, int], int],
     ) -> None:
         """Add directional connections based on adjacency."""
-        for room in rooms:
-            x, y, z = room.coords
-            for direction in ["north", "south", "east", "west"]:
-                dx, dy, dz = DIRECTION_OFFSETS[direction]
-                neighbor_coord = (x + dx, y + dy, z + dz)
-                if neighbor_coord in coord_to_room:
-                    if direction not in room.connections:
-                        room.connections.append(direction)
+        # Bits follow DIRECTIONS: north=1, south=2, east=4, west=8
+        table.set_link_masks(
+            [
+                ((x, y + 1, z) in coord_to_room)
+                | ((x, y - 1, z) in coord_to_room) << 1
+                | ((x + 1, y, z) in coord_to_room) << 2
+                | ((x - 1, y, z) in coord_to_room) << 3
+                for x, y, z in zip(table.xs, table.ys, table.zs)
+            ]
+        )
 
-    def _assign_entry(self, rooms: list[RoomTemplate]) -> None:
+    def _assign_entry(self, table: RoomTable) -> None:
         """Assign entry room at center of settlement."""
-        if not rooms:
+        if not len(table):
             return
 
         center_x = (self.min_x + self.max_x) // 2
         center_y = (self.min_y + self.max_y) // 2
 
         # Find room closest to center
+        xs, ys = table.xs, table.ys
         entry_room = min(
-            rooms,
-            key=lambda r: abs(r.coords[0] - center_x) + abs(r.coords[1] - center_y),
+            range(len(table)),
+            key=lambda i: abs(xs[i] - center_x) + abs(ys[i] - center_y),
         )
-        entry_room.room_type = RoomType.ENTRY
-        entry_room.is_entry = True
+        table.set_room_type(entry_room, RoomType.ENTRY, is_entry=True)
 
 
 class TowerGenerator:
@@ -1011,14 +1152,18 @@ class TowerGenerator:
         self.min_x, self.max_x, self.min_y, self.max_y, self.min_z, self.max_z = bounds
 
     def generate(self) -> list[RoomTemplate]:
-        """Generate layout returning list of RoomTemplate blueprints.
+        """Generate layout returning list of RoomTemplate blueprints."""
+        return self.generate_table().to_templates()
+
+    def generate_table(self) -> RoomTable:
+        """Generate layout as a compact RoomTable.
 
         Creates one main room per z-level from min_z to max_z.
         Entry at z=min_z (ground), boss at z=max_z (top).
         Optional side rooms on floors (30% chance for treasure).
         """
-        rooms: list[RoomTemplate] = []
-        coord_to_room: dict[tuple[int, int, int], RoomTemplate] = {}
+        table = RoomTable()
+        coord_to_room: dict[tuple[int, int, int], int] = {}
 
         # Center of the tower footprint
         center_x = (self.min_x + self.max_x) // 2
@@ -1026,52 +1171,42 @@ class TowerGenerator:
 
         # Generate rooms for each floor
         for z in range(self.min_z, self.max_z + 1):
-            room = self._create_floor_room(center_x, center_y, z)
-            rooms.append(room)
-            coord_to_room[(center_x, center_y, z)] = room
+            coord_to_room[(center_x, center_y, z)] = self._create_floor_room(
+                table, center_x, center_y, z
+            )
 
             # Add optional side chamber on some floors (not ground or top)
             if z != self.min_z and z != self.max_z:
-                self._add_side_chamber(rooms, coord_to_room, center_x, center_y, z)
+                self._add_side_chamber(table, coord_to_room, center_x, center_y, z)
 
         # Connect floors with up/down stairs
-        self._add_vertical_connections(rooms, coord_to_room)
+        self._add_vertical_connections(table, coord_to_room)
 
-        return rooms
+        return table
 
-    def _create_floor_room(self, x: int, y: int, z: int) -> RoomTemplate:
+    def _create_floor_room(self, table: RoomTable, x: int, y: int, z: int) -> int:
         """Create the main room for a floor.
 
         Args:
+            table: Layout being generated
             x: X coordinate
             y: Y coordinate
             z: Z level (floor number)
 
         Returns:
-            RoomTemplate for this floor
+            Index of the room for this floor
         """
         # Determine room type based on floor level
         if z == self.min_z:
-            room_type = RoomType.ENTRY
-            is_entry = True
-        elif z == self.max_z:
-            room_type = RoomType.BOSS_ROOM
-            is_entry = False
-        else:
-            room_type = RoomType.CHAMBER
-            is_entry = False
-
-        return RoomTemplate(
-            coords=(x, y, z),
-            room_type=room_type,
-            connections=[],
-            is_entry=is_entry,
-        )
+            return table.add_room((x, y, z), RoomType.ENTRY, is_entry=True)
+        if z == self.max_z:
+            return table.add_room((x, y, z), RoomType.BOSS_ROOM)
+        return table.add_room((x, y, z), RoomType.CHAMBER)
 
     def _add_side_chamber(
         self,
-        rooms: list[RoomTemplate],
-        coord_to_room: dict[tuple[int, int, int], RoomTemplate],
+        table: RoomTable,
+        coord_to_room: dict[tuple[int, int, int], int],
         center_x: int,
         center_y: int,
         z: int,
@@ -1093,55 +1228,37 @@ class TowerGenerator:
             if self.min_x <= nx <= self.max_x and self.min_y <= ny <= self.max_y:
                 coord = (nx, ny, z)
                 if coord not in coord_to_room:
-                    side_room = RoomTemplate(
-                        coords=coord,
-                        room_type=RoomType.TREASURE,
-                        connections=[],
-                        is_entry=False,
-                    )
-                    rooms.append(side_room)
+                    side_room = table.add_room(coord, RoomType.TREASURE)
                     coord_to_room[coord] = side_room
 
                     # Connect side room to main room
                     main_room = coord_to_room[(center_x, center_y, z)]
-                    self._connect_adjacent_rooms(main_room, side_room)
+                    self._connect_adjacent_rooms(table, main_room, side_room)
                     return
 
-    def _connect_adjacent_rooms(
-        self, room1: RoomTemplate, room2: RoomTemplate
-    ) -> None:
+    def _connect_adjacent_rooms(self, table: RoomTable, room1: int, room2: int) -> None:
         """Connect two horizontally adjacent rooms."""
-        x1, y1, z1 = room1.coords
-        x2, y2, z2 = room2.coords
-
-        dx = x2 - x1
-        dy = y2 - y1
+        dx = table.xs[room2] - table.xs[room1]
+        dy = table.ys[room2] - table.ys[room1]
 
         if dx == 1:
-            if "east" not in room1.connections:
-                room1.connections.append("east")
-            if "west" not in room2.connections:
-                room2.connections.append("west")
+            direction = "east"
         elif dx == -1:
-            if "west" not in room1.connections:
-                room1.connections.append("west")
-            if "east" not in room2.connections:
-                room2.connections.append("east")
+            direction = "west"
         elif dy == 1:
-            if "north" not in room1.connections:
-                room1.connections.append("north")
-            if "south" not in room2.connections:
-                room2.connections.append("south")
+            direction = "north"
         elif dy == -1:
-            if "south" not in room1.connections:
-                room1.connections.append("south")
-            if "north" not in room2.connections:
-                room2.connections.append("north")
+            direction = "south"
+        else:
+            return
+
+        table.connect(room1, direction)
+        table.connect(room2, OPPOSITE_DIRECTION[direction])
 
     def _add_vertical_connections(
         self,
-        rooms: list[RoomTemplate],
-        coord_to_room: dict[tuple[int, int, int], RoomTemplate],
+        table: RoomTable,
+        coord_to_room: dict[tuple[int, int, int], int],
     ) -> None:
         """Add up/down connections between floors.
 
@@ -1158,16 +1275,12 @@ class TowerGenerator:
             room = coord_to_room[coord]
 
             # Connect up if there's a floor above
-            above_coord = (center_x, center_y, z + 1)
-            if above_coord in coord_to_room and z < self.max_z:
-                if "up" not in room.connections:
-                    room.connections.append("up")
+            if (center_x, center_y, z + 1) in coord_to_room and z < self.max_z:
+                table.connect(room, "up")
 
             # Connect down if there's a floor below
-            below_coord = (center_x, center_y, z - 1)
-            if below_coord in coord_to_room and z > self.min_z:
-                if "down" not in room.connections:
-                    room.connections.append("down")
+            if (center_x, center_y, z - 1) in coord_to_room and z > self.min_z:
+                table.connect(room, "down")
 
 
 # Maps location categories to generator types.
@@ -1204,6 +1317,39 @@ CATEGORY_GENERATORS: dict[str, str] = {
 }
 
 
+@dataclass(frozen=True)
+class LayoutRequest:
+    """One layout to generate with generate_interior_layouts.
+
+    Attributes:
+        category: Location category (e.g., "dungeon", "tower").
+        bounds: 6-tuple (min_x, max_x, min_y, max_y, min_z, max_z).
+        seed: Random seed for deterministic generation.
+    """
+
+    category: str
+    bounds: tuple
+    seed: int
+
+
+# Generator classes by CATEGORY_GENERATORS name (others use the fallback layout)
+_GENERATOR_CLASSES: dict[str, type] = {
+    "BSPGenerator": BSPGenerator,
+    "CellularAutomataGenerator": CellularAutomataGenerator,
+    "GridSettlementGenerator": GridSettlementGenerator,
+    "TowerGenerator": TowerGenerator,
+}
+
+
+def _make_generator(category: str, bounds: tuple, seed: int) -> Optional[GeneratorProtocol]:
+    """Create the generator for a category, or None if it has no generator yet."""
+    generator_type = CATEGORY_GENERATORS.get(category, "BSPGenerator")
+    generator_class = _GENERATOR_CLASSES.get(generator_type)
+    if generator_class is None:
+        return None
+    return generator_class(bounds=bounds, seed=seed)
+
+
 def generate_interior_layout(
     category: str, bounds: tuple, seed: int
 ) -> list[RoomTemplate]:
@@ -1221,30 +1367,36 @@ def generate_interior_layout(
     Returns:
         List of RoomTemplate blueprints for the layout.
     """
-    generator_type = CATEGORY_GENERATORS.get(category, "BSPGenerator")
+    generator = _make_generator(category, bounds, seed)
+    if generator is None:
+        # Fallback for other generator types (not yet implemented)
+        return _generate_fallback_layout(bounds, seed)
+    return generator.generate()
 
-    # Use BSPGenerator for dungeon-type locations
-    if generator_type == "BSPGenerator":
-        generator = BSPGenerator(bounds=bounds, seed=seed)
-        return generator.generate()
 
-    # Use CellularAutomataGenerator for cave-type locations
-    if generator_type == "CellularAutomataGenerator":
-        generator = CellularAutomataGenerator(bounds=bounds, seed=seed)
-        return generator.generate()
+def generate_interior_layouts(requests: Iterable[LayoutRequest]) -> list[RoomTable]:
+    """Generate many interior layouts as compact RoomTables.
 
-    # Use GridSettlementGenerator for settlement-type locations
-    if generator_type == "GridSettlementGenerator":
-        generator = GridSettlementGenerator(bounds=bounds, seed=seed)
-        return generator.generate()
+    Each table holds the same layout generate_interior_layout returns for
+    the same category, bounds and seed (table.to_templates() gives identical
+    blueprints), without building a RoomTemplate per room.
 
-    # Use TowerGenerator for tower-type locations
-    if generator_type == "TowerGenerator":
-        generator = TowerGenerator(bounds=bounds, seed=seed)
-        return generator.generate()
+    Args:
+        requests: Layouts to generate
 
-    # Fallback for other generator types (not yet implemented)
-    return _generate_fallback_layout(bounds, seed)
+    Returns:
+        One RoomTable per request, in request order.
+    """
+    tables: list[RoomTable] = []
+    for request in requests:
+        generator = _make_generator(request.category, request.bounds, request.seed)
+        if generator is None:
+            tables.append(
+                RoomTable.from_templates(_generate_fallback_layout(request.bounds, request.seed))
+            )
+        else:
+            tables.append(generator.generate_table())
+    return tables
 
 
 def _generate_fallback_layout(bounds: tuple, seed: int) -> list[RoomTemplate]:
@@ -24,6 +24,13 @@ GENERATION_MESSAGES = {
         "Mapping the unknown...",
         "Unearthing forgotten ruins...",
     ],
+    "room": [
+        "Exploring hidden chambers...",
+        "Mapping the corridors...",
+        "Lighting the halls...",
+        "Opening sealed doors...",
+        "Tracing the passages...",
+    ],
     "npc": [
         "Summoning wanderers...",
         "Awakening souls...",
@@ -52,6 +59,20 @@ GENERATION_MESSAGES = {
         "Charting the wilderness...",
         "Discovering new regions...",
     ],
+    "world_context": [
+        "Shaping the world...",
+        "Setting the tone of the realm...",
+        "Recalling the age of legends...",
+        "Weaving the world's essence...",
+        "Dreaming up a realm...",
+    ],
+    "region_context": [
+        "Surveying the region...",
+        "Naming the lands...",
+        "Charting the frontier...",
+        "Reading the landscape...",
+        "Marking landmarks...",
+    ],
     "item": [
         "Forging treasures...",
         "Crafting artifacts...",
@@ -146,6 +167,10 @@ class ProgressIndicator:
             if not effects_enabled():
                 return
 
+            # Don't draw over the input prompt from background generation threads
+            if threading.current_thread() is not threading.main_thread():
+                return
+
             self._running = True
             self._thread = threading.Thread(target=self._spin, daemon=True)
             self._thread.start()
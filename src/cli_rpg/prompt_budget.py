@@ -0,0 +1,319 @@
+"""Prompt-size budgeting for AI generation prompts.
+
+Layered generation prompts embed WorldContext/RegionContext fields, neighbor
+lists and NPC conversation history, all of which grow over a session. This
+module provides PromptBudget, which AIService uses to:
+- measure prompt size (estimated tokens) per generation type
+- enforce per-type token budgets by trimming or summarizing the variable parts
+  of a prompt (context fields, name lists, conversation history)
+- cache the compressed world/region context per region, so it is not rebuilt
+  for every location generated in that region
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+from cli_rpg.ai_metrics import CHARS_PER_TOKEN
+
+if TYPE_CHECKING:
+    from cli_rpg.models.region_context import RegionContext  # pragma: no cover
+    from cli_rpg.models.world_context import WorldContext  # pragma: no cover
+
+# Default per-generation-type prompt budgets in estimated tokens. Types without
+# an entry are measured but never trimmed.
+DEFAULT_PROMPT_TOKEN_BUDGETS: dict[str, int] = {
+    "location": 500,
+    "area": 900,
+    "npc": 600,
+}
+
+# Character limits for context fields embedded in prompts (at compression level 0;
+# each further level halves them)
+CONTEXT_FIELD_LIMITS: dict[str, int] = {
+    "theme_essence": 200,
+    "region_name": 50,
+    "region_theme": 200,
+}
+
+# Number of most recent conversation lines always kept verbatim when possible
+RECENT_HISTORY_LINES = 4
+
+# Maximum characters kept from each older conversation line in the summary
+SUMMARY_LINE_CHARS = 60
+
+# Smallest history allowance; the latest exchange is kept even when the rest
+# of the prompt already fills the budget
+MIN_HISTORY_TOKENS = 32
+
+# Maximum compression level for context fields
+MAX_COMPRESSION_LEVEL = 2
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count (~4 characters per token)
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def shorten(text: str, max_chars: int) -> str:
+    """Shorten text to at most max_chars, cutting at a word boundary.
+
+    Args:
+        text: Text to shorten
+        max_chars: Maximum length of the result (including the ellipsis)
+
+    Returns:
+        Original text if short enough, otherwise a truncated copy ending in "..."
+    """
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= 3:
+        return text[:max_chars]
+    cut = text[:max_chars - 3]
+    space = cut.rfind(" ")
+    if space > max_chars // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:.") + "..."
+
+
+@dataclass(frozen=True)
+class CompressedContext:
+    """World and region context fields sized for embedding in prompts.
+
+    Attributes:
+        theme: World theme keyword
+        theme_essence: Shortened world theme essence
+        region_name: Shortened region name
+        region_theme: Shortened region theme
+    """
+
+    theme: str
+    theme_essence: str
+    region_name: str
+    region_theme: str
+
+
+@dataclass
+class PromptSizeStats:
+    """Prompt size measurements for one generation type.
+
+    Attributes:
+        prompts: Number of prompts measured
+        total_tokens: Sum of estimated prompt tokens
+        max_tokens: Largest estimated prompt
+        trimmed: Prompts whose variable parts were trimmed to fit the budget
+        over_budget: Prompts still over budget after trimming
+    """
+
+    prompts: int = 0
+    total_tokens: int = 0
+    max_tokens: int = 0
+    trimmed: int = 0
+    over_budget: int = 0
+
+
+class PromptBudget:
+    """Per-generation-type prompt budgets with a per-region context cache.
+
+    Attributes:
+        budgets: Token budget per generation type
+    """
+
+    def __init__(self, budgets: Optional[dict[str, int]] = None):
+        """Initialize the budgeter.
+
+        Args:
+            budgets: Token budget per generation type (defaults to
+                DEFAULT_PROMPT_TOKEN_BUDGETS)
+        """
+        self.budgets = dict(DEFAULT_PROMPT_TOKEN_BUDGETS if budgets is None else budgets)
+        self._lock = threading.Lock()
+        self._stats: dict[str, PromptSizeStats] = {}
+        # (theme, region name, coordinates, level) -> (source fields, compressed context)
+        self._context_cache: dict[tuple, tuple[tuple[str, ...], CompressedContext]] = {}
+
+    def budget_for(self, generation_type: str) -> Optional[int]:
+        """Return the token budget for a generation type, or None if unbudgeted."""
+        return self.budgets.get(generation_type)
+
+    def over_budget(self, generation_type: str, prompt: str) -> bool:
+        """Check whether a prompt exceeds its generation type's budget.
+
+        Args:
+            generation_type: Type of content being generated
+            prompt: Prompt text
+
+        Returns:
+            True if a budget is set and the prompt exceeds it
+        """
+        budget = self.budget_for(generation_type)
+        return budget is not None and estimate_tokens(prompt) > budget
+
+    def measure(self, generation_type: str, prompt: str, trimmed: bool = False) -> int:
+        """Record the size of a final prompt.
+
+        Args:
+            generation_type: Type of content being generated
+            prompt: Final prompt text
+            trimmed: Whether the prompt's variable parts were trimmed
+
+        Returns:
+            Estimated prompt tokens
+        """
+        tokens = estimate_tokens(prompt)
+        with self._lock:
+            stats = self._stats.setdefault(generation_type, PromptSizeStats())
+            stats.prompts += 1
+            stats.total_tokens += tokens
+            stats.max_tokens = max(stats.max_tokens, tokens)
+            if trimmed:
+                stats.trimmed += 1
+            if self.over_budget(generation_type, prompt):
+                stats.over_budget += 1
+        return tokens
+
+    def get_stats(self, generation_type: str) -> PromptSizeStats:
+        """Return a copy of the prompt size stats for a generation type."""
+        with self._lock:
+            stats = self._stats.get(generation_type, PromptSizeStats())
+            return PromptSizeStats(**stats.__dict__)
+
+    def compress_context(
+        self,
+        world_context: "WorldContext",
+        region_context: "RegionContext",
+        level: int = 0,
+    ) -> CompressedContext:
+        """Return prompt-sized context fields for a region, using the cache.
+
+        The compressed context is cached per (theme, region, level) and reused
+        while the source fields are unchanged.
+
+        Args:
+            world_context: Layer 1 world context
+            region_context: Layer 2 region context
+            level: Compression level; each level halves the field limits
+
+        Returns:
+            CompressedContext for embedding in prompts
+        """
+        source = (
+            world_context.theme,
+            world_context.theme_essence,
+            region_context.name,
+            region_context.theme,
+        )
+        key = (world_context.theme, region_context.name, region_context.coordinates, level)
+        with self._lock:
+            cached = self._context_cache.get(key)
+            if cached is not None and cached[0] == source:
+                return cached[1]
+
+        divisor = 2 ** level
+        compressed = CompressedContext(
+            theme=world_context.theme,
+            theme_essence=shorten(
+                world_context.theme_essence, CONTEXT_FIELD_LIMITS["theme_essence"] // divisor
+            ),
+            region_name=shorten(region_context.name, CONTEXT_FIELD_LIMITS["region_name"]),
+            region_theme=shorten(
+                region_context.theme, CONTEXT_FIELD_LIMITS["region_theme"] // divisor
+            ),
+        )
+        with self._lock:
+            self._context_cache[key] = (source, compressed)
+        return compressed
+
+    def fit_items(self, items: list[str], max_tokens: int, separator: str = ", ") -> list[str]:
+        """Keep the leading items of a list that fit in a token allowance.
+
+        Args:
+            items: Items in priority order
+            max_tokens: Token allowance for the joined items
+            separator: Separator used when the items are joined
+
+        Returns:
+            Leading items whose joined text fits (always at least one item if any)
+        """
+        kept: list[str] = []
+        for item in items:
+            candidate = separator.join(kept + [item])
+            if kept and estimate_tokens(candidate) > max_tokens:
+                break
+            kept.append(item)
+        return kept
+
+    def fit_history(self, lines: list[str], max_tokens: int) -> str:
+        """Fit conversation history lines into a token allowance.
+
+        The most recent lines are kept verbatim; older lines are condensed into
+        a one-line summary, which is dropped (with an omission note) if even the
+        summary does not fit. The allowance is raised to MIN_HISTORY_TOKENS, so
+        the last line always survives (shortened if it alone is too long).
+
+        Args:
+            lines: Formatted history lines, oldest first
+            max_tokens: Token allowance for the history block (may be zero or
+                negative when the rest of the prompt is over budget)
+
+        Returns:
+            History text that fits the allowance where possible
+        """
+        max_tokens = max(max_tokens, MIN_HISTORY_TOKENS)
+        text = "\n".join(lines)
+        if estimate_tokens(text) <= max_tokens:
+            return text
+
+        # Keep as many recent lines verbatim as fit (up to RECENT_HISTORY_LINES),
+        # leaving room for at least the omission note about older lines
+        reserve = 0
+        if len(lines) > 1:
+            reserve = estimate_tokens(f"({len(lines)} earlier lines omitted)") + 1
+        recent_tokens = max_tokens - reserve
+        recent: list[str] = []
+        for line in reversed(lines[-RECENT_HISTORY_LINES:]):
+            candidate = "\n".join([line] + recent)
+            if recent and estimate_tokens(candidate) > recent_tokens:
+                break
+            recent.insert(0, line)
+        if estimate_tokens("\n".join(recent)) > recent_tokens:
+            # A single very long line - shorten it to the allowance
+            recent = [shorten(recent[-1], recent_tokens * CHARS_PER_TOKEN)]
+
+        older = lines[:len(lines) - len(recent)]
+        if not older:
+            return "\n".join(recent)
+
+        remaining = max_tokens - estimate_tokens("\n".join(recent)) - 1
+        summary = "(Earlier: " + " / ".join(
+            shorten(line, SUMMARY_LINE_CHARS) for line in older
+        ) + ")"
+        if estimate_tokens(summary) > remaining:
+            summary = shorten(summary, remaining * CHARS_PER_TOKEN)
+            if remaining * CHARS_PER_TOKEN < SUMMARY_LINE_CHARS:
+                summary = f"({len(older)} earlier lines omitted)"
+        return "\n".join([summary] + recent)
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Return prompt size stats for all generation types.
+
+        Returns:
+            Mapping of generation type to stats dictionary (including budget)
+        """
+        with self._lock:
+            return {
+                name: {**stats.__dict__, "budget": self.budgets.get(name, 0)}
+                for name, stats in sorted(self._stats.items())
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all cached compressed contexts."""
+        with self._lock:
+            self._context_cache.clear()
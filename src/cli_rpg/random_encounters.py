@@ -12,6 +12,7 @@ from cli_rpg.models.npc import NPC
 from cli_rpg.models.shop import Shop, ShopItem
 from cli_rpg.models.item import Item, ItemType
 from cli_rpg.combat import spawn_enemy, CombatEncounter
+from cli_rpg.session_rng import ENCOUNTERS, session_stream
 from cli_rpg.encounter_tables import get_encounter_rate, get_merchant_items, get_undead_night_modifier
 from cli_rpg import colors
 
@@ -29,13 +30,16 @@ ENCOUNTER_WEIGHTS = {
 }
 
 
-def _select_encounter_type() -> str:
+def _select_encounter_type(rng: Optional[random.Random] = None) -> str:
     """Select encounter type based on weights.
 
+    Args:
+        rng: Optional random.Random for the roll (defaults to global random)
+
     Returns:
         Encounter type: "hostile", "merchant", or "wanderer"
     """
-    roll = random.random()
+    roll = (rng or random).random()
     cumulative = 0.0
 
     for encounter_type, weight in ENCOUNTER_WEIGHTS.items():
@@ -47,15 +51,18 @@ def _select_encounter_type() -> str:
     return "hostile"
 
 
-def spawn_wandering_merchant(level: int) -> NPC:
+def spawn_wandering_merchant(level: int, rng: Optional[random.Random] = None) -> NPC:
     """Create a wandering merchant NPC with random wares.
 
     Args:
         level: Player level for scaling shop items
+        rng: Optional random.Random for the rolls (defaults to global random)
 
     Returns:
         NPC with is_merchant=True and a shop with 2-3 items
     """
+    source = rng or random
+
     merchant_names = [
         "Traveling Peddler",
         "Mysterious Trader",
@@ -70,15 +77,15 @@ def spawn_wandering_merchant(level: int) -> NPC:
         "A shrewd-looking trader with jingling pockets",
     ]
 
-    name = random.choice(merchant_names)
-    description = random.choice(merchant_descriptions)
+    name = source.choice(merchant_names)
+    description = source.choice(merchant_descriptions)
 
     # Generate 2-3 random items for the shop
-    num_items = random.randint(2, 3)
+    num_items = source.randint(2, 3)
     shop_items = []
 
     for _ in range(num_items):
-        item, price = _generate_shop_item(level)
+        item, price = _generate_shop_item(level, rng)
         shop_items.append(ShopItem(item=item, buy_price=price))
 
     shop = Shop(name=f"{name}'s Wares", inventory=shop_items)
@@ -97,23 +104,26 @@ def spawn_wandering_merchant(level: int) -> NPC:
     )
 
 
-def _generate_shop_item(level: int) -> tuple[Item, int]:
+def _generate_shop_item(level: int, rng: Optional[random.Random] = None) -> tuple[Item, int]:
     """Generate a random item for a wandering merchant's shop.
 
     Args:
         level: Player level for scaling
+        rng: Optional random.Random for the rolls (defaults to global random)
 
     Returns:
         Tuple of (Item, buy_price)
     """
-    item_type = random.choice([ItemType.WEAPON, ItemType.ARMOR, ItemType.CONSUMABLE])
+    source = rng or random
+
+    item_type = source.choice([ItemType.WEAPON, ItemType.ARMOR, ItemType.CONSUMABLE])
 
     if item_type == ItemType.WEAPON:
         prefixes = ["Sturdy", "Sharp", "Fine", "Tempered"]
         names = ["Blade", "Dagger", "Mace", "Staff"]
-        prefix = random.choice(prefixes)
-        name = random.choice(names)
-        damage_bonus = max(1, level + random.randint(0, 2))
+        prefix = source.choice(prefixes)
+        name = source.choice(names)
+        damage_bonus = max(1, level + source.randint(0, 2))
         price = 20 + (level * 10) + (damage_bonus * 5)
         return Item(
             name=f"{prefix} {name}",
@@ -125,9 +135,9 @@ def _generate_shop_item(level: int) -> tuple[Item, int]:
     elif item_type == ItemType.ARMOR:
         prefixes = ["Padded", "Leather", "Chain", "Reinforced"]
         names = ["Vest", "Guard", "Helm", "Gloves"]
-        prefix = random.choice(prefixes)
-        name = random.choice(names)
-        defense_bonus = max(1, level + random.randint(0, 1))
+        prefix = source.choice(prefixes)
+        name = source.choice(names)
+        defense_bonus = max(1, level + source.randint(0, 1))
         price = 15 + (level * 8) + (defense_bonus * 5)
         return Item(
             name=f"{prefix} {name}",
@@ -137,13 +147,13 @@ def _generate_shop_item(level: int) -> tuple[Item, int]:
         ), price
 
     else:  # CONSUMABLE
-        heal_amount = 20 + (level * 5) + random.randint(0, 10)
+        heal_amount = 20 + (level * 5) + source.randint(0, 10)
         potions = [
             ("Health Potion", "A bubbling red potion"),
             ("Healing Tonic", "An herbal remedy"),
             ("Restoration Brew", "A powerful healing drink"),
         ]
-        name, desc = random.choice(potions)
+        name, desc = source.choice(potions)
         price = 10 + heal_amount // 2
         return Item(
             name=name,
@@ -153,15 +163,18 @@ def _generate_shop_item(level: int) -> tuple[Item, int]:
         ), price
 
 
-def spawn_wanderer(theme: str) -> NPC:
+def spawn_wanderer(theme: str, rng: Optional[random.Random] = None) -> NPC:
     """Create a neutral wanderer NPC with atmospheric dialogue.
 
     Args:
         theme: World theme for flavor (e.g., "fantasy", "dark")
+        rng: Optional random.Random for the rolls (defaults to global random)
 
     Returns:
         NPC with lore/hints dialogue
     """
+    source = rng or random
+
     wanderer_types = [
         {
             "name": "Weary Traveler",
@@ -201,8 +214,8 @@ def spawn_wanderer(theme: str) -> NPC:
         },
     ]
 
-    wanderer = random.choice(wanderer_types)
-    dialogue = random.choice(wanderer["dialogues"])
+    wanderer = source.choice(wanderer_types)
+    dialogue = source.choice(wanderer["dialogues"])
 
     return NPC(
         name=wanderer["name"],
@@ -231,6 +244,8 @@ def check_for_random_encounter(game_state: "GameState") -> Optional[str]:
     if game_state.is_in_combat():
         return None
 
+    rng = session_stream(game_state, ENCOUNTERS)
+
     # Don't trigger in safe zones (towns, villages, etc.)
     location = game_state.get_current_location()
     if location.is_safe_zone:
@@ -243,7 +258,7 @@ def check_for_random_encounter(game_state: "GameState") -> Optional[str]:
         success_chance = calculate_sneak_success_chance(game_state.current_character)
         game_state.is_sneaking = False  # Clear after check (consumed on move)
 
-        if random.random() * 100 < success_chance:
+        if rng.random() * 100 < success_chance:
             # Successfully avoided potential encounter
             return None
         # Sneak failed - continue with normal encounter check
@@ -262,11 +277,11 @@ def check_for_random_encounter(game_state: "GameState") -> Optional[str]:
         modifier = get_encounter_modifier_at_location(game_state.current_sub_grid, location.coordinates)
         encounter_rate *= modifier
 
-    if random.random() > encounter_rate:
+    if rng.random() > encounter_rate:
         return None
 
     # Select encounter type
-    encounter_type = _select_encounter_type()
+    encounter_type = _select_encounter_type(rng)
     location = game_state.get_current_location()
 
     if encounter_type == "hostile":
@@ -291,6 +306,10 @@ def _handle_hostile_encounter(game_state: "GameState") -> str:
     location = game_state.get_current_location()
     level = game_state.current_character.level
 
+    # Seeded sessions draw the spawn from the encounter stream
+    rng = session_stream(game_state, ENCOUNTERS, default=None)
+    seeded = {"rng": rng} if rng is not None else {}
+
     # Spawn enemy using existing system
     # Priority: terrain (WFC-generated) > category (semantic) > name matching
     # Issue 27: Pass is_night for undead stat bonus
@@ -300,6 +319,7 @@ def _handle_hostile_encounter(game_state: "GameState") -> str:
         location_category=location.category,
         terrain_type=location.terrain,
         is_night=game_state.game_time.is_night(),
+        **seeded,
     )
 
     # Create combat encounter
@@ -333,7 +353,7 @@ def _handle_merchant_encounter(game_state: "GameState") -> str:
         Formatted encounter message
     """
     level = game_state.current_character.level
-    merchant = spawn_wandering_merchant(level)
+    merchant = spawn_wandering_merchant(level, session_stream(game_state, ENCOUNTERS))
 
     # Add merchant to current location
     location = game_state.get_current_location()
@@ -357,7 +377,7 @@ def _handle_wanderer_encounter(game_state: "GameState") -> str:
     Returns:
         Formatted encounter message
     """
-    wanderer = spawn_wanderer(game_state.theme)
+    wanderer = spawn_wanderer(game_state.theme, session_stream(game_state, ENCOUNTERS))
 
     # Add wanderer to current location
     location = game_state.get_current_location()
@@ -8,6 +8,7 @@ from typing import Optional, TYPE_CHECKING
 
 from cli_rpg.models.world_event import WorldEvent
 from cli_rpg import colors
+from cli_rpg.world_events import get_active_events
 
 if TYPE_CHECKING:
     from cli_rpg.game_state import GameState
@@ -120,10 +121,8 @@ def _get_active_festival_id(game_state: "GameState") -> Optional[str]:
     Returns:
         Festival ID string if a festival is active, None otherwise
     """
-    for event in game_state.world_events:
-        if event.is_active and event.event_type == "festival":
-            return event.event_id
-    return None
+    festival = get_active_festival(game_state)
+    return festival.event_id if festival is not None else None
 
 
 def check_for_festival(game_state: "GameState") -> Optional[str]:
@@ -205,8 +204,8 @@ def get_active_festival(game_state: "GameState") -> Optional[WorldEvent]:
     Returns:
         Active festival WorldEvent, or None if no festival is active
     """
-    for event in game_state.world_events:
-        if event.is_active and event.event_type == "festival":
+    for event in get_active_events(game_state):
+        if event.event_type == "festival":
             return event
     return None
 
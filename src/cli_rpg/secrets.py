@@ -6,6 +6,7 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 from cli_rpg.models.character import Character
 from cli_rpg.models.item import Item, ItemType
 from cli_rpg.models.location import Location
+from cli_rpg.session_rng import LOOT, session_stream
 
 if TYPE_CHECKING:
     from cli_rpg.world_grid import SubGrid
@@ -59,6 +60,7 @@ def generate_hidden_room(
     sub_grid: "SubGrid",
     direction: str,
     parent_category: Optional[str] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[Location]:
     """Generate a hidden room in the SubGrid at an empty adjacent coordinate.
 
@@ -67,6 +69,7 @@ def generate_hidden_room(
         sub_grid: The SubGrid to add the room to
         direction: Direction the hidden door leads (north, south, east, west, up, down)
         parent_category: Category of parent location for theming
+        rng: Optional random.Random for room and treasure rolls (defaults to global random)
 
     Returns:
         The new Location if created, None if no valid position found
@@ -100,7 +103,8 @@ def generate_hidden_room(
     templates = HIDDEN_ROOM_TEMPLATES.get(category_key, HIDDEN_ROOM_TEMPLATES["default"])
 
     # Pick a random template
-    name, description = random.choice(templates)
+    source = rng or random
+    name, description = source.choice(templates)
 
     # Create the hidden room
     hidden_room = Location(
@@ -113,13 +117,13 @@ def generate_hidden_room(
     sub_grid.add_location(hidden_room, target_x, target_y, target_z)
 
     # 50% chance to add treasure
-    if random.random() < 0.5:
+    if source.random() < 0.5:
         hidden_room.hidden_secrets.append({
             "type": SecretType.HIDDEN_TREASURE.value,
             "description": "A cache left by whoever built this secret room.",
             "threshold": 8,  # Easy to find once you're in
             "discovered": False,
-            "reward_gold": random.randint(20, 50),
+            "reward_gold": source.randint(20, 50),
         })
 
     return hidden_room
@@ -210,7 +214,9 @@ def perform_active_search(
     messages = []
     for secret in found:
         desc = secret["description"]
-        success, reward_msg = apply_secret_rewards(char, location, secret, sub_grid)
+        success, reward_msg = apply_secret_rewards(
+            char, location, secret, sub_grid, rng=session_stream(game_state, LOOT)
+        )
         if reward_msg:
             messages.append(f"{desc} - {reward_msg}")
         else:
@@ -232,6 +238,7 @@ def apply_secret_rewards(
     location: Location,
     secret: dict,
     sub_grid: Optional["SubGrid"] = None,
+    rng: Optional[random.Random] = None,
 ) -> Tuple[bool, str]:
     """Apply rewards/effects for a discovered secret.
 
@@ -240,6 +247,7 @@ def apply_secret_rewards(
         location: Current location
         secret: The secret dict with type, description, etc.
         sub_grid: Optional SubGrid for creating hidden rooms when hidden_door found
+        rng: Optional random.Random for hidden room generation (defaults to global random)
 
     Returns:
         (success, message) describing what happened
@@ -258,7 +266,7 @@ def apply_secret_rewards(
     elif secret_type == SecretType.LORE_HINT.value:
         messages.append(_apply_lore_reward(char, secret))
     elif secret_type == SecretType.HIDDEN_DOOR.value:
-        messages.append(_apply_hidden_door(location, secret, sub_grid))
+        messages.append(_apply_hidden_door(location, secret, sub_grid, rng))
 
     # Mark reward as applied so it won't be re-applied
     secret["reward_applied"] = True
@@ -398,6 +406,7 @@ def _apply_hidden_door(
     location: Location,
     secret: dict,
     sub_grid: Optional["SubGrid"] = None,
+    rng: Optional[random.Random] = None,
 ) -> str:
     """Reveal a hidden exit direction and create a room if in SubGrid.
 
@@ -405,6 +414,7 @@ def _apply_hidden_door(
         location: Current location
         secret: The secret dict with exit_direction
         sub_grid: Optional SubGrid for creating the hidden room
+        rng: Optional random.Random for hidden room generation (defaults to global random)
 
     Returns:
         Message describing what happened
@@ -414,7 +424,7 @@ def _apply_hidden_door(
     # Try to generate actual hidden room in SubGrid
     if sub_grid is not None:
         hidden_room = generate_hidden_room(
-            location, sub_grid, exit_direction, location.category
+            location, sub_grid, exit_direction, location.category, rng=rng
         )
         if hidden_room is not None:
             return f"A hidden passage to the {exit_direction} reveals {hidden_room.name}!"
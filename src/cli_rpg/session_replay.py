@@ -5,11 +5,24 @@ This enables:
 1. Deterministic replay using the original RNG seed
 2. Validation that game responses match (for debugging regressions)
 3. Option to continue interactively from any point in the log
+4. Fast-forward to command N from the nearest logged GameState snapshot
+
+Snapshots are written to files next to the log (see GameplayLogger.log_snapshot)
+and referenced from "snapshot" entries; build_log_index reads seed, commands,
+states and snapshot pointers in a single pass over the log.
 """
+import bisect
 import json
-from dataclasses import dataclass
+import random
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Optional, Any
+from typing import Iterator, Optional, Any, TYPE_CHECKING
+
+from cli_rpg.logging_service import log_segments, open_log_segment
+
+if TYPE_CHECKING:
+    from cli_rpg.ai_service import AIService
+    from cli_rpg.game_state import GameState
 
 
 @dataclass
@@ -23,23 +36,54 @@ class LogEntry:
 def parse_log_file(log_path: str) -> Iterator[LogEntry]:
     """Parse a JSON Lines log file into LogEntry objects.
 
+    Rotated, compressed segments of the log are read first, in order.
+
     Args:
         log_path: Path to the log file
 
     Yields:
         LogEntry for each line in the log
+
+    Raises:
+        FileNotFoundError: If the log file does not exist
+    """
+    segments = log_segments(log_path)
+    if not segments:
+        raise FileNotFoundError(log_path)
+    for segment in segments:
+        with open_log_segment(segment) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                yield LogEntry(
+                    timestamp=entry.get("timestamp", ""),
+                    entry_type=entry.get("type", ""),
+                    data=entry
+                )
+
+
+def load_ai_payload(log_path: str, entry: LogEntry) -> dict[str, Any]:
+    """Return an ai_content entry's content and raw_response.
+
+    Large payloads are stored in the log's sidecar directory and referenced
+    by a "payload" field; small payloads are inline.
+
+    Args:
+        log_path: Path to the log file the entry was read from
+        entry: An ai_content LogEntry
+
+    Returns:
+        Dictionary with "content" and, if logged, "raw_response"
     """
-    with open(log_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            entry = json.loads(line)
-            yield LogEntry(
-                timestamp=entry.get("timestamp", ""),
-                entry_type=entry.get("type", ""),
-                data=entry
-            )
+    reference = entry.data.get("payload")
+    if reference is None:
+        return {
+            key: entry.data[key] for key in ("content", "raw_response") if key in entry.data
+        }
+    with open(Path(log_path).parent / reference, encoding="utf-8") as f:
+        return json.load(f)
 
 
 def extract_seed(log_path: str) -> Optional[int]:
@@ -128,3 +172,148 @@ def validate_state(expected: StateSnapshot, actual_state: dict) -> list[str]:
     if expected.level != actual_state.get("level"):
         diffs.append(f"level: expected {expected.level}, got {actual_state.get('level')}")
     return diffs
+
+
+def _state_from_entry(data: dict[str, Any]) -> StateSnapshot:
+    """Build a StateSnapshot from a "state" log entry."""
+    return StateSnapshot(
+        location=data.get("location", ""),
+        health=data.get("health", 0),
+        max_health=data.get("max_health", 0),
+        gold=data.get("gold", 0),
+        level=data.get("level", 1)
+    )
+
+
+@dataclass
+class SnapshotRef:
+    """Pointer to a GameState snapshot file referenced from the log.
+
+    Attributes:
+        command_index: Number of commands executed before the snapshot
+        path: Snapshot file path (resolved against the log's directory)
+    """
+    command_index: int
+    path: str
+
+
+@dataclass
+class LogIndex:
+    """Everything replay needs from a log, read in a single pass.
+
+    Attributes:
+        seed: RNG seed from session_start (None if absent)
+        commands: Command inputs in log order
+        states: State snapshots keyed by the number of commands executed
+            before they were logged (0 = initial state)
+        snapshots: Snapshot pointers in command order
+    """
+    seed: Optional[int] = None
+    commands: list[str] = field(default_factory=list)
+    states: dict[int, StateSnapshot] = field(default_factory=dict)
+    snapshots: list[SnapshotRef] = field(default_factory=list)
+
+    def nearest_snapshot(self, command_index: int) -> Optional[SnapshotRef]:
+        """Find the latest snapshot taken at or before a command.
+
+        Args:
+            command_index: Number of commands to fast-forward to
+
+        Returns:
+            SnapshotRef, or None if no snapshot precedes the command
+        """
+        position = bisect.bisect_right(
+            [ref.command_index for ref in self.snapshots], command_index
+        )
+        return self.snapshots[position - 1] if position else None
+
+
+def build_log_index(log_path: str) -> LogIndex:
+    """Index a log file in a single pass.
+
+    Args:
+        log_path: Path to the log file
+
+    Returns:
+        LogIndex for the log
+    """
+    index = LogIndex()
+    log_dir = Path(log_path).parent
+    for entry in parse_log_file(log_path):
+        if entry.entry_type == "session_start" and index.seed is None:
+            index.seed = entry.data.get("seed")
+        elif entry.entry_type == "command":
+            index.commands.append(entry.data.get("input", ""))
+        elif entry.entry_type == "state":
+            index.states[len(index.commands)] = _state_from_entry(entry.data)
+        elif entry.entry_type == "snapshot":
+            index.snapshots.append(SnapshotRef(
+                command_index=entry.data.get("command_index", 0),
+                path=str(log_dir / entry.data.get("file", ""))
+            ))
+    index.snapshots.sort(key=lambda ref: ref.command_index)
+    return index
+
+
+def can_snapshot(game_state: "GameState") -> bool:
+    """Check whether a game state can be snapshotted and restored faithfully.
+
+    Combat and conversations are not part of GameState.to_dict, so
+    snapshots are only taken outside them.
+
+    Args:
+        game_state: Current game state
+
+    Returns:
+        True if the state is safe to snapshot
+    """
+    return (
+        not game_state.is_in_combat()
+        and not game_state.is_in_conversation
+        and not game_state.pending_dialogue_choice
+    )
+
+
+def make_snapshot(game_state: "GameState", command_index: int) -> dict[str, Any]:
+    """Capture a replayable snapshot of the game state and global RNG.
+
+    Args:
+        game_state: Current game state
+        command_index: Number of commands executed so far
+
+    Returns:
+        JSON-compatible snapshot dictionary
+    """
+    version, internal, gauss_next = random.getstate()
+    return {
+        "command_index": command_index,
+        "rng_state": [version, list(internal), gauss_next],
+        "game_state": game_state.to_dict(),
+    }
+
+
+def restore_snapshot(
+    path: str, ai_service: Optional["AIService"] = None
+) -> tuple["GameState", int]:
+    """Restore a game state and the global RNG from a snapshot file.
+
+    Args:
+        path: Snapshot file path
+        ai_service: Optional AIService for the restored game state
+
+    Returns:
+        Tuple of (game_state, command_index)
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+        KeyError: If required snapshot fields are missing
+    """
+    from cli_rpg.game_state import GameState
+
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    game_state = GameState.from_dict(snapshot["game_state"], ai_service=ai_service)
+    version, internal, gauss_next = snapshot["rng_state"]
+    random.setstate((version, tuple(internal), gauss_next))
+    return game_state, snapshot["command_index"]
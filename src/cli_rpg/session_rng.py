@@ -0,0 +1,123 @@
+"""Per-session random number streams.
+
+Gameplay randomness (combat rolls, encounters, loot, weather, world events,
+fallback content) is drawn from named substreams owned by the GameState
+instead of the global random module. Each stream is seeded from the session
+seed and its name, so streams do not perturb each other: an extra weather
+roll no longer shifts every later combat roll, and several seeded sessions
+can run side by side in one process.
+
+A SessionRNG without a seed keeps the legacy behaviour: every stream is the
+global random module (stream() returns None, which the rng parameters of
+spawn_enemy, CombatEncounter etc. already treat as "use global random").
+"""
+
+import hashlib
+import random
+from typing import Any, Optional
+
+# Named substreams
+COMBAT = "combat"
+ENCOUNTERS = "encounters"
+LOOT = "loot"
+WEATHER = "weather"
+EVENTS = "events"
+AI_FALLBACK = "ai_fallback"
+STREAMS = (COMBAT, ENCOUNTERS, LOOT, WEATHER, EVENTS, AI_FALLBACK)
+
+
+def derive_stream_seed(seed: int, name: str) -> int:
+    """Derive a stream seed from the session seed and the stream name.
+
+    Args:
+        seed: Session seed
+        name: Stream name
+
+    Returns:
+        64-bit stream seed
+    """
+    digest = hashlib.sha256(f"{seed}:{name}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class SessionRNG:
+    """Named random streams for one game session.
+
+    Attributes:
+        seed: Session seed (None uses the global random module for every stream)
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize session streams.
+
+        Args:
+            seed: Session seed (None uses the global random module)
+        """
+        self.seed = seed
+        self._streams: dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> Optional[random.Random]:
+        """Return a named stream, creating it on first use.
+
+        Args:
+            name: Stream name (e.g. COMBAT)
+
+        Returns:
+            The stream's random.Random, or None when the session is unseeded
+        """
+        if self.seed is None:
+            return None
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(derive_stream_seed(self.seed, name))
+            self._streams[name] = rng
+        return rng
+
+    def to_dict(self) -> dict:
+        """Serialize the seed and the state of every stream used so far.
+
+        Returns:
+            JSON-compatible dictionary
+        """
+        streams = {}
+        for name, rng in self._streams.items():
+            version, internal, gauss_next = rng.getstate()
+            streams[name] = [version, list(internal), gauss_next]
+        return {"seed": self.seed, "streams": streams}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionRNG":
+        """Restore session streams from to_dict output.
+
+        Args:
+            data: Dictionary from to_dict
+
+        Returns:
+            SessionRNG continuing every stream where it left off
+        """
+        session_rng = cls(seed=data.get("seed"))
+        if session_rng.seed is None:
+            return session_rng
+        for name, (version, internal, gauss_next) in data.get("streams", {}).items():
+            rng = random.Random()
+            rng.setstate((version, tuple(internal), gauss_next))
+            session_rng._streams[name] = rng
+        return session_rng
+
+
+def session_stream(game_state: Any, name: str, default: Any = random) -> Any:
+    """Return a game state's named stream, or a default for unseeded sessions.
+
+    Args:
+        game_state: GameState (or None / any object without a SessionRNG)
+        name: Stream name
+        default: Returned when the game state has no seeded streams
+            (the global random module unless given)
+
+    Returns:
+        A random.Random stream, or the default
+    """
+    session_rng = getattr(game_state, "rng", None)
+    if isinstance(session_rng, SessionRNG):
+        return session_rng.stream(name) or default
+    return default
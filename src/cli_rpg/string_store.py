@@ -0,0 +1,158 @@
+"""Content-addressed storage for long strings in saves.
+
+Fallback ASCII art and template descriptions repeat across thousands of
+locations, NPCs and enemies. In a save, every "ascii_art" or "description"
+value of at least BLOB_MIN_LENGTH characters is stored once in a top-level
+"strings" table keyed by a hash of its text, and the field holds
+{"$blob": id} instead. Loading resolves each reference to the table's single
+string object, and intern_text lets freshly loaded models share identical
+strings in memory.
+
+Saves without a "strings" table load unchanged.
+"""
+
+import hashlib
+import sys
+from typing import Any, Iterable, Optional
+
+# Fields whose long values are moved into the string table
+BLOB_KEYS = frozenset({"ascii_art", "description"})
+
+# Shorter strings stay inline (a reference would not be smaller)
+BLOB_MIN_LENGTH = 48
+
+# Key of a reference object and of the save's string table
+BLOB_REF_KEY = "$blob"
+STRINGS_KEY = "strings"
+
+
+def blob_id(text: str) -> str:
+    """Return the content address of a string.
+
+    Args:
+        text: String to hash
+
+    Returns:
+        First 16 hex digits of the SHA-1 of the UTF-8 text
+    """
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def intern_text(text: Any) -> Any:
+    """Return a shared instance of a string (other values unchanged).
+
+    Args:
+        text: Value read from save data
+
+    Returns:
+        The interned string, or text itself if it is not a string
+    """
+    return sys.intern(text) if isinstance(text, str) else text
+
+
+class StringStore:
+    """Table of long strings referenced by content address.
+
+    Attributes:
+        blobs: Mapping of blob ID to text
+    """
+
+    def __init__(self, blobs: Optional[dict[str, str]] = None):
+        """Create a store.
+
+        Args:
+            blobs: Existing table to start from (e.g. from a loaded save)
+        """
+        self.blobs: dict[str, str] = {
+            blob: sys.intern(text) for blob, text in (blobs or {}).items()
+        }
+
+    def add(self, text: str) -> str:
+        """Store a string and return its ID."""
+        blob = blob_id(text)
+        self.blobs.setdefault(blob, text)
+        return blob
+
+    def pack(self, data: Any) -> Any:
+        """Copy serialized data, replacing long blob fields with references.
+
+        Args:
+            data: JSON-compatible data (dicts, lists, scalars)
+
+        Returns:
+            Copy of data with references in place of long strings
+        """
+        if isinstance(data, dict):
+            packed = {}
+            for key, value in data.items():
+                if key in BLOB_KEYS and isinstance(value, str) and len(value) >= BLOB_MIN_LENGTH:
+                    packed[key] = {BLOB_REF_KEY: self.add(value)}
+                else:
+                    packed[key] = self.pack(value)
+            return packed
+        if isinstance(data, list):
+            return [self.pack(item) for item in data]
+        return data
+
+    def unpack(self, data: Any) -> Any:
+        """Resolve references in place and return the data.
+
+        Every reference to a blob resolves to the same string object.
+
+        Args:
+            data: Data produced by pack and decoded from JSON
+
+        Returns:
+            data with references replaced by their strings
+
+        Raises:
+            ValueError: If a reference is not in the table
+        """
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, dict) and len(value) == 1 and BLOB_REF_KEY in value:
+                    try:
+                        data[key] = self.blobs[value[BLOB_REF_KEY]]
+                    except KeyError:
+                        raise ValueError(f"Unknown string reference: {value[BLOB_REF_KEY]}")
+                else:
+                    self.unpack(value)
+        elif isinstance(data, list):
+            for item in data:
+                self.unpack(item)
+        return data
+
+    def subset(self, blob_ids: Iterable[str]) -> dict[str, str]:
+        """Return the table entries for the given IDs."""
+        return {blob: self.blobs[blob] for blob in blob_ids if blob in self.blobs}
+
+
+def pack_save_data(data: dict) -> dict:
+    """Move long strings of a save dict into a "strings" table.
+
+    Args:
+        data: GameState.to_dict() output
+
+    Returns:
+        Packed copy with a "strings" table (omitted if nothing was packed)
+    """
+    store = StringStore()
+    packed = store.pack(data)
+    if store.blobs:
+        packed[STRINGS_KEY] = store.blobs
+    return packed
+
+
+def unpack_save_data(data: dict) -> dict:
+    """Resolve the string references of a loaded save dict in place.
+
+    Args:
+        data: Decoded save data, packed or not
+
+    Returns:
+        data without its "strings" table and with references resolved
+    """
+    if STRINGS_KEY not in data:
+        return data
+    store = StringStore(data.pop(STRINGS_KEY))
+    return store.unpack(data)
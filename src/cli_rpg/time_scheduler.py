@@ -0,0 +1,138 @@
+"""Game-time scheduler for timed systems.
+
+Timed systems (quest time limits, world events, festivals, interior events)
+register their deadlines here, keyed on GameTime.total_hours. When time
+advances, callers pop only the items that are due instead of scanning every
+quest or event ever created, so per-move cost no longer grows with the
+history of the world.
+
+The scheduler is a derived index: it is never saved. Each source list is
+registered with sync(), which schedules items appended since the previous
+sync and rebuilds the queue if the list was replaced or edited otherwise
+(e.g. after loading a save).
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+
+# Source kinds used by the game's timed systems
+QUEST_DEADLINES = "quest_deadlines"
+WORLD_EVENTS = "world_events"
+INTERIOR_EVENTS = "interior_events"
+
+
+@dataclass(order=True)
+class ScheduledEntry:
+    """A scheduled item in a TimeScheduler queue.
+
+    Attributes:
+        due_hour: GameTime.total_hours at which the item is due
+        order: Position of the item in its source list (keeps list order
+            among items due together)
+        seq: Insertion counter (tie-breaker)
+        item: The scheduled quest/event
+    """
+
+    due_hour: int
+    order: int
+    seq: int
+    item: Any = field(compare=False)
+
+
+class TimeScheduler:
+    """Min-heaps of game-time deadlines, one per source kind."""
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler."""
+        self._heaps: dict[Hashable, list[ScheduledEntry]] = {}
+        # kind -> (source list, synced length, last synced item)
+        self._sources: dict[Hashable, tuple[list, int, Any]] = {}
+        self._seq = 0
+
+    def schedule(self, kind: Hashable, due_hour: int, item: Any, order: int = 0) -> None:
+        """Schedule an item.
+
+        Args:
+            kind: Source kind (e.g. QUEST_DEADLINES)
+            due_hour: GameTime.total_hours at which the item is due
+            item: Item to schedule
+            order: Position of the item in its source list
+        """
+        self._seq += 1
+        heapq.heappush(
+            self._heaps.setdefault(kind, []),
+            ScheduledEntry(due_hour, order, self._seq, item),
+        )
+
+    def sync(
+        self,
+        kind: Hashable,
+        items: list,
+        deadline: Callable[[Any], Optional[int]],
+    ) -> None:
+        """Schedule items appended to a source list since the last sync.
+
+        If the list was replaced, shrunk or edited other than by appending,
+        the queue for this kind is rebuilt from the whole list.
+
+        Args:
+            kind: Source kind
+            items: Source list (e.g. character.quests)
+            deadline: Returns an item's due hour, or None to leave it unscheduled
+        """
+        state = self._sources.get(kind)
+        if (
+            state is not None
+            and state[0] is items
+            and state[1] <= len(items)
+            and (state[1] == 0 or items[state[1] - 1] is state[2])
+        ):
+            start = state[1]
+        else:
+            self._heaps[kind] = []
+            start = 0
+        for order in range(start, len(items)):
+            due = deadline(items[order])
+            if due is not None:
+                self.schedule(kind, due, items[order], order)
+        self._sources[kind] = (items, len(items), items[-1] if items else None)
+
+    def pop_due(self, kind: Hashable, now: int) -> list[ScheduledEntry]:
+        """Remove and return the entries due at or before a time.
+
+        Args:
+            kind: Source kind
+            now: Current GameTime.total_hours
+
+        Returns:
+            Due entries in source-list order
+        """
+        heap = self._heaps.get(kind)
+        due: list[ScheduledEntry] = []
+        while heap and heap[0].due_hour <= now:
+            due.append(heapq.heappop(heap))
+        due.sort(key=lambda entry: (entry.order, entry.seq))
+        return due
+
+    def pending(self, kind: Hashable) -> list[Any]:
+        """Return the scheduled items of a kind in source-list order.
+
+        Args:
+            kind: Source kind
+
+        Returns:
+            Items still waiting in the queue
+        """
+        entries = sorted(self._heaps.get(kind, []), key=lambda entry: (entry.order, entry.seq))
+        return [entry.item for entry in entries]
+
+    def next_due(self, kind: Hashable) -> Optional[int]:
+        """Return the earliest due hour of a kind, or None if nothing is scheduled."""
+        heap = self._heaps.get(kind)
+        return heap[0].due_hour if heap else None
+
+    def clear(self) -> None:
+        """Drop all scheduled items and source tracking."""
+        self._heaps.clear()
+        self._sources.clear()
@@ -31,6 +31,7 @@ class ChunkManager:
         world_seed: Seed for deterministic world generation
         _chunks: Cache of generated chunks keyed by (chunk_x, chunk_y)
         _region_context: Current region context for biased terrain generation
+        _revisions: Per-chunk count of set_tile_at edits (see chunk_revision)
     """
 
     tile_registry: TileRegistry
@@ -42,6 +43,7 @@ class ChunkManager:
     _region_context: Optional["RegionContext"] = None
     _current_weight_overrides: Optional[Dict[str, float]] = None
     _synced: bool = False
+    _revisions: Dict[Tuple[int, int], int] = field(default_factory=dict)
 
     def _get_weight(self, tile_name: str) -> float:
         """Get weight for a tile, using current weight override if available.
@@ -528,6 +530,53 @@ class ChunkManager:
         chunk_y = world_y // self.chunk_size
         chunk = self.get_or_generate_chunk(chunk_x, chunk_y)
         chunk[(world_x, world_y)] = terrain
+        key = (chunk_x, chunk_y)
+        self._revisions[key] = self._revisions.get(key, 0) + 1
+
+    def chunk_revision(self, chunk_x: int, chunk_y: int) -> int:
+        """Return how many times a chunk's tiles have been rewritten.
+
+        Lets caches built from chunk terrain (see MapPyramid) detect edits
+        without rescanning the chunk.
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            Number of set_tile_at calls that touched the chunk
+        """
+        return self._revisions.get((chunk_x, chunk_y), 0)
+
+    def has_chunk(self, chunk_x: int, chunk_y: int) -> bool:
+        """Check whether a chunk has been generated (or loaded).
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            True if the chunk's terrain is known
+        """
+        return (chunk_x, chunk_y) in self._chunks
+
+    def peek_tile(self, world_x: int, world_y: int) -> Optional[str]:
+        """Get terrain at world coordinates without generating its chunk.
+
+        Chunk generation depends on already-generated neighbours, so
+        read-only consumers (such as pathfinding) must not trigger it.
+
+        Args:
+            world_x: World X coordinate
+            world_y: World Y coordinate
+
+        Returns:
+            Terrain tile name, or None if the chunk has not been generated
+        """
+        chunk = self._chunks.get((world_x // self.chunk_size, world_y // self.chunk_size))
+        if chunk is None:
+            return None
+        return chunk.get((world_x, world_y))
 
     def sync_with_locations(
         self, world: Dict[str, "Location"], default_terrain: str = "plains"
@@ -11,6 +11,7 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from cli_rpg.models.character import Character
     from cli_rpg.ai_service import AIService
+    from cli_rpg.flavor_pool import FlavorTextPool
 
 WHISPER_CHANCE = 0.30  # 30% chance of whisper on location entry
 PLAYER_HISTORY_CHANCE = 0.10  # 10% of whispers are player-history-aware
@@ -199,13 +200,20 @@ def get_depth_dread_modifier(z: int) -> float:
 class WhisperService:
     """Service for generating ambient whispers."""
 
-    def __init__(self, ai_service: Optional["AIService"] = None):
+    def __init__(
+        self,
+        ai_service: Optional["AIService"] = None,
+        flavor_pool: Optional["FlavorTextPool"] = None,
+    ):
         """Initialize the whisper service.
 
         Args:
             ai_service: Optional AI service for dynamic whisper generation
+            flavor_pool: Optional pool of prefetched AI whispers; when set, AI
+                whispers are only served from the pool (never generated inline)
         """
         self.ai_service = ai_service
+        self.flavor_pool = flavor_pool
 
     def get_whisper(
         self,
@@ -243,8 +251,15 @@ class WhisperService:
             if history_whisper:
                 return history_whisper
 
-        # Try AI generation if available
-        if self.ai_service:
+        # Serve a prefetched AI whisper when a pool is attached
+        if self.flavor_pool is not None:
+            from cli_rpg.flavor_pool import WHISPER
+
+            pooled = self.flavor_pool.take(WHISPER, location_category, theme, dread)
+            if pooled:
+                return pooled
+        # Otherwise try AI generation if available
+        elif self.ai_service:
             try:
                 return self._generate_ai_whisper(location_category, theme)
             except Exception:
@@ -146,6 +146,7 @@ def generate_fallback_location(
     chunk_manager: Optional["ChunkManager"] = None,
     is_named: bool = False,
     category_hint: Optional[str] = None,
+    rng: Optional[random.Random] = None,
 ) -> Location:
     """Generate a fallback location when AI is unavailable.
 
@@ -162,18 +163,21 @@ def generate_fallback_location(
         is_named: Whether this is a named POI (True) or terrain filler (False)
         category_hint: Optional category hint from clustering (e.g., "village", "dungeon").
                       Only used for named locations.
+        rng: Optional random.Random for template choices (defaults to global random)
 
     Returns:
         A new Location instance with proper coordinates for grid placement
     """
+    source = rng or random
+
     # Select template based on terrain if provided, otherwise random
     if terrain is not None and terrain in TERRAIN_TEMPLATES:
         template = TERRAIN_TEMPLATES[terrain]
     else:
-        template = random.choice(FALLBACK_LOCATION_TEMPLATES)
+        template = source.choice(FALLBACK_LOCATION_TEMPLATES)
 
     # Generate name with direction suffix for uniqueness (no coordinates)
-    base_name = random.choice(template["name_patterns"])
+    base_name = source.choice(template["name_patterns"])
 
     # Direction suffixes for uniqueness without exposing coordinates
     DIRECTION_SUFFIXES = {
@@ -192,7 +196,7 @@ def generate_fallback_location(
     location_name = f"{base_name}{suffix}"
 
     # Select random description
-    description = random.choice(template["descriptions"])
+    description = source.choice(template["descriptions"])
 
     # Calculate back connection direction
     back_direction = OPPOSITE_DIRECTIONS[direction]
@@ -223,12 +227,14 @@ def generate_fallback_location(
 # Import AI components (optional)
 try:
     from cli_rpg.ai_service import AIService
-    from cli_rpg.ai_world import create_ai_world
+    from cli_rpg.ai_world import WorldBuild, create_ai_world, start_ai_world
     AI_AVAILABLE = True
 except ImportError:
     AI_AVAILABLE = False
     AIService = None  # type: ignore[misc, assignment]
+    WorldBuild = None  # type: ignore[misc, assignment]
     create_ai_world = None  # type: ignore[assignment]
+    start_ai_world = None  # type: ignore[assignment]
 
 
 def get_default_factions() -> list:
@@ -1010,3 +1016,41 @@ def create_world(
         # Use default world
         world, starting_location = create_default_world()
         return (world, starting_location)
+
+
+def start_world(
+    ai_service: Optional["AIService"] = None,
+    theme: str = "fantasy",
+    strict: bool = True
+) -> tuple[dict[str, Location], str, Optional["WorldBuild"]]:
+    """Create a game world, streaming an AI world in the background.
+
+    Like create_world, but an AI world returns as soon as its starting
+    location is ready; the rest arrives through the returned WorldBuild
+    (attach it with GameState.attach_world_build).
+
+    Args:
+        ai_service: Optional AIService for AI-generated world
+        theme: World theme (default: "fantasy")
+        strict: If True (default), AI generation failures raise exceptions.
+                If False, falls back to default world on AI error.
+
+    Returns:
+        Tuple of (world, starting_location, build) where build is the running
+        WorldBuild, or None for the default world
+
+    Raises:
+        Exception: If strict=True and AI generation fails
+    """
+    if ai_service is not None and AI_AVAILABLE:
+        try:
+            logger.info("Starting AI-generated world")
+            build = start_ai_world(ai_service, theme=theme)
+            return (build.world, build.starting_location, build)
+        except Exception as e:
+            if strict:
+                raise
+            logger.warning(f"AI world generation failed: {e}")
+            logger.info("Falling back to default world")
+    world, starting_location = create_default_world()
+    return (world, starting_location, None)
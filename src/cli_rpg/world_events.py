@@ -10,6 +10,8 @@ from typing import Optional, TYPE_CHECKING
 from cli_rpg.models.world_event import WorldEvent
 from cli_rpg import colors
 from cli_rpg.frames import frame_announcement
+from cli_rpg.session_rng import ENCOUNTERS, EVENTS, session_stream
+from cli_rpg.time_scheduler import WORLD_EVENTS, TimeScheduler
 
 if TYPE_CHECKING:
     from cli_rpg.game_state import GameState
@@ -75,25 +77,27 @@ def spawn_random_event(game_state: "GameState") -> WorldEvent:
     Returns:
         New WorldEvent instance
     """
+    rng = session_stream(game_state, EVENTS, default=random)
+
     # Choose random event type
-    event_type = random.choice(list(EVENT_TEMPLATES.keys()))
+    event_type = rng.choice(list(EVENT_TEMPLATES.keys()))
     template = EVENT_TEMPLATES[event_type]
 
     # Choose affected location (current or nearby)
     affected_location = game_state.current_location
 
     # Generate event ID
-    event_id = f"{event_type}_{affected_location.replace(' ', '_').lower()}_{random.randint(1000, 9999)}"
+    event_id = f"{event_type}_{affected_location.replace(' ', '_').lower()}_{rng.randint(1000, 9999)}"
 
     # Choose random name and description
-    name = random.choice(template["name_templates"])
-    description = random.choice(template["description_templates"]).format(
+    name = rng.choice(template["name_templates"])
+    description = rng.choice(template["description_templates"]).format(
         location=affected_location
     )
 
     # Random duration within range
     min_dur, max_dur = template["duration_range"]
-    duration = random.randint(min_dur, max_dur)
+    duration = rng.randint(min_dur, max_dur)
 
     return WorldEvent(
         event_id=event_id,
@@ -106,6 +110,43 @@ def spawn_random_event(game_state: "GameState") -> WorldEvent:
     )
 
 
+def _sync_event_schedule(game_state: "GameState") -> TimeScheduler:
+    """Register world events added since the last call with the game scheduler.
+
+    Args:
+        game_state: Current game state
+
+    Returns:
+        The game state's scheduler
+    """
+    total_hours = game_state.game_time.total_hours
+    current_hour = game_state.game_time.hour
+
+    def _deadline(event: WorldEvent) -> Optional[int]:
+        if not event.is_active:
+            return None
+        return total_hours + event.get_time_remaining(current_hour)
+
+    scheduler = game_state.scheduler
+    scheduler.sync(WORLD_EVENTS, game_state.world_events, _deadline)
+    return scheduler
+
+
+def get_active_events(game_state: "GameState") -> list[WorldEvent]:
+    """Get active world events (including festivals) in creation order.
+
+    Uses the game scheduler rather than scanning every event ever spawned.
+
+    Args:
+        game_state: Current game state
+
+    Returns:
+        List of active world events
+    """
+    scheduler = _sync_event_schedule(game_state)
+    return [event for event in scheduler.pending(WORLD_EVENTS) if event.is_active]
+
+
 def check_for_new_event(game_state: "GameState") -> Optional[str]:
     """Check if a new world event should spawn.
 
@@ -118,12 +159,12 @@ def check_for_new_event(game_state: "GameState") -> Optional[str]:
         Event notification message if event spawned, None otherwise
     """
     # Don't spawn if too many active events
-    active_events = [e for e in game_state.world_events if e.is_active]
+    active_events = get_active_events(game_state)
     if len(active_events) >= 3:
         return None
 
     # Roll for event spawn
-    if random.random() > EVENT_SPAWN_CHANCE:
+    if session_stream(game_state, EVENTS, default=random).random() > EVENT_SPAWN_CHANCE:
         return None
 
     # Create and add event
@@ -151,8 +192,12 @@ def progress_events(game_state: "GameState") -> list[str]:
 
     messages = []
     current_hour = game_state.game_time.hour
+    total_hours = game_state.game_time.total_hours
 
-    for event in game_state.world_events:
+    # Only events whose scheduled end has been reached are visited
+    scheduler = _sync_event_schedule(game_state)
+    for entry in scheduler.pop_due(WORLD_EVENTS, total_hours):
+        event = entry.item
         if not event.is_active:
             continue
 
@@ -166,9 +211,12 @@ def progress_events(game_state: "GameState") -> list[str]:
             event.consequence_applied = True
             event.is_active = False
             messages.append(consequence_msg)
+        else:
+            remaining = max(1, event.get_time_remaining(current_hour))
+            scheduler.schedule(WORLD_EVENTS, total_hours + remaining, event, entry.order)
 
     # Update economy disruption based on active events
-    update_economy_from_events(game_state.economy_state, game_state.world_events)
+    update_economy_from_events(game_state.economy_state, get_active_events(game_state))
 
     return messages
 
@@ -511,10 +559,12 @@ def _resolve_invasion(
     from cli_rpg.combat import CombatEncounter, spawn_enemies
 
     # Spawn invasion enemies (2-3 enemies)
+    rng = session_stream(game_state, ENCOUNTERS)
     enemies = spawn_enemies(
         location_name=event.affected_locations[0],
         level=game_state.current_character.level,
-        count=random.randint(2, 3),
+        count=rng.randint(2, 3),
+        rng=rng,
     )
 
     # Store event ID on combat so we can resolve on victory
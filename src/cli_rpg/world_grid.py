@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Tuple, List, TYPE_CHECKING
 
 from cli_rpg.models.location import Location
+from cli_rpg.time_scheduler import TimeScheduler
 
 if TYPE_CHECKING:
     from cli_rpg.models.district import District
@@ -133,6 +136,12 @@ class SubGrid:
     - z>0 is upper floors (towers, etc.)
     - z<0 is below ground (dungeons, basements, etc.)
 
+    Rooms are also kept in a dense list over the bounds (see _cell_index),
+    so coordinate lookups index a list instead of hashing a tuple. Exit
+    distances and treasure counts are derived lazily and cached: the exit
+    distance map is rebuilt when rooms are added (or bounds change), and the
+    treasure counters are kept current by open_treasure.
+
     Attributes:
         _grid: Internal storage mapping (x, y, z) coordinates to locations
         _by_name: Name-based lookup for convenience
@@ -141,6 +150,12 @@ class SubGrid:
         secret_passages: List of secret passages connecting non-adjacent rooms
         visited_rooms: Set of (x, y, z) coordinates that have been visited
         exploration_bonus_awarded: Whether the exploration completion bonus was given
+        _cells: Dense row-major (z, y, x) room list over the bounds
+        _cells_key: (bounds, room count) _cells was built for
+        _exit_points: Exit point coordinates
+        _exit_distances: Distance to the nearest exit per cell (-1 if no exits)
+        _exits_key: (bounds, room count) the exit data was built for
+        _treasure_counts: [opened, total] treasure counters, None until first read
     """
 
     _grid: Dict[Tuple[int, int, int], Location] = field(default_factory=dict)
@@ -152,10 +167,27 @@ class SubGrid:
     visited_rooms: set = field(default_factory=set)
     exploration_bonus_awarded: bool = False
     interior_events: List["InteriorEvent"] = field(default_factory=list)
+    # Expiry queue for interior_events (derived, not serialized)
+    event_schedule: TimeScheduler = field(
+        default_factory=TimeScheduler, repr=False, compare=False
+    )
     # Discovery milestone tracking
     first_secret_found: bool = False
     all_treasures_opened: bool = False
     boss_milestone_awarded: bool = False
+    # Derived lookup structures (not serialized)
+    _cells: List[Optional[Location]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _cells_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _exit_points: List[Tuple[int, int, int]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _exit_distances: Optional[array] = field(default=None, init=False, repr=False, compare=False)
+    _exits_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _treasure_counts: Optional[List[int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_location(self, location: Location, x: int, y: int, z: int = 0) -> None:
         """Add a location within bounds.
@@ -187,9 +219,63 @@ class SubGrid:
         location.coordinates = (x, y, z)
         location.parent_location = self.parent_name
 
-        # Add to both indices
+        self._place(location, x, y, z)
+
+    def _place(self, location: Location, x: int, y: int, z: int) -> None:
+        """Store a location in every index and drop derived data."""
         self._grid[(x, y, z)] = location
         self._by_name[location.name] = location
+        if self._cells_key is not None and self._cells_key[0] == self.bounds:
+            index = self._cell_index(x, y, z)
+            if index is not None:
+                self._cells[index] = location
+                self._cells_key = (self.bounds, len(self._grid))
+        self._exits_key = None
+        self._treasure_counts = None
+
+    def invalidate_caches(self) -> None:
+        """Drop derived lookups after editing rooms in place.
+
+        Needed only when exit points or treasures change on rooms already in
+        the grid by some route other than add_location or open_treasure.
+        """
+        self._cells_key = None
+        self._exits_key = None
+        self._treasure_counts = None
+
+    def _full_bounds(self) -> Tuple[int, int, int, int, int, int]:
+        """Return bounds as a 6-tuple (legacy 4-tuples get z range 0..0)."""
+        if len(self.bounds) == 6:
+            return self.bounds
+        return (*self.bounds, 0, 0)
+
+    def _cell_index(self, x: int, y: int, z: int) -> Optional[int]:
+        """Return the dense index of coordinates, or None outside the bounds."""
+        min_x, max_x, min_y, max_y, min_z, max_z = self._full_bounds()
+        if not (min_x <= x <= max_x and min_y <= y <= max_y and min_z <= z <= max_z):
+            return None
+        width = max_x - min_x + 1
+        height = max_y - min_y + 1
+        return ((z - min_z) * height + (y - min_y)) * width + (x - min_x)
+
+    def _ensure_cells(self) -> List[Optional[Location]]:
+        """Return the dense room list, rebuilding it if rooms or bounds changed.
+
+        Rooms written straight into _grid (as from_dict and some generators
+        do) change its size, which triggers the rebuild.
+        """
+        key = (self.bounds, len(self._grid))
+        if self._cells_key != key:
+            min_x, max_x, min_y, max_y, min_z, max_z = self._full_bounds()
+            size = (max_x - min_x + 1) * (max_y - min_y + 1) * (max_z - min_z + 1)
+            cells: List[Optional[Location]] = [None] * max(size, 0)
+            for (x, y, z), location in self._grid.items():
+                index = self._cell_index(x, y, z)
+                if index is not None:
+                    cells[index] = location
+            self._cells = cells
+            self._cells_key = key
+        return self._cells
 
     def get_by_coordinates(self, x: int, y: int, z: int = 0) -> Optional[Location]:
         """Get location at specific coordinates.
@@ -202,7 +288,12 @@ class SubGrid:
         Returns:
             Location at coordinates, or None if empty
         """
-        return self._grid.get((x, y, z))
+        cells = self._ensure_cells()
+        index = self._cell_index(x, y, z)
+        if index is None:
+            # Rooms are only ever added inside the bounds
+            return self._grid.get((x, y, z))
+        return cells[index]
 
     def get_by_name(self, name: str) -> Optional[Location]:
         """Get location by name.
@@ -226,12 +317,7 @@ class SubGrid:
         Returns:
             True if within bounds, False otherwise
         """
-        # Handle both 6-tuple and legacy 4-tuple bounds
-        if len(self.bounds) == 6:
-            min_x, max_x, min_y, max_y, min_z, max_z = self.bounds
-        else:
-            min_x, max_x, min_y, max_y = self.bounds
-            min_z, max_z = 0, 0
+        min_x, max_x, min_y, max_y, min_z, max_z = self._full_bounds()
         return min_x <= x <= max_x and min_y <= y <= max_y and min_z <= z <= max_z
 
     def mark_visited(self, x: int, y: int, z: int = 0) -> None:
@@ -275,20 +361,36 @@ class SubGrid:
     def get_treasure_stats(self) -> tuple[int, int]:
         """Get treasure opening statistics for milestone tracking.
 
-        Counts treasure chests across all locations in the SubGrid.
+        Counts treasure chests across all locations in the SubGrid once,
+        then keeps the counters current through open_treasure.
 
         Returns:
             Tuple of (opened_count, total_count) for treasures.
         """
-        opened = 0
-        total = 0
-        for location in self._by_name.values():
-            for treasure in location.treasures:
-                total += 1
-                if treasure.get("opened", False):
-                    opened += 1
+        if self._treasure_counts is None:
+            opened = 0
+            total = 0
+            for location in self._by_name.values():
+                for treasure in location.treasures:
+                    total += 1
+                    if treasure.get("opened", False):
+                        opened += 1
+            self._treasure_counts = [opened, total]
+        opened, total = self._treasure_counts
         return (opened, total)
 
+    def open_treasure(self, treasure: dict) -> None:
+        """Mark a treasure chest in this SubGrid as opened.
+
+        Args:
+            treasure: Treasure dict from one of the SubGrid's locations
+        """
+        if treasure.get("opened", False):
+            return
+        treasure["opened"] = True
+        if self._treasure_counts is not None:
+            self._treasure_counts[0] += 1
+
     def are_all_treasures_opened(self) -> bool:
         """Check if all treasure chests in the SubGrid have been opened.
 
@@ -309,13 +411,40 @@ class SubGrid:
         Used for weather penetration sounds - sounds from outside are
         louder near exit points and fade as you go deeper inside.
 
+        Distances for every cell in the bounds are computed together by a
+        breadth-first pass out from the exits (over the open box that equals
+        Manhattan distance) and cached until rooms are added.
+
         Args:
             coords: Current (x, y, z) coordinates within the SubGrid
 
         Returns:
             Manhattan distance to nearest exit point, or -1 if no exits exist
         """
-        # Find all exit points
+        distances = self._ensure_exit_distances()
+        if distances is not None:
+            index = self._cell_index(coords[0], coords[1], coords[2])
+            if index is not None:
+                return distances[index]
+
+        if not self._exit_points:
+            return -1
+        return min(
+            abs(coords[0] - exit_x) + abs(coords[1] - exit_y) + abs(coords[2] - exit_z)
+            for exit_x, exit_y, exit_z in self._exit_points
+        )
+
+    def _ensure_exit_distances(self) -> Optional[array]:
+        """Return the per-cell exit distance map, rebuilding it if stale.
+
+        Returns:
+            Distances indexed like _cells, or None if some exit lies outside
+            the bounds (callers then scan _exit_points)
+        """
+        key = (self.bounds, len(self._grid))
+        if self._exits_key == key:
+            return self._exit_distances
+
         exit_points: List[Tuple[int, int, int]] = []
         for location in self._by_name.values():
             if location.is_exit_point and location.coordinates is not None:
@@ -324,18 +453,39 @@ class SubGrid:
                     exit_points.append((loc_coords[0], loc_coords[1], loc_coords[2]))
                 else:
                     exit_points.append((loc_coords[0], loc_coords[1], 0))
+        self._exit_points = exit_points
+        self._exits_key = key
 
-        if not exit_points:
-            return -1
-
-        # Calculate Manhattan distance to each exit and return minimum
-        min_distance = float("inf")
-        for exit_x, exit_y, exit_z in exit_points:
-            distance = abs(coords[0] - exit_x) + abs(coords[1] - exit_y) + abs(coords[2] - exit_z)
-            if distance < min_distance:
-                min_distance = distance
+        seeds = [self._cell_index(*exit_coords) for exit_coords in exit_points]
+        if None in seeds:
+            self._exit_distances = None
+            return None
 
-        return int(min_distance)
+        min_x, max_x, min_y, max_y, min_z, max_z = self._full_bounds()
+        width = max_x - min_x + 1
+        height = max_y - min_y + 1
+        distances = array("i", [-1]) * (width * height * (max_z - min_z + 1))
+        queue = deque()
+        for index, exit_coords in zip(seeds, exit_points):
+            if distances[index] != 0:
+                distances[index] = 0
+                queue.append(exit_coords)
+
+        # Breadth-first over the whole box, so distances are Manhattan
+        while queue:
+            x, y, z = queue.popleft()
+            next_distance = distances[((z - min_z) * height + (y - min_y)) * width + (x - min_x)] + 1
+            for dx, dy, dz in SUBGRID_DIRECTION_OFFSETS.values():
+                nx, ny, nz = x + dx, y + dy, z + dz
+                if not (min_x <= nx <= max_x and min_y <= ny <= max_y and min_z <= nz <= max_z):
+                    continue
+                index = ((nz - min_z) * height + (ny - min_y)) * width + (nx - min_x)
+                if distances[index] == -1:
+                    distances[index] = next_distance
+                    queue.append((nx, ny, nz))
+
+        self._exit_distances = distances
+        return distances
 
     def to_dict(self) -> dict:
         """Serialize the sub-grid to a dictionary.
@@ -408,8 +558,7 @@ class SubGrid:
                 else:
                     x, y, z = location.coordinates
                 # Bypass add_location to preserve existing connections
-                grid._grid[(x, y, z)] = location
-                grid._by_name[location.name] = location
+                grid._place(location, x, y, z)
 
         return grid
 
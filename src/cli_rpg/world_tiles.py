@@ -856,13 +856,21 @@ def get_cluster_category_bias(
     Returns:
         Category string to bias towards, or None if no clustering
     """
+    from cli_rpg.paged_world import PagedWorld
+
     if rng is None:
         rng = random_module.Random()
 
-    # Find all named locations within radius
+    # Find all named locations within radius (a paged world pages in only the
+    # regions the radius reaches)
     nearby_categories: List[str] = []
+    if isinstance(world, PagedWorld):
+        world.load_near(target_coords, radius)
+        locations = world.loaded_values()
+    else:
+        locations = world.values()
 
-    for location in world.values():
+    for location in locations:
         # Skip unnamed locations (terrain filler)
         if not location.is_named:
             continue
@@ -484,3 +484,38 @@ def test_list_cache_persists_to_disk(mock_openai_class, temp_cache_file):
     # API should NOT be called again
     assert mock_client.chat.completions.create.call_count == 1
     assert result1 == result2
+
+
+# Test: concurrent writers (world-build, flavor and interior threads) share the cache
+@patch('cli_rpg.ai_service.OpenAI')
+def test_concurrent_cache_writes_keep_file_complete(mock_openai_class, temp_cache_file):
+    """Parallel _set_cached calls must not raise or leave a partial cache file."""
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    config = AIConfig(
+        api_key="test-key",
+        enable_caching=True,
+        cache_file=temp_cache_file,
+        retry_delay=0.1
+    )
+    service = AIService(config)
+
+    def write_entries(worker: int) -> None:
+        for i in range(25):
+            service._set_cached(f"prompt {worker}-{i}", {"name": f"Place {worker}-{i}"})
+            assert service._get_cached(f"prompt {worker}-{i}") is not None
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(write_entries, w) for w in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    with open(temp_cache_file, 'r') as f:
+        saved = json.load(f)
+    assert len(saved) == 8 * 25
+    assert not os.path.exists(temp_cache_file + ".tmp")
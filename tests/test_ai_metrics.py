@@ -0,0 +1,242 @@
+"""Tests for per-generation-type AI metrics.
+
+These tests verify:
+1. AIMetrics records calls, latency buckets, tokens, retries and cache lookups
+2. AIService attributes provider usage and retries to the generation type
+3. The ai-stats command, JSON event and session log entry expose the metrics
+"""
+
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from cli_rpg.ai_config import AIConfig
+from cli_rpg.ai_metrics import LATENCY_BUCKETS_MS, AIMetrics
+from cli_rpg.ai_service import AIService, AIServiceError
+from cli_rpg.json_output import emit_ai_metrics
+from cli_rpg.logging_service import GameplayLogger
+
+
+@pytest.fixture
+def mock_service():
+    """AIService backed by the local mock provider."""
+    config = AIConfig(
+        api_key="mock", provider="mock", retry_delay=0.001,
+        enable_caching=False, mock_seed=5,
+    )
+    return AIService(config)
+
+
+class TestAIMetrics:
+    """Registry behaviour."""
+
+    def test_track_call_records_usage_and_latency(self):
+        metrics = AIMetrics()
+
+        with metrics.track_call("location", prompt="x" * 400):
+            metrics.record_usage(120, 80)
+
+        stats = metrics.get("location")
+        assert stats.calls == 1
+        assert stats.prompt_tokens == 120
+        assert stats.completion_tokens == 80
+        assert sum(stats.latency_histogram) == 1
+        assert len(stats.latency_histogram) == len(LATENCY_BUCKETS_MS) + 1
+
+    def test_tokens_estimated_without_usage(self):
+        metrics = AIMetrics()
+
+        with metrics.track_call("whisper", prompt="p" * 40):
+            metrics.record_completion_text("c" * 20)
+
+        stats = metrics.get("whisper")
+        assert stats.prompt_tokens == 10
+        assert stats.completion_tokens == 5
+
+    def test_non_integer_usage_is_ignored(self):
+        metrics = AIMetrics()
+
+        with metrics.track_call("npc", prompt="abcd"):
+            metrics.record_usage(Mock(), None)
+
+        assert metrics.get("npc").prompt_tokens == 1
+
+    def test_failed_call_counts_failure(self):
+        metrics = AIMetrics()
+
+        with pytest.raises(RuntimeError):
+            with metrics.track_call("quest"):
+                raise RuntimeError("boom")
+
+        stats = metrics.get("quest")
+        assert stats.calls == 1
+        assert stats.failures == 1
+
+    def test_retries_attributed_to_active_and_last_type(self):
+        metrics = AIMetrics()
+
+        with metrics.track_call("area"):
+            metrics.record_api_retry()
+        metrics.record_parse_retry()
+
+        stats = metrics.get("area")
+        assert stats.api_retries == 1
+        assert stats.parse_retries == 1
+
+    def test_cache_hit_ratio(self):
+        metrics = AIMetrics()
+        metrics.record_cache("location", hit=True)
+        metrics.record_cache("location", hit=False)
+        metrics.record_cache("location", hit=True)
+
+        stats = metrics.get("location")
+        assert stats.cache_hit_ratio == pytest.approx(2 / 3)
+        assert metrics.get("quest").cache_hit_ratio is None
+
+    def test_active_call_is_per_thread(self):
+        metrics = AIMetrics()
+
+        def _other_thread():
+            metrics.record_usage(999, 999)  # No active call on this thread
+
+        with metrics.track_call("room", prompt="abcd"):
+            thread = threading.Thread(target=_other_thread)
+            thread.start()
+            thread.join()
+
+        assert metrics.get("room").prompt_tokens == 1
+
+    def test_snapshot_totals_and_report(self):
+        metrics = AIMetrics()
+        with metrics.track_call("location"):
+            metrics.record_usage(10, 20)
+        with metrics.track_call("dream"):
+            metrics.record_usage(5, 5)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["totals"]["calls"] == 2
+        assert snapshot["totals"]["total_tokens"] == 40
+        assert set(snapshot["by_type"]) == {"dream", "location"}
+        json.dumps(snapshot)  # JSON-serializable
+
+        report = metrics.format_report()
+        assert "location" in report and "dream" in report
+
+    def test_empty_report(self):
+        assert "No AI generation calls" in AIMetrics().format_report()
+
+
+class TestAIServiceMetrics:
+    """AIService integration with the registry."""
+
+    def test_provider_usage_recorded_per_type(self, mock_service):
+        mock_service.generate_location(theme="fantasy")
+        mock_service.generate_whisper(theme="fantasy", location_category="dungeon")
+
+        location = mock_service.metrics.get("location")
+        assert location.calls == 1
+        assert location.prompt_tokens > 0
+        assert location.completion_tokens > 0
+        assert mock_service.metrics.get("whisper").calls == 1
+
+    def test_context_and_room_calls_have_own_types(self, mock_service):
+        from cli_rpg.models.world_context import WorldContext
+
+        calls = [
+            lambda: mock_service.generate_world_context(theme="fantasy"),
+            lambda: mock_service.generate_region_context(
+                theme="fantasy", world_context=WorldContext.default("fantasy"), coordinates=(0, 0)
+            ),
+            lambda: mock_service.generate_room_content(
+                room_type="chamber", category="dungeon", connections=["north"], is_entry=False
+            ),
+        ]
+        for call in calls:
+            try:
+                call()
+            except AIServiceError:
+                pass  # Only the recorded type matters here
+
+        for generation_type in ("world_context", "region_context", "room"):
+            assert mock_service.metrics.get(generation_type).calls >= 1
+        for generation_type in ("location", "lore", "area"):
+            assert mock_service.metrics.get(generation_type).calls == 0
+
+    def test_api_retries_recorded(self):
+        config = AIConfig(
+            api_key="mock", provider="mock", retry_delay=0.001, max_retries=2,
+            enable_caching=False, mock_error_rate=1.0,
+        )
+        service = AIService(config)
+
+        with pytest.raises(AIServiceError):
+            service.generate_enemy(theme="fantasy", location_name="Cave", player_level=1)
+
+        stats = service.metrics.get("enemy")
+        assert stats.api_retries == 2
+        assert stats.failures == 1
+
+    def test_cache_lookups_recorded(self, tmp_path):
+        config = AIConfig(
+            api_key="mock", provider="mock", retry_delay=0.001,
+            cache_file=str(tmp_path / "cache.json"), mock_seed=1,
+        )
+        service = AIService(config)
+
+        service.generate_location(theme="fantasy")
+        service.generate_location(theme="fantasy")
+
+        stats = service.metrics.get("location")
+        assert stats.cache_misses == 1
+        assert stats.cache_hits == 1
+        assert stats.calls == 1
+
+
+class TestMetricsOutputs:
+    """ai-stats command, JSON event and session log entry."""
+
+    def test_ai_stats_command(self, mock_service):
+        from cli_rpg.main import handle_exploration_command
+
+        mock_service.generate_location(theme="fantasy")
+        game_state = Mock()
+        game_state.ai_service = mock_service
+
+        continue_game, message = handle_exploration_command(game_state, "ai-stats", [])
+
+        assert continue_game is True
+        assert "AI Generation Stats" in message
+        assert "location" in message
+
+    def test_ai_stats_command_without_ai(self):
+        from cli_rpg.main import handle_exploration_command
+
+        game_state = Mock()
+        game_state.ai_service = None
+
+        _, message = handle_exploration_command(game_state, "ai-stats", [])
+
+        assert "not enabled" in message
+
+    def test_emit_ai_metrics(self, capsys):
+        metrics = AIMetrics()
+        with metrics.track_call("npc"):
+            pass
+
+        emit_ai_metrics(metrics.snapshot())
+
+        event = json.loads(capsys.readouterr().out)
+        assert event["type"] == "ai_metrics"
+        assert event["by_type"]["npc"]["calls"] == 1
+
+    def test_log_ai_metrics(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path))
+        logger.log_ai_metrics({"totals": {"calls": 3}, "by_type": {}})
+        logger.close()
+
+        entry = json.loads(log_path.read_text().strip())
+        assert entry["type"] == "ai_metrics"
+        assert entry["totals"]["calls"] == 3
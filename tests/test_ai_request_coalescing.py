@@ -0,0 +1,152 @@
+"""Tests for request-level deduplication (single-flight) in AIService.
+
+Spec: Concurrent callers requesting generation for the same prompt share a
+single in-flight API call; the second caller waits for the first call's result
+instead of firing a duplicate paid request.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cli_rpg.ai_config import AIConfig
+from cli_rpg.ai_service import AIService, AIServiceError
+
+
+@pytest.fixture
+def service():
+    """Create an AIService with caching disabled."""
+    config = AIConfig(api_key="test-key", enable_caching=False, retry_delay=0.1)
+    return AIService(config)
+
+
+def _run_concurrently(func, count):
+    """Run func in `count` threads and collect results/errors."""
+    results: list = []
+    errors: list = []
+
+    def _target():
+        try:
+            results.append(func())
+        except Exception as e:  # pragma: no cover - collected for assertions
+            errors.append(e)
+
+    threads = [threading.Thread(target=_target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return results, errors
+
+
+def test_concurrent_identical_prompts_share_one_call(service):
+    """Identical concurrent prompts result in a single provider call."""
+    calls = []
+
+    def slow_provider(prompt):
+        calls.append(prompt)
+        time.sleep(0.2)
+        return "shared response"
+
+    with patch.object(service, "_call_provider", side_effect=slow_provider):
+        results, errors = _run_concurrently(lambda: service._call_llm("same prompt"), 4)
+
+    assert errors == []
+    assert results == ["shared response"] * 4
+    assert len(calls) == 1
+
+
+def test_different_prompts_are_not_coalesced(service):
+    """Distinct prompts each make their own provider call."""
+    with patch.object(service, "_call_provider", side_effect=lambda p: p.upper()) as mock_call:
+        assert service._call_llm("alpha") == "ALPHA"
+        assert service._call_llm("beta") == "BETA"
+
+    assert mock_call.call_count == 2
+
+
+def test_sequential_calls_are_not_coalesced(service):
+    """Once a call finishes, a later identical prompt makes a fresh call."""
+    with patch.object(service, "_call_provider", return_value="ok") as mock_call:
+        service._call_llm("prompt")
+        service._call_llm("prompt")
+
+    assert mock_call.call_count == 2
+    assert service._inflight == {}
+
+
+def test_waiters_receive_owner_error(service):
+    """Callers attached to a failing in-flight call see the same error."""
+
+    def failing_provider(prompt):
+        time.sleep(0.2)
+        raise AIServiceError("provider down")
+
+    errors: list = []
+
+    def _target():
+        try:
+            service._call_llm("doomed prompt")
+        except AIServiceError as e:
+            errors.append(e)
+
+    with patch.object(service, "_call_provider", side_effect=failing_provider) as mock_call:
+        threads = [threading.Thread(target=_target) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+    assert len(errors) == 3
+    assert mock_call.call_count == 1
+    assert service._inflight == {}
+
+
+def test_streamed_call_is_shared_with_concurrent_callers(service, monkeypatch):
+    """A request arriving while the same prompt streams waits for its final text."""
+    import io
+
+    service.config.enable_streaming = True
+    monkeypatch.setattr("cli_rpg.text_effects._effects_enabled_override", True)
+    stream_calls = []
+
+    def slow_stream(prompt, output=None):
+        stream_calls.append(prompt)
+        time.sleep(0.3)
+        output.write("streamed lore")
+        return "streamed lore"
+
+    follower_results: list = []
+    follower = threading.Thread(
+        target=lambda: (time.sleep(0.1), follower_results.append(service._call_llm("lore prompt")))
+    )
+
+    with patch.object(service, "_call_llm_streaming", side_effect=slow_stream), \
+            patch.object(service, "_call_provider") as mock_provider:
+        follower.start()
+        result = service._call_llm_streamable("lore prompt", output=io.StringIO())
+        follower.join(timeout=5)
+
+    assert result == "streamed lore"
+    assert follower_results == ["streamed lore"]
+    assert len(stream_calls) == 1
+    mock_provider.assert_not_called()
+    assert service._inflight == {}
+
+
+def test_streaming_fallback_does_not_wait_on_itself(service, monkeypatch):
+    """A failed stream falls back to _call_llm for the same prompt without deadlock."""
+    import io
+
+    service.config.enable_streaming = True
+    monkeypatch.setattr("cli_rpg.text_effects._effects_enabled_override", True)
+
+    with patch.object(service, "_call_llm_streaming", side_effect=AIServiceError("drop")), \
+            patch.object(service, "_call_provider", return_value="fallback") as mock_provider:
+        result = service._call_llm_streamable("prompt", output=io.StringIO())
+
+    assert result == "fallback"
+    mock_provider.assert_called_once()
+    assert service._inflight == {}
@@ -341,7 +341,7 @@ def test_generate_dialogue_can_stream(monkeypatch):
     streamable_called = False
     original_result = "Welcome to my shop, traveler!"
 
-    def mock_streamable(prompt, output=None):
+    def mock_streamable(prompt, output=None, generation_type="default"):
         nonlocal streamable_called
         streamable_called = True
         return original_result
@@ -369,7 +369,7 @@ def test_generate_lore_can_stream(monkeypatch):
     streamable_called = False
     original_result = "Long ago, the ancient kingdom fell to darkness. " * 3
 
-    def mock_streamable(prompt, output=None):
+    def mock_streamable(prompt, output=None, generation_type="default"):
         nonlocal streamable_called
         streamable_called = True
         return original_result
@@ -391,7 +391,7 @@ def test_generate_dream_can_stream(monkeypatch):
     streamable_called = False
     original_result = "You dream of endless corridors stretching before you."
 
-    def mock_streamable(prompt, output=None):
+    def mock_streamable(prompt, output=None, generation_type="default"):
         nonlocal streamable_called
         streamable_called = True
         return original_result
@@ -419,7 +419,7 @@ def test_generate_whisper_can_stream(monkeypatch):
     streamable_called = False
     original_result = "Something watches from the shadows..."
 
-    def mock_streamable(prompt, output=None):
+    def mock_streamable(prompt, output=None, generation_type="default"):
         nonlocal streamable_called
         streamable_called = True
         return original_result
@@ -532,6 +532,52 @@ def test_streaming_fallback_on_error(monkeypatch):
             assert result == "Fallback non-streaming response"
 
 
+def _failing_stream(first_text: str) -> Iterator[MockStreamChunk]:
+    """Yield one chunk, then fail like a dropped connection."""
+    yield MockStreamChunk([MockChoice(MockDelta(first_text))])
+    raise ConnectionError("connection reset")
+
+
+def test_streaming_failure_mid_stream_ends_partial_line(monkeypatch):
+    """Test a stream that dies after printing tokens is closed before falling back."""
+    from cli_rpg.ai_service import STREAM_INTERRUPTED_NOTICE
+
+    config = AIConfig(api_key="test-key", provider="openai", enable_streaming=True)
+    monkeypatch.setattr("cli_rpg.text_effects._effects_enabled_override", True)
+    service = AIService(config)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _failing_stream("The old tale")
+    service.client = mock_client
+    output = io.StringIO()
+
+    with patch.object(service, "_call_llm", return_value="Fallback lore") as mock_call:
+        result = service._call_llm_streamable("Test prompt", output=output)
+
+    assert result == "Fallback lore"
+    mock_call.assert_called_once()
+    assert output.getvalue() == f"The old tale\n{STREAM_INTERRUPTED_NOTICE}\n"
+
+
+def test_narrative_streaming_failure_mid_stream_finishes_handler():
+    """Test the narrative handler gets done=True when a stream fails part way."""
+    config = AIConfig(api_key="test-key", provider="openai", enable_streaming=True)
+    service = AIService(config)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _failing_stream(
+        '{"name": "Hollow", "description": "Wind hums'
+    )
+    service.client = mock_client
+    events: list[tuple[str, bool]] = []
+    service.narrative_stream_handler = lambda text, done: events.append((text, done))
+
+    with patch.object(service, "_call_llm", return_value='{"name": "Fallback"}'):
+        result = service._call_llm_narrative_streamable("prompt", "location")
+
+    assert result == '{"name": "Fallback"}'
+    assert "".join(text for text, done in events if not done) == "Wind hums"
+    assert events[-1] == ("", True)
+
+
 def test_streaming_config_disabled_uses_non_streaming(monkeypatch):
     """Test that streaming config disabled uses non-streaming even with effects enabled."""
     config = AIConfig(api_key="test-key", provider="openai", enable_streaming=False)
@@ -553,3 +599,109 @@ def test_streaming_config_disabled_uses_non_streaming(monkeypatch):
 
         assert call_llm_called
         assert result == "Non-streaming response"
+
+
+# --- Test 9: Narrative streaming for structured generations ---
+
+
+def _location_stream_chunks() -> list[MockStreamChunk]:
+    """Build a streamed location JSON response split into small chunks."""
+    text = (
+        '{"name": "Whispering Hollow", "description": "Wind hums through hollow '
+        'reeds.", "category": "forest"}'
+    )
+    return [MockStreamChunk([MockChoice(MockDelta(text[i:i + 8]))]) for i in range(0, len(text), 8)]
+
+
+def test_generate_location_with_context_streams_description(monkeypatch):
+    """Test the description is sent to the narrative handler while streaming.
+
+    Spec: An incremental JSON streaming parser lets the description field be
+    printed (and emitted as partial narrative events) before the object completes.
+    """
+    from cli_rpg.models.region_context import RegionContext
+    from cli_rpg.models.world_context import WorldContext
+
+    config = AIConfig(
+        api_key="test-key", provider="openai", enable_streaming=True, enable_caching=False
+    )
+    service = AIService(config)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = iter(_location_stream_chunks())
+    service.client = mock_client
+
+    events: list[tuple[str, bool]] = []
+    service.narrative_stream_handler = lambda text, done: events.append((text, done))
+
+    result = service.generate_location_with_context(
+        world_context=WorldContext.default("fantasy"),
+        region_context=RegionContext.default("Test Region", (0, 0)),
+    )
+
+    streamed = "".join(text for text, done in events if not done)
+    assert streamed == "Wind hums through hollow reeds."
+    assert events[-1] == ("", True)
+    assert result["name"] == "Whispering Hollow"
+    assert result["description"] == "Wind hums through hollow reeds."
+
+
+def test_narrative_streaming_skipped_without_handler_when_effects_disabled(monkeypatch):
+    """Test structured generations use _call_llm when no sink is available."""
+    config = AIConfig(api_key="test-key", provider="openai", enable_streaming=True)
+    monkeypatch.setattr("cli_rpg.text_effects._effects_enabled_override", False)
+    service = AIService(config)
+
+    with patch.object(service, "_call_llm", return_value="plain") as mock_call:
+        with patch.object(service, "_call_llm_streaming") as mock_streaming:
+            result = service._call_llm_narrative_streamable("prompt", "location")
+
+    assert result == "plain"
+    mock_call.assert_called_once()
+    mock_streaming.assert_not_called()
+
+
+def test_narrative_streaming_skipped_off_main_thread():
+    """Test background threads never stream narrative output."""
+    import threading
+
+    config = AIConfig(api_key="test-key", provider="openai", enable_streaming=True)
+    service = AIService(config)
+    service.narrative_stream_handler = MagicMock()
+    handlers: list[object] = []
+
+    thread = threading.Thread(target=lambda: handlers.append(service._get_narrative_stream_handler()))
+    thread.start()
+    thread.join()
+
+    assert handlers == [None]
+
+
+def test_conversation_response_streams_raw_text():
+    """Test NPC conversation responses stream their plain text."""
+    config = AIConfig(api_key="test-key", provider="openai", enable_streaming=True)
+    service = AIService(config)
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = iter([
+        MockStreamChunk([MockChoice(MockDelta("Greetings, "))]),
+        MockStreamChunk([MockChoice(MockDelta("traveler of the roads."))]),
+    ])
+    service.client = mock_client
+
+    events: list[tuple[str, bool]] = []
+    service.narrative_stream_handler = lambda text, done: events.append((text, done))
+
+    result = service.generate_conversation_response(
+        npc_name="Mira",
+        npc_description="A tired innkeeper",
+        npc_role="villager",
+        theme="fantasy",
+        location_name="Inn",
+        conversation_history=[],
+        player_input="Hello",
+    )
+
+    assert result == "Greetings, traveler of the roads."
+    assert "".join(text for text, done in events if not done).startswith(
+        "Greetings, traveler of the roads."
+    )
+    assert events[-1] == ("", True)
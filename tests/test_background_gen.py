@@ -11,6 +11,7 @@ Tests cover:
 8. Generation failure is handled gracefully
 9. Integration: move uses cached location
 10. Integration: move queues adjacent locations after arrival
+11. Higher-priority tasks are generated first
 """
 
 import pytest
@@ -356,3 +357,101 @@ class TestBackgroundGenIntegration:
         finally:
             if gs.background_gen_queue:
                 gs.background_gen_queue.shutdown()
+
+
+class TestBackgroundGenCoalescing:
+    """Tests for attaching foreground moves to in-flight background tasks."""
+
+    # Spec: foreground move attaches to the background job instead of duplicating it
+    def test_pop_or_wait_attaches_to_in_progress_task(self):
+        """pop_or_wait should wait for an in-progress task and return its result."""
+        started = threading.Event()
+        mock_ai = Mock()
+
+        def slow_generate(**kwargs):
+            started.set()
+            time.sleep(0.3)
+            return {"name": "Slow Marsh", "description": "Reeds", "category": "swamp", "npcs": []}
+
+        mock_ai.generate_location.side_effect = slow_generate
+        queue = BackgroundGenerationQueue(ai_service=mock_ai, theme="fantasy")
+        queue.start()
+
+        try:
+            queue.submit(coords=(3, 3), terrain="swamp")
+            assert started.wait(timeout=2)
+
+            data = queue.pop_or_wait((3, 3), timeout=5)
+
+            assert data is not None
+            assert data["name"] == "Slow Marsh"
+            assert mock_ai.generate_location.call_count == 1
+            assert queue.get_cached((3, 3)) is None
+        finally:
+            queue.shutdown()
+
+    def test_pop_or_wait_claims_queued_task(self):
+        """pop_or_wait should claim a not-yet-started task so the worker skips it."""
+        mock_ai = Mock()
+        queue = BackgroundGenerationQueue(ai_service=mock_ai, theme="fantasy")
+        # Mark as running without starting workers so the task stays queued
+        queue._running = True
+
+        queue.submit(coords=(5, 5), terrain="plains")
+        assert queue.pop_or_wait((5, 5)) is None
+        assert (5, 5) not in queue._pending
+
+        # Worker picks the task up later and skips it
+        task = queue._queue.get_nowait()
+        queue._process_task(task)
+        mock_ai.generate_location.assert_not_called()
+        assert queue.get_cached((5, 5)) is None
+
+    def test_pop_or_wait_returns_cached_data(self):
+        """pop_or_wait should pop already cached data immediately."""
+        queue = BackgroundGenerationQueue(ai_service=Mock(), theme="fantasy")
+        queue._cache[(1, 1)] = {"name": "Ready", "description": "Done", "category": "plains"}
+
+        data = queue.pop_or_wait((1, 1))
+
+        assert data["name"] == "Ready"
+        assert queue.get_cached((1, 1)) is None
+
+    def test_pop_or_wait_unknown_coords_returns_none(self):
+        """pop_or_wait should return None for coordinates never submitted."""
+        queue = BackgroundGenerationQueue(ai_service=Mock(), theme="fantasy")
+        assert queue.pop_or_wait((9, 9)) is None
+
+
+class TestBackgroundGenPriority:
+    """Tests for prioritized background generation."""
+
+    def test_higher_priority_generated_first(self):
+        """Workers should take the highest-priority task first."""
+        queue = BackgroundGenerationQueue(ai_service=Mock(), theme="fantasy")
+        queue._running = True
+
+        queue.submit(coords=(1, 0), terrain="plains", priority=0.5)
+        queue.submit(coords=(0, 1), terrain="plains", priority=3.0)
+        queue.submit(coords=(-1, 0), terrain="plains", priority=0.5)
+
+        order = [queue._queue.get_nowait().coords for _ in range(3)]
+        assert order == [(0, 1), (1, 0), (-1, 0)]
+
+    def test_resubmit_with_higher_priority_moves_ahead(self):
+        """A queued tile resubmitted with a higher priority is generated once, early."""
+        mock_ai = Mock()
+        mock_ai.generate_location.return_value = {"name": "Field", "description": "Grass"}
+        queue = BackgroundGenerationQueue(ai_service=mock_ai, theme="fantasy")
+        queue._running = True
+
+        assert queue.submit(coords=(2, 0), terrain="plains", priority=0.5) is True
+        assert queue.submit(coords=(2, 0), terrain="plains", priority=0.1) is False
+        assert queue.submit(coords=(2, 0), terrain="plains", priority=2.0) is True
+
+        while not queue._queue.empty():
+            queue._process_task(queue._queue.get_nowait())
+
+        assert mock_ai.generate_location.call_count == 1
+        assert queue.is_prefetched((2, 0)) is True
+        assert queue.is_prefetched((5, 5)) is False
@@ -0,0 +1,195 @@
+"""Tests for the buffered GameplayLogger.
+
+These tests verify:
+1. Entries are written by the background writer in batches and on close
+2. Time-based flushing writes entries without close
+3. Rotated logs are compressed and read back in order by parse_log_file
+4. Large AI payloads go to a content-addressed sidecar
+5. Write errors are surfaced without stopping the writer or hanging flush
+"""
+
+import gzip
+import json
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+from cli_rpg.logging_service import _CLOSE, GameplayLogger, log_segments
+from cli_rpg.session_replay import extract_commands, load_ai_payload, parse_log_file
+
+
+def _entries(path: Path) -> list[dict]:
+    """Read JSON Lines entries from a plain log file."""
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestBufferedWrites:
+    """Batching and flushing."""
+
+    def test_entries_buffered_until_close(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), flush_interval=60)
+
+        for i in range(5):
+            logger.log_command(f"look {i}")
+        time.sleep(0.05)
+        assert log_path.read_text() == ""
+
+        logger.close()
+
+        assert [entry["input"] for entry in _entries(log_path)] == [f"look {i}" for i in range(5)]
+
+    def test_flush_interval_writes_without_close(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), flush_interval=0.01)
+        try:
+            logger.log_command("look")
+            deadline = time.monotonic() + 2
+            while not log_path.read_text() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert _entries(log_path)[0]["input"] == "look"
+        finally:
+            logger.close()
+
+    def test_flush_bytes_and_explicit_flush(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), flush_bytes=1, flush_interval=60)
+        logger.log_command("north")
+        logger.flush()
+
+        assert _entries(log_path)[0]["input"] == "north"
+        logger.close()
+        logger.close()  # Closing twice is harmless
+        logger.log_command("ignored")
+
+    def test_unknown_compression_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            GameplayLogger(str(tmp_path / "session.log"), rotate_compression="zip")
+
+
+class TestWriteErrors:
+    """A failing disk must not kill the writer or hang flush."""
+
+    class _FailingFile:
+        """Log file stand-in whose writes fail until healed."""
+
+        def __init__(self, real):
+            self.real = real
+            self.failing = True
+
+        def write(self, text):
+            if self.failing:
+                raise OSError(28, "No space left on device")
+            return self.real.write(text)
+
+        def flush(self):
+            self.real.flush()
+
+        def close(self):
+            self.real.close()
+
+    def test_write_error_raised_by_flush_and_writer_keeps_draining(self, tmp_path, caplog):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), flush_interval=60)
+        failing = self._FailingFile(logger.file)
+        logger.file = failing
+
+        logger.log_command("lost")
+        with pytest.raises(OSError, match="No space left"):
+            logger.flush(timeout=5)
+
+        failing.failing = False
+        with caplog.at_level(logging.WARNING, logger="cli_rpg.logging_service"):
+            logger.log_command("kept")
+        logger.close()
+
+        assert [entry["input"] for entry in _entries(log_path)] == ["kept"]
+        assert caplog.text == ""  # flush already surfaced the error
+
+    def test_write_entry_logs_error_once(self, tmp_path, caplog):
+        logger = GameplayLogger(str(tmp_path / "session.log"), flush_bytes=1)
+        logger.file = self._FailingFile(logger.file)
+        logger.log_command("lost")
+        deadline = time.monotonic() + 5
+        while logger._error is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with caplog.at_level(logging.WARNING, logger="cli_rpg.logging_service"):
+            logger.log_command("again")
+            logger.log_command("and again")
+        logger.close()
+
+        assert caplog.text.count("losing entries") == 1
+
+    def test_flush_does_not_hang_when_writer_stopped(self, tmp_path):
+        logger = GameplayLogger(str(tmp_path / "session.log"), flush_interval=60)
+        logger._queue.put(_CLOSE)  # Stop the writer behind the logger's back
+        logger._writer.join(timeout=5)
+
+        with pytest.raises(TimeoutError):
+            logger.flush(timeout=5)
+        logger.close()
+
+
+class TestRotation:
+    """Compressed log rotation."""
+
+    def test_rotated_segments_read_in_order(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), rotate_bytes=200)
+        for i in range(10):
+            logger.log_command(f"go north {i}")
+        logger.close()
+
+        segments = log_segments(str(log_path))
+        assert segments[0].name == "session.log.1.gz"
+        assert segments[-1] == log_path
+        with gzip.open(segments[0], "rt") as f:
+            assert json.loads(f.readline())["input"] == "go north 0"
+        assert extract_commands(str(log_path)) == [f"go north {i}" for i in range(10)]
+
+    def test_lzma_rotation(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path), rotate_bytes=100, rotate_compression="lzma")
+        for i in range(3):
+            logger.log_command(f"look {i}")
+        logger.close()
+
+        assert log_segments(str(log_path))[0].name == "session.log.1.xz"
+        assert extract_commands(str(log_path)) == ["look 0", "look 1", "look 2"]
+
+
+class TestAiPayloadSidecar:
+    """Large AI payloads are stored outside the main log."""
+
+    def test_large_payload_moved_to_sidecar_once(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path))
+        content = {"description": "x" * 5000}
+        logger.log_ai_content("location", "hash1", content, raw_response="raw")
+        logger.log_ai_content("location", "hash1", content, raw_response="raw")
+        logger.close()
+
+        entries = list(parse_log_file(str(log_path)))
+        assert "content" not in entries[0].data
+        assert entries[0].data["payload"] == entries[1].data["payload"]
+        assert len(list((tmp_path / "session.log.ai").iterdir())) == 1
+        assert load_ai_payload(str(log_path), entries[0]) == {
+            "content": content, "raw_response": "raw"
+        }
+
+    def test_small_payload_inline(self, tmp_path):
+        log_path = tmp_path / "session.log"
+        logger = GameplayLogger(str(log_path))
+        content = {"name": "Goblin"}
+        logger.log_ai_content("enemy", "hash2", content)
+        content["name"] = "Changed after logging"
+        logger.close()
+
+        entry = next(parse_log_file(str(log_path)))
+        assert entry.data["content"] == {"name": "Goblin"}
+        assert load_ai_payload(str(log_path), entry) == {"content": {"name": "Goblin"}}
+        assert not (tmp_path / "session.log.ai").exists()
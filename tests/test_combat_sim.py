@@ -0,0 +1,136 @@
+"""Tests for the headless combat simulator.
+
+These tests verify:
+1. Injected RNGs make spawning and combat rolls reproducible
+2. simulate_fight runs a full fight without display output
+3. sweep aggregates per-cell results independently of worker count
+"""
+
+import random
+
+import pytest
+
+from cli_rpg.combat import CombatEncounter, spawn_boss, spawn_enemy
+from cli_rpg.combat_sim import (
+    CellStats,
+    FightResult,
+    build_character,
+    cell_seed,
+    format_sweep_report,
+    simulate_fight,
+    summarize,
+    sweep,
+)
+from cli_rpg.models.character import CharacterClass
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    """Disable colors and sound for the duration of each test."""
+    from cli_rpg.colors import set_colors_enabled
+    from cli_rpg.sound_effects import set_sound_enabled
+
+    set_colors_enabled(False)
+    set_sound_enabled(False)
+    yield
+    set_colors_enabled(True)
+    set_sound_enabled(True)
+
+
+class TestInjectedRng:
+    """rng parameters on spawn functions and CombatEncounter."""
+
+    def test_spawn_enemy_uses_rng(self):
+        names = {
+            spawn_enemy("Woods", 1, location_category="forest", rng=random.Random(7)).name
+            for _ in range(5)
+        }
+        assert len(names) == 1
+
+    def test_spawn_boss_uses_rng(self):
+        first = spawn_boss("Crypt", 3, location_category="dungeon", rng=random.Random(3))
+        second = spawn_boss("Crypt", 3, location_category="dungeon", rng=random.Random(3))
+        assert first.name == second.name
+
+    def test_combat_rolls_use_rng(self):
+        def _fight(seed: int) -> list[str]:
+            player = build_character(CharacterClass.ROGUE, 1)
+            enemy = spawn_enemy("Woods", 1, location_category="forest", rng=random.Random(1))
+            combat = CombatEncounter(player, enemy=enemy, rng=random.Random(seed))
+            combat.is_active = True
+            return [combat.player_attack()[1] + combat.enemy_turn() for _ in range(3)]
+
+        assert _fight(11) == _fight(11)
+
+
+class TestSimulateFight:
+    """Single-fight fast path."""
+
+    def test_fight_is_reproducible(self):
+        first = simulate_fight(CharacterClass.WARRIOR, 2, "cave", random.Random(5))
+        second = simulate_fight(CharacterClass.WARRIOR, 2, "cave", random.Random(5))
+        assert first == second
+
+    def test_fight_reports_outcome(self):
+        result = simulate_fight(CharacterClass.MAGE, 1, "forest", random.Random(2))
+
+        assert result.turns >= 1
+        assert result.damage_dealt > 0
+        assert result.won or result.damage_taken > 0
+
+    def test_turn_limit_marks_stalemate(self):
+        result = simulate_fight(
+            CharacterClass.RANGER, 1, "boss:dungeon", random.Random(4), max_turns=1
+        )
+
+        assert result.turns == 1
+        assert not result.won
+        assert result.stalemate
+
+    def test_build_character_levels_up(self):
+        assert build_character(CharacterClass.CLERIC, 4).level == 4
+
+
+class TestSweep:
+    """Sweep aggregation."""
+
+    def test_cell_seed_is_stable(self):
+        assert cell_seed(1, CharacterClass.MAGE, 2, "forest") == cell_seed(
+            1, CharacterClass.MAGE, 2, "forest"
+        )
+        assert cell_seed(1, CharacterClass.MAGE, 2, "forest") != cell_seed(
+            1, CharacterClass.MAGE, 3, "forest"
+        )
+
+    def test_sweep_covers_all_cells(self):
+        results = sweep(
+            classes=[CharacterClass.WARRIOR, CharacterClass.MAGE],
+            levels=[1, 3],
+            templates=["forest"],
+            fights=5,
+            workers=1,
+        )
+
+        assert [(c.character_class, c.level) for c in results] == [
+            ("Warrior", 1), ("Warrior", 3), ("Mage", 1), ("Mage", 3),
+        ]
+        assert all(cell.fights == 5 for cell in results)
+
+    def test_sweep_is_deterministic(self):
+        kwargs = dict(
+            classes=[CharacterClass.ROGUE], levels=[2], templates=["swamp"],
+            fights=20, workers=1, seed=9,
+        )
+        first = [cell.to_dict() for cell in sweep(**kwargs)]
+        second = [cell.to_dict() for cell in sweep(**kwargs)]
+        assert first == second
+
+    def test_report_and_summary(self):
+        cell = CellStats("Mage", 1, "forest")
+        cell.add(FightResult(won=True, turns=2, damage_dealt=30, damage_taken=4))
+        cell.add(FightResult(won=False, turns=6, damage_dealt=10, damage_taken=50))
+
+        assert cell.win_rate == 0.5
+        assert cell.to_dict()["turns"]["max"] == 6.0
+        assert "forest" in format_sweep_report([cell])
+        assert summarize([])["mean"] == 0.0
@@ -129,7 +129,7 @@ def test_theme_selection_flow_with_ai(mock_ai_config, mock_ai_service):
     
     with patch('cli_rpg.main.load_ai_config', return_value=mock_ai_config), \
          patch('cli_rpg.main.AIService', return_value=mock_ai_service), \
-         patch('cli_rpg.main.create_world') as mock_create_world, \
+         patch('cli_rpg.main.start_world') as mock_start_world, \
          patch('builtins.input', side_effect=inputs):
         
         # Mock world creation to return a simple world
@@ -139,7 +139,7 @@ def test_theme_selection_flow_with_ai(mock_ai_config, mock_ai_service):
                 description="Starting location"
             )
         }
-        mock_create_world.return_value = (mock_world, "Town Square")
+        mock_start_world.return_value = (mock_world, "Town Square", None)
         
         # Capture output
         old_stdout = sys.stdout
@@ -151,9 +151,9 @@ def test_theme_selection_flow_with_ai(mock_ai_config, mock_ai_service):
         finally:
             sys.stdout = old_stdout
 
-        # Verify create_world was called with AI service and theme
-        assert mock_create_world.called
-        call_args = mock_create_world.call_args
+        # Verify start_world was called with AI service and theme
+        assert mock_start_world.called
+        call_args = mock_start_world.call_args
         assert call_args is not None
         # Check that ai_service was passed
         assert 'ai_service' in call_args.kwargs or len(call_args.args) > 0
@@ -172,7 +172,7 @@ def test_world_creation_with_ai_service(mock_ai_service):
     
     character = Character(name="TestHero", strength=10, dexterity=10, intelligence=10)
     
-    with patch('cli_rpg.main.create_world') as mock_create_world, \
+    with patch('cli_rpg.main.start_world') as mock_start_world, \
          patch('cli_rpg.main.GameState') as MockGameState, \
          patch('builtins.input', return_value="quit"):  # Quit immediately
         
@@ -183,7 +183,7 @@ def test_world_creation_with_ai_service(mock_ai_service):
                 description="Starting location"
             )
         }
-        mock_create_world.return_value = (mock_world, "Town Square")
+        mock_start_world.return_value = (mock_world, "Town Square", None)
         
         # Mock GameState
         mock_game_state_instance = Mock()
@@ -201,9 +201,9 @@ def test_world_creation_with_ai_service(mock_ai_service):
         finally:
             sys.stdout = old_stdout
         
-        # Verify create_world called with AI service
+        # Verify start_world called with AI service
         # Note: strict=True is the default when not specified
-        mock_create_world.assert_called_once_with(
+        mock_start_world.assert_called_once_with(
             ai_service=mock_ai_service,
             theme="fantasy",
             strict=True
@@ -225,7 +225,7 @@ def test_game_state_initialization_with_ai(mock_ai_service):
     
     character = Character(name="TestHero", strength=10, dexterity=10, intelligence=10)
     
-    with patch('cli_rpg.main.create_world') as mock_create_world, \
+    with patch('cli_rpg.main.start_world') as mock_start_world, \
          patch('cli_rpg.main.GameState') as MockGameState, \
          patch('builtins.input', return_value="quit"):
         
@@ -236,7 +236,7 @@ def test_game_state_initialization_with_ai(mock_ai_service):
                 description="Starting location"
             )
         }
-        mock_create_world.return_value = (mock_world, "Town Square")
+        mock_start_world.return_value = (mock_world, "Town Square", None)
         
         # Mock GameState
         mock_game_state_instance = Mock()
@@ -290,7 +290,7 @@ def test_complete_e2e_flow_with_mocked_ai(mock_ai_config, mock_ai_service):
     
     with patch('cli_rpg.main.load_ai_config', return_value=mock_ai_config), \
          patch('cli_rpg.main.AIService', return_value=mock_ai_service), \
-         patch('cli_rpg.main.create_world') as mock_create_world:
+         patch('cli_rpg.main.start_world') as mock_start_world:
         
         # Mock world
         mock_world = {
@@ -299,7 +299,7 @@ def test_complete_e2e_flow_with_mocked_ai(mock_ai_config, mock_ai_service):
                 description="A futuristic plaza"
             )
         }
-        mock_create_world.return_value = (mock_world, "Town Square")
+        mock_start_world.return_value = (mock_world, "Town Square", None)
         
         with patch('builtins.input', side_effect=inputs):
             # Capture output
@@ -325,7 +325,7 @@ def test_complete_e2e_flow_with_mocked_ai(mock_ai_config, mock_ai_service):
         assert "theme" in output.lower() or "cyberpunk" in output.lower()
         
         # Verify world was created with AI
-        assert mock_create_world.called
+        assert mock_start_world.called
 
 
 def test_theme_persistence_in_save_load(mock_ai_service):
@@ -371,7 +371,7 @@ def test_default_theme_when_ai_unavailable():
     
     character = Character(name="TestHero", strength=10, dexterity=10, intelligence=10)
     
-    with patch('cli_rpg.main.create_world') as mock_create_world, \
+    with patch('cli_rpg.main.start_world') as mock_start_world, \
          patch('cli_rpg.main.GameState') as MockGameState, \
          patch('builtins.input', return_value="quit"):
         
@@ -382,7 +382,7 @@ def test_default_theme_when_ai_unavailable():
                 description="Starting location"
             )
         }
-        mock_create_world.return_value = (mock_world, "Town Square")
+        mock_start_world.return_value = (mock_world, "Town Square", None)
         
         # Mock GameState
         mock_game_state_instance = Mock()
@@ -401,8 +401,8 @@ def test_default_theme_when_ai_unavailable():
         finally:
             sys.stdout = old_stdout
         
-        # Verify create_world called with default theme
-        call_kwargs = mock_create_world.call_args.kwargs
+        # Verify start_world called with default theme
+        call_kwargs = mock_start_world.call_args.kwargs
         assert call_kwargs.get('theme') == 'fantasy'
 
 
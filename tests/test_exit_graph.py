@@ -0,0 +1,116 @@
+"""Tests for the cached overworld exit graph.
+
+These tests verify:
+1. Exits match coordinate adjacency and follow locations added later
+2. Locations moved, removed or replaced in place are not reported stale
+3. Graphs are shared per world dict
+4. Overworld exit queries no longer scan the world per direction
+"""
+
+from cli_rpg.exit_graph import ExitGraph, get_exit_graph
+from cli_rpg.models.location import Location
+
+
+def _world(*placements) -> dict:
+    """Build a world dict from (name, coords) pairs."""
+    return {name: Location(name, f"{name} area", coordinates=coords) for name, coords in placements}
+
+
+class TestExitGraph:
+    """Coordinate index and exit queries."""
+
+    def test_exits_follow_added_locations(self):
+        world = _world(("Camp", (0, 0)), ("Field", (0, 1)))
+        graph = ExitGraph(world)
+
+        assert graph.exits_from((0, 0)) == ["north"]
+
+        world["Ridge"] = Location("Ridge", "A ridge", coordinates=(1, 0))
+
+        assert graph.exits_from((0, 0)) == ["east", "north"]
+        assert graph.location_at((1, 0)) is world["Ridge"]
+
+    def test_removed_and_moved_locations_not_stale(self):
+        world = _world(("Camp", (0, 0)), ("Field", (0, 1)), ("Ridge", (1, 0)))
+        graph = ExitGraph(world)
+        assert graph.exits_from((0, 0)) == ["east", "north"]
+
+        del world["Ridge"]
+        world["Field"].coordinates = (5, 5)
+
+        assert graph.exits_from((0, 0)) == []
+        assert graph.location_at((5, 5)) is world["Field"]
+
+    def test_location_moved_into_range_is_found(self):
+        world = _world(("Aa", (0, 0)), ("Bb", (5, 5)))
+        assert world["Aa"].get_available_directions(world=world) == []
+
+        world["Bb"].coordinates = (0, 1)
+
+        assert world["Aa"].get_available_directions(world=world) == ["north"]
+
+    def test_same_size_replacement_not_stale(self):
+        world = _world(("AA", (0, 0)), ("Ridge", (1, 0)))
+        graph = ExitGraph(world)
+        assert world["AA"].get_available_directions(world=world) == ["east"]
+        assert graph.exits_from((0, 0)) == ["east"]
+
+        del world["Ridge"]
+        world["Field"] = Location("Field", "A field", coordinates=(0, 1))
+
+        assert world["AA"].get_available_directions(world=world) == ["north"]
+        assert graph.exits_from((0, 0)) == ["north"]
+
+    def test_generated_location_replacing_a_name_is_indexed(self):
+        from cli_rpg.game_state import GameState
+        from cli_rpg.models.character import Character
+
+        world = _world(("Camp", (0, 0)), ("Old Mill", (0, 1)))
+        game_state = GameState(Character("Hero", strength=10, dexterity=10, intelligence=10), world, "Camp")
+        assert game_state.get_current_location().get_available_directions(world=world) == ["north"]
+
+        game_state._add_location(Location("Old Mill", "Another mill", coordinates=(1, 0)))
+
+        assert game_state.get_current_location().get_available_directions(world=world) == ["east"]
+
+    def test_first_location_wins_and_lists_ignored(self):
+        world = _world(("First", (2, 2)), ("Second", (2, 2)))
+        world["Listed"] = Location("Listed", "Odd coords")
+        world["Listed"].coordinates = [3, 3]
+        graph = ExitGraph(world)
+
+        assert graph.location_at((2, 2)).name == "First"
+        assert graph.location_at((3, 3)) is None
+
+    def test_graph_shared_per_world(self):
+        world = _world(("Camp", (0, 0)))
+        other = _world(("Camp", (0, 0)))
+
+        assert get_exit_graph(world) is get_exit_graph(world)
+        assert get_exit_graph(world) is not get_exit_graph(other)
+
+
+class TestLocationExits:
+    """Location.get_available_directions uses the graph."""
+
+    def test_available_directions(self):
+        world = _world(("Camp", (0, 0)), ("South Road", (0, -1)), ("West Gate", (-1, 0)))
+
+        assert world["Camp"].get_available_directions(world=world) == ["south", "west"]
+
+    def test_query_does_not_scan_world(self):
+        class CountingWorld(dict):
+            scans = 0
+
+            def values(self):
+                CountingWorld.scans += 1
+                return super().values()
+
+        world = CountingWorld(_world(*[(f"Tile {i}", (i, 0)) for i in range(50)]))
+        world["Tile 10"].get_available_directions(world=world)
+        scans = CountingWorld.scans
+
+        for _ in range(20):
+            assert world["Tile 10"].get_available_directions(world=world) == ["east", "west"]
+
+        assert CountingWorld.scans == scans
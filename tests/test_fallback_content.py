@@ -11,10 +11,15 @@ Tests verify:
 8. All ENTERABLE_CATEGORIES have fallback templates
 9. Category-specific content for dungeons
 10. Role-specific content for merchants
+11. Template tables are compiled once and the batch API matches single calls
 """
 
 import pytest
-from cli_rpg.fallback_content import FallbackContentProvider
+from cli_rpg.fallback_content import (
+    ROOM_DESCRIPTIONS,
+    FallbackContentProvider,
+    compile_fallback_tables,
+)
 from cli_rpg.procedural_interiors import RoomType
 from cli_rpg.world_tiles import ENTERABLE_CATEGORIES
 
@@ -379,3 +384,40 @@ class TestReproducibility:
         assert result2a == result2a_fresh
         assert result1b == result1b_fresh
         assert result2b == result2b_fresh
+
+
+class TestCompiledTables:
+    """Tests for the precompiled selection tables and batch API."""
+
+    def test_tables_compiled_once(self):
+        """Providers share one compiled table set."""
+        assert FallbackContentProvider(seed=1)._tables is FallbackContentProvider(seed=2)._tables
+        assert compile_fallback_tables() is compile_fallback_tables()
+
+    def test_defaults_pre_resolved(self):
+        """Unknown categories resolve to the default pool in a single lookup."""
+        tables = compile_fallback_tables()
+
+        assert tables.room_descriptions[RoomType.ENTRY]["default"] == tuple(
+            ROOM_DESCRIPTIONS[RoomType.ENTRY]["default"]
+        )
+        assert all(isinstance(pool, tuple) for pool in tables.items["weapon"].values())
+
+    def test_batch_matches_individual_calls(self):
+        """get_room_contents makes the same draws as repeated get_room_content."""
+        rooms = [(room_type, category) for room_type in RoomType
+                 for category in ("dungeon", "Cave", "unknown", "")]
+
+        batch = FallbackContentProvider(seed=7).get_room_contents(rooms)
+        single_provider = FallbackContentProvider(seed=7)
+        single = [single_provider.get_room_content(rt, cat) for rt, cat in rooms]
+
+        assert batch == single
+
+    def test_returned_content_is_independent(self):
+        """Mutating returned content does not change the compiled tables."""
+        provider = FallbackContentProvider(seed=3)
+        quest = provider.get_quest_content("dungeon")
+        quest["name"] = "Changed"
+
+        assert all(q["name"] != "Changed" for q in compile_fallback_tables().quests["dungeon"])
@@ -0,0 +1,237 @@
+"""Tests for prefetched flavor text pools.
+
+These tests verify:
+1. FlavorTextPool serves pooled lines and refills below the low-water mark
+2. Pools persist across sessions
+3. Whispers, dreams and banter use the pool instead of inline AI calls
+4. GameState starts and saves the pool
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cli_rpg.ai_config import AIConfig
+from cli_rpg.ai_service import AIGenerationError, AIService
+from cli_rpg.companion_banter import CompanionBanterService
+from cli_rpg.dreams import maybe_trigger_dream
+from cli_rpg.flavor_pool import (
+    BANTER,
+    DREAM,
+    WHISPER,
+    FlavorTextPool,
+    dread_band,
+    flavor_pool_path,
+)
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.companion import Companion
+from cli_rpg.models.location import Location
+from cli_rpg.whisper import WhisperService
+
+
+def _ai_service() -> Mock:
+    """Create a mock AI service returning numbered lines."""
+    service = Mock(spec=AIService)
+    counter = iter(range(1000))
+    service.generate_whisper.side_effect = lambda **kw: f"Whisper {next(counter)}"
+    service.generate_dream.side_effect = lambda **kw: f"Dream {next(counter)}"
+    service.generate_banter.side_effect = lambda **kw: f"Banter {next(counter)}"
+    return service
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def pool():
+    """A running pool backed by a mock AI service."""
+    flavor_pool = FlavorTextPool(_ai_service(), pool_size=3, low_water=2)
+    flavor_pool.start()
+    yield flavor_pool
+    flavor_pool.shutdown()
+
+
+class TestFlavorTextPool:
+    """Serving and refilling."""
+
+    def test_empty_pool_returns_none_and_refills(self, pool):
+        assert pool.take(WHISPER, "forest", "fantasy") is None
+        assert _wait_for(lambda: pool.available(WHISPER, "forest", "fantasy") == 3)
+        assert pool.take(WHISPER, "forest", "fantasy").startswith("Whisper")
+
+    def test_refill_below_low_water(self, pool):
+        pool.prime(WHISPER, "cave", "fantasy")
+        assert _wait_for(lambda: pool.available(WHISPER, "cave", "fantasy") == 3)
+
+        pool.take(WHISPER, "cave", "fantasy")
+        pool.take(WHISPER, "cave", "fantasy")
+
+        assert _wait_for(lambda: pool.available(WHISPER, "cave", "fantasy") == 3)
+
+    def test_pools_keyed_by_dread_band(self, pool):
+        pool.prime(DREAM, None, "fantasy", dread=80)
+        assert _wait_for(lambda: pool.available(DREAM, None, "fantasy", dread=60) == 3)
+
+        assert pool.available(DREAM, None, "fantasy", dread=10) == 0
+        assert dread_band(49) == "low"
+        assert dread_band(50) == "high"
+
+    def test_failed_generation_leaves_pool_empty(self):
+        service = Mock(spec=AIService)
+        service.generate_whisper.side_effect = AIGenerationError("offline")
+        flavor_pool = FlavorTextPool(service, pool_size=3)
+        flavor_pool.start()
+        try:
+            flavor_pool.prime(WHISPER, "town", "fantasy")
+            assert _wait_for(lambda: service.generate_whisper.call_count == 1)
+            assert flavor_pool.take(WHISPER, "town", "fantasy") is None
+        finally:
+            flavor_pool.shutdown()
+
+    def test_not_started_never_generates(self):
+        service = _ai_service()
+        flavor_pool = FlavorTextPool(service)
+
+        assert flavor_pool.take(WHISPER, "town", "fantasy") is None
+        service.generate_whisper.assert_not_called()
+
+
+class TestPersistence:
+    """Pools survive between sessions."""
+
+    def test_save_and_load_round_trip(self, pool, tmp_path):
+        pool.prime(BANTER, "forest", "sci-fi")
+        assert _wait_for(lambda: pool.available(BANTER, "forest", "sci-fi") == 3)
+        path = str(tmp_path / "pool.json")
+        pool.save(path)
+
+        restored = FlavorTextPool(None, pool_size=2)
+        restored.load(path)
+
+        assert restored.available(BANTER, "forest", "sci-fi") == 2
+        assert restored.take(BANTER, "forest", "sci-fi").startswith("Banter")
+
+    def test_load_ignores_missing_and_malformed_files(self, tmp_path):
+        flavor_pool = FlavorTextPool(None)
+        flavor_pool.load(str(tmp_path / "missing.json"))
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        flavor_pool.load(str(bad))
+        flavor_pool.load_dict({"pools": [{"kind": "riddle", "category": "x",
+                                          "theme": "y", "band": "low", "lines": ["a"]}]})
+
+        assert flavor_pool.to_dict() == {"pools": []}
+
+    def test_pool_path_follows_ai_cache(self, tmp_path):
+        config = AIConfig(api_key="test", cache_file=str(tmp_path / "ai_cache.json"))
+        service = Mock(spec=AIService)
+        service.config = config
+
+        assert flavor_pool_path(service) == str(tmp_path / "flavor_pool.json")
+        assert flavor_pool_path(Mock(spec=AIService)) is None
+
+
+class TestConsumers:
+    """Whispers, dreams and banter read from the pool."""
+
+    def test_whisper_served_from_pool_without_inline_call(self):
+        service = _ai_service()
+        flavor_pool = FlavorTextPool(service)
+        flavor_pool.load_dict({"pools": [{"kind": WHISPER, "category": "forest",
+                                          "theme": "fantasy", "band": "low",
+                                          "lines": ["The trees remember."]}]})
+        whisper_service = WhisperService(ai_service=service, flavor_pool=flavor_pool)
+
+        with patch("cli_rpg.whisper.random.random", return_value=0.0):
+            first = whisper_service.get_whisper("forest")
+            second = whisper_service.get_whisper("forest")
+
+        assert first == "The trees remember."
+        assert second is not None  # Template whisper once the pool is empty
+        service.generate_whisper.assert_not_called()
+
+    def test_dream_served_from_pool(self):
+        service = _ai_service()
+        flavor_pool = FlavorTextPool(service)
+        flavor_pool.load_dict({"pools": [{"kind": DREAM, "category": "default",
+                                          "theme": "fantasy", "band": "low",
+                                          "lines": ["You dream of lanterns."]}]})
+
+        dream = maybe_trigger_dream(
+            ai_service=service, dream_chance=1.0, flavor_pool=flavor_pool
+        )
+
+        assert "You dream of lanterns." in dream
+        service.generate_dream.assert_not_called()
+
+    def test_banter_served_from_pool(self):
+        flavor_pool = FlavorTextPool(None)
+        flavor_pool.load_dict({"pools": [{"kind": BANTER, "category": "town",
+                                          "theme": "fantasy", "band": "low",
+                                          "lines": ["Smells like fresh bread."]}]})
+        banter_service = CompanionBanterService(flavor_pool=flavor_pool)
+        companion = Companion(name="Lyra", description="A ranger", recruited_at="Town")
+
+        with patch("cli_rpg.companion_banter.random.random", side_effect=[0.0, 0.99, 0.99]):
+            banter = banter_service.get_banter([companion], "town")
+
+        assert banter == ("Lyra", "Smells like fresh bread.")
+
+
+class TestGameStateFlavorPool:
+    """GameState wiring."""
+
+    def test_start_and_stop_persist_pool(self, tmp_path):
+        service = _ai_service()
+        service.config = AIConfig(api_key="test", cache_file=str(tmp_path / "ai_cache.json"))
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        world = {"Town": Location("Town", "A town", coordinates=(0, 0), category="town")}
+        game_state = GameState(character, world, "Town", ai_service=service)
+
+        game_state.start_flavor_pool()
+        flavor_pool = game_state.flavor_pool
+        assert game_state.whisper_service.flavor_pool is flavor_pool
+        assert _wait_for(lambda: flavor_pool.available(WHISPER, "town", "fantasy") > 0)
+        game_state.stop_flavor_pool()
+
+        assert game_state.flavor_pool is None
+        assert (tmp_path / "flavor_pool.json").exists()
+
+    def test_no_pool_without_ai_service(self):
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        game_state = GameState(character, {"Town": Location("Town", "A town")}, "Town")
+
+        game_state.start_flavor_pool()
+
+        assert game_state.flavor_pool is None
+
+
+class TestGenerateBanter:
+    """AIService.generate_banter."""
+
+    def test_banter_is_cleaned_and_truncated(self, tmp_path):
+        config = AIConfig(api_key="test", provider="openai", cache_file=str(tmp_path / "c.json"))
+        with patch("cli_rpg.ai_service.OpenAI"):
+            service = AIService(config)
+        with patch.object(service, "_call_llm", return_value='"' + "x" * 200 + '"'):
+            banter = service.generate_banter(theme="fantasy", location_category="forest")
+
+        assert len(banter) == 120
+        assert banter.endswith("...")
+
+    def test_short_banter_rejected(self, tmp_path):
+        config = AIConfig(api_key="test", provider="openai", cache_file=str(tmp_path / "c.json"))
+        with patch("cli_rpg.ai_service.OpenAI"):
+            service = AIService(config)
+        with patch.object(service, "_call_llm", return_value="Hm."):
+            with pytest.raises(AIGenerationError):
+                service.generate_banter(theme="fantasy")
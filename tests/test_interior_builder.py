@@ -0,0 +1,161 @@
+"""Tests for background interior building.
+
+These tests verify:
+1. Interiors are built off the main thread and handed back whole
+2. The queue is bounded and cancels builds from other regions
+3. GameState queues visible enterable POIs and enter reuses the build
+   (or builds directly when the background build overruns its wait)
+4. Seeded sessions keep building interiors on enter
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from cli_rpg.game_state import GameState
+from cli_rpg.interior_builder import InteriorBuilder
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.world_grid import SubGrid
+
+
+def _dungeon(name: str, coords: tuple[int, int]) -> Location:
+    return Location(name, f"{name} looms here", coordinates=coords, category="dungeon", is_overworld=True)
+
+
+def _interior(location, **kwargs) -> SubGrid:
+    """Stand-in for generate_subgrid_for_location: a one-room interior."""
+    sub_grid = SubGrid(parent_name=location.name)
+    sub_grid.add_location(Location(f"{location.name} Hall", "A hall", is_exit_point=True), 0, 0, 0)
+    return sub_grid
+
+
+def _wait_ready(builder: InteriorBuilder, timeout: float = 10.0) -> list:
+    """Poll pop_ready until the worker hands something back."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready = builder.pop_ready()
+        if ready:
+            return ready
+        time.sleep(0.01)
+    return []
+
+
+class TestInteriorBuilder:
+    """Queue behaviour."""
+
+    def test_builds_fallback_interior(self):
+        builder = InteriorBuilder(ai_service=None, theme="fantasy")
+        builder.start()
+        try:
+            assert builder.submit(_dungeon("Crypt", (3, 4)), (0, 0))
+            ready = _wait_ready(builder)
+        finally:
+            builder.shutdown()
+
+        assert [name for name, _ in ready] == ["Crypt"]
+        assert ready[0][1].parent_name == "Crypt"
+        assert not builder.is_pending("Crypt")
+
+    def test_queue_limit_and_cancellation(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_interior(location, **kwargs):
+            started.set()
+            release.wait(5)
+            return _interior(location)
+
+        builder = InteriorBuilder(ai_service=None, theme="fantasy", max_queued=2)
+        with patch("cli_rpg.ai_world.generate_subgrid_for_location", side_effect=slow_interior):
+            builder.start()
+            try:
+                builder.submit(_dungeon("Busy", (0, 0)), (0, 0))
+                started.wait(5)
+                assert builder.submit(_dungeon("Near", (1, 0)), (0, 0))
+                assert builder.submit(_dungeon("Far", (40, 0)), (2, 0))
+                assert not builder.submit(_dungeon("Extra", (2, 0)), (0, 0))
+
+                assert builder.cancel_outside({(0, 0)}) == 1
+                release.set()
+
+                assert builder.pop_or_wait("Busy", timeout=5) is not None
+                assert builder.pop_or_wait("Far") is None
+            finally:
+                release.set()
+                builder.shutdown()
+
+
+class TestGameStateInteriors:
+    """Integration with visibility and enter."""
+
+    def _game_state(self, seed=None) -> GameState:
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        world = {
+            "Camp": Location("Camp", "A camp", coordinates=(0, 0), is_overworld=True),
+            "Crypt": _dungeon("Crypt", (1, 0)),
+        }
+        return GameState(character, world, "Camp", seed=seed)
+
+    def test_enter_reuses_background_build(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def tracked_interior(location, **kwargs):
+            calls.append(threading.current_thread().name)
+            started.set()
+            release.wait(5)
+            return _interior(location)
+
+        game_state = self._game_state()
+        with patch("cli_rpg.ai_world.generate_subgrid_for_location", side_effect=tracked_interior):
+            game_state.start_interior_builder()
+            try:
+                assert started.wait(5)
+                game_state.current_location = "Crypt"
+                release.set()
+
+                success, _ = game_state.enter()
+            finally:
+                game_state.stop_interior_builder()
+
+        assert success
+        assert calls == ["interior-builder"]
+        assert game_state.world["Crypt"].entry_point == "Crypt Hall"
+
+    def test_enter_falls_back_when_background_build_is_stuck(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def stuck_interior(location, **kwargs):
+            calls.append(threading.current_thread().name)
+            if threading.current_thread().name == "interior-builder":
+                started.set()
+                release.wait(5)
+            return _interior(location)
+
+        game_state = self._game_state()
+        with patch("cli_rpg.ai_world.generate_subgrid_for_location", side_effect=stuck_interior), \
+                patch("cli_rpg.game_state.BACKGROUND_GEN_WAIT_TIMEOUT", 0.05):
+            game_state.start_interior_builder()
+            try:
+                assert started.wait(5)
+                game_state.current_location = "Crypt"
+
+                success, _ = game_state.enter()
+            finally:
+                release.set()
+                game_state.stop_interior_builder()
+
+        assert success
+        assert calls == ["interior-builder", threading.current_thread().name]
+        assert game_state.world["Crypt"].entry_point == "Crypt Hall"
+
+    def test_seeded_session_builds_on_enter(self):
+        game_state = self._game_state(seed=7)
+
+        game_state.start_interior_builder()
+
+        assert game_state.interior_builder is None
@@ -0,0 +1,112 @@
+"""Tests for incremental JSON field streaming.
+
+Spec: An incremental JSON streaming parser lets the description field of a
+structured AI response be displayed while the rest of the object is still
+arriving.
+"""
+
+import json
+
+from cli_rpg.json_stream import JSONFieldStreamer, StreamingFieldWriter
+
+
+def _stream(text: str, chunk_size: int, fields=("description",), limit=None):
+    """Feed text in fixed-size chunks and collect (field, delta) pairs."""
+    deltas: list[tuple[str, str]] = []
+    completed: list[str] = []
+    streamer = JSONFieldStreamer(
+        fields,
+        on_delta=lambda f, t: deltas.append((f, t)),
+        on_complete=completed.append,
+        limit=limit,
+    )
+    for i in range(0, len(text), chunk_size):
+        streamer.feed(text[i:i + chunk_size])
+    return deltas, completed
+
+
+class TestJSONFieldStreamer:
+    """Tests for JSONFieldStreamer."""
+
+    def test_extracts_description_across_chunk_boundaries(self):
+        """Decoded description text is identical regardless of chunk size."""
+        doc = json.dumps({
+            "name": "Misty Vale",
+            "description": "Fog clings to the \"old\" stones.\nA bell tolls.",
+            "category": "forest",
+        })
+        for chunk_size in (1, 3, 7, len(doc)):
+            deltas, completed = _stream(doc, chunk_size)
+            text = "".join(t for _, t in deltas)
+            assert text == "Fog clings to the \"old\" stones.\nA bell tolls."
+            assert completed == ["description"]
+
+    def test_streams_before_document_completes(self):
+        """Description fragments are emitted before the closing brace arrives."""
+        deltas: list[str] = []
+        streamer = JSONFieldStreamer(["description"], on_delta=lambda f, t: deltas.append(t))
+        streamer.feed('{"name": "Vale", "description": "A quiet gl')
+        assert "".join(deltas) == "A quiet gl"
+
+    def test_ignores_code_fence_preamble(self):
+        """Text before the JSON document (markdown fences) is skipped."""
+        doc = '```json\n{"description": "Dark halls."}\n```'
+        deltas, _ = _stream(doc, 4)
+        assert "".join(t for _, t in deltas) == "Dark halls."
+
+    def test_ignores_keys_and_other_fields(self):
+        """A value equal to a watched key name is not mistaken for the field."""
+        doc = '{"name": "description", "category": "town", "description": "Busy."}'
+        deltas, _ = _stream(doc, 5)
+        assert "".join(t for _, t in deltas) == "Busy."
+
+    def test_decodes_unicode_escapes(self):
+        """\\uXXXX escapes (including surrogate pairs) are decoded."""
+        doc = json.dumps({"description": "Café \U0001F409"}, ensure_ascii=True)
+        deltas, _ = _stream(doc, 2)
+        assert "".join(t for _, t in deltas) == "Café \U0001F409"
+
+    def test_limit_stops_after_first_value(self):
+        """Only the first matching value is streamed when limit=1."""
+        doc = json.dumps([
+            {"name": "A", "description": "First place."},
+            {"name": "B", "description": "Second place."},
+        ])
+        deltas, completed = _stream(doc, 3, limit=1)
+        assert "".join(t for _, t in deltas) == "First place."
+        assert completed == ["description"]
+
+    def test_nested_array_streams_each_value_without_limit(self):
+        """All matching values are streamed in order without a limit."""
+        doc = json.dumps([{"description": "One."}, {"description": "Two."}])
+        deltas, completed = _stream(doc, 6)
+        assert "".join(t for _, t in deltas) == "One.Two."
+        assert completed == ["description", "description"]
+
+
+class TestStreamingFieldWriter:
+    """Tests for the file-like StreamingFieldWriter adapter."""
+
+    def test_writer_extracts_field_and_completes_once(self):
+        """Writer forwards decoded field text and signals completion once."""
+        deltas: list[str] = []
+        completions: list[bool] = []
+        writer = StreamingFieldWriter(
+            on_delta=deltas.append,
+            on_complete=lambda: completions.append(True),
+            fields=["description"],
+        )
+        writer.write('{"description": "Ash')
+        writer.write(' falls."}\n')
+        writer.flush()
+        writer.close()
+        assert "".join(deltas) == "Ash falls."
+        assert completions == [True]
+
+    def test_raw_writer_forwards_text(self):
+        """Without fields, text is forwarded unchanged."""
+        deltas: list[str] = []
+        writer = StreamingFieldWriter(on_delta=deltas.append, fields=None)
+        writer.write("Hello")
+        writer.write(" there")
+        assert "".join(deltas) == "Hello there"
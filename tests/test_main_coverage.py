@@ -393,20 +393,21 @@ class TestStartGameAIError:
 
         # First call fails, second succeeds
         call_count = [0]
-        def mock_create_world(ai_service=None, theme="fantasy", strict=True):
+        def mock_start_world(ai_service=None, theme="fantasy", strict=True):
             call_count[0] += 1
             if call_count[0] == 1:
                 raise Exception("AI failed")
             # Return valid world on retry
             return (
                 {"Town": Location(name="Town", description="A town")},
-                "Town"
+                "Town",
+                None
             )
 
         # User chooses 1 (retry), then quit
         inputs = iter(['1', 'quit', 'n'])
 
-        with patch('cli_rpg.main.create_world', side_effect=mock_create_world), \
+        with patch('cli_rpg.main.start_world', side_effect=mock_start_world), \
              patch('builtins.input', lambda x: next(inputs)):
             captured_output = io.StringIO()
             with patch('sys.stdout', captured_output):
@@ -421,20 +422,21 @@ class TestStartGameAIError:
 
         character = Character(name="Hero", strength=10, dexterity=10, intelligence=10)
 
-        # Mock create_world: first strict call fails, second non-strict succeeds
-        def mock_create_world(ai_service=None, theme="fantasy", strict=True):
+        # Mock start_world: first strict call fails, second non-strict succeeds
+        def mock_start_world(ai_service=None, theme="fantasy", strict=True):
             if strict:
                 raise Exception("AI failed")
             # Return valid world for non-strict mode
             return (
                 {"Town": Location(name="Town", description="A town")},
-                "Town"
+                "Town",
+                None
             )
 
         # User chooses 2 (use default), then quit
         inputs = iter(['2', 'quit', 'n'])
 
-        with patch('cli_rpg.main.create_world', side_effect=mock_create_world), \
+        with patch('cli_rpg.main.start_world', side_effect=mock_start_world), \
              patch('builtins.input', lambda x: next(inputs)):
             captured_output = io.StringIO()
             with patch('sys.stdout', captured_output):
@@ -450,7 +452,7 @@ class TestStartGameAIError:
 
         character = Character(name="Hero", strength=10, dexterity=10, intelligence=10)
 
-        with patch('cli_rpg.main.create_world', side_effect=Exception("AI failed")), \
+        with patch('cli_rpg.main.start_world', side_effect=Exception("AI failed")), \
              patch('builtins.input', return_value='3'):
             captured_output = io.StringIO()
             with patch('sys.stdout', captured_output):
@@ -468,7 +470,7 @@ class TestStartGameAIError:
         # User enters invalid then 3 (return to menu)
         inputs = iter(['5', 'abc', '3'])
 
-        with patch('cli_rpg.main.create_world', side_effect=Exception("AI failed")), \
+        with patch('cli_rpg.main.start_world', side_effect=Exception("AI failed")), \
              patch('builtins.input', lambda x: next(inputs)):
             captured_output = io.StringIO()
             with patch('sys.stdout', captured_output):
@@ -1599,8 +1601,8 @@ class TestStartGameValidation:
 
         character = Character(name="Hero", strength=10, dexterity=10, intelligence=10)
 
-        # Mock create_world to return empty dict
-        with patch('cli_rpg.main.create_world', return_value=({}, "Town")):
+        # Mock start_world to return empty dict
+        with patch('cli_rpg.main.start_world', return_value=({}, "Town", None)):
             with pytest.raises(ValueError, match="empty world"):
                 start_game(character, strict=False)
 
@@ -1610,9 +1612,9 @@ class TestStartGameValidation:
 
         character = Character(name="Hero", strength=10, dexterity=10, intelligence=10)
 
-        # Mock create_world to return world without the starting location
+        # Mock start_world to return world without the starting location
         world = {"Forest": Location(name="Forest", description="A forest")}
-        with patch('cli_rpg.main.create_world', return_value=(world, "NonexistentTown")):
+        with patch('cli_rpg.main.start_world', return_value=(world, "NonexistentTown", None)):
             with pytest.raises(ValueError, match="not found in world"):
                 start_game(character, strict=False)
 
@@ -0,0 +1,139 @@
+"""Tests for the zoomable world map and its terrain/POI pyramid.
+
+These tests verify:
+1. Blocks summarize dominant terrain and named locations per zoom level
+2. Cached blocks are invalidated by newly seen tiles, new locations and chunk edits
+3. Views cost the same regardless of how much of the world is explored
+4. The worldmap command accepts zoom levels
+"""
+
+import pytest
+
+from cli_rpg.game_state import GameState
+from cli_rpg.main import handle_exploration_command
+from cli_rpg.map_pyramid import MapPyramid
+from cli_rpg.map_renderer import render_zoomed_worldmap
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+
+
+class FakeChunks:
+    """Minimal ChunkManager stand-in: forest west of x=0, plains elsewhere."""
+
+    chunk_size = 8
+
+    def __init__(self):
+        self.tiles = {}
+        self.revisions = {}
+        self.lookups = 0
+
+    def get_tile_at(self, x, y):
+        self.lookups += 1
+        return self.tiles.get((x, y), "forest" if x < 0 else "plains")
+
+    def set_tile_at(self, x, y, terrain):
+        self.tiles[(x, y)] = terrain
+        key = (x // self.chunk_size, y // self.chunk_size)
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+
+    def chunk_revision(self, cx, cy):
+        return self.revisions.get((cx, cy), 0)
+
+
+def _town(name, coords):
+    return Location(name, f"{name} area", coordinates=coords, is_overworld=True, is_named=True)
+
+
+def _seen(min_x, max_x, min_y, max_y):
+    return {(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)}
+
+
+class TestMapPyramid:
+    """Block summaries and invalidation."""
+
+    def test_block_summary(self):
+        world = {"Camp": _town("Camp", (0, 0)), "Mill": _town("Mill", (5, 1))}
+        seen = _seen(-6, 1, -1, 1)
+        rows = MapPyramid().view(world, (0, 0), 4, 3, 1, seen, FakeChunks())
+
+        # Blocks x -4..-1 (seen forest), 0..3 (Camp) and 4..7 (unseen but Mill)
+        assert [(c.terrain, c.poi) for c in rows[0]] == [
+            ("forest", None), ("plains", "Camp"), ("plains", "Mill")
+        ]
+
+    def test_unseen_tiles_are_blank_and_locations_always_shown(self):
+        world = {"Camp": _town("Camp", (0, 0))}
+        rows = MapPyramid().view(world, (0, 0), 1, 3, 1, set(), None)
+
+        assert [c.terrain for c in rows[0]] == [None, "plains", None]
+
+    def test_mark_seen_invalidates_block(self):
+        world = {"Camp": _town("Camp", (0, 0))}
+        pyramid = MapPyramid()
+        seen = {(0, 0)}
+        pyramid.view(world, (0, 0), 16, 3, 1, seen, FakeChunks())
+        assert pyramid.levels[16][(-1, 0)].terrain is None
+
+        seen.add((-3, 0))
+        pyramid.mark_seen([(-3, 0)])
+
+        assert pyramid.view(world, (0, 0), 16, 3, 1, seen, FakeChunks())[0][0].terrain == "forest"
+
+    def test_new_location_and_chunk_edit_invalidate_block(self):
+        world = {"Camp": _town("Camp", (0, 0))}
+        chunks = FakeChunks()
+        pyramid = MapPyramid()
+        seen = _seen(0, 3, 0, 3)
+        pyramid.mark_seen(seen)
+        assert pyramid.view(world, (0, 0), 4, 1, 1, seen, chunks)[0][0].poi == "Camp"
+
+        world["Abbey"] = _town("Abbey", (2, 2))
+        assert pyramid.view(world, (0, 0), 4, 1, 1, seen, chunks)[0][0].poi == "Abbey"
+
+        for x in range(4):
+            for y in range(1, 4):
+                chunks.set_tile_at(x, y, "swamp")
+        assert pyramid.view(world, (0, 0), 4, 1, 1, seen, chunks)[0][0].terrain == "swamp"
+
+    def test_cached_view_does_not_rescan(self):
+        world = {f"Town {i}": _town(f"Town {i}", (i * 3, 0)) for i in range(200)}
+        chunks = FakeChunks()
+        pyramid = MapPyramid()
+        seen = _seen(-100, 600, -50, 50)
+        pyramid.mark_seen(seen)
+        pyramid.view(world, (0, 0), 16, 41, 17, seen, chunks)
+        lookups = chunks.lookups
+
+        pyramid.view(world, (0, 0), 16, 41, 17, seen, chunks)
+
+        assert chunks.lookups == lookups
+
+    def test_rejects_unknown_zoom(self):
+        with pytest.raises(ValueError):
+            MapPyramid().view({}, (0, 0), 2, 3, 3, set(), None)
+
+
+class TestZoomedWorldmap:
+    """Rendering and the worldmap command."""
+
+    def test_render_marks_player_and_legend(self):
+        world = {"Camp": _town("Camp", (0, 0)), "Tower": _town("Tower", (20, 0))}
+
+        output = render_zoomed_worldmap(world, "Camp", 4, MapPyramid(), width=11, height=3)
+
+        assert output.startswith("=== WORLD MAP (1:4) ===")
+        assert "A = Tower" in output
+        assert "You (Camp)" in output
+        assert "x -20..20, y -4..4" in output
+
+    def test_worldmap_command_zoom(self):
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        world = {"Camp": _town("Camp", (0, 0))}
+        game_state = GameState(character, world, "Camp")
+
+        _, output = handle_exploration_command(game_state, "worldmap", ["1:16"])
+        assert "WORLD MAP (1:16)" in output
+
+        continuing, output = handle_exploration_command(game_state, "worldmap", ["3"])
+        assert continuing
+        assert "Unknown zoom level" in output
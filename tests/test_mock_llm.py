@@ -0,0 +1,245 @@
+"""Tests for the local mock LLM provider.
+
+These tests verify:
+1. AIConfig handles AI_PROVIDER=mock and the mock settings
+2. MockLLMClient serves schema-valid responses for every generation method
+3. Latency, error and truncation injection behave as configured
+4. Streaming through the mock client works with AIService
+"""
+
+import io
+import json
+import time
+
+import pytest
+
+from cli_rpg.ai_config import AIConfig, AIConfigError
+from cli_rpg.ai_service import AIService, AIServiceError
+from cli_rpg.mock_llm import MockLLMClient, MockLLMError, MockLLMSettings
+from cli_rpg.models.region_context import RegionContext
+from cli_rpg.models.world_context import WorldContext
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    """Mock provider config with fast retries and no cache."""
+    return AIConfig(
+        api_key="mock",
+        provider="mock",
+        model="mock",
+        retry_delay=0.001,
+        enable_caching=False,
+        mock_seed=7,
+    )
+
+
+@pytest.fixture
+def service(mock_config):
+    """AIService backed by the mock provider."""
+    return AIService(mock_config)
+
+
+# Test: AIConfig from_env with AI_PROVIDER=mock
+def test_ai_config_from_env_with_mock_provider(monkeypatch):
+    """Spec: AI_PROVIDER=mock needs no API key and reads AI_MOCK_* settings."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.delenv("AI_MODEL", raising=False)
+    monkeypatch.setenv("AI_PROVIDER", "mock")
+    monkeypatch.setenv("AI_MOCK_LATENCY_MS", "250")
+    monkeypatch.setenv("AI_MOCK_LATENCY_DISTRIBUTION", "lognormal")
+    monkeypatch.setenv("AI_MOCK_ERROR_RATE", "0.1")
+    monkeypatch.setenv("AI_MOCK_SEED", "42")
+
+    config = AIConfig.from_env()
+
+    assert config.provider == "mock"
+    assert config.api_key == "mock"
+    assert config.model == "mock"
+    assert config.mock_latency_ms == 250.0
+    assert config.mock_latency_distribution == "lognormal"
+    assert config.mock_error_rate == 0.1
+    assert config.mock_seed == 42
+
+
+# Test: mock settings survive serialization
+def test_ai_config_mock_settings_round_trip():
+    """Spec: to_dict/from_dict preserve mock provider settings."""
+    config = AIConfig(
+        api_key="mock",
+        provider="mock",
+        mock_latency_ms=100.0,
+        mock_latency_jitter_ms=20.0,
+        mock_latency_distribution="normal",
+        mock_token_delay_ms=5.0,
+        mock_error_rate=0.2,
+        mock_truncation_rate=0.3,
+        mock_seed=9,
+    )
+
+    restored = AIConfig.from_dict(config.to_dict())
+
+    assert restored.mock_latency_ms == 100.0
+    assert restored.mock_latency_jitter_ms == 20.0
+    assert restored.mock_latency_distribution == "normal"
+    assert restored.mock_token_delay_ms == 5.0
+    assert restored.mock_error_rate == 0.2
+    assert restored.mock_truncation_rate == 0.3
+    assert restored.mock_seed == 9
+
+
+@pytest.mark.parametrize("kwargs,match", [
+    ({"mock_error_rate": 1.5}, "mock_error_rate"),
+    ({"mock_truncation_rate": -0.1}, "mock_truncation_rate"),
+    ({"mock_latency_ms": -1.0}, "mock latency"),
+    ({"mock_latency_distribution": "pareto"}, "mock_latency_distribution"),
+])
+def test_ai_config_rejects_invalid_mock_settings(kwargs, match):
+    """Spec: invalid mock settings raise AIConfigError."""
+    with pytest.raises(AIConfigError, match=match):
+        AIConfig(api_key="mock", provider="mock", **kwargs)
+
+
+# Test: AIService uses the mock client
+def test_ai_service_uses_mock_client(service):
+    """Spec: provider "mock" initializes MockLLMClient."""
+    assert isinstance(service.client, MockLLMClient)
+
+
+def test_mock_response_includes_usage():
+    """Spec: non-streaming responses carry token usage like the OpenAI client."""
+    client = MockLLMClient()
+    response = client.chat.completions.create(
+        model="mock", messages=[{"role": "user", "content": "Hello there"}]
+    )
+
+    assert response.choices[0].message.content
+    assert response.usage.total_tokens == (
+        response.usage.prompt_tokens + response.usage.completion_tokens
+    )
+
+
+class TestMockGeneration:
+    """Every AIService generate_* method parses mock responses."""
+
+    def test_generate_location(self, service):
+        location = service.generate_location(theme="fantasy")
+        assert 2 <= len(location["name"]) <= 50
+        assert location["description"]
+
+    def test_generate_area(self, service):
+        area = service.generate_area(
+            theme="fantasy",
+            sub_theme_hint="haunted forest",
+            entry_direction="north",
+            context_locations=["Town Square"],
+            size=5,
+        )
+        assert len(area) == 5
+        assert area[0]["relative_coords"] == [0, 0]
+        assert len({loc["name"] for loc in area}) == 5
+
+    def test_generate_area_with_context_required_category(self, service):
+        area = service.generate_area_with_context(
+            world_context=WorldContext.default("fantasy"),
+            region_context=RegionContext.default("Test Region", (0, 0)),
+            entry_direction="east",
+            size=4,
+            required_category="temple",
+        )
+        assert area[0]["category"] == "temple"
+
+    def test_generate_enemy_item_quest(self, service):
+        enemy = service.generate_enemy(theme="fantasy", location_name="Cave", player_level=3)
+        assert enemy["health"] > 0
+
+        item = service.generate_item(theme="fantasy", location_name="Cave", player_level=3)
+        assert item["name"]
+
+        quest = service.generate_quest(theme="fantasy", npc_name="Elder", player_level=3)
+        assert quest["objective_type"] == "kill"
+
+    def test_generate_layered_context(self, service):
+        world = service.generate_world_context("fantasy")
+        assert world.theme_essence
+
+        region = service.generate_region_context(
+            theme="fantasy", world_context=world, coordinates=(0, 0)
+        )
+        assert region.name.startswith("The ")
+
+        npcs = service.generate_npcs_for_location(
+            world_context=world,
+            location_name="Millbrook",
+            location_description="A quiet village.",
+            location_category="village",
+        )
+        assert any(npc["role"] == "merchant" for npc in npcs)
+
+    def test_generate_text_content(self, service):
+        assert service.generate_lore(theme="fantasy", location_name="Ruins")
+        assert service.generate_whisper(theme="fantasy", location_category="dungeon")
+        assert service.generate_dream(
+            theme="fantasy", dread=10, choices=None, location_name="Inn", is_nightmare=False
+        )
+        assert service.generate_npc_dialogue(
+            npc_name="Ada", npc_description="A smith.", npc_role="merchant", theme="fantasy"
+        )
+        art = service.generate_ascii_art(
+            enemy_name="Wolf", enemy_description="A grey wolf.", theme="fantasy"
+        )
+        assert len(art.splitlines()) >= 3
+
+
+class TestFailureInjection:
+    """Latency, error and truncation injection."""
+
+    def test_error_rate_one_always_fails(self):
+        client = MockLLMClient(MockLLMSettings(error_rate=1.0))
+        with pytest.raises(MockLLMError):
+            client.chat.completions.create(messages=[{"role": "user", "content": "x"}])
+
+    def test_errors_surface_after_retries(self):
+        config = AIConfig(
+            api_key="mock", provider="mock", retry_delay=0.001, max_retries=2,
+            enable_caching=False, mock_error_rate=1.0,
+        )
+        service = AIService(config)
+
+        with pytest.raises(AIServiceError):
+            service.generate_location(theme="fantasy")
+        assert service.client.request_count == 3
+
+    def test_truncation_cuts_json_response(self):
+        client = MockLLMClient(MockLLMSettings(truncation_rate=1.0, seed=1))
+        response = client.chat.completions.create(
+            messages=[{"role": "user", "content": "Generate an enemy for a fantasy game"}]
+        )
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(response.choices[0].message.content)
+
+    def test_fixed_latency_is_applied(self):
+        client = MockLLMClient(MockLLMSettings(latency_ms=30))
+        start = time.perf_counter()
+        client.chat.completions.create(messages=[{"role": "user", "content": "x"}])
+        assert time.perf_counter() - start >= 0.025
+
+    @pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal"])
+    def test_latency_distributions_are_seeded(self, distribution):
+        settings = MockLLMSettings(
+            latency_ms=100, latency_jitter_ms=40, latency_distribution=distribution, seed=3
+        )
+        first = [MockLLMClient(settings)._sample_latency() for _ in range(1)]
+        second = [MockLLMClient(settings)._sample_latency() for _ in range(1)]
+        assert first == second
+        assert all(value >= 0 for value in first)
+
+
+def test_streaming_through_ai_service(service):
+    """Spec: streamed mock responses reassemble to the full response."""
+    output = io.StringIO()
+
+    text = service._call_llm_streaming("Generate a single atmospheric whisper", output)
+
+    assert text == "Something beneath the floor counts your footsteps."
+    assert output.getvalue() == text + "\n"
@@ -0,0 +1,189 @@
+"""Tests for region-paged saves.
+
+These tests verify:
+1. Autosaves round-trip through the paged layout
+2. Loading materializes only the current and adjacent regions
+3. Distant regions page in on name or coordinate lookup
+4. Unloaded pages survive a re-save unchanged
+5. Sub-location resumes load the parent's region
+6. Moves, maps and fast travel after a resume keep distant regions unloaded
+7. Save type detection recognizes paged saves
+"""
+
+import json
+from unittest.mock import patch
+
+from cli_rpg.autosave import autosave, get_autosave_path, load_autosave
+from cli_rpg.exit_graph import get_exit_graph
+from cli_rpg.game_state import GameState
+from cli_rpg.map_renderer import render_map, render_worldmap
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.models.npc import NPC
+from cli_rpg.paged_world import PagedWorld, is_paged_save
+from cli_rpg.persistence import detect_save_type, load_game_state
+from cli_rpg.world_grid import SubGrid
+from cli_rpg.world_tiles import REGION_SIZE
+
+
+def _game_state() -> GameState:
+    """Camp at the origin, a neighbour region location and two distant ones."""
+    character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+    far = REGION_SIZE * 5
+    world = {
+        "Camp": Location("Camp", "A camp", coordinates=(0, 0)),
+        "Field": Location("Field", "A field", coordinates=(0, 1)),
+        "Border": Location("Border", "A border post", coordinates=(REGION_SIZE, 0)),
+        "Far Keep": Location("Far Keep", "A distant keep", coordinates=(far, far)),
+        "Far Gate": Location("Far Gate", "The keep's gate", coordinates=(far + 1, far)),
+        "Limbo": Location("Limbo", "Nowhere in particular"),
+    }
+    return GameState(character, world, "Camp")
+
+
+def _loaded_names(world: PagedWorld) -> set[str]:
+    return set(dict.keys(world))
+
+
+class TestPagedAutosave:
+    """Round trip and lazy materialization."""
+
+    def test_round_trip_loads_nearby_regions_only(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+
+        loaded = load_autosave("Hero", save_dir=str(tmp_path))
+
+        assert isinstance(loaded.world, PagedWorld)
+        assert _loaded_names(loaded.world) == {"Camp", "Field", "Border", "Limbo"}
+        assert len(loaded.world) == 6
+        assert "Far Keep" in loaded.world
+        assert loaded.current_location == "Camp"
+
+    def test_name_lookup_pages_in_region(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+        world = load_autosave("Hero", save_dir=str(tmp_path)).world
+
+        assert world["Far Keep"].description == "A distant keep"
+        assert "Far Gate" in _loaded_names(world)
+        assert world.get("Missing") is None
+
+    def test_coordinate_lookup_pages_in_region(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+        world = load_autosave("Hero", save_dir=str(tmp_path)).world
+        far = REGION_SIZE * 5
+
+        assert get_exit_graph(world).exits_from((far, far)) == ["east"]
+        assert world.unloaded_regions == []
+
+    def test_resave_keeps_unloaded_pages(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+        loaded = load_autosave("Hero", save_dir=str(tmp_path))
+        loaded.world["Camp"].description = "A busy camp"
+
+        autosave(loaded, save_dir=str(tmp_path))
+        reloaded = load_autosave("Hero", save_dir=str(tmp_path))
+
+        assert reloaded.world["Camp"].description == "A busy camp"
+        assert reloaded.world["Far Gate"].coordinates == (REGION_SIZE * 5 + 1, REGION_SIZE * 5)
+        assert sorted(reloaded.to_dict()["world"]) == sorted(_game_state().world)
+
+    def test_adding_location_to_unloaded_region_pages_it_in(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+        world = load_autosave("Hero", save_dir=str(tmp_path)).world
+        far = REGION_SIZE * 5
+
+        world["Far Tower"] = Location("Far Tower", "A tower", coordinates=(far + 2, far))
+
+        assert {"Far Keep", "Far Gate", "Far Tower"} <= _loaded_names(world)
+
+    def test_sub_location_resume_loads_parent_region(self, tmp_path):
+        game_state = _game_state()
+        far = REGION_SIZE * 5
+        keep = game_state.world["Far Keep"]
+        keep.sub_grid = SubGrid(parent_name="Far Keep")
+        keep.sub_grid.add_location(Location("Great Hall", "A hall"), 0, 0, 0)
+        game_state.current_location = "Great Hall"
+        game_state.in_sub_location = True
+        game_state.current_sub_grid = keep.sub_grid
+        autosave(game_state, save_dir=str(tmp_path))
+
+        loaded = load_autosave("Hero", save_dir=str(tmp_path))
+
+        assert loaded.current_sub_grid is not None
+        assert loaded.current_sub_grid.parent_name == "Far Keep"
+        assert "Camp" not in _loaded_names(loaded.world)
+        assert (far // REGION_SIZE, far // REGION_SIZE) in loaded.get_explored_regions()
+        assert (0, 0) in loaded.get_explored_regions()
+
+
+class TestPagedResume:
+    """Play after a resume stays region-local."""
+
+    def _resume(self, tmp_path) -> GameState:
+        """Resume a game with named outposts in twenty distant regions."""
+        game_state = _game_state()
+        for i in range(1, 21):
+            name = f"Outpost {i}"
+            game_state.world[name] = Location(
+                name, "A lonely outpost", coordinates=(REGION_SIZE * 3 * i, 0), is_named=True
+            )
+        game_state.world["Outpost 20"].npcs.append(
+            NPC(name="Warden", description="A tired warden", dialogue="Halt.")
+        )
+        autosave(game_state, save_dir=str(tmp_path))
+        return load_autosave("Hero", save_dir=str(tmp_path))
+
+    def test_named_move_keeps_distant_regions_unloaded(self, tmp_path):
+        loaded = self._resume(tmp_path)
+        unloaded = len(loaded.world.unloaded_regions)
+        loaded.tiles_since_enterable = 0
+
+        with patch.object(loaded.location_noise_manager, "should_spawn_location", return_value=True):
+            success, _ = loaded.move("west")
+
+        assert success
+        assert loaded.get_current_location().is_named
+        assert len(loaded.world.unloaded_regions) == unloaded
+
+    def test_world_wide_queries_keep_distant_regions_unloaded(self, tmp_path):
+        loaded = self._resume(tmp_path)
+        unloaded = len(loaded.world.unloaded_regions)
+
+        render_map(loaded.world, loaded.current_location)
+        render_worldmap(loaded.world, loaded.current_location)
+        destinations = loaded.get_fast_travel_destinations()
+        explored = loaded.get_explored_regions()
+        npc_names = loaded.get_npc_names()
+
+        assert "Outpost 20" in destinations
+        assert "Warden" in npc_names
+        assert (REGION_SIZE * 3 * 20 // REGION_SIZE, 0) in explored
+        assert len(loaded.world.unloaded_regions) == unloaded
+
+
+class TestPagedSaveDetection:
+    """Paged saves through the persistence entry points."""
+
+    def test_detect_and_load(self, tmp_path):
+        filepath = autosave(_game_state(), save_dir=str(tmp_path))
+
+        assert is_paged_save(filepath)
+        assert detect_save_type(filepath) == "game_state"
+        assert load_game_state(filepath).world["Field"].coordinates == (0, 1)
+
+    def test_plain_json_is_not_paged(self, tmp_path):
+        filepath = tmp_path / "legacy.json"
+        filepath.write_text(json.dumps(_game_state().to_dict(), indent=2))
+
+        assert not is_paged_save(str(filepath))
+        assert load_game_state(str(filepath)).world["Far Keep"].coordinates is not None
+
+    def test_header_holds_no_locations(self, tmp_path):
+        autosave(_game_state(), save_dir=str(tmp_path))
+
+        with open(get_autosave_path("Hero", str(tmp_path))) as f:
+            header = json.loads(f.readline())
+
+        assert "world" not in header
+        assert header["current_region"] == [0, 0]
+        assert header["character"]["name"] == "Hero"
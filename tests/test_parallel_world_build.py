@@ -0,0 +1,239 @@
+"""Tests for concurrent initial world creation.
+
+These tests verify:
+1. create_ai_world generates frontier locations concurrently
+2. Placement is independent of AI call completion order
+3. start_ai_world returns after the starting location and streams the rest
+4. GameState merges streamed locations, skipping taken coordinates, and
+   moves wait for tiles the build has not placed yet
+5. New games start on the streamed world (world.start_world, main.start_game)
+"""
+
+import random
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cli_rpg.ai_service import AIService
+from cli_rpg.ai_world import create_ai_world, start_ai_world
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.world import start_world
+
+
+def _ai_service(delays=None, gate=None) -> Mock:
+    """Create a mock AI service whose locations are named by request.
+
+    Frontier generation blocks until ``gate`` is set, when given.
+    """
+    service = Mock(spec=AIService)
+
+    def generate(theme, context_locations=None, source_location=None, direction=None):
+        if source_location is None:
+            return {"name": "Hub", "description": "The hub.", "category": "town"}
+        if gate is not None:
+            gate.wait(timeout=5)
+        if delays is not None:
+            time.sleep(delays.uniform(0, 0.01))
+        name = f"{source_location} {direction}"
+        return {"name": name, "description": f"{name}.", "category": "forest"}
+
+    service.generate_location.side_effect = generate
+    service.generate_location_ascii_art.return_value = "art"
+    return service
+
+
+def _layout(world: dict[str, Location]) -> dict:
+    """Map coordinates to location names."""
+    return {location.coordinates: name for name, location in world.items()}
+
+
+class TestCreateAiWorld:
+    """Concurrent frontier generation."""
+
+    def test_frontier_calls_run_concurrently(self):
+        service = _ai_service()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def generate(theme, context_locations=None, source_location=None, direction=None):
+            if source_location is None:
+                return {"name": "Hub", "description": "The hub."}
+            barrier.wait()  # Deadlocks (BrokenBarrierError) if calls are sequential
+            return {"name": f"Near {direction}", "description": "Nearby."}
+
+        service.generate_location.side_effect = generate
+
+        world, start = create_ai_world(service, initial_size=5, max_workers=4)
+
+        assert start == "Hub"
+        assert len(world) == 5
+
+    def test_placement_independent_of_timing(self):
+        layouts = [
+            _layout(create_ai_world(_ai_service(random.Random(seed)), initial_size=8)[0])
+            for seed in range(3)
+        ]
+
+        assert len(layouts[0]) == 8
+        assert layouts[0] == layouts[1] == layouts[2]
+
+    def test_matches_single_worker_layout(self):
+        parallel, _ = create_ai_world(_ai_service(), initial_size=6, max_workers=4)
+        serial, _ = create_ai_world(_ai_service(), initial_size=6, max_workers=1)
+
+        assert _layout(parallel) == _layout(serial)
+
+    def test_ascii_art_set_for_every_location(self):
+        world, _ = create_ai_world(_ai_service(), initial_size=4)
+
+        assert all(location.ascii_art == "art" for location in world.values())
+
+
+class TestStartAiWorld:
+    """Streaming world build."""
+
+    def test_returns_starting_location_and_streams_rest(self):
+        build = start_ai_world(_ai_service(), initial_size=4)
+
+        assert list(build.world) == ["Hub"]
+        assert build.world["Hub"].ascii_art == "art"
+        assert build.wait(timeout=5)
+        streamed = build.drain()
+        assert len(streamed) == 3
+        assert build.drain() == []
+
+    def test_streams_same_layout_as_create_ai_world(self):
+        world, _ = create_ai_world(_ai_service(), initial_size=6)
+        build = start_ai_world(_ai_service(), initial_size=6)
+        build.wait(timeout=5)
+        streamed = dict(build.world)
+        streamed.update({location.name: location for location in build.drain()})
+
+        assert _layout(streamed) == _layout(world)
+
+    def test_starting_location_errors_propagate(self):
+        service = _ai_service()
+        service.generate_location.side_effect = RuntimeError("offline")
+
+        with pytest.raises(RuntimeError):
+            start_ai_world(service)
+
+
+class TestGameStateMerge:
+    """GameState.attach_world_build."""
+
+    def _game_state(self, build) -> GameState:
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        return GameState(character, dict(build.world), build.starting_location)
+
+    def test_attach_merges_finished_locations(self):
+        build = start_ai_world(_ai_service(), initial_size=4)
+        build.wait(timeout=5)
+        game_state = self._game_state(build)
+
+        game_state.attach_world_build(build)
+
+        assert len(game_state.world) == 4
+        assert game_state.world_build is None
+
+    def test_taken_coordinates_are_skipped(self):
+        build = start_ai_world(_ai_service(), initial_size=2)
+        build.wait(timeout=5)
+        game_state = self._game_state(build)
+        game_state.world["Camp"] = Location("Camp", "A camp.", coordinates=(0, 1))
+
+        game_state.attach_world_build(build)
+
+        assert sorted(game_state.world) == ["Camp", "Hub"]
+
+    def test_impassable_terrain_is_skipped(self):
+        build = start_ai_world(_ai_service(), initial_size=2)
+        build.wait(timeout=5)
+        game_state = self._game_state(build)
+        game_state.chunk_manager = Mock()
+        game_state.chunk_manager.get_tile_at.return_value = "water"
+
+        game_state.attach_world_build(build)
+
+        assert sorted(game_state.world) == ["Hub"]
+
+    def test_move_waits_for_unbuilt_tile(self):
+        # Fix the interleaving: the player moves before the build places any tile
+        gate = threading.Event()
+        build = start_ai_world(_ai_service(gate=gate), initial_size=5)
+        game_state = self._game_state(build)
+        game_state.attach_world_build(build)
+        assert list(game_state.world) == ["Hub"]
+
+        results = []
+        mover = threading.Thread(target=lambda: results.append(game_state.move("north")))
+        mover.start()
+        mover.join(timeout=0.2)
+        assert mover.is_alive()  # Blocked on the build, not generating its own tile
+
+        gate.set()
+        mover.join(timeout=5)
+
+        assert results and results[0][0]
+        assert game_state.current_location == "Hub north"
+        build.wait(timeout=5)
+        game_state._merge_world_build()
+        expected, _ = create_ai_world(_ai_service(), initial_size=5)
+        assert _layout(game_state.world) == _layout(expected)
+
+    def test_move_into_built_tile_does_not_wait(self):
+        gate = threading.Event()
+        build = start_ai_world(_ai_service(gate=gate), initial_size=5)
+        game_state = self._game_state(build)
+        game_state.attach_world_build(build)
+        game_state.world["Camp"] = Location("Camp", "A camp.", coordinates=(0, 1))
+
+        assert game_state.move("north")[0]
+        assert game_state.current_location == "Camp"
+        assert game_state.world_build is build
+        gate.set()
+        build.wait(timeout=5)
+
+
+class TestNewGameStreaming:
+    """New games use the streamed world build."""
+
+    def test_start_world_streams_ai_world(self):
+        world, start, build = start_world(_ai_service())
+
+        assert start == "Hub"
+        assert list(world) == ["Hub"]
+        assert build is not None and build.wait(timeout=5)
+
+    def test_start_world_falls_back_when_not_strict(self):
+        service = _ai_service()
+        service.generate_location.side_effect = RuntimeError("offline")
+
+        world, start, build = start_world(service, strict=False)
+
+        assert build is None
+        assert start in world
+        with pytest.raises(RuntimeError):
+            start_world(service, strict=True)
+
+    def test_start_game_attaches_build(self):
+        from cli_rpg.main import start_game
+
+        started = []
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        with patch("cli_rpg.main.run_game_loop", side_effect=started.append), \
+                patch("cli_rpg.world.create_ai_world") as create_ai_world:
+            start_game(character, ai_service=_ai_service(), use_wfc=False)
+
+        create_ai_world.assert_not_called()
+        game_state = started[0]
+        assert game_state.current_location == "Hub"
+        if game_state.world_build is not None:
+            assert game_state.world_build.wait(timeout=5)
+            game_state.move("north")
+        assert game_state.world_build is None
+        assert len(game_state.world) == 3
+
@@ -0,0 +1,126 @@
+"""Tests for walkable paths over WFC terrain.
+
+These tests verify:
+1. A* and distance fields route around impassable terrain and agree
+2. Distance fields are cached per target and rebuilt when a covered chunk changes
+3. Pathfinding never generates chunks
+4. Fast travel, quest hints and agents use the walkable route
+"""
+
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.models.quest import ObjectiveType, Quest, QuestStatus
+from cli_rpg.pathfinding import PathfindingService
+from cli_rpg.wfc_chunks import ChunkManager
+from cli_rpg.world_tiles import TileRegistry
+from scripts.ai_agent import Agent
+from scripts.state_parser import AgentState, QuestInfo, update_state
+
+
+def _walled_terrain() -> ChunkManager:
+    """Plains from (-16, -16) to (15, 15) with a water wall at x=2, open only at y=6."""
+    chunk_manager = ChunkManager(tile_registry=TileRegistry(), world_seed=1)
+    for x in range(-16, 16):
+        for y in range(-16, 16):
+            terrain = "water" if x == 2 and -6 <= y <= 5 else "plains"
+            chunk_manager.set_tile_at(x, y, terrain)
+    return chunk_manager
+
+
+class TestPathfindingService:
+    """Paths and distance fields."""
+
+    def test_routes_around_wall(self):
+        pathfinder = PathfindingService(_walled_terrain())
+
+        path = pathfinder.find_path((0, 0), (4, 0))
+
+        # Up to the gap at y=6, across, and back down: 6 + 4 + 6
+        assert len(path) - 1 == 16
+        assert (2, 6) in path
+        assert pathfinder.distance((0, 0), (4, 0)) == 16
+        assert pathfinder.next_step((0, 0), (4, 0)) == "north"
+        assert pathfinder.route((4, 6), (4, 0)) == ("south", 6)
+
+    def test_field_matches_a_star(self):
+        pathfinder = PathfindingService(_walled_terrain())
+        distance_field = pathfinder.distance_field((4, 0))
+
+        for start in [(-10, -10), (0, 5), (1, -6), (8, 8), (3, 3)]:
+            assert distance_field.distance_from(start) == len(pathfinder.find_path(start, (4, 0))) - 1
+
+    def test_field_cached_until_chunk_changes(self):
+        chunk_manager = _walled_terrain()
+        pathfinder = PathfindingService(chunk_manager)
+        first = pathfinder.distance_field((4, 0))
+
+        assert pathfinder.distance_field((4, 0)) is first
+
+        # Open a gap right next to the start
+        chunk_manager.set_tile_at(2, 0, "plains")
+
+        rebuilt = pathfinder.distance_field((4, 0))
+        assert rebuilt is not first
+        assert rebuilt.distance_from((0, 0)) == 4
+
+    def test_does_not_generate_chunks(self):
+        chunk_manager = _walled_terrain()
+        generated = len(chunk_manager.to_dict()["chunks"])
+        pathfinder = PathfindingService(chunk_manager)
+
+        assert pathfinder.distance((0, 10), (60, 10)) == 60
+        pathfinder.distance_field((40, 40))
+
+        assert len(chunk_manager.to_dict()["chunks"]) == generated
+
+
+class TestGameIntegration:
+    """Fast travel, quest hints and agents."""
+
+    def _game_state(self) -> GameState:
+        world = {
+            "Camp": Location("Camp", "A camp", coordinates=(0, 0), is_named=True),
+            "Lighthouse": Location("Lighthouse", "A lighthouse", coordinates=(4, 0), is_named=True),
+        }
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        return GameState(character, world, "Camp", chunk_manager=_walled_terrain())
+
+    def test_travel_distance_follows_terrain(self):
+        game_state = self._game_state()
+
+        assert game_state.travel_distance((0, 0), (4, 0)) == 16
+
+        game_state.chunk_manager = None
+        assert game_state.travel_distance((0, 0), (4, 0)) == 4
+
+    def test_quest_route_points_around_wall(self):
+        game_state = self._game_state()
+        quest = Quest(
+            name="Light the Way",
+            description="Visit the lighthouse.",
+            objective_type=ObjectiveType.EXPLORE,
+            target="Lighthouse",
+            status=QuestStatus.ACTIVE,
+        )
+        game_state.current_character.quests.append(quest)
+
+        assert game_state.get_quest_route(quest) == ("north", 16)
+        assert game_state.get_quest_directions() == {"Lighthouse": "north"}
+
+    def test_agent_follows_game_route(self):
+        state = AgentState(
+            quest_details=[QuestInfo(name="Light the Way", objective_type="explore", target="Lighthouse")]
+        )
+        update_state(
+            state,
+            {
+                "type": "actions",
+                "exits": ["north", "east", "south"],
+                "npcs": [],
+                "commands": ["go"],
+                "routes": {"Lighthouse": "south"},
+            },
+        )
+
+        assert Agent()._get_smart_direction(state) == "south"
@@ -5,7 +5,20 @@ import os
 import pytest
 import tempfile
 
-from cli_rpg.persistence import save_game_state, load_game_state
+from cli_rpg.persistence import (
+    BINARY_SAVE_MAGIC,
+    SAVE_FORMATS,
+    SAVE_SCHEMA_VERSION,
+    benchmark_save_formats,
+    convert_save,
+    detect_save_format,
+    detect_save_type,
+    list_saves,
+    load_character,
+    load_game_state,
+    save_character,
+    save_game_state,
+)
 from cli_rpg.game_state import GameState
 from cli_rpg.models.character import Character
 from cli_rpg.models.location import Location
@@ -683,3 +696,96 @@ class TestSubGridPersistence:
         assert loaded_state.world["Forest"].sub_grid is None
         # Verify in_sub_location defaults to False
         assert loaded_state.in_sub_location is False
+
+
+class TestBinarySaveFormats:
+    """Tests for binary save formats, detection and conversion."""
+
+    def _game_state(self) -> GameState:
+        character = Character("Hero", strength=12, dexterity=10, intelligence=10)
+        world = {
+            "Start": Location("Start", "Start location", coordinates=(0, 0)),
+            "Forest": Location("Forest", "A dark forest", coordinates=(0, 1)),
+        }
+        return GameState(character, world, "Start")
+
+    @pytest.mark.parametrize("save_format", ["pickle", "marshal"])
+    def test_binary_roundtrip_matches_json(self, tmp_path, save_format):
+        """Binary saves restore the same game state as JSON saves."""
+        game_state = self._game_state()
+        json_path = save_game_state(game_state, str(tmp_path / "json"))
+        binary_path = save_game_state(game_state, str(tmp_path / "bin"), save_format=save_format)
+
+        assert binary_path.endswith(".sav")
+        with open(binary_path, "rb") as f:
+            assert f.read(len(BINARY_SAVE_MAGIC)) == BINARY_SAVE_MAGIC
+        assert detect_save_type(binary_path) == "game_state"
+        assert detect_save_format(binary_path) == save_format
+
+        from_json = load_game_state(json_path).to_dict()
+        from_binary = load_game_state(binary_path).to_dict()
+        assert json.dumps(from_binary, sort_keys=True) == json.dumps(from_json, sort_keys=True)
+
+    def test_character_binary_save_detected(self, tmp_path):
+        """Character-only saves record their kind in the binary header."""
+        character = Character("Hero", strength=12, dexterity=10, intelligence=10)
+        filepath = save_character(character, str(tmp_path), save_format="pickle")
+
+        assert detect_save_type(filepath) == "character"
+        assert load_character(filepath).strength == 12
+        assert [save["filepath"] for save in list_saves(str(tmp_path))] == [filepath]
+
+    def test_convert_between_formats(self, tmp_path):
+        """A binary save converts back to readable JSON."""
+        binary_path = save_game_state(self._game_state(), str(tmp_path), save_format="pickle")
+
+        json_path = convert_save(binary_path, "json")
+
+        assert json_path == binary_path[: -len(".sav")] + ".json"
+        assert detect_save_format(json_path) == "json"
+        with open(json_path) as f:
+            assert json.load(f)["current_location"] == "Start"
+
+    def test_newer_schema_version_rejected(self, tmp_path):
+        """Saves from a newer schema version are refused."""
+        filepath = save_game_state(self._game_state(), str(tmp_path), save_format="pickle")
+        with open(filepath, "r+b") as f:
+            f.seek(len(BINARY_SAVE_MAGIC))
+            f.write((SAVE_SCHEMA_VERSION + 1).to_bytes(2, "big"))
+
+        with pytest.raises(ValueError, match="newer"):
+            load_game_state(filepath)
+
+    def test_pickled_objects_rejected(self, tmp_path):
+        """Binary saves may not reference classes or functions."""
+        import pickle
+
+        filepath = tmp_path / "evil.sav"
+        payload = pickle.dumps({"world": {}, "hook": os.system}, protocol=5)
+        with open(filepath, "wb") as f:
+            f.write(BINARY_SAVE_MAGIC + SAVE_SCHEMA_VERSION.to_bytes(2, "big") + bytes([1, 1]) + payload)
+
+        with pytest.raises(ValueError, match="not allowed"):
+            load_game_state(str(filepath))
+
+    def test_non_plain_data_not_saved(self, tmp_path):
+        """Objects that JSON could not store are refused by binary formats too."""
+        game_state = self._game_state()
+        game_state.current_character.inventory.to_dict = lambda: {"bad": object()}
+
+        with pytest.raises(ValueError, match="plain data"):
+            save_game_state(game_state, str(tmp_path), save_format="pickle")
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """Unknown format names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown save format"):
+            save_game_state(self._game_state(), str(tmp_path), save_format="yaml")
+
+    def test_benchmark_reports_every_format(self):
+        """The benchmark covers every format and binary saves are smaller."""
+        results = benchmark_save_formats(self._game_state(), repeat=1)
+        sizes = {result["format"]: result["bytes"] for result in results}
+
+        assert list(sizes) == list(SAVE_FORMATS)
+        assert sizes["pickle"] < sizes["json"]
+        assert all(result["save_ms"] >= 0 and result["load_ms"] >= 0 for result in results)
@@ -0,0 +1,123 @@
+"""Tests for the frontier-aware prefetch planner.
+
+These tests verify:
+1. Without history the four neighbours are planned first
+2. The recent heading pulls tiles (including two steps ahead) to the front
+3. Quest targets and unexplored-region directions raise priorities
+4. Region prefetch is ranked and capped
+5. Hit rate is tracked through GameState moves
+"""
+
+from unittest.mock import Mock, patch
+
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.models.quest import ObjectiveType, Quest, QuestStatus
+from cli_rpg.prefetch_planner import PrefetchPlanner
+
+
+def _coords(targets) -> list[tuple[int, int]]:
+    return [t.coords for t in targets]
+
+
+class TestPlanTiles:
+    """Tile selection."""
+
+    def test_no_history_plans_neighbours(self):
+        planner = PrefetchPlanner(max_tiles=4)
+
+        targets = planner.plan_tiles((0, 0), generated={(0, 0)})
+
+        assert sorted(_coords(targets)) == [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+    def test_heading_prioritizes_tiles_ahead(self):
+        planner = PrefetchPlanner(max_tiles=3)
+        for _ in range(3):
+            planner.record_move("east")
+
+        targets = planner.plan_tiles((5, 0), generated={(5, 0), (4, 0)})
+
+        assert _coords(targets)[:2] == [(6, 0), (7, 0)]
+        assert targets[0].priority > targets[1].priority > targets[2].priority
+        assert (4, 0) not in _coords(targets)
+
+    def test_recent_moves_outweigh_older_ones(self):
+        planner = PrefetchPlanner(max_tiles=1)
+        for direction in ("east", "east", "north"):
+            planner.record_move(direction)
+
+        assert _coords(planner.plan_tiles((0, 0), generated=set())) == [(0, 1)]
+
+    def test_quest_target_and_frontier_break_ties(self):
+        planner = PrefetchPlanner(max_tiles=1)
+
+        toward_quest = planner.plan_tiles((0, 0), set(), quest_target=(0, -10))
+        toward_frontier = planner.plan_tiles((0, 0), set(), frontier_dirs=["west"])
+
+        assert _coords(toward_quest) == [(0, -1)]
+        assert _coords(toward_frontier) == [(-1, 0)]
+
+
+class TestPlanRegions:
+    """Region selection."""
+
+    def test_regions_ranked_by_heading_and_capped(self):
+        planner = PrefetchPlanner(max_regions=2)
+        planner.record_move("north")
+
+        regions = planner.plan_regions((15, 15), [(1, 0), (0, 1), (1, 1)])
+
+        assert regions == [(0, 1), (1, 1)]
+
+
+class TestHitRate:
+    """Hit rate tracking."""
+
+    def test_hit_rate(self):
+        planner = PrefetchPlanner()
+        assert planner.hit_rate is None
+        assert planner.format_report() is None
+
+        planner.record_arrival(True)
+        planner.record_arrival(True)
+        planner.record_arrival(False)
+
+        assert planner.hit_rate == 2 / 3
+        assert "2/3" in planner.format_report()
+
+    def test_move_records_heading_and_hits(self):
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        world = {"Camp": Location("Camp", "A camp", coordinates=(0, 0), category="wilderness")}
+        game_state = GameState(character, world, "Camp")
+        game_state.background_gen_queue = Mock()
+        game_state.background_gen_queue.is_prefetched.return_value = True
+        game_state.background_gen_queue.pop_or_wait.return_value = {
+            "name": "Prefetched Glade", "description": "Ready and waiting.", "category": "forest",
+        }
+
+        with patch("cli_rpg.game_state.autosave"), \
+                patch.object(game_state.location_noise_manager, "should_spawn_location",
+                             return_value=True):
+            success, _ = game_state.move("north")
+
+        assert success is True
+        assert game_state.current_location == "Prefetched Glade"
+        assert game_state.prefetch_planner.hits == 1
+        assert game_state.prefetch_planner.heading() == (0.0, 1.0)
+        submitted = game_state.background_gen_queue.submit.call_args_list
+        assert submitted[0].kwargs["coords"] == (0, 2)
+
+    def test_quest_target_coords(self):
+        character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+        world = {
+            "Camp": Location("Camp", "A camp", coordinates=(0, 0)),
+            "Old Tower": Location("Old Tower", "A tower", coordinates=(4, 7)),
+        }
+        character.quests.append(Quest(
+            name="Climb", description="Reach the tower", objective_type=ObjectiveType.EXPLORE,
+            target="Old Tower", status=QuestStatus.ACTIVE,
+        ))
+        game_state = GameState(character, world, "Camp")
+
+        assert game_state._quest_target_coords() == (4, 7)
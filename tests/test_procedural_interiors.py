@@ -456,3 +456,67 @@ class TestTowerGenerator:
         result = gen.generate()
         # Should have at least entry + boss rooms
         assert len(result) >= 2
+
+
+class TestRoomTable:
+    """Test the compact array-backed layout."""
+
+    def test_connections_keep_insertion_order(self):
+        """Connections come back in the order they were added, without duplicates."""
+        from cli_rpg.procedural_interiors import RoomTable
+
+        table = RoomTable()
+        room = table.add_room((1, 2, -1), RoomType.CHAMBER)
+        for direction in ["down", "west", "north", "west"]:
+            table.connect(room, direction)
+
+        assert table.connections(room) == ["down", "west", "north"]
+        assert table.connection_count(room) == 3
+        assert table.coords(room) == (1, 2, -1)
+
+    def test_round_trips_room_templates(self):
+        """from_templates and to_templates preserve every field."""
+        from cli_rpg.procedural_interiors import RoomTable
+
+        templates = [
+            RoomTemplate((0, 0, 0), RoomType.ENTRY, ["east", "down"], is_entry=True),
+            RoomTemplate((1, 0, 0), RoomType.PUZZLE, ["west"], suggested_hazards=["darkness"]),
+            RoomTemplate((0, 0, -1), RoomType.BOSS_ROOM, ["up"]),
+        ]
+
+        assert RoomTable.from_templates(templates).to_templates() == templates
+
+
+class TestBatchLayouts:
+    """Test generate_interior_layouts batch mode."""
+
+    def test_batch_matches_single_layouts(self):
+        """Each table converts to the layout generate_interior_layout returns."""
+        from cli_rpg.procedural_interiors import LayoutRequest, generate_interior_layouts
+        from cli_rpg.world_grid import get_subgrid_bounds
+
+        requests = [
+            LayoutRequest(category, get_subgrid_bounds(category), seed)
+            for category in ["dungeon", "cave", "town", "tower", "tavern"]
+            for seed in range(5)
+        ]
+
+        tables = generate_interior_layouts(requests)
+
+        assert len(tables) == len(requests)
+        for request, table in zip(requests, tables):
+            expected = generate_interior_layout(request.category, request.bounds, request.seed)
+            assert table.to_templates() == expected
+
+    def test_generator_table_matches_generate(self):
+        """BSP and tower generators produce the same layout in both forms."""
+        from cli_rpg.procedural_interiors import BSPGenerator, TowerGenerator
+
+        for generator_class, bounds in [
+            (BSPGenerator, (-5, 5, -5, 5, -2, 0)),
+            (TowerGenerator, (-1, 1, -1, 1, 0, 5)),
+        ]:
+            table = generator_class(bounds=bounds, seed=9).generate_table()
+            rooms = generator_class(bounds=bounds, seed=9).generate()
+            assert table.to_templates() == rooms
+            assert sum(room.is_entry for room in rooms) == 1
@@ -0,0 +1,237 @@
+"""Tests for prompt-size budgeting and context compression.
+
+These tests verify:
+1. Text helpers estimate tokens and shorten at word boundaries
+2. PromptBudget fits lists and conversation history into token allowances
+3. Compressed region context is cached per region
+4. AIService prompt builders enforce the per-type budgets
+"""
+
+import pytest
+
+from cli_rpg.ai_config import AIConfig, AIConfigError
+from cli_rpg.ai_service import AIService
+from cli_rpg.models.region_context import RegionContext
+from cli_rpg.models.world_context import WorldContext
+from cli_rpg.prompt_budget import (
+    DEFAULT_PROMPT_TOKEN_BUDGETS,
+    MIN_HISTORY_TOKENS,
+    PromptBudget,
+    estimate_tokens,
+    shorten,
+)
+
+
+def _service(**budgets: int) -> AIService:
+    """Build an AIService with optional budget overrides."""
+    config = AIConfig(
+        api_key="test-key",
+        enable_caching=False,
+        prompt_token_budgets={**DEFAULT_PROMPT_TOKEN_BUDGETS, **budgets},
+    )
+    return AIService(config)
+
+
+class TestHelpers:
+    """estimate_tokens and shorten."""
+
+    def test_estimate_tokens_rounds_up(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+    def test_shorten_keeps_short_text(self):
+        assert shorten("short text", 50) == "short text"
+
+    def test_shorten_cuts_at_word_boundary(self):
+        result = shorten("the quick brown fox jumps over the lazy dog", 20)
+        assert len(result) <= 20
+        assert result.endswith("...")
+        assert result == "the quick brown..."
+
+
+class TestPromptBudget:
+    """Budget enforcement helpers."""
+
+    def test_fit_items_keeps_leading_items(self):
+        budget = PromptBudget()
+        items = ["Alpha Keep", "Beta Ford", "Gamma Hold", "Delta Reach"]
+
+        kept = budget.fit_items(items, max_tokens=6)
+
+        assert kept == ["Alpha Keep", "Beta Ford"]
+
+    def test_fit_items_keeps_at_least_one(self):
+        assert PromptBudget().fit_items(["A very long location name"], 1) == [
+            "A very long location name"
+        ]
+
+    def test_fit_history_returns_short_history_unchanged(self):
+        lines = ["Player: Hello", "Ada: Well met."]
+        assert PromptBudget().fit_history(lines, 100) == "Player: Hello\nAda: Well met."
+
+    def test_fit_history_summarizes_older_lines(self):
+        lines = [f"Player: question number {i} " + "x" * 80 for i in range(10)]
+
+        result = PromptBudget().fit_history(lines, 150)
+
+        assert estimate_tokens(result) <= 150
+        assert result.startswith("(Earlier: ")
+        assert result.endswith(lines[-1])
+
+    def test_fit_history_omits_when_no_room_for_summary(self):
+        lines = [f"Player: {'y' * 100}" for _ in range(6)]
+
+        result = PromptBudget().fit_history(lines, 30)
+
+        assert "earlier lines omitted" in result
+
+    @pytest.mark.parametrize("allowance", [0, -50])
+    def test_fit_history_keeps_last_line_without_allowance(self, allowance):
+        lines = [f"Player: rumor {i}" for i in range(6)] + ["Ada: The bridge is out."]
+
+        result = PromptBudget().fit_history(lines, allowance)
+
+        assert result.endswith("Ada: The bridge is out.")
+        assert estimate_tokens(result) <= MIN_HISTORY_TOKENS
+
+    def test_fit_history_shortens_long_last_line_without_allowance(self):
+        lines = ["Player: Hello", "Ada: " + "word " * 100]
+
+        result = PromptBudget().fit_history(lines, 0)
+
+        assert result.splitlines()[-1].startswith("Ada: word")
+        assert estimate_tokens(result) <= MIN_HISTORY_TOKENS
+
+    def test_measure_records_stats(self):
+        budget = PromptBudget({"location": 10})
+
+        budget.measure("location", "x" * 20)
+        budget.measure("location", "x" * 80, trimmed=True)
+
+        stats = budget.get_stats("location")
+        assert stats.prompts == 2
+        assert stats.max_tokens == 20
+        assert stats.trimmed == 1
+        assert stats.over_budget == 1
+        assert budget.snapshot()["location"]["budget"] == 10
+
+    def test_compressed_context_cached_per_region(self):
+        budget = PromptBudget()
+        world = WorldContext.default("fantasy")
+        region = RegionContext.default("Misty Vale", (0, 0))
+
+        first = budget.compress_context(world, region)
+        second = budget.compress_context(world, region)
+
+        assert first is second
+
+    def test_compressed_context_rebuilt_when_region_changes(self):
+        budget = PromptBudget()
+        world = WorldContext.default("fantasy")
+        region = RegionContext.default("Misty Vale", (0, 0))
+
+        first = budget.compress_context(world, region)
+        region.theme = "A drowned valley of sunken bell towers"
+        second = budget.compress_context(world, region)
+
+        assert second is not first
+        assert second.region_theme == region.theme
+
+    def test_higher_level_shortens_fields(self):
+        budget = PromptBudget()
+        world = WorldContext.default("fantasy")
+        region = RegionContext.default("Misty Vale", (0, 0))
+        region.theme = "word " * 60
+
+        compressed = budget.compress_context(world, region, level=2)
+
+        assert len(compressed.region_theme) <= 50
+
+
+class TestAIServiceBudgets:
+    """Prompt builders enforce budgets."""
+
+    def test_default_budgets_leave_normal_prompts_untouched(self):
+        service = _service()
+        world = WorldContext.default("fantasy")
+        region = RegionContext.default("Misty Vale", (0, 0))
+
+        prompt = service._build_location_with_context_prompt(
+            world, region, None, None, "forest",
+            [{"name": "Old Mill", "direction": "north"}],
+        )
+
+        assert region.theme in prompt
+        assert "Old Mill (north)" in prompt
+        assert service.prompt_budget.get_stats("location").trimmed == 0
+
+    def test_long_theme_essence_kept_intact_when_under_budget(self):
+        service = _service(location=5000)
+        world = WorldContext.default("fantasy")
+        world.theme_essence = "A realm of ember-lit citadels and restless ghosts " * 6
+        region = RegionContext.default("Misty Vale", (0, 0))
+
+        prompt = service._build_location_with_context_prompt(
+            world, region, None, None, "forest", []
+        )
+
+        assert world.theme_essence in prompt
+        assert service.prompt_budget.get_stats("location").trimmed == 0
+
+    def test_location_prompt_compressed_when_over_budget(self):
+        service = _service(location=300)
+        world = WorldContext.default("fantasy")
+        region = RegionContext.default("Misty Vale", (0, 0))
+        region.theme = "A sprawling marshland " * 9
+        neighbors = [
+            {"name": f"Neighbor {i}", "direction": d}
+            for i, d in enumerate(["north", "south", "east", "west"])
+        ]
+
+        prompt = service._build_location_with_context_prompt(
+            world, region, None, None, "swamp", neighbors
+        )
+
+        assert "Neighbor 3" not in prompt
+        assert service.prompt_budget.get_stats("location").trimmed == 1
+
+    def test_conversation_history_summarized_when_over_budget(self):
+        service = _service(npc=250)
+        history = []
+        for i in range(10):
+            history.append({"role": "player", "content": f"Tell me about rumor {i}. " * 4})
+            history.append({"role": "npc", "content": f"Rumor {i} is old news. " * 4})
+
+        prompt = service._build_conversation_prompt(
+            npc_name="Ada", npc_description="A smith.", npc_role="merchant",
+            theme="fantasy", location_name="Forge", conversation_history=history,
+            player_input="What else?",
+        )
+
+        assert estimate_tokens(prompt) <= 250
+        assert "(Earlier: " in prompt or "earlier lines omitted" in prompt
+        assert "Rumor 9 is old news." in prompt
+
+    def test_area_prompt_trims_existing_locations(self):
+        service = _service(area=600)
+        names = [f"Existing Location Number {i}" for i in range(10)]
+
+        prompt = service._build_area_prompt(
+            "fantasy", "haunted forest", "north", names, 5
+        )
+
+        assert names[0] in prompt
+        assert names[9] not in prompt
+        assert service.prompt_budget.get_stats("area").trimmed == 1
+
+    def test_invalid_budget_rejected(self):
+        with pytest.raises(AIConfigError, match="prompt_token_budgets"):
+            AIConfig(api_key="test-key", prompt_token_budgets={"location": 0})
+
+    def test_budgets_round_trip(self):
+        config = AIConfig(api_key="test-key", prompt_token_budgets={"location": 321})
+
+        restored = AIConfig.from_dict(config.to_dict())
+
+        assert restored.prompt_token_budgets == {"location": 321}
@@ -847,3 +847,76 @@ class TestRecordTalk:
         messages = character.record_talk("Random NPC")
 
         assert messages == []
+
+
+class TestQuestObjectiveIndex:
+    """Tests for the (objective type, target) index behind the record_* methods."""
+
+    def test_finished_quests_are_pruned_from_index(self, character, kill_quest):
+        """Completed quests are dropped from the index when next matched."""
+        finished = Quest(
+            name="Old Hunt",
+            description="Already done",
+            status=QuestStatus.COMPLETED,
+            objective_type=ObjectiveType.KILL,
+            target="Goblin",
+        )
+        character.quests.extend([finished, kill_quest])
+
+        character.record_kill("Goblin")
+        kill_quest.status = QuestStatus.COMPLETED
+        character.record_kill("Goblin")
+
+        assert character._quests_for(ObjectiveType.KILL, "goblin") == []
+        assert finished.current_count == 0
+
+    def test_quests_accepted_later_are_indexed(self, character, kill_quest):
+        """Quests appended after an event are picked up incrementally."""
+        character.record_kill("Goblin")
+        character.quests.append(kill_quest)
+
+        messages = character.record_kill("goblin")
+
+        assert messages == ["Quest progress: Goblin Slayer [1/3]"]
+
+    def test_abandoned_quest_removed_from_index(self, character, kill_quest):
+        """Abandoning a quest stops it receiving progress."""
+        character.quests.append(kill_quest)
+        character.record_kill("Goblin")
+
+        character.abandon_quest("Goblin Slayer")
+
+        assert character.record_kill("Goblin") == []
+        assert kill_quest.current_count == 1
+
+    def test_replaced_quest_list_is_reindexed(self, character, kill_quest):
+        """Assigning a new quest list (e.g. on load) rebuilds the index."""
+        character.record_kill("Goblin")
+        character.quests = [kill_quest]
+
+        assert character.record_kill("Goblin") == ["Quest progress: Goblin Slayer [1/3]"]
+
+    def test_later_stage_targets_are_indexed(self, character):
+        """Events for a later stage match once earlier stages complete."""
+        from cli_rpg.models.quest import QuestStage
+
+        quest = Quest(
+            name="Two Steps",
+            description="Talk then kill",
+            status=QuestStatus.ACTIVE,
+            objective_type=ObjectiveType.KILL,
+            target="Goblin",
+            stages=[
+                QuestStage(name="Ask", description="Ask the elder",
+                           objective_type=ObjectiveType.TALK, target="Elder"),
+                QuestStage(name="Hunt", description="Hunt the wolf",
+                           objective_type=ObjectiveType.KILL, target="Wolf"),
+            ],
+        )
+        character.quests.append(quest)
+
+        assert character.record_kill("Wolf") == []
+        assert character.record_talk("Elder") == ["Stage complete: Ask", "Next: Hunt"]
+        assert character.record_kill("Wolf") == [
+            "Quest 'Two Steps' complete! Return to turn in."
+        ]
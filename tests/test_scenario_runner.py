@@ -12,13 +12,19 @@ import pytest
 
 from scripts.validation.assertions import Assertion, AssertionChecker, AssertionResult, AssertionType
 from scripts.validation.scenarios import (
+    ForkedScenarioRunner,
     Scenario,
     ScenarioRunner,
     ScenarioResult,
     ScenarioStep,
     StepResult,
+    _is_response_end,
+    format_scenario_report,
+    run_scenarios_parallel,
 )
 
+SCENARIOS_DIR = Path(__file__).parent.parent / "scripts" / "scenarios"
+
 
 # === YAML Parsing Tests ===
 
@@ -584,3 +590,54 @@ class TestResultDataclasses:
         assert result.passed is False
         assert result.assertions_passed == 3
         assert result.assertions_failed == 2
+
+
+# === Forked / Parallel Runner Tests ===
+
+
+class TestForkedScenarioRunner:
+    """Tests for forked games and parallel scenario runs."""
+
+    def test_response_end_detection(self) -> None:
+        """Test that replies end at actions, combat or game over."""
+        assert _is_response_end('{"type": "actions", "exits": []}')
+        assert _is_response_end('{"type": "combat", "enemy": "Wolf"}')
+        assert _is_response_end('{"type": "narrative", "text": "GAME OVER - You have fallen in battle."}')
+        assert not _is_response_end('{"type": "state", "location": "Town"}')
+        assert not _is_response_end("not json")
+
+    def test_forked_runner_runs_scenario(self) -> None:
+        """Test that a scenario runs against a forked game."""
+        runner = ForkedScenarioRunner(response_timeout=20.0)
+
+        result = runner.run(SCENARIOS_DIR / "movement" / "basic_navigation.yaml")
+
+        assert result.passed is True
+        assert result.steps_run == 5
+        assert all(step.output for step in result.results)
+
+    @pytest.mark.slow
+    def test_parallel_results_in_input_order(self) -> None:
+        """Test that parallel runs return one result per path, in order."""
+        paths = [
+            SCENARIOS_DIR / "rest" / "basic_rest.yaml",
+            SCENARIOS_DIR / "movement" / "basic_navigation.yaml",
+        ]
+
+        results = run_scenarios_parallel(paths, workers=2)
+
+        assert [r.scenario_name for r in results] == ["Basic Rest", "Basic Navigation"]
+
+    def test_format_scenario_report(self) -> None:
+        """Test the per-scenario wall time report."""
+        results = [
+            ScenarioResult("Fast", True, 1, 2, 0, [], 0.25),
+            ScenarioResult("Slow", False, 1, 1, 1, [], 1.5),
+        ]
+
+        report = format_scenario_report(results, wall_time=1.6)
+
+        lines = report.splitlines()
+        assert lines[0].startswith("FAIL") and "Slow" in lines[0]
+        assert "1/2 assertions" in lines[0]
+        assert lines[-1] == "1/2 scenarios passed in 1.60s (1.75s of scenario time)"
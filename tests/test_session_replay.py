@@ -7,6 +7,7 @@ These tests verify the --replay CLI flag and related functionality:
 - Test 4: --validate mode detects state divergence
 - Test 5: --continue-at N starts from command N
 - Test 6: replay works with JSON mode
+- Test 7: snapshots are logged and --from N fast-forwards from them
 """
 import json
 import pytest
@@ -19,7 +20,9 @@ from cli_rpg.session_replay import (
     extract_commands,
     extract_states,
     validate_state,
+    build_log_index,
     LogEntry,
+    SnapshotRef,
     StateSnapshot,
 )
 
@@ -438,3 +441,94 @@ class TestReplayModeIntegration:
 
         exit_code = main(["--replay", str(log_file), "--validate"])
         assert exit_code == 0
+
+
+class TestSnapshotReplay:
+    """Tests for snapshot logging and --from N fast-forward."""
+
+    COMMANDS = "look\ngo north\ngo south\nlook\ngo east\ngo west\nstatus\ngo north\nlook\n"
+
+    def _record_session(self, log_file: Path) -> None:
+        """Record a seeded non-interactive session with a snapshot every 3 commands."""
+        import io
+        import random
+        from cli_rpg import logging_service
+        from cli_rpg.main import run_non_interactive
+
+        random.seed(7)
+        with patch("cli_rpg.main.load_ai_config", return_value=None), \
+                patch.object(logging_service, "DEFAULT_SNAPSHOT_INTERVAL", 3), \
+                patch("sys.stdin", io.StringIO(self.COMMANDS)):
+            run_non_interactive(log_file=str(log_file), skip_character_creation=True, seed=7)
+
+    def test_index_keys_states_by_command_count(self, tmp_path):
+        """build_log_index keys states by commands executed before them."""
+        log_file = tmp_path / "indexed.log"
+        log_file.write_text(
+            '{"type": "session_start", "seed": 5}\n'
+            '{"type": "state", "location": "A", "health": 1, "max_health": 1, "gold": 0, "level": 1}\n'
+            '{"type": "command", "input": "look"}\n'
+            '{"type": "state", "location": "B", "health": 1, "max_health": 1, "gold": 0, "level": 1}\n'
+            '{"type": "snapshot", "command_index": 1, "file": "indexed.log.snapshots/cmd_000001.json"}\n'
+        )
+
+        index = build_log_index(str(log_file))
+
+        assert index.seed == 5
+        assert index.commands == ["look"]
+        assert index.states[0].location == "A"
+        assert index.states[1].location == "B"
+        assert index.snapshots == [
+            SnapshotRef(1, str(tmp_path / "indexed.log.snapshots" / "cmd_000001.json"))
+        ]
+
+    def test_nearest_snapshot(self, tmp_path):
+        """nearest_snapshot returns the latest snapshot at or before N."""
+        log_file = tmp_path / "near.log"
+        log_file.write_text(
+            '{"type": "snapshot", "command_index": 100, "file": "a"}\n'
+            '{"type": "snapshot", "command_index": 200, "file": "b"}\n'
+        )
+        index = build_log_index(str(log_file))
+
+        assert index.nearest_snapshot(50) is None
+        assert index.nearest_snapshot(100).command_index == 100
+        assert index.nearest_snapshot(250).command_index == 200
+
+    def test_session_writes_snapshot_files(self, tmp_path):
+        """Non-interactive sessions log a snapshot every interval."""
+        log_file = tmp_path / "session.log"
+        self._record_session(log_file)
+
+        index = build_log_index(str(log_file))
+
+        # Snapshots are skipped while in combat, so only the first is guaranteed
+        assert index.snapshots[0].command_index == 3
+        assert all(ref.command_index % 3 == 0 for ref in index.snapshots)
+        snapshot = json.loads(Path(index.snapshots[0].path).read_text())
+        assert snapshot["command_index"] == 3
+        assert "game_state" in snapshot and "rng_state" in snapshot
+
+    def test_replay_from_matches_full_replay(self, tmp_path, capsys):
+        """--from N produces the same output and state as a full replay."""
+        from cli_rpg.main import run_replay_mode
+
+        log_file = tmp_path / "session.log"
+        self._record_session(log_file)
+        capsys.readouterr()
+
+        with patch("cli_rpg.main.load_ai_config", return_value=None):
+            assert run_replay_mode(str(log_file), validate=True) == 0
+            full = capsys.readouterr().out
+            assert run_replay_mode(str(log_file), validate=True, start_from=5) == 0
+            fast = capsys.readouterr().out
+
+        assert "[1/9]" not in fast and "[5/9]" not in fast
+        assert fast[fast.index("[6/9]"):] == full[full.index("[6/9]"):]
+
+    def test_from_flag_parses(self, tmp_path):
+        """--from flag should parse with --replay."""
+        from cli_rpg.main import parse_args
+
+        args = parse_args(["--replay", str(tmp_path / "test.log"), "--from", "500"])
+        assert args.replay_from == 500
@@ -0,0 +1,133 @@
+"""Tests for per-session RNG streams.
+
+These tests verify:
+1. Named streams are deterministic per seed and independent of each other
+2. Unseeded sessions fall back to the global random module
+3. Stream state survives GameState save/load
+4. Seeded game states do not depend on the global random module
+"""
+
+import random
+from unittest.mock import Mock
+
+from cli_rpg.combat import CombatEncounter, generate_loot, spawn_enemies
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.enemy import Enemy
+from cli_rpg.models.location import Location
+from cli_rpg.models.weather import Weather
+from cli_rpg.random_encounters import check_for_random_encounter
+from cli_rpg.session_rng import (
+    COMBAT,
+    ENCOUNTERS,
+    LOOT,
+    WEATHER,
+    SessionRNG,
+    session_stream,
+)
+
+
+def _game_state(seed=None) -> GameState:
+    """Create a minimal game state in the wilderness."""
+    character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+    world = {"Wilds": Location("Wilds", "Open land", coordinates=(0, 0), category="forest")}
+    return GameState(character, world, "Wilds", seed=seed)
+
+
+class TestSessionRNG:
+    """Stream derivation and serialization."""
+
+    def test_streams_are_deterministic_per_seed(self):
+        first = SessionRNG(42)
+        second = SessionRNG(42)
+
+        assert [first.stream(COMBAT).random() for _ in range(3)] == [
+            second.stream(COMBAT).random() for _ in range(3)
+        ]
+
+    def test_streams_are_independent(self):
+        busy = SessionRNG(42)
+        quiet = SessionRNG(42)
+        for _ in range(100):
+            busy.stream(WEATHER).random()
+
+        assert busy.stream(COMBAT).random() == quiet.stream(COMBAT).random()
+        assert SessionRNG(42).stream(LOOT).random() != SessionRNG(42).stream(COMBAT).random()
+
+    def test_unseeded_uses_global_random(self):
+        session_rng = SessionRNG()
+
+        assert session_rng.stream(COMBAT) is None
+        assert session_stream(Mock(rng=session_rng), COMBAT) is random
+        assert session_stream(Mock(), COMBAT) is random
+        assert session_stream(None, LOOT, default="fallback") == "fallback"
+
+    def test_round_trip_continues_streams(self):
+        session_rng = SessionRNG(7)
+        session_rng.stream(ENCOUNTERS).random()
+
+        restored = SessionRNG.from_dict(session_rng.to_dict())
+
+        assert restored.stream(ENCOUNTERS).random() == session_rng.stream(ENCOUNTERS).random()
+        assert restored.stream(WEATHER).random() == session_rng.stream(WEATHER).random()
+
+
+class TestThreading:
+    """Subsystems draw from the session streams."""
+
+    def test_seeded_encounters_ignore_global_random(self):
+        outcomes = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            game_state = _game_state(seed=99)
+            outcomes.append([check_for_random_encounter(game_state) is not None
+                             for _ in range(20) if not game_state.is_in_combat()])
+
+        assert outcomes[0] == outcomes[1]
+
+    def test_combat_uses_session_stream(self):
+        game_state = _game_state(seed=5)
+        enemy = Enemy("Goblin", health=30, max_health=30, attack_power=3, defense=1,
+                      xp_reward=10, level=1)
+        combat = CombatEncounter(game_state.current_character, enemy=enemy,
+                                 game_state=game_state)
+
+        assert combat._random is game_state.rng.stream(COMBAT)
+
+    def test_rng_parameters(self):
+        enemy = Enemy("Goblin", health=30, max_health=30, attack_power=3, defense=1,
+                      xp_reward=10, level=1)
+
+        loot = [generate_loot(enemy, 3, rng=random.Random(11)) for _ in range(2)]
+        enemies = [spawn_enemies("Forest", 5, rng=random.Random(3)) for _ in range(2)]
+
+        assert repr(loot[0]) == repr(loot[1])
+        assert [e.name for e in enemies[0]] == [e.name for e in enemies[1]]
+
+    def test_weather_transition_uses_stream(self):
+        weathers = [Weather(), Weather()]
+        for weather in weathers:
+            rng = random.Random(8)
+            for _ in range(50):
+                weather.transition(rng)
+
+        assert weathers[0].condition == weathers[1].condition
+
+
+class TestPersistence:
+    """GameState save/load."""
+
+    def test_seeded_streams_saved_and_restored(self):
+        game_state = _game_state(seed=123)
+        game_state.rng.stream(COMBAT).random()
+
+        restored = GameState.from_dict(game_state.to_dict())
+
+        assert restored.rng.seed == 123
+        assert restored.rng.stream(COMBAT).random() == game_state.rng.stream(COMBAT).random()
+
+    def test_unseeded_state_not_saved(self):
+        data = _game_state().to_dict()
+
+        assert "rng" not in data
+        assert GameState.from_dict(data).rng.seed is None
@@ -0,0 +1,95 @@
+"""Tests for content-addressed strings in saves.
+
+These tests verify:
+1. Long art and descriptions are stored once and referenced by ID
+2. Short strings stay inline and unpacked saves load unchanged
+3. Loaded locations and NPCs share identical string instances
+4. Paged autosaves keep the strings of unloaded pages across re-saves
+"""
+
+import json
+
+import pytest
+
+from cli_rpg.autosave import autosave, get_autosave_path, load_autosave
+from cli_rpg.game_state import GameState
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.models.npc import NPC
+from cli_rpg.persistence import load_game_state, save_game_state
+from cli_rpg.string_store import StringStore, blob_id, pack_save_data, unpack_save_data
+from cli_rpg.world_tiles import REGION_SIZE
+
+ART = "\n".join(["    /\\    ", "   /  \\   ", "  /____\\  ", "  |    |  ", "  | [] |  ", "  |____|  "])
+DESCRIPTION = "A quiet clearing ringed by birches, their pale bark catching the light."
+
+
+def _game_state(count: int = 6, spacing: int = 1) -> GameState:
+    """Locations and NPCs that all share the same art and description."""
+    world = {}
+    for i in range(count):
+        location = Location(
+            f"Clearing {i}", DESCRIPTION, coordinates=(i * spacing, 0), ascii_art=ART
+        )
+        location.npcs.append(NPC(f"Hermit {i}", DESCRIPTION, "Hello.", ascii_art=ART))
+        world[location.name] = location
+    character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+    return GameState(character, world, "Clearing 0")
+
+
+class TestStringStore:
+    """Packing and unpacking serialized data."""
+
+    def test_pack_stores_each_string_once(self):
+        data = _game_state().to_dict()
+
+        packed = pack_save_data(data)
+
+        assert set(packed["strings"]) == {blob_id(ART), blob_id(DESCRIPTION)}
+        assert packed["world"]["Clearing 3"]["ascii_art"] == {"$blob": blob_id(ART)}
+        assert packed["world"]["Clearing 3"]["npcs"][0]["description"] == {
+            "$blob": blob_id(DESCRIPTION)
+        }
+        assert unpack_save_data(json.loads(json.dumps(packed))) == data
+
+    def test_short_strings_stay_inline(self):
+        packed = pack_save_data({"world": {"Hut": {"description": "A hut"}}})
+
+        assert packed == {"world": {"Hut": {"description": "A hut"}}}
+        assert unpack_save_data(packed) == packed
+
+    def test_unknown_reference_rejected(self):
+        with pytest.raises(ValueError):
+            StringStore().unpack({"description": {"$blob": "missing"}})
+
+
+class TestSavesShareStrings:
+    """Manual saves and paged autosaves."""
+
+    def test_manual_save_round_trip_shares_instances(self, tmp_path):
+        game_state = _game_state()
+        filepath = save_game_state(game_state, str(tmp_path))
+
+        with open(filepath) as f:
+            assert f.read().count("birches") == 1
+        loaded = load_game_state(filepath)
+
+        first, last = loaded.world["Clearing 0"], loaded.world["Clearing 5"]
+        assert first.ascii_art == ART
+        assert first.ascii_art is last.ascii_art
+        assert first.description is last.npcs[0].description
+
+    def test_paged_resave_keeps_unloaded_strings(self, tmp_path):
+        game_state = _game_state(count=3, spacing=REGION_SIZE * 4)
+        game_state.world["Clearing 0"].description = "Home, with a long description of its own."
+        autosave(game_state, save_dir=str(tmp_path))
+
+        loaded = load_autosave("Hero", save_dir=str(tmp_path))
+        autosave(loaded, save_dir=str(tmp_path))
+        reloaded = load_autosave("Hero", save_dir=str(tmp_path))
+
+        with open(get_autosave_path("Hero", str(tmp_path))) as f:
+            header = json.loads(f.readline())
+        assert set(header["strings"]) == {blob_id(ART), blob_id(DESCRIPTION)}
+        assert reloaded.world["Clearing 2"].npcs[0].ascii_art == ART
+        assert reloaded.to_dict()["world"] == game_state.to_dict()["world"]
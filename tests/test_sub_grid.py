@@ -281,3 +281,67 @@ class TestSubGridEntryPoint:
 
         assert grid.get_by_coordinates(0, 0) is not None
         assert grid.get_by_coordinates(0, 0).name == "Entrance"
+
+
+class TestSubGridDerivedLookups:
+    """Test the dense room index and cached exit/treasure data."""
+
+    def _dungeon(self) -> SubGrid:
+        grid = SubGrid(bounds=(-3, 3, -3, 3, -1, 0), parent_name="Dungeon")
+        entry = Location(name="Entry", description="The way in.")
+        entry.is_exit_point = True
+        grid.add_location(entry, 0, 0, 0)
+        vault = Location(name="Vault", description="A vault.")
+        vault.treasures = [
+            {"name": "Chest 1", "opened": False, "locked": False, "items": []},
+            {"name": "Chest 2", "opened": True, "locked": False, "items": []},
+        ]
+        grid.add_location(vault, 3, 3, -1)
+        return grid
+
+    def test_lookups_follow_direct_grid_writes(self):
+        """Rooms written straight into _grid are still found by coordinates."""
+        grid = self._dungeon()
+        assert grid.get_by_coordinates(1, 0, 0) is None
+
+        cellar = Location(name="Cellar", description="A cellar.", coordinates=(1, 0, 0))
+        grid._grid[(1, 0, 0)] = cellar
+
+        assert grid.get_by_coordinates(1, 0, 0) is cellar
+        assert grid.get_by_coordinates(3, 3, -1).name == "Vault"
+
+    def test_exit_distances_update_when_rooms_added(self):
+        """The cached exit distance map is rebuilt after add_location."""
+        grid = self._dungeon()
+        assert grid.get_distance_to_nearest_exit((3, 3, -1)) == 7
+
+        stairs = Location(name="Stairs", description="Stairs out.")
+        stairs.is_exit_point = True
+        grid.add_location(stairs, 3, 2, -1)
+
+        assert grid.get_distance_to_nearest_exit((3, 3, -1)) == 1
+        # Outside the bounds falls back to scanning the exits
+        assert grid.get_distance_to_nearest_exit((0, 0, 5)) == 5
+
+    def test_treasure_counters_track_open_treasure(self):
+        """open_treasure keeps the running counters current."""
+        grid = self._dungeon()
+        assert grid.get_treasure_stats() == (1, 2)
+
+        vault = grid.get_by_name("Vault")
+        grid.open_treasure(vault.treasures[0])
+        grid.open_treasure(vault.treasures[0])
+
+        assert vault.treasures[0]["opened"] is True
+        assert grid.get_treasure_stats() == (2, 2)
+        assert grid.are_all_treasures_opened() is True
+
+    def test_invalidate_caches_picks_up_in_place_edits(self):
+        """Chests placed on existing rooms are counted after invalidate_caches."""
+        grid = self._dungeon()
+        assert grid.get_treasure_stats() == (1, 2)
+
+        grid.get_by_name("Entry").treasures.append({"name": "Chest 3", "opened": False})
+        grid.invalidate_caches()
+
+        assert grid.get_treasure_stats() == (1, 3)
@@ -0,0 +1,184 @@
+"""Tests for the game-time scheduler.
+
+These tests verify:
+1. TimeScheduler pops only due items, in source-list order
+2. sync() registers appended items incrementally and rebuilds on replacement
+3. Quest deadlines, world events and interior events are driven by the scheduler
+"""
+
+from unittest.mock import patch
+
+from cli_rpg.game_state import GameState
+from cli_rpg.interior_events import InteriorEvent, progress_interior_events
+from cli_rpg.models.character import Character
+from cli_rpg.models.location import Location
+from cli_rpg.models.quest import ObjectiveType, Quest, QuestStatus
+from cli_rpg.models.world_event import WorldEvent
+from cli_rpg.time_scheduler import (
+    INTERIOR_EVENTS,
+    QUEST_DEADLINES,
+    WORLD_EVENTS,
+    TimeScheduler,
+)
+from cli_rpg.world_events import get_active_events, progress_events
+from cli_rpg.world_grid import SubGrid
+
+
+def _game_state() -> GameState:
+    """Create a minimal game state."""
+    character = Character("Hero", strength=10, dexterity=10, intelligence=10)
+    world = {"Town": Location("Town", "A town", coordinates=(0, 0))}
+    return GameState(character, world, "Town")
+
+
+def _timed_quest(name: str, accepted_at: int, limit: int) -> Quest:
+    """Create an active time-limited quest."""
+    return Quest(
+        name=name,
+        description="Hurry",
+        objective_type=ObjectiveType.KILL,
+        target="Goblin",
+        status=QuestStatus.ACTIVE,
+        time_limit_hours=limit,
+        accepted_at=accepted_at,
+    )
+
+
+class TestTimeScheduler:
+    """Heap behaviour and source syncing."""
+
+    def test_pop_due_returns_only_due_items_in_order(self):
+        scheduler = TimeScheduler()
+        scheduler.schedule("k", 10, "late", order=0)
+        scheduler.schedule("k", 5, "second", order=2)
+        scheduler.schedule("k", 3, "first", order=1)
+
+        due = scheduler.pop_due("k", 6)
+
+        assert [entry.item for entry in due] == ["first", "second"]
+        assert scheduler.next_due("k") == 10
+        assert scheduler.pending("k") == ["late"]
+
+    def test_sync_schedules_appended_items_once(self):
+        scheduler = TimeScheduler()
+        items = [1, 2]
+        calls = []
+
+        def deadline(item):
+            calls.append(item)
+            return item
+
+        scheduler.sync("k", items, deadline)
+        items.append(3)
+        scheduler.sync("k", items, deadline)
+
+        assert calls == [1, 2, 3]
+        assert scheduler.pending("k") == [1, 2, 3]
+
+    def test_sync_rebuilds_when_list_replaced(self):
+        scheduler = TimeScheduler()
+        scheduler.sync("k", [1, 2], lambda item: item)
+
+        scheduler.sync("k", [7], lambda item: item)
+
+        assert scheduler.pending("k") == [7]
+
+    def test_unscheduled_items_are_skipped(self):
+        scheduler = TimeScheduler()
+        scheduler.sync("k", [1, None, 3], lambda item: item)
+
+        assert scheduler.pending("k") == [1, 3]
+
+
+class TestQuestDeadlines:
+    """check_expired_quests uses the scheduler."""
+
+    def test_only_due_quests_are_visited(self):
+        game_state = _game_state()
+        soon = _timed_quest("Soon", accepted_at=0, limit=5)
+        later = _timed_quest("Later", accepted_at=0, limit=50)
+        game_state.current_character.quests.extend([soon, later])
+
+        game_state.game_time.advance(6)
+        messages = game_state.check_expired_quests()
+
+        assert messages == ["Quest 'Soon' has expired and failed!"]
+        assert later.status == QuestStatus.ACTIVE
+        assert game_state.scheduler.pending(QUEST_DEADLINES) == [later]
+
+    def test_quest_accepted_later_is_scheduled(self):
+        game_state = _game_state()
+        game_state.check_expired_quests()
+        quest = _timed_quest("Late Start", accepted_at=0, limit=2)
+        game_state.current_character.quests.append(quest)
+
+        game_state.game_time.advance(3)
+        game_state.check_expired_quests()
+
+        assert quest.status == QuestStatus.FAILED
+
+
+class TestWorldEventSchedule:
+    """progress_events and active-event lookups use the scheduler."""
+
+    def _event(self, event_id: str, start_hour: int, duration: int) -> WorldEvent:
+        return WorldEvent(
+            event_id=event_id,
+            name=f"Event {event_id}",
+            description="Test",
+            event_type="caravan",
+            affected_locations=["Town"],
+            start_hour=start_hour,
+            duration_hours=duration,
+        )
+
+    def test_expired_events_leave_the_queue(self):
+        game_state = _game_state()
+        hour = game_state.game_time.hour
+        short = self._event("short", hour, 2)
+        long = self._event("long", hour, 10)
+        game_state.world_events.extend([short, long])
+
+        game_state.game_time.advance(3)
+        progress_events(game_state)
+
+        assert short.is_active is False
+        assert get_active_events(game_state) == [long]
+        assert game_state.scheduler.pending(WORLD_EVENTS) == [long]
+
+    def test_expiry_is_not_checked_before_due(self):
+        game_state = _game_state()
+        event = self._event("caravan", game_state.game_time.hour, 10)
+        game_state.world_events.append(event)
+        progress_events(game_state)
+
+        game_state.game_time.advance(1)
+        with patch.object(WorldEvent, "is_expired") as is_expired:
+            progress_events(game_state)
+
+        is_expired.assert_not_called()
+
+
+class TestInteriorEventSchedule:
+    """progress_interior_events uses the SubGrid event schedule."""
+
+    def test_migration_cleared_when_due(self):
+        game_state = _game_state()
+        sub_grid = SubGrid(parent_name="Cave")
+        migration = InteriorEvent(
+            event_id="m1",
+            event_type="monster_migration",
+            location_coords=(0, 0, 0),
+            blocked_direction=None,
+            start_hour=0,
+            duration_hours=4,
+        )
+        sub_grid.interior_events.append(migration)
+
+        assert progress_interior_events(game_state, sub_grid) == []
+        game_state.game_time.advance(4)
+        messages = progress_interior_events(game_state, sub_grid)
+
+        assert migration.is_active is False
+        assert len(messages) == 1
+        assert sub_grid.event_schedule.pending(INTERIOR_EVENTS) == []